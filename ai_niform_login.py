@@ -4,397 +4,89 @@ from PIL import Image, ImageTk
 import datetime
 import time
 import os
-import cv2
-import numpy as np
-from ultralytics import YOLO
 from database_manager import DatabaseManager
+from compliance import SplashComplianceVoter, DECISION_CLEAN, DECISION_MANUAL_VERIFICATION
+from detector_config import get_detector_config
+from detection_telemetry import get_detection_telemetry
+from approval_service import ApprovalService
+from main_screen_supervisor import MainScreenSupervisor
+from status_bus import StatusBusClient, stamp_event, write_status_file, read_status_file
+from ui_marks import mark
+from view_manager import ViewManager
+from audio_player import get_audio_player
 import json
 import os.path
 from datetime import datetime, timedelta
-import subprocess
 import threading
-import sys
 import threading
-import platform
 
-# PyQt5 imports for main screen window
-try:
-    from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
-    from PyQt5.QtCore import QTimer, Qt
-    from PyQt5.QtGui import QPixmap, QFont
-    PYQT5_AVAILABLE = True
-except ImportError:
-    PYQT5_AVAILABLE = False
-    print("PyQt5 not available - main screen will launch as separate process")
+# Vision modules (cv2, numpy, ultralytics and torch behind it) take seconds to
+# import and the login screen does not need them. preload_vision_modules()
+# imports them on a background thread once the login window is up;
+# ensure_vision_modules() waits for that (or imports them itself) before the
+# first camera or detector use.
+YOLOCameraDetection = None
+get_evidence_recorder = None
+start_model_registry = None
+stop_model_registry = None
+SharedFrameWriter = None
+get_camera_session = None
+shutdown_camera_sessions = None
+SpeculativeWarmup = None
+TkFrameDisplay = None
 
-class STIMainScreenWindow(QMainWindow):
-    """PyQt5 Main Screen Window integrated into the tkinter application"""
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("AI-niform - Main Screen")
-        self.setGeometry(100, 100, 1920, 1080)
-        self.setFixedSize(1920, 1080)
-        
-        # Set up the main widget
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
-        
-        # Create main layout
-        layout = QVBoxLayout(main_widget)
-        layout.setSpacing(0)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        self.setup_ui(layout)
-        self.setup_timer()
-        
-        # Set window style
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: white;
-            }
-        """)
-        
-        # Enable key events
-        self.setFocusPolicy(Qt.StrongFocus)
-    
-    def setup_ui(self, layout):
-        """Setup the main screen UI"""
-        # Top Banner
-        top_banner = QFrame()
-        top_banner.setFixedHeight(120)
-        top_banner.setStyleSheet("background-color: #DAA520;")
-        
-        welcome_label = QLabel("Welcome to STI College Balagtas!")
-        welcome_label.setAlignment(Qt.AlignCenter)
-        welcome_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 36px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        
-        top_layout = QVBoxLayout(top_banner)
-        top_layout.addWidget(welcome_label)
-        layout.addWidget(top_banner)
-        
-        # Main Content Area
-        main_content = QFrame()
-        main_layout = QHBoxLayout(main_content)
-        main_layout.setSpacing(0)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Left Panel (Logo)
-        left_panel = QFrame()
-        left_panel.setStyleSheet("background-color: white;")
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setAlignment(Qt.AlignCenter)
-        
-        # Load and display STI Logo
-        logo_path = os.path.join("image-elements", "STI Balagtas Logo.png")
-        if os.path.exists(logo_path):
-            logo_label = QLabel()
-            pixmap = QPixmap(logo_path)
-            scaled_pixmap = pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
-            logo_label.setAlignment(Qt.AlignCenter)
-            left_layout.addWidget(logo_label)
-        else:
-            fallback_label = QLabel("STI Balagtas Logo")
-            fallback_label.setAlignment(Qt.AlignCenter)
-            fallback_label.setStyleSheet("""
-                QLabel {
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #0066CC;
-                    background-color: #FFD700;
-                    padding: 20px;
-                    border-radius: 3px;
-                }
-            """)
-            left_layout.addWidget(fallback_label)
-        
-        main_layout.addWidget(left_panel, 40)
-        
-        # Right Panel (Card Reader)
-        right_panel = QFrame()
-        right_panel.setStyleSheet("background-color: #4A90E2;")
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.setAlignment(Qt.AlignCenter)
-        
-        # Card Reader Interface
-        self.instruction_label = QLabel("Please tap your ID\nto the Card Reader")
-        self.instruction_label.setAlignment(Qt.AlignCenter)
-        self.instruction_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(self.instruction_label)
-        
-        # Status label
-        self.status_label = QLabel("Ready for scanning...")
-        self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 18px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(self.status_label)
-        
-        main_layout.addWidget(right_panel, 60)
-        layout.addWidget(main_content)
-        
-        # Bottom bar
-        bottom_bar = QFrame()
-        bottom_bar.setFixedHeight(100)
-        bottom_layout = QHBoxLayout(bottom_bar)
-        
-        # Date and time
-        current_date = datetime.now().strftime("%B %d, %Y")
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        
-        date_label = QLabel(current_date)
-        date_label.setAlignment(Qt.AlignCenter)
-        date_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-                background-color: #87CEEB;
-            }
-        """)
-        
-        time_label = QLabel(current_time)
-        time_label.setAlignment(Qt.AlignCenter)
-        time_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-                background-color: #021C37;
-            }
-        """)
-        
-        bottom_layout.addWidget(date_label)
-        bottom_layout.addWidget(time_label)
-        layout.addWidget(bottom_bar)
-    
-    def setup_timer(self):
-        """Setup timer for updating time"""
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_time)
-        self.timer.start(1000)
-    
-    def update_time(self):
-        """Update the time display"""
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        # Update time label if it exists
-        for child in self.findChildren(QLabel):
-            if ":" in child.text() and len(child.text()) < 15:
-                child.setText(current_time)
-                break
-    
-    def keyPressEvent(self, event):
-        """Handle key press events"""
-        if event.key() == Qt.Key_Escape:
-            self.close()
-        else:
-            super().keyPressEvent(event)
-    
-    def closeEvent(self, event):
-        """Handle window close event"""
-        # Notify the parent application that this window is closing
-        if hasattr(self, 'parent_app'):
-            self.parent_app.on_main_screen_closed()
-        event.accept()
+_vision_lock = threading.Lock()
+_vision_thread = None
+_vision_loaded = False
 
-class YOLOCameraDetection:
-    def __init__(self, model_path='best.pt', camera_id=0, confidence_threshold=0.5):
-        """Initialize YOLO Camera Detection"""
-        self.model_path = model_path
-        self.camera_id = camera_id
-        self.confidence_threshold = confidence_threshold
-        self.cap = None
-        self.model = None
-        self.is_running = False
-        
-    def load_model(self):
-        """Load YOLO model"""
-        try:
-            print(f"Loading YOLO model from {self.model_path}...")
-            if os.path.exists(self.model_path):
-                self.model = YOLO(self.model_path)
-                print("Model loaded successfully!")
-                return True
-            else:
-                print(f"Model file {self.model_path} not found. Using placeholder detection.")
-                self.model = None
-                return False
-        except Exception as e:
-            print(f"Error loading model: {e}")
-            self.model = None
-            return False
-    
-    def initialize_camera(self):
-        """Initialize camera capture"""
-        try:
-            self.cap = cv2.VideoCapture(self.camera_id)
-            if not self.cap.isOpened():
-                print(f"Error: Could not open camera {self.camera_id}")
-                return False
-            
-            # Set camera properties
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-            self.cap.set(cv2.CAP_PROP_FPS, 30)
-            
-            print(f"Camera {self.camera_id} initialized successfully!")
-            return True
-        except Exception as e:
-            print(f"Error initializing camera: {e}")
-            return False
-    
-    def detect_objects(self, frame):
-        """Perform object detection on frame"""
-        try:
-            if self.model is None:
-                return []
-            
-            # Run YOLO detection
-            results = self.model(frame, conf=self.confidence_threshold, verbose=False)
-            
-            # Process results
-            detections = []
-            for result in results:
-                boxes = result.boxes
-                if boxes is not None:
-                    for box in boxes:
-                        # Get box coordinates
-                        x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                        x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
-                        
-                        # Get confidence and class
-                        confidence = float(box.conf[0])
-                        class_id = int(box.cls[0])
-                        class_name = self.model.names[class_id]
-                        
-                        detections.append({
-                            'bbox': (x1, y1, x2, y2),
-                            'confidence': confidence,
-                            'class_id': class_id,
-                            'class_name': class_name
-                        })
-            
-            # Print debugging information
-            self.print_detection_debug(detections)
-            
-            return detections
-        except Exception as e:
-            print(f"Error during detection: {e}")
-            return []
-    
-    def print_detection_debug(self, detections):
-        """Print debugging information for YOLO detections"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"\n[{timestamp}] " + "="*50)
-        print("YOLO DETECTION RESULTS")
-        print("="*50)
-        
-        if not detections:
-            print("ict longsleeve = 0")
-            print("ict logo = 0")
-            print("black shoes = 0")
-            print("ict pants = 0")
-            print("\nRESULT = MANUAL VERIFICATION")
+def _import_vision_modules():
+    """Import the vision modules into this module's namespace"""
+    global YOLOCameraDetection, get_evidence_recorder, start_model_registry, stop_model_registry
+    global SharedFrameWriter, get_camera_session, shutdown_camera_sessions, SpeculativeWarmup, TkFrameDisplay
+    global _vision_loaded
+    with _vision_lock:
+        if _vision_loaded:
             return
-        
-        # Count detections by class
-        class_counts = {}
-        for detection in detections:
-            class_name = detection['class_name'].lower()
-            class_counts[class_name] = class_counts.get(class_name, 0) + 1
-        
-        # Print counts for each expected class
-        ict_longsleeve = class_counts.get('ict longsleeve', 0)
-        ict_logo = class_counts.get('ict logo', 0)
-        black_shoes = class_counts.get('black shoes', 0)
-        ict_pants = class_counts.get('ict pants', 0)
-        
-        print(f"ict longsleeve = {ict_longsleeve}")
-        print(f"ict logo = {ict_logo}")
-        print(f"black shoes = {black_shoes}")
-        print(f"ict pants = {ict_pants}")
-        
-        # Determine result based on detection counts
-        total_detections = sum(class_counts.values())
-        
-        if total_detections == 0:
-            print("\nRESULT = MANUAL VERIFICATION")
-        elif ict_longsleeve >= 1 and ict_logo >= 1 and black_shoes >= 1 and ict_pants >= 1:
-            print("\nRESULT = ENTRY ACCESS")
-        else:
-            print("\nRESULT = MANUAL VERIFICATION")
-        
-        print("="*50)
-    
-    def draw_detections(self, frame, detections):
-        """Draw detection boxes and labels on frame"""
-        for detection in detections:
-            x1, y1, x2, y2 = detection['bbox']
-            confidence = detection['confidence']
-            class_name = detection['class_name']
-            
-            # Draw bounding box
-            cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-            
-            # Create label
-            label = f"{class_name}: {confidence:.2f}"
-            
-            # Get label size
-            (label_width, label_height), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
-            
-            # Draw label background
-            cv2.rectangle(frame, (x1, y1 - label_height - 10), (x1 + label_width, y1), (0, 255, 0), -1)
-            
-            # Draw label text
-            cv2.putText(frame, label, (x1, y1 - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 2)
-        
-        return frame
-    
-    def get_frame_with_detection(self):
-        """Get a frame with object detection"""
-        if self.cap is None:
-            return None
-        
-        ret, frame = self.cap.read()
-        if not ret:
-            return None
-        
-        # Perform object detection
-        detections = self.detect_objects(frame)
-        
-        # Draw detections
-        frame = self.draw_detections(frame, detections)
-        
-        return frame
-    
-    def cleanup(self):
-        """Clean up resources"""
-        self.is_running = False
-        if self.cap is not None:
-            self.cap.release()
-        print("Camera cleanup completed")
+        start = time.perf_counter()
+        from yolo_detection import YOLOCameraDetection
+        from evidence_recorder import get_evidence_recorder
+        from model_registry import start_model_registry, stop_model_registry
+        from shared_frames import SharedFrameWriter
+        from camera_session import get_camera_session, shutdown_camera_sessions
+        from speculative_warmup import SpeculativeWarmup
+        from frame_display import TkFrameDisplay
+        _vision_loaded = True
+        print(f"Vision modules loaded in {time.perf_counter() - start:.2f} s")
+
+def _preload_vision_modules():
+    try:
+        _import_vision_modules()
+    except Exception as e:
+        print(f"Error preloading vision modules: {e}")
+
+def preload_vision_modules():
+    """Start importing the vision modules in the background"""
+    global _vision_thread
+    if _vision_loaded or _vision_thread is not None:
+        return
+    _vision_thread = threading.Thread(target=_preload_vision_modules, name="vision-preload", daemon=True)
+    _vision_thread.start()
+
+def ensure_vision_modules():
+    """Block until the vision modules are imported"""
+    if _vision_loaded:
+        return
+    if _vision_thread is not None:
+        _vision_thread.join()
+    _import_vision_modules()
+
+def vision_modules_loaded():
+    return _vision_loaded
 
 class StudentTeacherSplashScreen:
     def __init__(self, main_frame, person_data, duration=8, app_instance=None):
         """Initialize splash screen for student/teacher"""
+        ensure_vision_modules()
         self.main_frame = main_frame
         self.person_data = person_data
         self.duration = duration
@@ -462,6 +154,8 @@ class StudentTeacherSplashScreen:
         # Camera label
         self.camera_label = tk.Label(camera_frame, bg='black', text="Initializing camera...")
         self.camera_label.pack(expand=True)
+        self.camera_display = TkFrameDisplay(640, 480)
+        self.camera_display.attach(self.camera_label)
         
         # Right side - Information panel
         info_frame = tk.Frame(main_container, bg='#4A90E2', width=400, height=480)
@@ -568,7 +262,8 @@ class StudentTeacherSplashScreen:
     def initialize_camera(self):
         """Initialize camera and YOLO model"""
         try:
-            self.camera_detector = YOLOCameraDetection()
+            camera_session = getattr(self.app_instance, 'camera_session', None)
+            self.camera_detector = YOLOCameraDetection(camera_session=camera_session)
             if not self.camera_detector.load_model():
                 print("Warning: Could not load YOLO model")
             if not self.camera_detector.initialize_camera():
@@ -590,18 +285,8 @@ class StudentTeacherSplashScreen:
             if self.camera_detector and self.camera_detector.cap:
                 frame = self.camera_detector.get_frame_with_detection()
                 if frame is not None:
-                    # Convert frame to PIL Image
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    frame_pil = Image.fromarray(frame_rgb)
-                    
-                    # Resize to fit the camera frame
-                    frame_pil = frame_pil.resize((640, 480), Image.Resampling.LANCZOS)
-                    
-                    # Convert to PhotoImage
-                    self.camera_photo = ImageTk.PhotoImage(frame_pil)
-                    
-                    # Update camera label
-                    self.camera_label.configure(image=self.camera_photo, text="")
+                    # Update camera label (persistent PhotoImage, no per-frame allocations)
+                    self.camera_display.show(frame)
                     
                     # Update compliance status based on detections
                     self.update_compliance_status()
@@ -680,6 +365,31 @@ class AINiformLogin:
         
         # Initialize main screen process tracking
         self.main_screen_process = None
+        # Keeps a hidden standby main screen for fast failover
+        self.main_screen_supervisor = None
+        
+        # Camera session kept open for the whole guard shift
+        self.camera_session = None
+        # Shared-memory ring the main screen reads its live mirror from
+        self.shared_frame_writer = None
+        
+        # Event channel to the main screen (main_screen_status.txt is the fallback)
+        self.status_bus = StatusBusClient()
+        
+        # Warm guard approve/deny window (started with the guard interface)
+        self.approval_service = None
+        
+        # Persistent display pipeline for the splash camera label (created with the first splash)
+        self.splash_display = None
+        # Auto-close timer of the splash and whether its scan decision was logged
+        self.splash_close_after_id = None
+        self.splash_decision_logged = False
+        self._splash_timers = []
+        
+        # Detector warm-up started on the first keystroke of an RFID burst
+        self.speculative_warmup = None
+        self.speculative_warmup_after_id = None
+        self.splash_warmup = None
         
         # Initialize message system
         self.last_response_message = ""
@@ -705,66 +415,27 @@ class AINiformLogin:
         self.create_login_button()
         self.create_status_bar()
         
+        # Guard-side screens are built once and switched with pack_forget
+        self.views = ViewManager(self.main_frame, keep=(self.status_frame,))
+        self.register_views()
+        
         # Start time update
         self.running = True
         self.update_time()
         
-        # Track concurrent beep processes to allow overlapping sounds without leaks
-        self._beep_processes = []
+        # Tap beep decoded once and played from the audio thread
+        self.audio_player = get_audio_player()
+        self.audio_player.start()
+        
+        # Import the vision modules in the background once the login window is up
+        self.root.after_idle(lambda: self.root.after(100, preload_vision_modules))
+        self.root.after_idle(lambda: mark('login_window_ready'))
     
     def play_beep_sound(self):
         """Play a short beep sound when ID is tapped (asynchronous)"""
-        try:
-            system_name = platform.system()
-            if system_name == "Windows":
-                # Use asynchronous PlaySound so multiple taps can overlap
-                def win_beep_async():
-                    try:
-                        import winsound
-                        winsound.PlaySound("SystemAsterisk", winsound.SND_ALIAS | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
-                    except Exception:
-                        try:
-                            import winsound as _ws
-                            _ws.Beep(1000, 120)
-                        except Exception:
-                            os.system('echo -e "\a"')
-                threading.Thread(target=win_beep_async, daemon=True).start()
-            elif system_name == "Darwin":  # macOS
-                # Launch afplay without waiting; allow multiple concurrent processes
-                p = subprocess.Popen([
-                    'afplay', '/System/Library/Sounds/Ping.aiff'
-                ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                # Track and prune finished processes
-                self._beep_processes = [bp for bp in self._beep_processes if bp.poll() is None]
-                self._beep_processes.append(p)
-                if len(self._beep_processes) > 8:
-                    old = self._beep_processes.pop(0)
-                    try:
-                        if old.poll() is None:
-                            old.terminate()
-                    except Exception:
-                        pass
-            else:  # Linux and others
-                # Try paplay asynchronously; fallback to system bell if missing
-                try:
-                    p = subprocess.Popen([
-                        'paplay', '/usr/share/sounds/alsa/Front_Left.wav'
-                    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                    self._beep_processes = [bp for bp in self._beep_processes if bp.poll() is None]
-                    self._beep_processes.append(p)
-                    if len(self._beep_processes) > 8:
-                        old = self._beep_processes.pop(0)
-                        try:
-                            if old.poll() is None:
-                                old.terminate()
-                        except Exception:
-                            pass
-                except FileNotFoundError:
-                    os.system('echo -e "\a"')
-        except Exception as e:
-            # Fallback to system bell
-            print(f"Beep sound error: {e}")
-            os.system('echo -e "\a"')
+        # No audio device or backend: fall back to the system bell
+        if not self.audio_player.play():
+            self.root.bell()
     
     def center_window(self):
         """Center the window on screen"""
@@ -844,6 +515,15 @@ class AINiformLogin:
     
 
     
+    def register_views(self):
+        """Cached screens: a builder run once and a refresh run on every show"""
+        self.views.register('guard', self.build_guard_view, self.refresh_guard_view)
+        self.views.register('visitor_form', self.build_visitor_form_view, self.refresh_visitor_form_view)
+        self.views.register('student', self.build_student_view, self.refresh_student_view)
+        self.views.register('special_pass_active', self.build_special_pass_active_view,
+                            self.refresh_special_pass_active_view)
+        self.views.register('splash', self.build_splash_view, self.refresh_splash_content)
+    
     def create_status_bar(self):
         """Create the status bar with time, date, and quit"""
         self.status_frame = tk.Frame(self.main_frame, bg='white')
@@ -929,10 +609,8 @@ class AINiformLogin:
     
     def show_turnstile_interface(self):
         """Show the turnstile system interface"""
-        # Clear the main frame but keep status bar
-        for widget in self.main_frame.winfo_children():
-            if widget != self.status_frame:
-                widget.destroy()
+        # Clear the main frame but keep status bar and cached views
+        self.views.clear()
         
         # Create turnstile interface
         self.create_turnstile_header()
@@ -979,6 +657,8 @@ class AINiformLogin:
                 image=self.logo_photo,
                 bg='#4A90E2'
             )
+            # Cached views share self.logo_photo; each label keeps its own image
+            logo_label.image = self.logo_photo
             logo_label.pack(expand=True, pady=5)
         except Exception as e:
             print(f"Error loading logo: {e}")
@@ -1185,10 +865,8 @@ class AINiformLogin:
     
     def back_to_login(self, event=None):
         """Return to login screen"""
-        # Clear the main frame but keep status bar
-        for widget in self.main_frame.winfo_children():
-            if widget != self.status_frame:
-                widget.destroy()
+        # Drop the cached views (they show the guard who logged out) but keep status bar
+        self.views.reset()
         
         # Recreate login interface
         self.create_logo()
@@ -1303,6 +981,13 @@ class AINiformLogin:
         self.running = False
         # Close the main screen window if it exists
         self.close_main_screen_window()
+        # Release the camera
+        self.stop_camera_session()
+        if vision_modules_loaded():
+            stop_model_registry()
+            get_evidence_recorder().stop()
+        self.stop_approval_service()
+        self.audio_player.stop()
         self.root.quit()
     
     def on_quit_hover_enter(self, event):
@@ -1391,24 +1076,13 @@ class AINiformLogin:
     
     def show_guard_interface(self):
         """Show the guard interface and launch main screen in separate window"""
-        # Clear the main frame but keep status bar
-        for widget in self.main_frame.winfo_children():
-            if widget != self.status_frame:
-                widget.destroy()
-        
-        # Create the original guard interface
-        self.create_guard_header()
-        self.create_guard_main_content()
-        self.create_guard_sidebar()
+        # Built once, refreshed on every show
+        self.views.show('guard')
         self.update_status_bar_for_guard()
         
         # Clear any old status from main screen status file to prevent showing old status
         try:
-            with open("main_screen_status.txt", "w") as f:
-                f.write("RESET_TO_DEFAULT\n")
-                f.write("N/A\n")
-                f.write("N/A\n")
-                f.write("N/A\n")
+            write_status_file("RESET_TO_DEFAULT")
             print("Cleared main screen status file on guard interface launch")
         except Exception as e:
             print(f"Error clearing main screen status file: {e}")
@@ -1426,23 +1100,31 @@ class AINiformLogin:
         if should_launch:
             self.launch_main_screen_window()
         
+        # Camera and detector modules (normally preloaded while the guard logged in)
+        ensure_vision_modules()
+        
+        # Open the camera once for the shift so scans start on a live frame
+        self.start_camera_session()
+        
+        # Watch the models directory so new weights go live without a restart
+        start_model_registry()
+        
+        # Keep the approve/deny window ready so approvals do not start a new process
+        if self.approval_service is None:
+            self.approval_service = ApprovalService(self.root)
+        self.approval_service.start()
+        
         # Start checking for main screen status
         self.root.after(2000, self.check_main_screen_status)
         
         # Ensure focus is set after interface is created
         self.root.after(100, self.focus_guard_entry)
+        mark('guard_interface_shown')
     
     def show_guard_interface_without_main_screen(self):
         """Show the guard interface without launching main screen (for back navigation)"""
-        # Clear the main frame but keep status bar
-        for widget in self.main_frame.winfo_children():
-            if widget != self.status_frame:
-                widget.destroy()
-        
-        # Create the original guard interface
-        self.create_guard_header()
-        self.create_guard_main_content()
-        self.create_guard_sidebar()
+        # Built once, refreshed on every show
+        self.views.show('guard')
         self.update_status_bar_for_guard()
         
         # Don't launch the main screen - just return to guard interface
@@ -1461,18 +1143,69 @@ class AINiformLogin:
             current_dir = os.path.dirname(os.path.abspath(__file__))
             main_screen_path = os.path.join(current_dir, "testmainscreen.py")
             
-            # Launch the PyQt5 application as separate process
-            self.main_screen_process = subprocess.Popen([sys.executable, main_screen_path])
-            print("Main screen launched as separate process")
+            # The supervisor promotes its warm standby (or starts a new process)
+            # and keeps a fresh standby ready for the next failover
+            if self.main_screen_supervisor is None:
+                self.main_screen_supervisor = MainScreenSupervisor(self.root, main_screen_path,
+                                                                   on_failover=self.on_main_screen_failover)
+            self.main_screen_process = self.main_screen_supervisor.ensure_active()
             
         except Exception as e:
             print(f"Error launching main screen as process: {e}")
             # Set to None if launch failed
             self.main_screen_process = None
     
+    def start_camera_session(self):
+        """Open the shared camera session for the current guard shift"""
+        try:
+            if self.camera_session is None:
+                camera = get_detector_config().get('camera')
+                self.camera_session = get_camera_session(camera['camera_id'], width=camera['width'],
+                                                         height=camera['height'], fps=camera['fps'])
+            self.camera_session.start()
+        except Exception as e:
+            print(f"Error starting camera session: {e}")
+            self.camera_session = None
+            return
+        
+        # Mirror the scan frames to the main screen process
+        try:
+            if self.shared_frame_writer is None:
+                self.shared_frame_writer = SharedFrameWriter(width=self.camera_session.width,
+                                                             height=self.camera_session.height)
+            self.camera_session.add_listener(self.shared_frame_writer.write)
+        except Exception as e:
+            print(f"Shared camera frames not available: {e}")
+            self.shared_frame_writer = None
+    
+    def stop_camera_session(self):
+        """Release the camera at the end of the guard shift"""
+        try:
+            if vision_modules_loaded():
+                shutdown_camera_sessions()
+        except Exception as e:
+            print(f"Error stopping camera session: {e}")
+        self.camera_session = None
+        if self.shared_frame_writer is not None:
+            self.shared_frame_writer.close()
+            self.shared_frame_writer = None
+    
+    def on_main_screen_failover(self, process):
+        """The supervisor replaced the main screen process"""
+        self.main_screen_process = process
+        # The old process' status bus connection is gone
+        self.disconnect_status_bus()
+    
     def cleanup_main_screen_process(self):
         """Clean up the main screen process if it exists"""
-        if hasattr(self, 'main_screen_process') and self.main_screen_process is not None:
+        # Closing on purpose - not a MAIN_SCREEN_CLOSED event to react to
+        self.disconnect_status_bus()
+        if self.main_screen_supervisor is not None:
+            # Stops the active and the standby main screen
+            self.main_screen_supervisor.stop()
+            self.main_screen_process = None
+            print("Main screen process cleaned up")
+        elif hasattr(self, 'main_screen_process') and self.main_screen_process is not None:
             try:
                 if self.main_screen_process.poll() is None:  # Process is still running
                     self.main_screen_process.terminate()
@@ -1492,10 +1225,23 @@ class AINiformLogin:
             self.guard_id_entry.focus()
             self.guard_id_entry.select_range(0, tk.END)  # Select all text if any
     
-    def create_guard_header(self):
+    def build_guard_view(self, parent):
+        """Guard screen widgets (cached by the view manager)"""
+        self.create_guard_header(parent)
+        self.create_guard_main_content(parent)
+        self.create_guard_sidebar(parent)
+    
+    def refresh_guard_view(self):
+        """Last response message and an empty ID field"""
+        message_text = self.last_response_message if self.last_response_message else "Awaiting ID card scan."
+        self.guard_message_label.config(text=message_text)
+        self.id_number_entry.delete(0, tk.END)
+        self.id_number_entry.focus()
+    
+    def create_guard_header(self, parent=None):
         """Create the header with red and blue banners"""
         # Create top frame to hold both banners
-        top_frame = tk.Frame(self.main_frame, bg='white', height=100)
+        top_frame = tk.Frame(parent or self.main_frame, bg='white', height=100)
         top_frame.pack(side='top', fill='x')
         top_frame.pack_propagate(False)
         
@@ -1531,6 +1277,8 @@ class AINiformLogin:
                 image=self.logo_photo,
                 bg='#4A90E2'
             )
+            # Cached views share self.logo_photo; each label keeps its own image
+            logo_label.image = self.logo_photo
             logo_label.pack(expand=True, pady=5)
         except Exception as e:
             print(f"Error loading logo: {e}")
@@ -1556,10 +1304,10 @@ class AINiformLogin:
             )
             balagtas_label.pack()
     
-    def create_guard_main_content(self):
+    def create_guard_main_content(self, parent=None):
         """Create the main content area with AI-niform logo"""
         # Main content frame (white background)
-        content_frame = tk.Frame(self.main_frame, bg='white')
+        content_frame = tk.Frame(parent or self.main_frame, bg='white')
         content_frame.pack(side='left', fill='both', expand=True)
         
         # AI-niform logo (centered in white area)
@@ -1589,10 +1337,10 @@ class AINiformLogin:
         )
         niform_part.pack(side='left')
     
-    def create_guard_sidebar(self):
+    def create_guard_sidebar(self, parent=None):
         """Create the right sidebar with visitor/student buttons and ID input"""
         # Blue sidebar (extends from top to bottom)
-        sidebar = tk.Frame(self.main_frame, bg='#4A90E2', width=300)
+        sidebar = tk.Frame(parent or self.main_frame, bg='#4A90E2', width=300)
         sidebar.pack(side='right', fill='y')
         sidebar.pack_propagate(False)
         
@@ -1879,6 +1627,9 @@ class AINiformLogin:
             # Log the logout
             self.db_manager.log_access(card_id, "GUARD_LOGOUT")
             
+            # End of shift - release the camera
+            self.stop_camera_session()
+            
             # Clear current guard
             self.current_guard = None
             
@@ -1911,6 +1662,13 @@ class AINiformLogin:
         """Handle when guard screen window is closed (X button)"""
         # Close the main screen window if it exists
         self.close_main_screen_window()
+        # Release the camera
+        self.stop_camera_session()
+        if vision_modules_loaded():
+            stop_model_registry()
+            get_evidence_recorder().stop()
+        self.stop_approval_service()
+        self.audio_player.stop()
         # Close the guard screen
         self.root.destroy()
     
@@ -1920,19 +1678,13 @@ class AINiformLogin:
             return
         
         try:
-            if os.path.exists("main_screen_status.txt"):
-                with open("main_screen_status.txt", 'r') as f:
-                    lines = f.readlines()
-                    if lines and lines[0].strip() == "MAIN_SCREEN_CLOSED":
-                        print("Detected main screen was closed - relaunching...")
-                        # Clear the status file
-                        with open("main_screen_status.txt", "w") as f:
-                            f.write("RESET_TO_DEFAULT\n")
-                            f.write("N/A\n")
-                            f.write("N/A\n")
-                            f.write("N/A\n")
-                        # Relaunch the main screen
-                        self.launch_main_screen_window()
+            # While the status bus is connected, MAIN_SCREEN_CLOSED arrives as an event
+            if not self.connect_status_bus():
+                status = read_status_file()
+                if status and status[0] == "MAIN_SCREEN_CLOSED":
+                    print("Detected main screen was closed - relaunching...")
+                    write_status_file("RESET_TO_DEFAULT")
+                    self.on_main_screen_closed()
         except Exception as e:
             print(f"Error checking main screen status: {e}")
         
@@ -1940,6 +1692,98 @@ class AINiformLogin:
         if self.running:
             self.root.after(2000, self.check_main_screen_status)
     
+    def request_guard_approval(self, person_data):
+        """Show the guard approve/deny window without blocking the Tk loop"""
+        if self.approval_service is None:
+            self.approval_service = ApprovalService(self.root)
+        guard_name = self.current_guard['name'] if self.current_guard else "Unknown Guard"
+        print("Requesting guard approve/deny decision...")
+        self.approval_service.request(person_data, guard_name,
+                                      lambda result: self.on_guard_approval_decision(person_data, result))
+    
+    def cancel_guard_approval(self):
+        """Take down a pending approve/deny window (the compliance screen was left)"""
+        if self.approval_service is not None:
+            self.approval_service.cancel()
+    
+    def on_guard_approval_decision(self, person_data, result):
+        """Continue the entry flow with the guard's decision"""
+        decision = result['decision']
+        if decision == "approve":
+            # Notify main screen to show student/teacher info similar to special pass
+            try:
+                current_time = datetime.now().strftime("%I:%M:%S %p")
+                guard_name = self.current_guard['name'] if self.current_guard else "Unknown Guard"
+                person_name = person_data.get('name', 'Unknown')
+                person_role = person_data.get('role', 'USER')
+                self.send_main_screen_status("STUDENT_TEACHER_APPROVED", person_name, person_role, current_time, guard_name)
+            except Exception as e:
+                print(f"Error writing student/teacher approved status: {e}")
+            # Guard approved – show approval splash
+            self.show_approval_interface(person_data)
+        elif decision == "error":
+            # Fail open: approve-button.py could not be launched at all, so no
+            # guard could be asked - don't leave the person waiting
+            self.show_approval_interface(person_data)
+        else:
+            # Treat deny, window close or a lost approval window as denial
+            self.show_denial_message(person_data, "Access denied by guard.")
+    
+    def stop_approval_service(self):
+        """Close the warm approve/deny window"""
+        if self.approval_service is not None:
+            self.approval_service.stop()
+            self.approval_service = None
+    
+    def send_main_screen_status(self, status, *fields):
+        """Send a stamped status event to the main screen (status file if the bus is down)"""
+        stamp = stamp_event()
+        if self.connect_status_bus() and self.status_bus.send(status, fields, stamp):
+            return True
+        self.disconnect_status_bus()
+        write_status_file(status, fields, stamp=stamp)
+        return False
+    
+    def connect_status_bus(self):
+        """Connect to the main screen's status bus and watch it from the Tk loop"""
+        if self.status_bus.connected:
+            return True
+        if not self.status_bus.connect():
+            return False
+        try:
+            self.root.tk.createfilehandler(self.status_bus.sock, tk.READABLE, self.on_status_bus_readable)
+        except Exception as e:
+            # No file handlers on this platform: send only, keep polling for MAIN_SCREEN_CLOSED
+            print(f"Status bus: cannot watch socket ({e}) - using status file")
+            self.status_bus.close()
+            return False
+        return True
+    
+    def disconnect_status_bus(self):
+        """Stop watching the status bus and close it"""
+        if self.status_bus.connected:
+            try:
+                self.root.tk.deletefilehandler(self.status_bus.sock)
+            except Exception:
+                pass
+            self.status_bus.close()
+    
+    def on_status_bus_readable(self, sock, mask):
+        """Handle events sent by the main screen as soon as they arrive"""
+        events = self.status_bus.receive() if self.status_bus.connected else None
+        if events is None:
+            # Main screen went away; its MAIN_SCREEN_CLOSED (if any) is in the status file
+            self.disconnect_status_bus()
+            print("Main screen status bus disconnected")
+            return
+        for status, _fields, _stamp in events:
+            if status == "MAIN_SCREEN_CLOSED":
+                print("Main screen closed (status bus) - relaunching...")
+                self.disconnect_status_bus()
+                write_status_file("RESET_TO_DEFAULT")
+                self.on_main_screen_closed()
+                return
+    
     def cancel_logout(self):
         """Cancel logout and close window"""
         self.logout_window.destroy()
@@ -2017,15 +1861,8 @@ class AINiformLogin:
     
     def show_visitor_form_interface(self):
         """Show the visitor form interface"""
-        # Clear the main frame but keep status bar
-        for widget in self.main_frame.winfo_children():
-            if widget != self.status_frame:
-                widget.destroy()
-        
-        # Create visitor form interface
-        self.create_visitor_form_header()
-        self.create_visitor_form_content()
-        self.create_visitor_form_sidebar()
+        # Built once, refreshed on every show
+        self.views.show('visitor_form')
         self.update_status_bar_for_visitor_form()
         
         # Ensure focus is set after interface is created
@@ -2037,10 +1874,25 @@ class AINiformLogin:
             self.visitor_id_number_entry.focus()
             self.visitor_id_number_entry.select_range(0, tk.END)  # Select all text if any
     
-    def create_visitor_form_header(self):
+    def build_visitor_form_view(self, parent):
+        """Visitor form widgets (cached by the view manager)"""
+        self.create_visitor_form_header(parent)
+        self.create_visitor_form_content(parent)
+        self.create_visitor_form_sidebar(parent)
+    
+    def refresh_visitor_form_view(self):
+        """Start every visit with an empty form"""
+        for var in (self.visitor_name_var, self.visitor_contact_var, self.visitor_type_var,
+                    self.visitor_purpose_var, self.visitor_visiting_var, self.visitor_id_type_var,
+                    self.visitor_special_pass_var):
+            var.set("")
+        self.visitor_id_number_entry.delete(0, tk.END)
+        self.visitor_id_number_entry.focus()
+    
+    def create_visitor_form_header(self, parent=None):
         """Create the header with red and blue banners"""
         # Create top frame to hold both banners
-        top_frame = tk.Frame(self.main_frame, bg='white', height=100)
+        top_frame = tk.Frame(parent or self.main_frame, bg='white', height=100)
         top_frame.pack(side='top', fill='x')
         top_frame.pack_propagate(False)
         
@@ -2076,6 +1928,8 @@ class AINiformLogin:
                 image=self.logo_photo,
                 bg='#4A90E2'
             )
+            # Cached views share self.logo_photo; each label keeps its own image
+            logo_label.image = self.logo_photo
             logo_label.pack(expand=True, pady=5)
         except Exception as e:
             print(f"Error loading logo: {e}")
@@ -2101,10 +1955,10 @@ class AINiformLogin:
             )
             balagtas_label.pack()
     
-    def create_visitor_form_content(self):
+    def create_visitor_form_content(self, parent=None):
         """Create the visitor form content"""
         # Main content frame (white background)
-        content_frame = tk.Frame(self.main_frame, bg='white')
+        content_frame = tk.Frame(parent or self.main_frame, bg='white')
         content_frame.pack(side='left', fill='both', expand=True)
         
         # Create a canvas with scrollbar for the form
@@ -2229,10 +2083,10 @@ class AINiformLogin:
         )
         submit_button.pack(anchor='e', pady=(0, 20))
     
-    def create_visitor_form_sidebar(self):
+    def create_visitor_form_sidebar(self, parent=None):
         """Create the right sidebar for visitor form"""
         # Blue sidebar (extends from top to bottom)
-        sidebar = tk.Frame(self.main_frame, bg='#4A90E2', width=300)
+        sidebar = tk.Frame(parent or self.main_frame, bg='#4A90E2', width=300)
         sidebar.pack(side='right', fill='y')
         sidebar.pack_propagate(False)
         
@@ -2466,10 +2320,8 @@ class AINiformLogin:
     
     def show_visitor_success_screen(self, visitor_id, visitor_name):
         """Show visitor registration success screen"""
-        # Clear the main frame but keep status bar
-        for widget in self.main_frame.winfo_children():
-            if widget != self.status_frame:
-                widget.destroy()
+        # Clear the main frame but keep status bar and cached views
+        self.views.clear()
         
         # Create success interface
         self.create_visitor_form_header()
@@ -2522,10 +2374,8 @@ class AINiformLogin:
     
     def show_visitor_error_screen(self, special_pass_id, visitor_name, expires_at):
         """Show visitor registration error screen"""
-        # Clear the main frame but keep status bar
-        for widget in self.main_frame.winfo_children():
-            if widget != self.status_frame:
-                widget.destroy()
+        # Clear the main frame but keep status bar and cached views
+        self.views.clear()
         
         # Create error interface
         self.create_visitor_form_header()
@@ -2660,10 +2510,8 @@ class AINiformLogin:
         """Show visitor special pass error screen"""
         print("Showing visitor special pass error screen")  # Debug print
         
-        # Clear the main frame but keep status bar
-        for widget in self.main_frame.winfo_children():
-            if widget != self.status_frame:
-                widget.destroy()
+        # Clear the main frame but keep status bar and cached views
+        self.views.clear()
         
         # Create error interface
         self.create_visitor_form_header()
@@ -2731,15 +2579,8 @@ class AINiformLogin:
     
     def show_student_interface(self):
         """Show the student interface"""
-        # Clear the main frame but keep status bar
-        for widget in self.main_frame.winfo_children():
-            if widget != self.status_frame:
-                widget.destroy()
-        
-        # Create student interface
-        self.create_student_header()
-        self.create_student_content()
-        self.create_student_sidebar()
+        # Built once, refreshed on every show
+        self.views.show('student')
         self.update_status_bar_for_student()
         
         # Ensure focus is set after interface is created
@@ -2751,10 +2592,21 @@ class AINiformLogin:
             self.student_number_entry.focus()
             self.student_number_entry.select_range(0, tk.END)
     
-    def create_student_header(self):
+    def build_student_view(self, parent):
+        """Student screen widgets (cached by the view manager)"""
+        self.create_student_header(parent)
+        self.create_student_content(parent)
+        self.create_student_sidebar(parent)
+    
+    def refresh_student_view(self):
+        """Empty student number and ID fields"""
+        self.student_number_entry.delete(0, tk.END)
+        self.student_id_number_entry.delete(0, tk.END)
+    
+    def create_student_header(self, parent=None):
         """Create the header with red and blue banners"""
         # Create top frame to hold both banners
-        top_frame = tk.Frame(self.main_frame, bg='white', height=100)
+        top_frame = tk.Frame(parent or self.main_frame, bg='white', height=100)
         top_frame.pack(side='top', fill='x')
         top_frame.pack_propagate(False)
         
@@ -2790,6 +2642,8 @@ class AINiformLogin:
                 image=self.logo_photo,
                 bg='#4A90E2'
             )
+            # Cached views share self.logo_photo; each label keeps its own image
+            logo_label.image = self.logo_photo
             logo_label.pack(expand=True, pady=5)
         except Exception as e:
             print(f"Error loading logo: {e}")
@@ -2815,10 +2669,10 @@ class AINiformLogin:
             )
             balagtas_label.pack()
     
-    def create_student_content(self):
+    def create_student_content(self, parent=None):
         """Create the student content"""
         # Main content frame (white background)
-        content_frame = tk.Frame(self.main_frame, bg='white')
+        content_frame = tk.Frame(parent or self.main_frame, bg='white')
         content_frame.pack(side='left', fill='both', expand=True)
         
         # Content container
@@ -2859,10 +2713,10 @@ class AINiformLogin:
         )
         submit_button.pack()
     
-    def create_student_sidebar(self):
+    def create_student_sidebar(self, parent=None):
         """Create the right sidebar for student interface"""
         # Blue sidebar (extends from top to bottom)
-        sidebar = tk.Frame(self.main_frame, bg='#4A90E2', width=300)
+        sidebar = tk.Frame(parent or self.main_frame, bg='#4A90E2', width=300)
         sidebar.pack(side='right', fill='y')
         sidebar.pack_propagate(False)
         
@@ -3071,6 +2925,11 @@ class AINiformLogin:
         
         card_id = self.id_number_entry.get().strip()
         
+        # First keystroke of an RFID burst - overlap camera/model start-up
+        # with the rest of the card input and the database lookup
+        if card_id and self.speculative_warmup is None:
+            self.start_speculative_warmup()
+        
         # Check if we have a complete RFID code (typically 10 digits)
         if len(card_id) >= 10:
             # Play beep sound when ID is tapped
@@ -3100,6 +2959,10 @@ class AINiformLogin:
         # Find the person in database
         person = self.db_manager.find_person(card_id)
         
+        # Only students and teachers go through the camera scan
+        if not person or person['role'] not in ['STUDENT', 'TEACHER']:
+            self.cancel_speculative_warmup()
+        
         if person:
             # Check if it's a Special Pass and handle grace period
             if person['role'] == 'SPECIAL':
@@ -3115,11 +2978,7 @@ class AINiformLogin:
                     
                     # Send deactivated pass status to main screen
                     try:
-                        with open("main_screen_status.txt", "w") as f:
-                            f.write("DEACTIVATED_PASS\n")
-                            f.write("N/A\n")
-                            f.write("N/A\n")
-                            f.write("N/A\n")
+                        self.send_main_screen_status("DEACTIVATED_PASS")
                         print("Deactivated pass status sent to main screen")
                     except Exception as e:
                         print(f"Error writing status file: {e}")
@@ -3155,11 +3014,7 @@ class AINiformLogin:
                     
                     # Send deactivated pass status to main screen
                     try:
-                        with open("main_screen_status.txt", "w") as f:
-                            f.write("DEACTIVATED_PASS\n")
-                            f.write("N/A\n")
-                            f.write("N/A\n")
-                            f.write("N/A\n")
+                        self.send_main_screen_status("DEACTIVATED_PASS")
                         print("Deactivated pass status sent to main screen")
                     except Exception as e:
                         print(f"Error writing status file: {e}")
@@ -3224,11 +3079,7 @@ class AINiformLogin:
             
             # Send invalid ID status to main screen
             try:
-                with open("main_screen_status.txt", "w") as f:
-                    f.write("INVALID_ID\n")
-                    f.write("N/A\n")
-                    f.write("N/A\n")
-                    f.write("N/A\n")
+                self.send_main_screen_status("INVALID_ID")
                 print("Invalid ID status sent to main screen")
             except Exception as e:
                 print(f"Error writing status file: {e}")
@@ -3254,7 +3105,14 @@ class AINiformLogin:
         self.splash_camera_detector = None
         self.splash_is_running = False
         self.compliance_person_data = person_data
-        self.no_detection_count = 0  # Counter for consecutive frames with no detection
+        self.splash_decision_logged = False
+        # A new scan: an approval still open for the previous person is moot
+        self.cancel_guard_approval()
+        detector_config = get_detector_config()
+        detector_config.reload_if_changed()
+        self.splash_voter = SplashComplianceVoter(no_detection_limit=detector_config.get('no_detection_frames'),
+                                                  required_classes=detector_config.required_classes)
+        get_evidence_recorder().begin_scan(person_data.get('id'))
         
         # Disable logout button during splash screen
         self.disable_logout_button()
@@ -3265,25 +3123,12 @@ class AINiformLogin:
             guard_name = self.current_guard['name'] if self.current_guard else "Unknown Guard"
             person_name = person_data.get('name', 'Unknown')
             person_role = person_data.get('role', 'USER')
-            with open("main_screen_status.txt", "w") as f:
-                f.write("STUDENT_TEACHER_INFO\n")
-                f.write(f"{person_name}\n")
-                f.write(f"{person_role}\n")
-                f.write(f"{current_time}\n")
-                f.write(f"{guard_name}\n")
+            self.send_main_screen_status("STUDENT_TEACHER_INFO", person_name, person_role, current_time, guard_name)
         except Exception as e:
             print(f"Error writing student/teacher info status: {e}")
         
-        # Clear the main frame but keep header and status bar
-        for widget in self.main_frame.winfo_children():
-            if widget not in [self.status_frame]:
-                widget.destroy()
-        
-        # Create header (Turnstile is Closed + Guard in-charge)
-        self.create_splash_header()
-        
-        # Create splash content
-        self.create_splash_content_integrated(person_data)
+        # Header, camera area and status banner are cached; the info panel shows this person
+        self.views.show('splash', person_data)
         
         # Initialize camera
         self.initialize_splash_camera()
@@ -3293,7 +3138,7 @@ class AINiformLogin:
 
         # Initialize timed status sequence (3s ready -> 3s scanning -> 2s result)
         try:
-            self._splash_timers = []
+            self.cancel_splash_timers()
             self.set_splash_status("Getting ready in 3 second(s)...")
             self._schedule_splash(3000, lambda: self.set_splash_status("Scanning is in progress... Please do not move."))
             # At 6s, show result frame for ~2s
@@ -3301,16 +3146,19 @@ class AINiformLogin:
         except Exception as _e:
             pass
         
-        # Auto-close after duration
-        self.main_frame.after(duration * 1000, self.close_splash_and_restore)
+        # Auto-close after duration (cancelled on early stop or Escape)
+        self.cancel_splash_close()
+        self.splash_close_after_id = self.main_frame.after(duration * 1000, self.close_splash_and_restore)
+        mark('splash_shown', role=person_data.get('role'))
         
         # Bind escape key to close
         self.root.bind('<Escape>', lambda e: self.close_splash_and_restore())
     
-    def create_splash_content_integrated(self, person_data):
+    def create_splash_content_integrated(self, parent=None):
         """Create the splash screen content in the main window"""
+        parent = parent or self.main_frame
         # Main container
-        main_container = tk.Frame(self.main_frame, bg='white')
+        main_container = tk.Frame(parent, bg='white')
         main_container.pack(expand=True, fill='both', padx=20, pady=20)
         
         # Left side - Camera feed
@@ -3322,27 +3170,41 @@ class AINiformLogin:
         self.splash_camera_label = tk.Label(camera_frame, bg='black', text="Initializing camera...")
         self.splash_camera_label.pack(expand=True)
         
-        # Right side - Information panel
-        info_frame = tk.Frame(main_container, bg='#4A90E2', width=400, height=480)
-        info_frame.pack(side='right', fill='y')
-        info_frame.pack_propagate(False)
-        
-        # Profile picture
-        self.create_splash_profile_section(info_frame, person_data)
-        
-        # Information section
-        self.create_splash_info_section(info_frame)
-        
-        # Guard in-charge section
-        self.create_splash_guard_section(info_frame)
+        # Right side - Information panel (filled per person by refresh_splash_content)
+        self.splash_info_frame = tk.Frame(main_container, bg='#4A90E2', width=400, height=480)
+        self.splash_info_frame.pack(side='right', fill='y')
+        self.splash_info_frame.pack_propagate(False)
 
         # Status banner below camera (light blue) for step messages
-        status_bar = tk.Frame(self.main_frame, bg='#ADD8E6', height=40)
+        status_bar = tk.Frame(parent, bg='#ADD8E6', height=40)
         status_bar.pack(side='top', fill='x')
         status_bar.pack_propagate(False)
         self.splash_status_label = tk.Label(status_bar, text="", font=("Arial", 16, "bold"), bg='#ADD8E6', fg='black')
         self.splash_status_label.pack(expand=True)
 
+    def refresh_splash_content(self, person_data):
+        """Show the scanned person on the cached splash view"""
+        # Back to the placeholder after the last scan's frames and scan-ok image
+        self.splash_camera_label.config(image='', text="Initializing camera...")
+        if self.splash_display is None:
+            ensure_vision_modules()
+            self.splash_display = TkFrameDisplay(640, 480)
+        self.splash_display.attach(self.splash_camera_label)
+        self.splash_display.reset_stats()
+        self.splash_status_label.config(text="")
+        
+        for widget in self.splash_info_frame.winfo_children():
+            widget.destroy()
+        
+        # Profile picture
+        self.create_splash_profile_section(self.splash_info_frame, person_data)
+        
+        # Information section
+        self.create_splash_info_section(self.splash_info_frame)
+        
+        # Guard in-charge section
+        self.create_splash_guard_section(self.splash_info_frame)
+
     def set_splash_status(self, text):
         try:
             if hasattr(self, 'splash_status_label') and self.splash_status_label.winfo_exists():
@@ -3352,10 +3214,19 @@ class AINiformLogin:
 
     def _schedule_splash(self, delay_ms, func):
         try:
-            self.main_frame.after(delay_ms, func)
+            self._splash_timers.append(self.main_frame.after(delay_ms, func))
         except Exception:
             pass
 
+    def cancel_splash_timers(self):
+        """Cancel the status and scan-ok steps of the splash (the cached view outlives the scan)"""
+        for after_id in self._splash_timers:
+            try:
+                self.main_frame.after_cancel(after_id)
+            except Exception:
+                pass
+        self._splash_timers = []
+
     def _show_scan_complete_overlay(self):
         # Replace left camera area with scan-ok image on black background
         try:
@@ -3500,10 +3371,57 @@ class AINiformLogin:
             print(f"Error getting student number: {e}")
             return None
     
+    def start_speculative_warmup(self):
+        """Start camera subscription and detector warm-up ahead of the card lookup"""
+        try:
+            detector = YOLOCameraDetection(camera_session=self.camera_session)
+            self.speculative_warmup = SpeculativeWarmup(detector)
+            self.speculative_warmup.start()
+            # Give up if no complete card ID follows the keystroke
+            self.speculative_warmup_after_id = self.root.after(3000, self.cancel_speculative_warmup)
+        except Exception as e:
+            print(f"Error starting speculative warm-up: {e}")
+            self.speculative_warmup = None
+    
+    def cancel_speculative_warmup(self):
+        """Cancel a pending speculative warm-up"""
+        if self.speculative_warmup_after_id is not None:
+            try:
+                self.root.after_cancel(self.speculative_warmup_after_id)
+            except Exception:
+                pass
+            self.speculative_warmup_after_id = None
+        if self.speculative_warmup is not None:
+            self.speculative_warmup.cancel()
+            self.speculative_warmup = None
+    
+    def claim_speculative_warmup(self):
+        """Take ownership of the warm detector, if a warm-up is pending"""
+        warmup = self.speculative_warmup
+        if warmup is None:
+            return None
+        if self.speculative_warmup_after_id is not None:
+            try:
+                self.root.after_cancel(self.speculative_warmup_after_id)
+            except Exception:
+                pass
+            self.speculative_warmup_after_id = None
+        self.speculative_warmup = None
+        return warmup
+    
     def initialize_splash_camera(self):
         """Initialize camera and YOLO model for splash screen"""
+        # Reuse the detector warmed up while the card was being read
+        self.splash_warmup = self.claim_speculative_warmup()
+        if self.splash_warmup is not None:
+            self.splash_camera_detector = self.splash_warmup.detector
+            if self.splash_camera_detector.cap is None and not self.splash_camera_detector.initialize_camera():
+                # No camera session: the warm-up left opening the device to us
+                print("Warning: Could not initialize camera")
+            return
+        
         try:
-            self.splash_camera_detector = YOLOCameraDetection()
+            self.splash_camera_detector = YOLOCameraDetection(camera_session=self.camera_session)
             if not self.splash_camera_detector.load_model():
                 print("Warning: Could not load YOLO model")
             if not self.splash_camera_detector.initialize_camera():
@@ -3514,101 +3432,122 @@ class AINiformLogin:
     def start_splash_camera_feed(self):
         """Start the camera feed update loop for splash screen"""
         self.splash_is_running = True
-        # Add a small delay to let camera initialize, then start detection
-        self.main_frame.after(1000, self.update_splash_camera_feed)
+        if self.camera_session is not None and self.camera_session.is_live():
+            # Persistent session is already streaming - start on the live frame
+            self.main_frame.after(0, self.update_splash_camera_feed)
+        else:
+            # Add a small delay to let camera initialize, then start detection
+            self.main_frame.after(1000, self.update_splash_camera_feed)
     
     def update_splash_camera_feed(self):
         """Update camera feed with detection results for splash screen"""
         if not self.splash_is_running:
             return
+        frame_start = time.perf_counter()
         
         try:
             if self.splash_camera_detector and self.splash_camera_detector.cap:
-                frame = self.splash_camera_detector.get_frame_with_detection()
+                warming_up = self.splash_warmup is not None and not self.splash_warmup.is_ready()
+                if warming_up:
+                    # Model is still warming up in the background - just show the feed
+                    ret, frame = self.splash_camera_detector.cap.read()
+                    detections = []
+                    if not ret:
+                        frame = None
+                else:
+                    # One inference per frame: the same detections are drawn and voted on
+                    frame, detections = self.splash_camera_detector.get_frame_and_detections()
                 if frame is not None:
-                    # Convert frame to PIL Image
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    frame_pil = Image.fromarray(frame_rgb)
-                    
-                    # Resize to fit the camera frame
-                    frame_pil = frame_pil.resize((640, 480), Image.Resampling.LANCZOS)
+                    # Update camera label (persistent PhotoImage, no per-frame allocations)
+                    self.splash_display.show(frame)
                     
-                    # Convert to PhotoImage
-                    self.splash_camera_photo = ImageTk.PhotoImage(frame_pil)
-                    
-                    # Update camera label
-                    self.splash_camera_label.configure(image=self.splash_camera_photo, text="")
-                    
-                    # Add detection logic here
-                    if self.splash_camera_detector.model is not None:
-                        detections = self.splash_camera_detector.detect_objects(frame)
-                        print(f"Detection count: {len(detections)}")  # Debug print
+                    if warming_up:
+                        pass
+                    elif self.splash_camera_detector.model is not None:
+                        result = self.splash_voter.update(detections)
+                        if result is not None:
+                            self.compliance_result = result
+                        get_detection_telemetry().record(detections, self.splash_camera_detector.last_inference_ms)
+                        get_evidence_recorder().add_frame(frame, detections)
+                        if self.splash_camera_detector.debug:
+                            print(f"Detection count: {len(detections)}")  # Debug print
+                            if not detections:
+                                print(f"No objects detected - count: {self.splash_voter.no_detection_count}")  # Debug print
                         
-                        if detections:
-                            # Reset no detection counter
-                            self.no_detection_count = 0
-                            
-                            # Analyze detections to determine result
-                            class_counts = {}
-                            for detection in detections:
-                                class_name = detection['class_name'].lower()
-                                class_counts[class_name] = class_counts.get(class_name, 0) + 1
-                            
-                            # Check if all required items are detected
-                            ict_longsleeve = class_counts.get('ict longsleeve', 0)
-                            ict_logo = class_counts.get('ict logo', 0)
-                            black_shoes = class_counts.get('black shoes', 0)
-                            ict_pants = class_counts.get('ict pants', 0)
-                            
-                            if ict_longsleeve >= 1 and ict_logo >= 1 and black_shoes >= 1 and ict_pants >= 1:
-                                # All required items detected - clean
-                                self.compliance_result = "clean"
-                            else:
-                                # Partial detection - manual verification needed
-                                self.compliance_result = "manual_verification"
+                        if self.splash_voter.finished:
+                            self.cancel_splash_close()
+                            self.cancel_splash_timers()
+                            try:
+                                self.root.unbind('<Escape>')
+                            except Exception:
+                                pass
+                            self.log_splash_decision(DECISION_MANUAL_VERIFICATION, stopped_early=True)
+                            if detections:
                                 print("Manual verification needed - showing compliance interface")
-                                # Stop the splash screen first
-                                self.splash_is_running = False
-                                if self.splash_camera_detector:
-                                    self.splash_camera_detector.cleanup()
-                                # Show the guard screen with Approve/Deny buttons
-                                self.show_uniform_compliance_interface(self.compliance_person_data, "manual_verification")
-                                return  # Stop camera feed updates
-                        else:
-                            # No detections - increment counter
-                            self.no_detection_count += 1
-                            print(f"No objects detected - count: {self.no_detection_count}")  # Debug print
-                            
-                            # Show guard screen with Approve/Deny buttons after 3 seconds (90 frames at 30fps)
-                            if self.no_detection_count >= 90:
-                                print("No objects detected for 3 seconds - showing guard screen with Approve/Deny buttons")  # Debug print
-                                self.compliance_result = "manual_verification"
-                                # Stop the splash screen first
-                                self.splash_is_running = False
-                                if self.splash_camera_detector:
-                                    self.splash_camera_detector.cleanup()
-                                # Show the guard screen with Approve/Deny buttons
-                                self.show_uniform_compliance_interface(self.compliance_person_data, "manual_verification")
-                                return  # Stop camera feed updates
+                            else:
+                                print("No objects detected - showing guard screen with Approve/Deny buttons")  # Debug print
+                            # Stop the splash screen first
+                            self.splash_is_running = False
+                            if self.splash_camera_detector:
+                                self.splash_camera_detector.cleanup()
+                            # Show the guard screen with Approve/Deny buttons
+                            self.show_uniform_compliance_interface(self.compliance_person_data, DECISION_MANUAL_VERIFICATION)
+                            return  # Stop camera feed updates
                     else:
                         # No model available - assume clean
                         print("No model available - assuming clean")  # Debug print
-                        self.compliance_result = "clean"
+                        self.compliance_result = DECISION_CLEAN
             
         except Exception as e:
             print(f"Error updating camera feed: {e}")
         
-        # Schedule next update
+        # Schedule next update within the configured frame budget
         if self.splash_is_running:
-            self.main_frame.after(33, self.update_splash_camera_feed)  # ~30 FPS
+            frame_budget_ms = get_detector_config().get('frame_budget_ms')
+            elapsed_ms = int((time.perf_counter() - frame_start) * 1000)
+            self.main_frame.after(max(1, frame_budget_ms - elapsed_ms), self.update_splash_camera_feed)
     
 
     
+    def cancel_splash_close(self):
+        """Cancel the pending splash auto-close"""
+        if self.splash_close_after_id is not None:
+            try:
+                self.main_frame.after_cancel(self.splash_close_after_id)
+            except Exception:
+                pass
+            self.splash_close_after_id = None
+    
+    def log_splash_decision(self, decision, stopped_early):
+        """Close the telemetry window of a scan and record its decision (once per scan)"""
+        if self.splash_decision_logged:
+            return
+        self.splash_decision_logged = True
+        try:
+            telemetry = get_detection_telemetry()
+            telemetry.flush()
+            person = getattr(self, 'compliance_person_data', None) or {}
+            detector = getattr(self, 'splash_camera_detector', None)
+            model_version = detector.model_version if detector is not None else None
+            telemetry.event('scan_decision', decision=decision, stopped_early=stopped_early,
+                            person_id=person.get('id'), model_version=model_version,
+                            display=self.splash_display.stats())
+            print(f"Scan decision: {decision} (model {model_version})")
+            if decision != DECISION_CLEAN:
+                # Keep the last frames of the scan for later review
+                get_evidence_recorder().save(decision, reason="scan decision", person_id=person.get('id'))
+        except Exception as e:
+            print(f"Error logging splash decision: {e}")
+    
     def close_splash_and_restore(self):
         """Close the splash screen and then show the Approve/Deny frame"""
+        # Escape closes early: the auto-close must not show the result a second time
+        self.cancel_splash_close()
+        self.cancel_splash_timers()
         self.splash_is_running = False
         if self.splash_camera_detector:
             self.splash_camera_detector.cleanup()
+        self.splash_warmup = None
         
         # Enable logout button after splash screen closes
         self.enable_logout_button()
@@ -3616,6 +3555,7 @@ class AINiformLogin:
         # After the splash, present the compliance interface (Approve/Deny)
         try:
             detection_result = getattr(self, 'compliance_result', 'manual_verification')
+            self.log_splash_decision(detection_result, stopped_early=False)
             # Show compliance UI inline
             self.show_uniform_compliance_interface(self.compliance_person_data, detection_result)
         except Exception as e:
@@ -3629,10 +3569,16 @@ class AINiformLogin:
         except:
             pass
     
-    def create_splash_header(self):
+    def build_splash_view(self, parent):
+        """Splash header, camera area and status banner (cached by the view manager)"""
+        # Header (Turnstile is Closed + Guard in-charge)
+        self.create_splash_header(parent)
+        self.create_splash_content_integrated(parent)
+    
+    def create_splash_header(self, parent=None):
         """Create the header with Turnstile is Closed and Guard in-charge"""
         # Create top frame to hold both banners
-        top_frame = tk.Frame(self.main_frame, bg='white', height=100)
+        top_frame = tk.Frame(parent or self.main_frame, bg='white', height=100)
         top_frame.pack(side='top', fill='x')
         top_frame.pack_propagate(False)
         
@@ -3708,11 +3654,7 @@ class AINiformLogin:
     def reset_main_screen_message(self):
         """Reset the main screen message back to default"""
         try:
-            with open("main_screen_status.txt", "w") as f:
-                f.write("RESET_TO_DEFAULT\n")
-                f.write("N/A\n")
-                f.write("N/A\n")
-                f.write("N/A\n")
+            self.send_main_screen_status("RESET_TO_DEFAULT")
             print("Reset to default status sent to main screen")
         except Exception as e:
             print(f"Error writing reset status file: {e}")
@@ -3735,11 +3677,6 @@ class AINiformLogin:
     
     def show_special_pass_active_interface(self):
         """Show the Special Pass active interface"""
-        # Clear the main frame but keep status bar
-        for widget in self.main_frame.winfo_children():
-            if widget != self.status_frame:
-                widget.destroy()
-        
         # Write status to main screen status file based on check type
         try:
             current_time = datetime.now().strftime("%I:%M:%S %p")
@@ -3754,24 +3691,31 @@ class AINiformLogin:
                 status = "TURNSTILE_OPEN"
                 print(f"Turnstile opened status sent to main screen for Special Pass {special_pass_id}")
             
-            with open("main_screen_status.txt", "w") as f:
-                f.write(f"{status}\n")
-                f.write(f"{special_pass_id}\n")
-                f.write(f"{current_time}\n")
-                f.write(f"{guard_name}\n")
+            self.send_main_screen_status(status, special_pass_id, current_time, guard_name)
         except Exception as e:
             print(f"Error writing status file: {e}")
         
-        # Create Special Pass active interface
-        self.create_special_pass_active_header()
-        self.create_special_pass_active_main_content()
-        self.create_special_pass_active_sidebar()
+        # Header and content are cached; the sidebar is rebuilt for the pass
+        self.views.show('special_pass_active')
         self.update_status_bar_for_special_pass_active()
     
-    def create_special_pass_active_header(self):
+    def build_special_pass_active_view(self, parent):
+        """Special Pass header and content (cached; the sidebar is per pass)"""
+        self.create_special_pass_active_header(parent)
+        self.create_special_pass_active_main_content(parent)
+        self.special_pass_view = parent
+        self.special_pass_sidebar = None
+    
+    def refresh_special_pass_active_view(self):
+        """Rebuild the sidebar with the current pass and its check time"""
+        if self.special_pass_sidebar is not None:
+            self.special_pass_sidebar.destroy()
+        self.special_pass_sidebar = self.create_special_pass_active_sidebar(self.special_pass_view)
+    
+    def create_special_pass_active_header(self, parent=None):
         """Create the header with green and blue banners for Special Pass active"""
         # Create top frame to hold both banners
-        top_frame = tk.Frame(self.main_frame, bg='white', height=120)
+        top_frame = tk.Frame(parent or self.main_frame, bg='white', height=120)
         top_frame.pack(side='top', fill='x')
         top_frame.pack_propagate(False)
         
@@ -3817,10 +3761,10 @@ class AINiformLogin:
         )
         close_button.pack(side='right', padx=20, pady=15)
     
-    def create_special_pass_active_main_content(self):
+    def create_special_pass_active_main_content(self, parent=None):
         """Create the main content area with AI-niform logo"""
         # Main content frame (white background)
-        content_frame = tk.Frame(self.main_frame, bg='white')
+        content_frame = tk.Frame(parent or self.main_frame, bg='white')
         content_frame.pack(side='left', fill='both', expand=True)
         
         # AI-niform logo (centered in white area)
@@ -3850,10 +3794,10 @@ class AINiformLogin:
         )
         niform_part.pack(side='left')
     
-    def create_special_pass_active_sidebar(self):
+    def create_special_pass_active_sidebar(self, parent=None):
         """Create the right sidebar with Special Pass details and user image"""
         # Blue sidebar (extends from top to bottom)
-        sidebar = tk.Frame(self.main_frame, bg='#4A90E2', width=300)
+        sidebar = tk.Frame(parent or self.main_frame, bg='#4A90E2', width=300)
         sidebar.pack(side='right', fill='y')
         sidebar.pack_propagate(False)
         
@@ -4019,6 +3963,7 @@ class AINiformLogin:
             fg='white'
         )
         guard_name_label.pack(anchor='w')
+        return sidebar
     
     def update_status_bar_for_special_pass_active(self):
         """Update status bar to show Log out button for Special Pass active interface"""
@@ -4089,18 +4034,8 @@ class AINiformLogin:
         
         # Write status to main screen status file to close turnstile
         try:
-            with open("main_screen_status.txt", "w") as f:
-                f.write("TURNSTILE_CLOSED\n")
-                f.write("N/A\n")
-                f.write("N/A\n")
-                f.write("N/A\n")
+            self.send_main_screen_status("TURNSTILE_CLOSED")
             print("Turnstile closed status sent to main screen")
-            
-            # Verify the file was written correctly
-            with open("main_screen_status.txt", "r") as f:
-                content = f.read()
-                print(f"Status file content written: {repr(content)}")
-                
         except Exception as e:
             print(f"Error writing status file: {e}")
         
@@ -4120,9 +4055,7 @@ def show_uniform_compliance_interface(self, person_data, detection_result):
     self.disable_logout_button()
     
     # Clear the main frame but keep header and status bar
-    for widget in self.main_frame.winfo_children():
-        if widget not in [self.status_frame]:
-            widget.destroy()
+    self.views.clear()
     
     # Embedded inline Approve/Deny UI (no external popup)
     # Render the compliance UI directly inside the guard screen
@@ -4566,44 +4499,16 @@ def update_status_bar_for_compliance(self):
 
 def handle_approve(self, person_data):
     """Handle approve action for clean uniform"""
-    # Launch guard confirmation window (approve-button.py). When it exits with
-    # a successful click, proceed to the approval splash for 5 seconds.
-    try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        approve_path = os.path.join(current_dir, "approve-button.py")
-        print("Launching guard approve/deny window...")
-        result = subprocess.run([sys.executable, approve_path], capture_output=True, text=True)
-        output = (result.stdout or "") + ("\n" + result.stderr if result.stderr else "")
-        print(output.strip())
-        if "Approve Button Clicked" in output:
-            # Notify main screen to show student/teacher info similar to special pass
-            try:
-                current_time = datetime.now().strftime("%I:%M:%S %p")
-                guard_name = self.current_guard['name'] if self.current_guard else "Unknown Guard"
-                person_name = person_data.get('name', 'Unknown')
-                person_role = person_data.get('role', 'USER')
-                with open("main_screen_status.txt", "w") as f:
-                    f.write("STUDENT_TEACHER_APPROVED\n")
-                    f.write(f"{person_name}\n")
-                    f.write(f"{person_role}\n")
-                    f.write(f"{current_time}\n")
-                    f.write(f"{guard_name}\n")
-            except Exception as _e:
-                print(f"Error writing student/teacher approved status: {_e}")
-            # Guard approved – show approval splash
-            self.show_approval_interface(person_data)
-        else:
-            # Treat deny or window close as denial
-            self.show_denial_message(person_data, "Access denied by guard.")
-    except Exception as e:
-        print(f"Error launching approve-button: {e}")
-        # Fallback straight to approval interface to avoid blocking operations
-        self.show_approval_interface(person_data)
+    # Ask the guard through the approve/deny window; the decision arrives
+    # asynchronously and approved entries get the approval splash.
+    self.request_guard_approval(person_data)
 
 def handle_deny_clean(self, person_data):
     """Handle deny action for clean uniform"""
+    self.cancel_guard_approval()
     # Add violation count
     self.add_violation(person_data['id'])
+    get_evidence_recorder().save("violation", reason="denied by guard (clean scan)", person_id=person_data['id'])
     
     # Show violation interface (Different/Incomplete Uniform Found)
     self.show_violation_interface(person_data)
@@ -4611,55 +4516,31 @@ def handle_deny_clean(self, person_data):
 def handle_manual_approve(self, person_data):
     """Handle approve action for manual verification"""
     # Same guard confirmation flow as clean approve
-    try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        approve_path = os.path.join(current_dir, "approve-button.py")
-        print("Launching guard approve/deny window (manual verification)...")
-        result = subprocess.run([sys.executable, approve_path], capture_output=True, text=True)
-        output = (result.stdout or "") + ("\n" + result.stderr if result.stderr else "")
-        print(output.strip())
-        if "Approve Button Clicked" in output:
-            # Notify main screen to show student/teacher info similar to special pass
-            try:
-                current_time = datetime.now().strftime("%I:%M:%S %p")
-                guard_name = self.current_guard['name'] if self.current_guard else "Unknown Guard"
-                person_name = person_data.get('name', 'Unknown')
-                person_role = person_data.get('role', 'USER')
-                with open("main_screen_status.txt", "w") as f:
-                    f.write("STUDENT_TEACHER_APPROVED\n")
-                    f.write(f"{person_name}\n")
-                    f.write(f"{person_role}\n")
-                    f.write(f"{current_time}\n")
-                    f.write(f"{guard_name}\n")
-            except Exception as _e:
-                print(f"Error writing student/teacher approved status: {_e}")
-            self.show_approval_interface(person_data)
-        else:
-            self.show_denial_message(person_data, "Access denied by guard.")
-    except Exception as e:
-        print(f"Error launching approve-button: {e}")
-        self.show_approval_interface(person_data)
+    self.request_guard_approval(person_data)
 
 def handle_manual_deny(self, person_data):
     """Handle deny action for manual verification"""
+    self.cancel_guard_approval()
     # Add violation count
     self.add_violation(person_data['id'])
+    get_evidence_recorder().save("violation", reason="denied by guard (manual verification)",
+                                 person_id=person_data['id'])
     
     # Show violation interface (Different/Incomplete Uniform Found)
     self.show_violation_interface(person_data)
 
 def handle_deny_violation(self, person_data):
     """Handle deny action for uniform violation"""
+    self.cancel_guard_approval()
     # No additional violation count for uniform violations
+    get_evidence_recorder().save("violation", reason="uniform violation", person_id=person_data['id'])
     # Show denial message for 5 seconds
     self.show_denial_message(person_data, "Access denied due to uniform violation.")
 
 def show_approval_interface(self, person_data):
     """Show approval interface for 5 seconds"""
     # Clear main content
-    for widget in self.main_frame.winfo_children():
-        if widget not in [self.status_frame]:
-            widget.destroy()
+    self.views.clear()
     
     # Create approval header (Turnstile is Open)
     self.create_approval_header()
@@ -4822,9 +4703,7 @@ def handle_deny_after_approval(self, person_data):
 def show_violation_interface(self, person_data):
     """Show violation interface (Different/Incomplete Uniform Found)"""
     # Clear main content
-    for widget in self.main_frame.winfo_children():
-        if widget not in [self.status_frame]:
-            widget.destroy()
+    self.views.clear()
     
     # Create violation header (Turnstile is Open)
     self.create_violation_header()
@@ -5012,9 +4891,7 @@ def close_violation_and_restore(self):
 def show_denial_message(self, person_data, reason):
     """Show denial message for 5 seconds"""
     # Clear main content
-    for widget in self.main_frame.winfo_children():
-        if widget not in [self.status_frame]:
-            widget.destroy()
+    self.views.clear()
     
     # Create denial header (Turnstile is Closed)
     self.create_compliance_header()
@@ -5148,9 +5025,7 @@ def show_no_object_splash(self):
         self.splash_camera_detector.cleanup()
     
     # Clear current splash content
-    for widget in self.main_frame.winfo_children():
-        if widget != self.status_frame:
-            widget.destroy()
+    self.views.clear()
     
     # Create header (Turnstile is Closed + Guard in-charge)
     self.create_splash_header()
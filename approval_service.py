@@ -0,0 +1,223 @@
+"""
+Warm guard approval window for the guard application.
+
+handle_approve / handle_manual_approve used to start approve-button.py with a
+blocking subprocess.run() for every approval: a new interpreter, a new
+QApplication and freshly built avatar pixmaps, with the Tk mainloop (and the
+camera feed) frozen until the guard clicked, and the answer found by
+searching stdout for "Approve Button Clicked".
+
+ApprovalService starts "approve-button.py --serve SOCKET" once per guard
+shift. The window stays built and hidden; request() sends an
+APPROVAL_REQUEST over the socket (status_bus.py framing) and returns
+immediately. The APPROVAL_DECISION arrives through a Tk file handler and
+the callback gets a structured result:
+
+    {'request_id': '3', 'decision': 'approve' | 'deny' | 'closed' | 'lost' | 'error',
+     'latency_ms': 1830.4, 'mode': 'service' | 'one-shot'}
+
+'lost' means the service died or dropped the socket while the request was on
+screen - no guard approved it, so the caller treats it as a denial. 'error'
+is only reported when the one-shot window could not be launched at all.
+
+If the service is not running (no Unix sockets, the process died, ...) the
+one-shot window is started instead and watched with root.after(), so the
+Tk loop never blocks either way.
+
+Only one request is on screen at a time. A new request() replaces the
+outstanding one (the server answers the old id with 'superseded', which is
+dropped here), and cancel() takes the window down when the guard leaves the
+compliance screen another way. A replaced or cancelled request never calls
+back.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+from status_bus import BUS_AVAILABLE, StatusBusClient
+
+APPROVE_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "approve-button.py")
+
+
+class ApprovalService:
+    def __init__(self, root, script_path=APPROVE_SCRIPT, socket_path=None):
+        """Approval window process driven from the Tk loop of root"""
+        self.root = root
+        self.script_path = script_path
+        self.socket_path = socket_path or os.path.join(tempfile.gettempdir(),
+                                                       f"ainiform_approval_{os.getpid()}.sock")
+        self.process = None
+        self.client = StatusBusClient(self.socket_path)
+        self.pending = {}
+        self.one_shots = {}
+        self.next_request_id = 0
+
+    @property
+    def ready(self):
+        return self.client.connected
+
+    def start(self):
+        """Pre-spawn the hidden approval window; returns False if it cannot run here"""
+        if not BUS_AVAILABLE:
+            return False
+        if self.process is not None and self.process.poll() is None:
+            return True
+        try:
+            self.process = subprocess.Popen([sys.executable, self.script_path, "--serve", self.socket_path])
+            print("Approval service starting...")
+        except Exception as e:
+            print(f"Error starting approval service: {e}")
+            self.process = None
+            return False
+        self.root.after(100, self._connect)
+        return True
+
+    def _connect(self):
+        """Wait for the service socket, then watch it from the Tk loop"""
+        if self.client.connected or self.process is None:
+            return
+        if self.process.poll() is not None:
+            print("Approval service exited during startup")
+            self.process = None
+            return
+        if not self.client.connect():
+            self.root.after(100, self._connect)
+            return
+        try:
+            self.root.tk.createfilehandler(self.client.sock, tk.READABLE, self._on_readable)
+            print("Approval service ready")
+        except Exception as e:
+            print(f"Approval service: cannot watch socket ({e}) - using one-shot window")
+            self.client.close()
+
+    def _disconnect(self):
+        """Stop watching the service socket"""
+        if self.client.connected:
+            try:
+                self.root.tk.deletefilehandler(self.client.sock)
+            except Exception:
+                pass
+            self.client.close()
+
+    def request(self, person_data, guard_name, callback):
+        """Ask the guard to approve; callback(result) runs later in the Tk loop"""
+        # The window shows one request: drop the outstanding one
+        self._forget_outstanding()
+        self.next_request_id += 1
+        request_id = str(self.next_request_id)
+        started = time.perf_counter()
+        fields = [request_id, person_data.get('name', 'Unknown'), person_data.get('role', 'USER'), guard_name]
+        if self.ready and self.client.send("APPROVAL_REQUEST", fields):
+            self.pending[request_id] = (callback, started)
+            return request_id
+
+        # Service not available: one-shot window now, warm service for the next approval
+        self._disconnect()
+        self.start()
+        self._run_one_shot(request_id, callback, started)
+        return request_id
+
+    def cancel(self):
+        """Take down the request on screen without a decision (no callback)"""
+        if not self.pending and not self.one_shots:
+            return
+        if self.pending and self.client.connected:
+            self.client.send("APPROVAL_CANCEL")
+        self._forget_outstanding()
+
+    def _forget_outstanding(self):
+        """Drop the callbacks of outstanding requests and close one-shot windows"""
+        for request_id in list(self.pending):
+            print(f"Approval request {request_id} dropped before a decision")
+        self.pending.clear()
+        for request_id, process in list(self.one_shots.items()):
+            print(f"Approval request {request_id} dropped before a decision")
+            try:
+                process.terminate()
+            except Exception as e:
+                print(f"Error closing approve-button: {e}")
+        self.one_shots.clear()
+
+    def _on_readable(self, sock, mask):
+        """Deliver decisions as soon as the guard clicks"""
+        events = self.client.receive()
+        if events is None:
+            print("Approval service connection lost")
+            self._disconnect()
+            for request_id, (callback, started) in list(self.pending.items()):
+                self._deliver(callback, request_id, "lost", started, "service")
+            self.pending.clear()
+            return
+        for event, fields, _stamp in events:
+            if event == "APPROVAL_DECISION" and len(fields) >= 2:
+                request_id, decision = fields[0], fields[1]
+                entry = self.pending.pop(request_id, None)
+                if entry is not None:
+                    self._deliver(entry[0], request_id, decision, entry[1], "service")
+
+    def _run_one_shot(self, request_id, callback, started):
+        """Fallback: start approve-button.py once and poll it without blocking"""
+        try:
+            process = subprocess.Popen([sys.executable, self.script_path],
+                                       stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        except Exception as e:
+            print(f"Error launching approve-button: {e}")
+            # Fail open only here: no approval window could be shown at all, so
+            # the guard never saw the request (same as the old subprocess.run
+            # launch failure). A window that was shown and then crashed reports
+            # 'lost' (service) or 'closed' (one-shot) and is denied instead.
+            self._deliver(callback, request_id, "error", started, "one-shot")
+            return
+
+        self.one_shots[request_id] = process
+
+        def _poll():
+            if process.poll() is None:
+                self.root.after(100, _poll)
+                return
+            output = process.communicate()[0] or ""
+            if self.one_shots.pop(request_id, None) is None:
+                # Replaced or cancelled while the window was up
+                return
+            print(output.strip())
+            if "Approve Button Clicked" in output:
+                decision = "approve"
+            elif "Deny Button Clicked" in output:
+                decision = "deny"
+            else:
+                decision = "closed"
+            self._deliver(callback, request_id, decision, started, "one-shot")
+
+        self.root.after(100, _poll)
+
+    def _deliver(self, callback, request_id, decision, started, mode):
+        """Call back with the structured decision"""
+        result = {
+            'request_id': request_id,
+            'decision': decision,
+            'latency_ms': round((time.perf_counter() - started) * 1000.0, 1),
+            'mode': mode,
+        }
+        print(f"Guard decision: {decision} ({result['latency_ms']} ms, {mode})")
+        try:
+            callback(result)
+        except Exception as e:
+            print(f"Error handling guard decision: {e}")
+
+    def stop(self):
+        """Close the approval window process (end of shift)"""
+        if self.client.connected:
+            self.client.send("QUIT")
+        self._disconnect()
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self.process.terminate()
+            except Exception as e:
+                print(f"Error stopping approval service: {e}")
+            self.process = None
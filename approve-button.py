@@ -9,13 +9,21 @@ This module builds a PyQt5 window that visually matches the provided design:
 Images expected (relative to this file):
 - image-elements/STI Balagtas Logo.png
 - image-elements/Generic User Image.jpg
+
+Run without arguments it shows one decision and exits, printing
+"Approve Button Clicked" / "Deny Button Clicked". With --serve SOCKET it
+stays running with the window built once and hidden, and answers
+APPROVAL_REQUEST events from the guard application (approval_service.py)
+with APPROVAL_DECISION events over the status bus framing.
 """
 
+import argparse
 import os
 import sys
 from datetime import datetime
+from typing import Callable, Optional
 
-from PyQt5.QtCore import Qt, QTimer, QSize
+from PyQt5.QtCore import Qt, QTimer, QSize, QSocketNotifier
 from PyQt5.QtGui import QFont, QPixmap, QPainter, QPainterPath, QColor, QGuiApplication
 from PyQt5.QtWidgets import (
     QApplication,
@@ -29,6 +37,8 @@ from PyQt5.QtWidgets import (
     QSizePolicy,
 )
 
+from status_bus import StatusBusServer, encode_event
+
 
 def resource_path(*relative_parts: str) -> str:
     """Return absolute path for resources next to this script.
@@ -57,6 +67,8 @@ class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("Approve / Deny")
+        # Set by ApprovalServer; None means one-shot mode (print and quit)
+        self.decision_callback: Optional[Callable[[str], None]] = None
         # Lock window to 1366x768 as requested
         self.setFixedSize(QSize(1366, 768))
 
@@ -207,17 +219,17 @@ class MainWindow(QMainWindow):
         vbox.addWidget(avatar_label, 0, Qt.AlignHCenter)
 
         # ID card title and role
-        id_title = QLabel("Test ID Card")
-        id_title.setAlignment(Qt.AlignCenter)
-        id_title.setStyleSheet("color: white;")
-        id_title.setFont(QFont("Arial", 24, QFont.Black))
-        vbox.addWidget(id_title)
-
-        role_label = QLabel("(Test User Role)")
-        role_label.setAlignment(Qt.AlignCenter)
-        role_label.setStyleSheet("color: white;")
-        role_label.setFont(QFont("Arial", 16))
-        vbox.addWidget(role_label)
+        self.id_title = QLabel("Test ID Card")
+        self.id_title.setAlignment(Qt.AlignCenter)
+        self.id_title.setStyleSheet("color: white;")
+        self.id_title.setFont(QFont("Arial", 24, QFont.Black))
+        vbox.addWidget(self.id_title)
+
+        self.role_label = QLabel("(Test User Role)")
+        self.role_label.setAlignment(Qt.AlignCenter)
+        self.role_label.setStyleSheet("color: white;")
+        self.role_label.setFont(QFont("Arial", 16))
+        vbox.addWidget(self.role_label)
 
         # Time Check-in
         self.checkin_label = QLabel("")
@@ -237,11 +249,11 @@ class MainWindow(QMainWindow):
         guard_title.setFont(QFont("Arial", 24, QFont.Black))
         vbox.addWidget(guard_title)
 
-        guard_name = QLabel("John Jason Domingo")
-        guard_name.setAlignment(Qt.AlignLeft)
-        guard_name.setStyleSheet("color: white;")
-        guard_name.setFont(QFont("Arial", 18))
-        vbox.addWidget(guard_name)
+        self.guard_name_label = QLabel("John Jason Domingo")
+        self.guard_name_label.setAlignment(Qt.AlignLeft)
+        self.guard_name_label.setStyleSheet("color: white;")
+        self.guard_name_label.setFont(QFont("Arial", 18))
+        vbox.addWidget(self.guard_name_label)
 
         return container
 
@@ -381,18 +393,45 @@ class MainWindow(QMainWindow):
         self.move(x, y)
 
     # ------------------- Actions -------------------
+    def show_request(self, person_name: str, person_role: str, guard_name: str) -> None:
+        """Fill in the person and guard and bring the (already built) window up."""
+        self.id_title.setText(person_name)
+        self.role_label.setText(f"({person_role})")
+        self.guard_name_label.setText(guard_name)
+        self.launch_time = datetime.now()
+        self.checkin_time_str = self._format_time(self.launch_time)
+        self.checkin_label.setText(f"Time Check-in: {self.checkin_time_str}")
+        self._update_time_and_date()
+        self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
     def _handle_approve(self) -> None:
+        if self.decision_callback is not None:
+            self.decision_callback("approve")
+            return
         print("Approve Button Clicked", flush=True)
         app = QApplication.instance()
         if app is not None:
             app.quit()
 
     def _handle_deny(self) -> None:
+        if self.decision_callback is not None:
+            self.decision_callback("deny")
+            return
         print("Deny Button Clicked", flush=True)
         app = QApplication.instance()
         if app is not None:
             app.quit()
 
+    def closeEvent(self, event) -> None:
+        if self.decision_callback is not None:
+            # Served window: closing it (or Log out) counts as a denial; keep it warm
+            event.ignore()
+            self.decision_callback("closed")
+            return
+        super().closeEvent(event)
+
     def _set_status_header(self, open_state: bool) -> None:
         if open_state:
             self.status_header.setStyleSheet("background-color: #2ECC71;")
@@ -415,9 +454,90 @@ class MainWindow(QMainWindow):
         layout.addWidget(label)
 
 
+class ApprovalServer:
+    """Keeps one hidden MainWindow and answers approval requests over a socket."""
+
+    def __init__(self, window: MainWindow, socket_path: str) -> None:
+        self.window = window
+        self.window.decision_callback = self._decide
+        self.bus = StatusBusServer(socket_path)
+        self.notifiers = {}
+        self.pending = None  # (client, request id) of the request on screen
+
+    def start(self) -> bool:
+        if not self.bus.start():
+            return False
+        self.listen_notifier = QSocketNotifier(self.bus.fileno(), QSocketNotifier.Read)
+        self.listen_notifier.activated.connect(self._accept)
+        return True
+
+    def _accept(self, _fd: int) -> None:
+        for client in self.bus.accept():
+            notifier = QSocketNotifier(client.fileno(), QSocketNotifier.Read)
+            notifier.activated.connect(lambda _fd, client=client: self._read(client))
+            self.notifiers[client] = notifier
+
+    def _read(self, client) -> None:
+        events = self.bus.read(client)
+        if events is None:
+            notifier = self.notifiers.pop(client, None)
+            if notifier is not None:
+                notifier.setEnabled(False)
+                notifier.deleteLater()
+            self.bus.drop(client)
+            if not self.bus.has_clients():
+                # The guard application is gone
+                QApplication.instance().quit()
+            return
+        for event, fields, _stamp in events:
+            if event == "APPROVAL_REQUEST" and len(fields) >= 4:
+                request_id, person_name, person_role, guard_name = fields[:4]
+                # Answer a request still on screen before showing the new one
+                self._answer("superseded")
+                self.pending = (client, request_id)
+                self.window.show_request(person_name, person_role, guard_name)
+            elif event == "APPROVAL_CANCEL":
+                self.pending = None
+                self.window.hide()
+            elif event == "QUIT":
+                QApplication.instance().quit()
+
+    def _decide(self, decision: str) -> None:
+        self.window.hide()
+        self._answer(decision)
+
+    def _answer(self, decision: str) -> None:
+        if self.pending is None:
+            return
+        client, request_id = self.pending
+        self.pending = None
+        try:
+            client.setblocking(True)
+            client.sendall(encode_event("APPROVAL_DECISION", [request_id, decision]))
+            client.setblocking(False)
+        except OSError as e:
+            print(f"Could not send approval decision: {e}", flush=True)
+
+    def close(self) -> None:
+        self.bus.close()
+
+
 def main() -> None:
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Guard approve/deny window")
+    parser.add_argument("--serve", metavar="SOCKET", default=None,
+                        help="Stay running and answer approval requests on this socket")
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication([sys.argv[0]] + qt_args)
     window = MainWindow()
+    if args.serve:
+        server = ApprovalServer(window, args.serve)
+        if not server.start():
+            sys.exit(1)
+        print("Approval service ready", flush=True)
+        code = app.exec_()
+        server.close()
+        sys.exit(code)
     window.show()
     sys.exit(app.exec_())
 
@@ -0,0 +1,235 @@
+"""
+In-process player for the card-tap beep.
+
+play_beep_sound used to start paplay / afplay for every RFID tap and keep a
+list of child processes to prune, so rapid tapping forked a process per tap
+on the Tk thread. AudioPlayer picks a backend once and plays the beep from a
+dedicated audio thread:
+
+    simpleaudio   (optional, any platform) the beep decoded once into memory,
+                  up to `voices` overlapping beeps; the oldest voice is cut
+                  when the pool is full
+    winsound      (Windows, stdlib) the SystemAsterisk sound, or the beep file
+                  from memory, one beep at a time
+    command       paplay (Linux) / afplay (macOS) started with one Popen from
+                  the audio thread, never waited for; finished players are
+                  reaped on the next beep
+
+play() only queues the request and returns False when no backend or audio
+device is available, so the caller can fall back to the system bell.
+The default beep is the platform's own sound (DEFAULT_BEEP_PATHS: the ALSA
+"Front_Left" sample on Linux, Ping.aiff on macOS, SystemAsterisk on
+Windows). simpleaudio only plays WAV; when the beep cannot be decoded the
+command player is preferred, and a synthesised tone is the last resort.
+"""
+
+import array
+import io
+import math
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import wave
+
+try:
+    import simpleaudio
+    SIMPLEAUDIO_AVAILABLE = True
+except ImportError:
+    SIMPLEAUDIO_AVAILABLE = False
+
+try:
+    import winsound
+    WINSOUND_AVAILABLE = True
+except ImportError:
+    WINSOUND_AVAILABLE = False
+
+DEFAULT_BEEP_PATHS = {
+    'linux': "/usr/share/sounds/alsa/Front_Left.wav",
+    'darwin': "/System/Library/Sounds/Ping.aiff",
+}
+DEFAULT_BEEP_PATH = DEFAULT_BEEP_PATHS.get(sys.platform)
+WINDOWS_BEEP_ALIAS = "SystemAsterisk"
+
+# Command-line players tried in order (the beep path is the only argument)
+PLATFORM_PLAYERS = {
+    'linux': ('paplay', 'aplay'),
+    'darwin': ('afplay',),
+}
+
+
+class Sound:
+    def __init__(self, frames, channels=1, sample_width=2, rate=44100):
+        """Decoded PCM samples"""
+        self.frames = frames
+        self.channels = channels
+        self.sample_width = sample_width
+        self.rate = rate
+
+    @classmethod
+    def from_wav(cls, path):
+        with wave.open(path, 'rb') as f:
+            return cls(f.readframes(f.getnframes()), f.getnchannels(), f.getsampwidth(), f.getframerate())
+
+    @classmethod
+    def tone(cls, frequency=1000, duration_ms=120, rate=44100, volume=0.5):
+        """16-bit mono sine beep with a short fade to avoid clicks"""
+        count = int(rate * duration_ms / 1000)
+        fade = max(1, int(rate * 0.005))
+        samples = array.array('h')
+        for i in range(count):
+            envelope = min(1.0, i / fade, (count - 1 - i) / fade)
+            samples.append(int(32767 * volume * envelope * math.sin(2 * math.pi * frequency * i / rate)))
+        return cls(samples.tobytes(), 1, 2, rate)
+
+    @classmethod
+    def silence(cls, duration_ms=10, rate=44100):
+        return cls(b'\x00\x00' * int(rate * duration_ms / 1000), 1, 2, rate)
+
+    def to_wav_bytes(self):
+        """The sound as an in-memory WAV file (for winsound.SND_MEMORY)"""
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as f:
+            f.setnchannels(self.channels)
+            f.setsampwidth(self.sample_width)
+            f.setframerate(self.rate)
+            f.writeframes(self.frames)
+        return buffer.getvalue()
+
+
+def load_beep(path=DEFAULT_BEEP_PATH):
+    """Decode the beep file once; None if it is missing or not a WAV"""
+    if path and os.path.exists(path):
+        try:
+            return Sound.from_wav(path)
+        except Exception as e:
+            print(f"Could not decode beep sound {path}: {e}")
+    return None
+
+
+def find_player_command():
+    """The first installed command-line player for this platform, or None"""
+    for command in PLATFORM_PLAYERS.get(sys.platform, ()):
+        path = shutil.which(command)
+        if path is not None:
+            return path
+    return None
+
+
+class AudioPlayer:
+    def __init__(self, path=DEFAULT_BEEP_PATH, voices=4):
+        """Beep player with its own audio thread and a small voice pool"""
+        self.voices = max(1, voices)
+        self.path = path
+        self.sound = load_beep(path)
+        self.command = None
+        self._wav_bytes = None
+        player_command = find_player_command() if path and os.path.exists(path) else None
+        if SIMPLEAUDIO_AVAILABLE and (self.sound is not None or player_command is None):
+            self.backend = 'simpleaudio'
+        elif WINSOUND_AVAILABLE:
+            self.backend = 'winsound'
+            if self.sound is not None:
+                self._wav_bytes = self.sound.to_wav_bytes()
+        elif player_command is not None:
+            # simpleaudio is not installed (or cannot play this file): hand the
+            # file to the platform player, as before, but from the audio thread
+            self.backend = 'command'
+            self.command = player_command
+        else:
+            self.backend = None
+        if self.sound is None:
+            self.sound = Sound.tone()
+        self._queue = queue.Queue()
+        self._thread = None
+        self._playing = []
+
+    @property
+    def available(self):
+        return self.backend is not None
+
+    def start(self):
+        """Start the audio thread and check that the device opens"""
+        if self.backend is None or (self._thread is not None and self._thread.is_alive()):
+            return self.available
+        self._thread = threading.Thread(target=self._run, name="audio-player", daemon=True)
+        self._thread.start()
+        # Probe the device with a few milliseconds of silence
+        if self.backend == 'simpleaudio':
+            self._queue.put(Sound.silence())
+        return True
+
+    def play(self):
+        """Queue one beep; False when there is nothing to play it on"""
+        if not self.start():
+            return False
+        if self._queue.qsize() >= self.voices:
+            # Taps faster than the device can start voices - coalesce
+            return True
+        self._queue.put(self.sound)
+        return True
+
+    def _run(self):
+        while True:
+            sound = self._queue.get()
+            if sound is None:
+                break
+            try:
+                self._play(sound)
+            except Exception as e:
+                print(f"Audio device not available ({e}) - using the system bell")
+                self.backend = None
+                break
+
+    def _play(self, sound):
+        if self.backend == 'simpleaudio':
+            self._playing = [voice for voice in self._playing if voice.is_playing()]
+            if len(self._playing) >= self.voices:
+                self._playing.pop(0).stop()
+            self._playing.append(simpleaudio.play_buffer(sound.frames, sound.channels,
+                                                         sound.sample_width, sound.rate))
+        elif self.backend == 'winsound':
+            # SND_MEMORY cannot be combined with SND_ASYNC; this thread waits instead of Tk
+            if self._wav_bytes is None:
+                winsound.PlaySound(WINDOWS_BEEP_ALIAS, winsound.SND_ALIAS | winsound.SND_NODEFAULT)
+            else:
+                winsound.PlaySound(self._wav_bytes, winsound.SND_MEMORY)
+        elif self.backend == 'command':
+            self._playing = [process for process in self._playing if process.poll() is None]
+            if len(self._playing) >= self.voices:
+                # Still busy with earlier taps - coalesce
+                return
+            self._playing.append(subprocess.Popen([self.command, self.path],
+                                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+
+    def stop(self):
+        """Stop the audio thread and any beep still playing"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=2)
+        self._thread = None
+        for voice in self._playing:
+            try:
+                if self.backend == 'simpleaudio':
+                    voice.stop()
+                else:
+                    # Let a command player finish its beep; just reap it
+                    voice.poll()
+            except Exception:
+                pass
+        self._playing = []
+
+
+_player = None
+_player_lock = threading.Lock()
+
+
+def get_audio_player():
+    """Process-wide beep player"""
+    global _player
+    with _player_lock:
+        if _player is None:
+            _player = AudioPlayer()
+        return _player
@@ -0,0 +1,133 @@
+"""
+Startup import profile for the guard application.
+
+Runs "python -X importtime -c 'import <module>'" in a fresh interpreter a few
+times and summarises the import-time report: total import time, the slowest
+top-level packages by cumulative time and the slowest single modules by self
+time. With --baseline the result is compared against an earlier run and the
+script exits with status 1 when the total grew by more than --max-regression,
+so the login startup cost can be tracked like any other benchmark.
+
+Example:
+    python bench_imports.py --output import_profile.json
+    python bench_imports.py --baseline import_profile.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+
+def parse_importtime(stderr):
+    """Parse -X importtime lines into (self_us, cumulative_us, depth, name) tuples"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue
+        name = fields[2].rstrip()
+        # One space after the bar, then two more per nesting level
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        entries.append((self_us, cumulative_us, depth, name.strip()))
+    return entries
+
+
+def profile_once(module):
+    """Import the module in a fresh interpreter; returns (entries, wall seconds)"""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        tail = [line for line in result.stderr.splitlines() if not line.startswith('import time:')][-3:]
+        raise RuntimeError(f"import {module} failed: {' / '.join(tail)}")
+    return parse_importtime(result.stderr), wall
+
+
+def summarise(entries, wall, top):
+    """Build the report for one run"""
+    total_us = sum(cumulative for _, cumulative, depth, _ in entries if depth == 0)
+    packages = {}
+    for self_us, cumulative, depth, name in entries:
+        if depth == 0:
+            root = name.split('.')[0]
+            packages[root] = packages.get(root, 0) + cumulative
+    slowest_packages = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    slowest_modules = sorted(entries, key=lambda entry: entry[0], reverse=True)[:top]
+    return {
+        'total_ms': round(total_us / 1000.0, 1),
+        'wall_ms': round(wall * 1000.0, 1),
+        'modules': len(entries),
+        'packages': [{'name': name, 'cumulative_ms': round(us / 1000.0, 1)} for name, us in slowest_packages],
+        'self_time': [{'name': name, 'self_ms': round(self_us / 1000.0, 1)}
+                      for self_us, _, _, name in slowest_modules],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile import time of the guard application')
+    parser.add_argument('--module', type=str, default='ai_niform_login',
+                       help='Module to import (default: ai_niform_login)')
+    parser.add_argument('--runs', type=int, default=3,
+                       help='Fresh-interpreter runs; the fastest is reported (default: 3)')
+    parser.add_argument('--top', type=int, default=15,
+                       help='Number of packages/modules to list (default: 15)')
+    parser.add_argument('--output', type=str, default=None,
+                       help='Write the report as JSON')
+    parser.add_argument('--baseline', type=str, default=None,
+                       help='Compare with an earlier JSON report')
+    parser.add_argument('--max-regression', type=float, default=0.2,
+                       help='Allowed growth of total import time vs. the baseline (default: 0.2 = 20%%)')
+
+    args = parser.parse_args()
+
+    runs = []
+    for index in range(args.runs):
+        try:
+            entries, wall = profile_once(args.module)
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(2)
+        runs.append(summarise(entries, wall, args.top))
+        print(f"Run {index + 1}: {runs[-1]['total_ms']} ms import, {runs[-1]['wall_ms']} ms wall")
+
+    report = min(runs, key=lambda run: run['total_ms'])
+    report['module'] = args.module
+    report['python'] = sys.version.split()[0]
+    report['runs'] = [run['total_ms'] for run in runs]
+
+    print("="*50)
+    print(f"import {args.module}: {report['total_ms']} ms ({report['modules']} modules)")
+    print("Slowest packages (cumulative):")
+    for package in report['packages']:
+        print(f"  {package['cumulative_ms']:>9.1f} ms  {package['name']}")
+    print("Slowest modules (self):")
+    for module in report['self_time']:
+        print(f"  {module['self_ms']:>9.1f} ms  {module['name']}")
+    print("="*50)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        change = (report['total_ms'] - baseline['total_ms']) / max(baseline['total_ms'], 1e-6)
+        print(f"Baseline {baseline['total_ms']} ms -> {report['total_ms']} ms ({change:+.1%})")
+        if change > args.max_regression:
+            print("Import time regression above the allowed limit")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Sweep torch CPU thread settings for the uniform detector on this host.
+
+Every configuration runs in a fresh process (torch only accepts thread counts
+once per process): load the model, optionally pin to a CPU set, warm up and
+time a fixed number of inferences. Energy comes from Intel RAPL
+(/sys/class/powercap/intel-rapl:*/energy_uj) when it is readable; otherwise
+CPU seconds used by the process are reported as the cost. The best
+frames/sec-per-watt (or frames per CPU-second) configuration is printed as a
+"runtime" section for detector_config.json.
+
+Example:
+    python bench_torch_threads.py --image sample.jpg --frames 60 --output bench_threads.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+def read_rapl_energy_uj():
+    """Sum of package energy counters in microjoules, or None if unavailable"""
+    total = 0
+    found = False
+    for path in glob.glob('/sys/class/powercap/intel-rapl:*/energy_uj'):
+        # Top-level packages only (intel-rapl:0, not intel-rapl:0:0)
+        if path.count(':') != 1:
+            continue
+        try:
+            with open(path, 'r') as f:
+                total += int(f.read().strip())
+            found = True
+        except (OSError, ValueError):
+            return None
+    return total if found else None
+
+
+def run_worker(args):
+    """Benchmark one configuration in this process and print a JSON line"""
+    from torch_runtime import configure_torch_runtime, pin_current_thread
+    configure_torch_runtime(args.intra, args.inter)
+    if args.cpus:
+        pin_current_thread(args.cpus)
+
+    import cv2
+    import numpy as np
+    from yolo_detection import YOLOCameraDetection
+
+    detector = YOLOCameraDetection(model_path=args.model, device='cpu', debug=False)
+    if not detector.load_model():
+        print(json.dumps({'error': f"could not load model {args.model}"}))
+        return
+    frame = cv2.imread(args.image) if args.image else None
+    if frame is None:
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    for _ in range(args.warmup):
+        detector.detect_objects(frame)
+
+    energy_start = read_rapl_energy_uj()
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    latencies = []
+    for _ in range(args.frames):
+        frame_start = time.perf_counter()
+        detector.detect_objects(frame)
+        latencies.append((time.perf_counter() - frame_start) * 1000.0)
+    elapsed = time.perf_counter() - start
+    cpu_seconds = time.process_time() - cpu_start
+    energy_end = read_rapl_energy_uj()
+
+    latencies.sort()
+    result = {
+        'intra_op_threads': args.intra,
+        'inter_op_threads': args.inter,
+        'inference_cpus': args.cpus,
+        'fps': round(args.frames / elapsed, 2),
+        'p50_ms': round(latencies[len(latencies) // 2], 2),
+        'p95_ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 2),
+        'cpu_seconds': round(cpu_seconds, 3),
+        'frames_per_cpu_second': round(args.frames / cpu_seconds, 2) if cpu_seconds > 0 else None,
+    }
+    if energy_start is not None and energy_end is not None and energy_end > energy_start:
+        watts = (energy_end - energy_start) / 1e6 / elapsed
+        result['watts'] = round(watts, 2)
+        result['fps_per_watt'] = round(result['fps'] / watts, 3)
+    print(json.dumps(result))
+
+
+def thread_counts(cpu_count):
+    """1, 2, 4, ... up to the number of CPUs"""
+    counts = []
+    count = 1
+    while count < cpu_count:
+        counts.append(count)
+        count *= 2
+    counts.append(cpu_count)
+    return counts
+
+
+def run_sweep(args):
+    """Run every configuration in a subprocess and recommend one"""
+    cpu_count = os.cpu_count() or 1
+    configs = []
+    for intra in thread_counts(cpu_count):
+        for inter in (1, 2):
+            configs.append((intra, inter, None))
+        if args.pin and intra < cpu_count:
+            # Keep the first cores free for the UI and the serial listener
+            configs.append((intra, 1, list(range(cpu_count - intra, cpu_count))))
+
+    results = []
+    for intra, inter, cpus in configs:
+        command = [sys.executable, os.path.abspath(__file__), '--worker', '--intra', str(intra),
+                   '--inter', str(inter), '--model', args.model, '--frames', str(args.frames),
+                   '--warmup', str(args.warmup)]
+        if args.image:
+            command += ['--image', args.image]
+        if cpus:
+            command += ['--cpus'] + [str(cpu) for cpu in cpus]
+        print(f"intra={intra} inter={inter} cpus={cpus} ...", end=' ', flush=True)
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=args.timeout)
+            lines = [line for line in output.stdout.splitlines() if line.startswith('{')]
+            result = json.loads(lines[-1]) if lines else {'error': output.stderr.strip()[-200:]}
+        except Exception as e:
+            result = {'error': str(e)}
+        result.setdefault('intra_op_threads', intra)
+        result.setdefault('inter_op_threads', inter)
+        result.setdefault('inference_cpus', cpus)
+        print(result.get('error') or f"{result['fps']} FPS")
+        results.append(result)
+
+    valid = [result for result in results if 'error' not in result]
+    if not valid:
+        print("No configuration completed")
+        return results, None
+
+    metric = 'fps_per_watt' if all('fps_per_watt' in result for result in valid) else 'frames_per_cpu_second'
+    best = max(valid, key=lambda result: result[metric] or 0)
+    recommendation = {
+        'metric': metric,
+        'runtime': {
+            'intra_op_threads': best['intra_op_threads'],
+            'inter_op_threads': best['inter_op_threads'],
+            'inference_cpus': best['inference_cpus'],
+            'inference_mode': True,
+        },
+        'fps': best['fps'],
+    }
+    print("="*50)
+    print(f"Best {metric}: {best[metric]} at {best['fps']} FPS")
+    print('"runtime": ' + json.dumps(recommendation['runtime']))
+    print("="*50)
+    return results, recommendation
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sweep torch thread settings for the uniform detector')
+    parser.add_argument('--model', type=str, default='best.pt',
+                       help='Path to YOLO model file (default: best.pt)')
+    parser.add_argument('--image', type=str, default=None,
+                       help='Frame to run on (default: a black 640x480 frame)')
+    parser.add_argument('--frames', type=int, default=50,
+                       help='Timed inferences per configuration (default: 50)')
+    parser.add_argument('--warmup', type=int, default=5,
+                       help='Untimed inferences before timing (default: 5)')
+    parser.add_argument('--pin', action='store_true',
+                       help='Also try pinning inference to the last N cores')
+    parser.add_argument('--timeout', type=float, default=600.0,
+                       help='Seconds allowed per configuration (default: 600)')
+    parser.add_argument('--output', type=str, default=None,
+                       help='Write all results and the recommendation as JSON')
+    # Internal: run a single configuration
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--intra', type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--inter', type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--cpus', type=int, nargs='*', default=None, help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args)
+        return
+
+    results, recommendation = run_sweep(args)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'cpu_count': os.cpu_count(), 'results': results,
+                       'recommendation': recommendation}, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
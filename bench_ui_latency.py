@@ -0,0 +1,384 @@
+"""
+Startup and screen-transition latency benchmark for the guard and main screens.
+
+Runs headless: the PyQt5 main screen uses the offscreen platform plugin and
+the Tk guard screen gets a private Xvfb display when no DISPLAY is set (Tk
+scenarios are reported as skipped when neither is available). Measured:
+
+    login_cold_start        python ai_niform_login.py until the login window is up
+    main_screen_cold_start  python testmainscreen.py until the window is shown
+    login_to_guard          show_guard_interface() after a guard login
+                            (the fixed 3 s "ACCESS GRANTED" delay is not included)
+    tap_to_splash           show_student_teacher_splash() until it is drawn
+    main_screen.show_*      every STIWelcomeScreen.show_* screen build
+
+Cold starts run the real scripts with AINIFORM_UI_MARKS set (see ui_marks.py)
+and time from launch to the mark. Transitions run in a worker process per
+toolkit with the main screen, approval window and camera launches stubbed on
+the instance, so nothing else is started. The screens record check-ins,
+check-outs and access log lines, so the workers run in a scratch directory
+holding copies of the data files and images (WORKSPACE_FILES); the tracked
+database.txt / visitors.txt / access_log.txt are never written. Each scenario is repeated and the
+median is reported. The JSON report carries the git commit; with --baseline
+every scenario is compared against an earlier report and the script exits
+with status 1 when one got slower by more than --max-regression.
+
+Do not run this next to a live gate: the cold starts use the real status file
+and data files.
+
+Example:
+    python bench_ui_latency.py --output ui_latency.json
+    python bench_ui_latency.py --baseline ui_latency.json
+"""
+
+import argparse
+import inspect
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# show_* argument values by parameter name
+SAMPLE_ARGUMENTS = {
+    'card_id': '0095277892',
+    'special_pass': 'SP-001',
+    'time_checkin': '08:15:02 AM',
+    'time_checkout': '04:30:10 PM',
+    'time_value': '08:15:02 AM',
+    'guard_name': 'Benchmark Guard',
+    'person_name': 'Bob Wilson',
+    'person_role': 'STUDENT',
+    'status': 'Invalid ID',
+}
+SAMPLE_PERSON = {'id': '0095277892', 'role': 'STUDENT', 'name': 'Bob Wilson',
+                 'status': 'ACTIVE', 'image_path': '', 'violation_count': 0}
+
+# Modal or interactive screens that would block the worker
+SKIPPED_SCREENS = {'show_developer_mode'}
+
+# Copied into the worker's scratch directory (the screens open them relative to the cwd)
+WORKSPACE_FILES = ('database.txt', 'visitors.txt', 'access_log.txt', 'violations.txt',
+                   'detector_config.json', 'image-elements', 'image-students', 'image-teachers')
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def first_person(role):
+    """The first database.txt entry with this role, read without logging an access"""
+    from database_manager import DatabaseManager
+    with open('database.txt', 'r') as f:
+        for line in f:
+            parts = line.strip().split(',')
+            if line.startswith('#') or len(parts) < 4:
+                continue
+            if parts[1] == role and parts[3] == 'ACTIVE':
+                return DatabaseManager().find_person(parts[0])
+    return None
+
+
+def run_qt_worker(args):
+    """Time every main screen build in this process and print a JSON line"""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtWidgets import QApplication
+    from testmainscreen import STIWelcomeScreen
+
+    app = QApplication([sys.argv[0]])
+    app.setStyle('Fusion')
+    window = STIWelcomeScreen()
+    window.show()
+    app.processEvents()
+
+    results = {}
+    for name, method in inspect.getmembers(window, inspect.ismethod):
+        if not name.startswith('show_') or name in SKIPPED_SCREENS:
+            continue
+        call_args = []
+        for parameter in inspect.signature(method).parameters.values():
+            if parameter.name == 'person':
+                call_args.append(dict(SAMPLE_PERSON))
+            else:
+                call_args.append(SAMPLE_ARGUMENTS.get(parameter.name, 'N/A'))
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            method(*call_args)
+            app.processEvents()
+            samples.append((time.perf_counter() - start) * 1000.0)
+            window.stop_all_timers()
+            window.reset_to_main_screen()
+            app.processEvents()
+        results[f'main_screen.{name}'] = round(median(samples), 2)
+
+    window.stop_all_timers()
+    if window.status_bus is not None:
+        window.status_bus.close()
+    print(json.dumps(results))
+
+
+def run_tk_worker(args):
+    """Time guard login and the student splash in this process and print a JSON line"""
+    import tkinter as tk
+    import ai_niform_login
+    from ai_niform_login import AINiformLogin
+
+    root = tk.Tk()
+    app = AINiformLogin(root)
+    root.update()
+
+    # Keep the benchmark to this process: no main screen, approval window or camera
+    app.launch_main_screen_window = lambda: None
+    app.check_main_screen_status = lambda: None
+    if not args.with_camera:
+        app.start_camera_session = lambda: None
+    app.approval_service = ai_niform_login.ApprovalService(root)
+    app.approval_service.start = lambda: False
+    ai_niform_login.ensure_vision_modules()
+
+    results = {}
+    guard = first_person('GUARD')
+    if guard is not None:
+        samples = []
+        for _ in range(args.repeat):
+            app.current_guard = guard
+            start = time.perf_counter()
+            app.show_guard_interface()
+            root.update()
+            samples.append((time.perf_counter() - start) * 1000.0)
+        results['login_to_guard'] = round(median(samples), 2)
+
+    person = first_person('STUDENT') or first_person('TEACHER')
+    if person is not None:
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            app.show_student_teacher_splash(person)
+            root.update()
+            samples.append((time.perf_counter() - start) * 1000.0)
+            app.close_splash_and_restore()
+            root.update()
+        results['tap_to_splash'] = round(median(samples), 2)
+
+    print(json.dumps(results))
+    sys.stdout.flush()
+    # Skip the Tk teardown: splash timers and the camera may still be live
+    os._exit(0)
+
+
+def start_display():
+    """Return (env, xvfb process, skip reason) for the Tk scenarios"""
+    env = dict(os.environ)
+    if env.get('DISPLAY'):
+        return env, None, None
+    xvfb = shutil.which('Xvfb')
+    if xvfb is None:
+        return env, None, "no DISPLAY and Xvfb is not installed"
+    display = f":{90 + os.getpid() % 100}"
+    process = subprocess.Popen([xvfb, display, '-screen', '0', '1366x768x24', '-nolisten', 'tcp'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(1.0)
+    if process.poll() is not None:
+        return env, None, "Xvfb failed to start"
+    env['DISPLAY'] = display
+    return env, process, None
+
+
+def time_cold_start(script, mark_name, env, timeout):
+    """Launch a script and return ms until it records mark_name"""
+    marks_fd, marks_path = tempfile.mkstemp(prefix='ainiform_marks_', suffix='.jsonl')
+    os.close(marks_fd)
+    env = dict(env, AINIFORM_UI_MARKS=marks_path)
+    start = time.time()
+    process = subprocess.Popen([sys.executable, os.path.join(BASE_DIR, script)], cwd=BASE_DIR, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.time() - start < timeout:
+            with open(marks_path, 'r') as f:
+                for line in f:
+                    record = json.loads(line)
+                    if record.get('mark') == mark_name:
+                        return round((record['time'] - start) * 1000.0, 1)
+            if process.poll() is not None:
+                raise RuntimeError(f"{script} exited with code {process.returncode}")
+            time.sleep(0.01)
+        raise RuntimeError(f"{script} did not reach {mark_name} within {timeout} s")
+    finally:
+        # SIGKILL: the close handlers would write MAIN_SCREEN_CLOSED to the status file
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        os.unlink(marks_path)
+
+
+def make_workspace():
+    """Scratch directory with copies of the data files the screens read and write"""
+    workspace = tempfile.mkdtemp(prefix='ainiform_bench_data_')
+    for name in WORKSPACE_FILES:
+        source = os.path.join(BASE_DIR, name)
+        if os.path.isdir(source):
+            shutil.copytree(source, os.path.join(workspace, name))
+        elif os.path.exists(source):
+            shutil.copy2(source, workspace)
+    # Model weights are only read (--with-camera): link them instead of copying
+    for name in os.listdir(BASE_DIR):
+        if name == 'models' or name.endswith(('.pt', '.onnx')):
+            try:
+                os.symlink(os.path.join(BASE_DIR, name), os.path.join(workspace, name))
+            except OSError as e:
+                print(f"Warning: cannot link {name} into the bench workspace: {e}")
+    return workspace
+
+
+def run_worker_process(toolkit, args, env):
+    """Run one worker in a scratch copy of the data files and return its JSON result"""
+    command = [sys.executable, os.path.abspath(__file__), '--worker', toolkit, '--repeat', str(args.repeat)]
+    if args.with_camera:
+        command.append('--with-camera')
+    workspace = make_workspace()
+    try:
+        output = subprocess.run(command, cwd=workspace, env=env, capture_output=True, text=True,
+                                timeout=args.timeout)
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+    for line in reversed(output.stdout.splitlines()):
+        if line.startswith('{'):
+            return json.loads(line)
+    tail = (output.stderr or output.stdout).strip().splitlines()[-3:]
+    raise RuntimeError(f"{toolkit} worker failed: {' / '.join(tail)}")
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run_benchmark(args):
+    """Run every scenario; returns the report"""
+    socket_dir = tempfile.mkdtemp(prefix='ainiform_bench_')
+    # Private status bus so a bench run never talks to a running gate
+    base_env = dict(os.environ, AINIFORM_STATUS_SOCKET=os.path.join(socket_dir, 'status.sock'))
+    qt_env = dict(base_env, QT_QPA_PLATFORM='offscreen')
+    tk_env, xvfb, tk_skip = start_display()
+    tk_env['AINIFORM_STATUS_SOCKET'] = base_env['AINIFORM_STATUS_SOCKET']
+
+    results = {}
+    skipped = {}
+    try:
+        cold_starts = [('main_screen_cold_start', 'testmainscreen.py', 'main_screen_shown', qt_env, None),
+                       ('login_cold_start', 'ai_niform_login.py', 'login_window_ready', tk_env, tk_skip)]
+        for name, script, mark_name, env, skip in cold_starts:
+            if skip:
+                skipped[name] = skip
+                continue
+            try:
+                samples = [time_cold_start(script, mark_name, env, args.timeout) for _ in range(args.repeat)]
+                results[name] = median(samples)
+                print(f"{name}: {results[name]} ms")
+            except RuntimeError as e:
+                skipped[name] = str(e)
+
+        for toolkit, env, skip in (('qt', qt_env, None), ('tk', tk_env, tk_skip)):
+            if skip:
+                skipped[f'{toolkit}_transitions'] = skip
+                continue
+            try:
+                worker_results = run_worker_process(toolkit, args, env)
+            except (RuntimeError, subprocess.TimeoutExpired) as e:
+                skipped[f'{toolkit}_transitions'] = str(e)
+                continue
+            for name, value in sorted(worker_results.items()):
+                print(f"{name}: {value} ms")
+            results.update(worker_results)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+        shutil.rmtree(socket_dir, ignore_errors=True)
+
+    for name, reason in skipped.items():
+        print(f"Skipped {name}: {reason}")
+    return {
+        'commit': git_commit(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'results_ms': results,
+        'skipped': skipped,
+    }
+
+
+def compare_with_baseline(report, baseline, max_regression):
+    """Print per-scenario changes; returns the names that regressed"""
+    regressions = []
+    for name, value in sorted(report['results_ms'].items()):
+        previous = baseline.get('results_ms', {}).get(name)
+        if previous is None:
+            continue
+        change = (value - previous) / max(previous, 1e-6)
+        flag = ""
+        if change > max_regression:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"  {name}: {previous} -> {value} ms ({change:+.1%}){flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Headless startup and screen-transition latency benchmark')
+    parser.add_argument('--repeat', type=int, default=3,
+                       help='Runs per scenario; the median is reported (default: 3)')
+    parser.add_argument('--timeout', type=float, default=120.0,
+                       help='Seconds before a cold start or worker is abandoned (default: 120)')
+    parser.add_argument('--with-camera', action='store_true',
+                       help='Open the real camera session in login_to_guard')
+    parser.add_argument('--output', type=str, default=None,
+                       help='Write the report as JSON')
+    parser.add_argument('--baseline', type=str, default=None,
+                       help='Compare with an earlier JSON report')
+    parser.add_argument('--max-regression', type=float, default=0.2,
+                       help='Allowed slowdown of any scenario vs. the baseline (default: 0.2 = 20%%)')
+    parser.add_argument('--worker', choices=['qt', 'tk'], default=None, help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.worker == 'qt':
+        run_qt_worker(args)
+        return
+    if args.worker == 'tk':
+        run_tk_worker(args)
+        return
+
+    report = run_benchmark(args)
+    if not report['results_ms']:
+        print("Error: no scenario could run here")
+        sys.exit(2)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        print(f"Baseline {baseline.get('commit')} -> {report['commit']}:")
+        regressions = compare_with_baseline(report, baseline, args.max_regression)
+        if regressions:
+            print(f"Latency regression above the allowed limit: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Persistent camera session for the guard screens.
+
+The capture device is opened once when the guard logs in and stays open for
+the whole shift. A background thread keeps the device streaming so the
+first frame after an RFID tap is already live (no warm-up, no dark frames).
+Screens do not own a cv2.VideoCapture anymore; they subscribe to the session
+and read the newest frame through a FrameSubscription, which mimics the
+small part of the VideoCapture API the detector uses (read/isOpened/release).
+
+If the device drops (USB unplugged, driver hiccup) the session releases it
+and keeps trying to reopen it in the background.
+
+Frame listeners (add_listener) are called on the capture thread with every
+decoded frame, e.g. to publish it to the main screen (shared_frames.py).
+They do not make the session decode frames on their own; frames are only
+decoded while a screen is subscribed.
+"""
+
+import threading
+import time
+
+import cv2
+
+
+class FrameSubscription:
+    """Read handle on a CameraSession (drop-in for cv2.VideoCapture.read)"""
+
+    def __init__(self, session):
+        self.session = session
+        self.last_seq = 0
+        self.active = True
+
+    def read(self):
+        """Return (ret, frame) with the newest frame from the session.
+
+        The frame is a private copy so callers may draw on it.
+        """
+        if not self.active:
+            return False, None
+        frame, seq = self.session.latest_frame()
+        if frame is None:
+            return False, None
+        self.last_seq = seq
+        return True, frame.copy()
+
+    def wait_for_frame(self, timeout=1.0):
+        """Block until a frame newer than the last one read is available"""
+        if not self.active:
+            return False, None
+        if self.session.wait_for_frame(self.last_seq, timeout):
+            return self.read()
+        return False, None
+
+    def isOpened(self):
+        """Mirror cv2.VideoCapture.isOpened()"""
+        return self.active and self.session.is_opened()
+
+    def release(self):
+        """Stop reading; the device itself stays open for other screens"""
+        if self.active:
+            self.active = False
+            self.session.unsubscribe(self)
+
+
+class CameraSession:
+    def __init__(self, camera_id=0, width=640, height=480, fps=30, reconnect_delay=1.0):
+        """Initialize a camera session (the device is opened by start())"""
+        self.camera_id = camera_id
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.reconnect_delay = reconnect_delay
+
+        self.cap = None
+        self.is_running = False
+        self.subscribers = []
+        self.listeners = []
+
+        self._thread = None
+        self._lock = threading.Lock()
+        self._frame_ready = threading.Condition(self._lock)
+        self._frame = None
+        self._frame_seq = 0
+        self._failed_reads = 0
+        self._last_frame_time = 0.0
+
+    def start(self):
+        """Start the capture thread if it is not already running"""
+        with self._lock:
+            if self.is_running:
+                return
+            self.is_running = True
+        self._thread = threading.Thread(target=self._capture_loop, name="camera-session", daemon=True)
+        self._thread.start()
+        print(f"Camera session started for camera {self.camera_id}")
+
+    def stop(self):
+        """Stop the capture thread and release the device"""
+        with self._lock:
+            if not self.is_running:
+                return
+            self.is_running = False
+            self._frame_ready.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        self._thread = None
+        if thread is None or not thread.is_alive():
+            self._release_device()
+        else:
+            # Still blocked in grab()/read(): releasing the device underneath it
+            # is unsafe, the loop releases it itself when the call returns
+            print(f"Camera session {self.camera_id}: capture thread did not stop in time - "
+                  f"device is released when it does")
+        with self._lock:
+            self._frame = None
+            for subscription in self.subscribers:
+                subscription.active = False
+            self.subscribers = []
+        print(f"Camera session stopped for camera {self.camera_id}")
+
+    def subscribe(self):
+        """Return a new FrameSubscription, starting the session if needed"""
+        self.start()
+        subscription = FrameSubscription(self)
+        with self._lock:
+            self.subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Forget a subscription (called by FrameSubscription.release)"""
+        with self._lock:
+            if subscription in self.subscribers:
+                self.subscribers.remove(subscription)
+
+    def add_listener(self, listener):
+        """Call listener(frame) for every decoded frame (on the capture thread)"""
+        with self._lock:
+            if listener not in self.listeners:
+                self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Stop calling a frame listener"""
+        with self._lock:
+            if listener in self.listeners:
+                self.listeners.remove(listener)
+
+    def latest_frame(self):
+        """Return (frame, sequence number) of the newest captured frame"""
+        with self._lock:
+            return self._frame, self._frame_seq
+
+    def wait_for_frame(self, after_seq=0, timeout=1.0):
+        """Wait until a frame with sequence > after_seq exists"""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            while self.is_running and self._frame_seq <= after_seq:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._frame_ready.wait(remaining)
+            return self._frame_seq > after_seq
+
+    def is_live(self, max_age=1.0):
+        """True if the device delivered a frame within the last max_age seconds"""
+        return self.is_opened() and time.monotonic() - self._last_frame_time <= max_age
+
+    def is_opened(self):
+        """True while the underlying device is open"""
+        cap = self.cap
+        return cap is not None and cap.isOpened()
+
+    def _open_device(self):
+        """Open the capture device and apply the capture settings"""
+        try:
+            cap = cv2.VideoCapture(self.camera_id)
+            if not cap.isOpened():
+                cap.release()
+                print(f"Error: Could not open camera {self.camera_id}")
+                return False
+
+            # Set camera properties once for the whole shift
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+            cap.set(cv2.CAP_PROP_FPS, self.fps)
+
+            self.cap = cap
+            self._failed_reads = 0
+            print(f"Camera {self.camera_id} opened by camera session")
+            return True
+        except Exception as e:
+            print(f"Error opening camera {self.camera_id}: {e}")
+            return False
+
+    def _release_device(self):
+        """Release the capture device if it is open"""
+        cap = self.cap
+        self.cap = None
+        if cap is not None:
+            try:
+                cap.release()
+            except Exception as e:
+                print(f"Error releasing camera {self.camera_id}: {e}")
+
+    def _capture_loop(self):
+        """Keep the device streaming and reconnect when it drops"""
+        while self.is_running:
+            if self.cap is None or not self.cap.isOpened():
+                self._release_device()
+                if not self._open_device():
+                    time.sleep(self.reconnect_delay)
+                    continue
+
+            with self._lock:
+                has_subscribers = bool(self.subscribers)
+
+            if has_subscribers:
+                ret, frame = self.cap.read()
+            else:
+                # Nobody is watching: grab() keeps the driver buffer fresh
+                # without paying for decoding the frame
+                ret, frame = self.cap.grab(), None
+
+            if not ret:
+                self._failed_reads += 1
+                if self._failed_reads >= self.fps:
+                    print(f"Camera {self.camera_id} stopped delivering frames - reconnecting...")
+                    self._release_device()
+                    with self._lock:
+                        self._frame = None
+                    time.sleep(self.reconnect_delay)
+                continue
+
+            self._failed_reads = 0
+            self._last_frame_time = time.monotonic()
+            with self._lock:
+                if frame is None:
+                    # Drop the stored frame so a new subscriber never
+                    # starts on a stale image; it gets the next read()
+                    self._frame = None
+                    continue
+                self._frame = frame
+                self._frame_seq += 1
+                self._frame_ready.notify_all()
+                listeners = list(self.listeners)
+
+            for listener in listeners:
+                try:
+                    listener(frame)
+                except Exception as e:
+                    print(f"Error in camera frame listener: {e}")
+
+        # The capture thread owns the device: release it here on the way out
+        self._release_device()
+
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_camera_session(camera_id=0, width=640, height=480, fps=30):
+    """Return the shared CameraSession for a camera id (settings apply on creation)"""
+    with _sessions_lock:
+        session = _sessions.get(camera_id)
+        if session is None:
+            session = CameraSession(camera_id, width=width, height=height, fps=fps)
+            _sessions[camera_id] = session
+        return session
+
+
+def shutdown_camera_sessions():
+    """Stop every shared camera session (end of shift / application exit)"""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.stop()
@@ -0,0 +1,81 @@
+"""
+Uniform compliance rules shared by the guard screen and offline tools.
+
+A student is in complete uniform when every required class is detected at
+least once in a frame. The splash screen turns a stream of per-frame
+detections into a decision with SplashComplianceVoter:
+
+- all required items in a frame          -> "clean" (keep scanning)
+- some, but not all, required items      -> "manual_verification" (stop)
+- no detections for no_detection_limit
+  consecutive frames (3 s at 30 FPS)     -> "manual_verification" (stop)
+"""
+
+REQUIRED_CLASSES = ('ict longsleeve', 'ict logo', 'black shoes', 'ict pants')
+
+RESULT_ENTRY_ACCESS = "ENTRY ACCESS"
+RESULT_MANUAL_VERIFICATION = "MANUAL VERIFICATION"
+
+DECISION_CLEAN = "clean"
+DECISION_MANUAL_VERIFICATION = "manual_verification"
+
+
+def count_classes(detections):
+    """Count detections per (lower-cased) class name"""
+    class_counts = {}
+    for detection in detections:
+        class_name = detection['class_name'].lower()
+        class_counts[class_name] = class_counts.get(class_name, 0) + 1
+    return class_counts
+
+
+def is_complete_uniform(class_counts, required_classes=REQUIRED_CLASSES):
+    """True if every required class was detected at least once"""
+    return all(class_counts.get(class_name, 0) >= 1 for class_name in required_classes)
+
+
+def compliance_result(detections, required_classes=REQUIRED_CLASSES):
+    """Per-frame result: ENTRY ACCESS or MANUAL VERIFICATION"""
+    if not detections:
+        return RESULT_MANUAL_VERIFICATION
+    if is_complete_uniform(count_classes(detections), required_classes):
+        return RESULT_ENTRY_ACCESS
+    return RESULT_MANUAL_VERIFICATION
+
+
+class SplashComplianceVoter:
+    def __init__(self, no_detection_limit=90, required_classes=REQUIRED_CLASSES):
+        """Frame-by-frame decision logic of the guard splash screen"""
+        self.no_detection_limit = no_detection_limit
+        self.required_classes = required_classes
+        self.reset()
+
+    def reset(self):
+        """Start a new scan"""
+        self.result = None
+        self.finished = False
+        self.no_detection_count = 0
+
+    def update(self, detections):
+        """Feed one frame of detections and return the current decision.
+
+        `finished` becomes True when the splash should stop scanning and
+        go straight to manual verification.
+        """
+        if self.finished:
+            return self.result
+
+        if detections:
+            self.no_detection_count = 0
+            if is_complete_uniform(count_classes(detections), self.required_classes):
+                self.result = DECISION_CLEAN
+            else:
+                self.result = DECISION_MANUAL_VERIFICATION
+                self.finished = True
+        else:
+            self.no_detection_count += 1
+            if self.no_detection_count >= self.no_detection_limit:
+                self.result = DECISION_MANUAL_VERIFICATION
+                self.finished = True
+
+        return self.result
@@ -0,0 +1,179 @@
+"""
+Windowed detection telemetry for the guard screens.
+
+Instead of printing a banner for every frame, the splash loop hands each
+frame's detections and inference time to DetectionTelemetry.record(). Frames
+are aggregated per window (window_seconds): frame count, empty frames,
+per-class counts and confidences, per-frame results and inference latency
+percentiles. At the end of a window one structured record is kept in an
+in-memory ring buffer (recent()) and, if a path is set, appended as one JSON
+line to the telemetry file. Rare events (scan decisions) go through event().
+
+Per-frame printouts are left to the detector's debug mode
+("debug" in detector_config.json).
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from compliance import REQUIRED_CLASSES, compliance_result
+from detector_config import get_detector_config
+
+
+class DetectionTelemetry:
+    def __init__(self, window_seconds=5.0, path=None, ring_size=256, max_bytes=5 * 1024 * 1024,
+                 required_classes=REQUIRED_CLASSES):
+        """Aggregate detections per window and emit one record per window"""
+        self.window_seconds = window_seconds
+        self.path = path
+        self.max_bytes = max_bytes
+        self.required_classes = required_classes
+        self.records = deque(maxlen=ring_size)
+        self._lock = threading.Lock()
+        self._reset_window(time.time())
+
+    def _reset_window(self, now):
+        """Start a new aggregation window"""
+        self.window_start = now
+        self.frames = 0
+        self.empty_frames = 0
+        self.class_stats = {}
+        self.results = {}
+        self.latencies_ms = []
+
+    def record(self, detections, latency_ms=None):
+        """Add one frame; emits the window record when the window is over"""
+        now = time.time()
+        with self._lock:
+            self.frames += 1
+            if not detections:
+                self.empty_frames += 1
+            seen = set()
+            for detection in detections:
+                class_name = detection['class_name'].lower()
+                stats = self.class_stats.setdefault(class_name, {
+                    'count': 0, 'frames': 0, 'conf_sum': 0.0, 'conf_min': 1.0, 'conf_max': 0.0,
+                })
+                confidence = detection['confidence']
+                stats['count'] += 1
+                stats['conf_sum'] += confidence
+                stats['conf_min'] = min(stats['conf_min'], confidence)
+                stats['conf_max'] = max(stats['conf_max'], confidence)
+                if class_name not in seen:
+                    stats['frames'] += 1
+                    seen.add(class_name)
+            result = compliance_result(detections, self.required_classes)
+            self.results[result] = self.results.get(result, 0) + 1
+            if latency_ms is not None:
+                self.latencies_ms.append(latency_ms)
+
+            if now - self.window_start < self.window_seconds:
+                return None
+            record = self._window_record(now)
+            self._reset_window(now)
+        self._emit(record)
+        return record
+
+    def flush(self):
+        """Emit the current (partial) window, e.g. when a scan ends"""
+        now = time.time()
+        with self._lock:
+            if self.frames == 0:
+                return None
+            record = self._window_record(now)
+            self._reset_window(now)
+        self._emit(record)
+        return record
+
+    def event(self, kind, **fields):
+        """Emit a one-off structured event (scan decision, errors, ...)"""
+        record = {'type': 'event', 'event': kind, 'time': _timestamp(time.time())}
+        record.update(fields)
+        self._emit(record)
+        return record
+
+    def recent(self, count=None):
+        """Return the newest records from the ring buffer"""
+        with self._lock:
+            records = list(self.records)
+        return records if count is None else records[-count:]
+
+    def _window_record(self, now):
+        """Build the record for the current window (caller holds the lock)"""
+        duration = max(now - self.window_start, 1e-6)
+        latencies = sorted(self.latencies_ms)
+        classes = {}
+        for class_name, stats in self.class_stats.items():
+            classes[class_name] = {
+                'count': stats['count'],
+                'frames': stats['frames'],
+                'conf_mean': round(stats['conf_sum'] / stats['count'], 3),
+                'conf_min': round(stats['conf_min'], 3),
+                'conf_max': round(stats['conf_max'], 3),
+            }
+        return {
+            'type': 'detection_window',
+            'start': _timestamp(self.window_start),
+            'end': _timestamp(now),
+            'frames': self.frames,
+            'fps': round(self.frames / duration, 2),
+            'empty_frames': self.empty_frames,
+            'classes': classes,
+            'results': dict(self.results),
+            'latency_ms': {
+                'p50': _percentile(latencies, 0.50),
+                'p95': _percentile(latencies, 0.95),
+                'max': round(latencies[-1], 2) if latencies else None,
+            },
+        }
+
+    def _emit(self, record):
+        """Keep the record in the ring buffer and append it to the file"""
+        with self._lock:
+            self.records.append(record)
+        if not self.path:
+            return
+        try:
+            if os.path.exists(self.path) and os.path.getsize(self.path) > self.max_bytes:
+                os.replace(self.path, self.path + '.1')
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(record) + "\n")
+        except Exception as e:
+            print(f"Error writing detection telemetry: {e}")
+
+
+def _timestamp(seconds):
+    return datetime.fromtimestamp(seconds).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
+def _percentile(ordered, fraction):
+    if not ordered:
+        return None
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))], 2)
+
+
+_telemetry = None
+_telemetry_lock = threading.Lock()
+
+
+def get_detection_telemetry():
+    """Return the shared telemetry channel configured by detector_config.json"""
+    global _telemetry
+    config = get_detector_config()
+    settings = config.get('telemetry')
+    with _telemetry_lock:
+        if _telemetry is None:
+            _telemetry = DetectionTelemetry(window_seconds=settings['window_seconds'],
+                                            path=settings['path'],
+                                            ring_size=settings['ring_size'],
+                                            required_classes=config.required_classes)
+        else:
+            # Follow config reloads
+            _telemetry.window_seconds = settings['window_seconds']
+            _telemetry.path = settings['path']
+            _telemetry.required_classes = config.required_classes
+        return _telemetry
@@ -0,0 +1,198 @@
+"""
+Detector configuration (detector_config.json).
+
+Gate tuning lives in one JSON file instead of constructor defaults and string
+literals spread over the detector and the splash screen:
+
+    {
+      "model_path": "best.pt",          weights file            (restart)
+      "backend": "pytorch",             key into "models"       (restart)
+      "models": {"pytorch": "best.pt", "onnx": "best.onnx"},
+      "device": null,                   "cpu", "0", ... or auto (restart)
+      "camera": {"camera_id": 0, "width": 640, "height": 480, "fps": 30},
+                                                                (restart)
+      "imgsz": 640,                     model input size        (live)
+      "confidence_threshold": 0.5,      default per-class threshold (live)
+      "class_thresholds": {"ict logo": 0.35},                   (live)
+      "required_classes": ["ict longsleeve", ...],              (live)
+      "no_detection_frames": 90,        empty frames before manual verification (live)
+      "frame_budget_ms": 33,            splash frame period     (live)
+      "telemetry": {"window_seconds": 5, "path": "detection_telemetry.jsonl", "ring_size": 256},
+                                        detection telemetry     (live)
+      "runtime": {"intra_op_threads": 2, ...},
+                                        torch threads/affinity, see torch_runtime.py (restart)
+      "model_registry": {"models_dir": "models", "poll_seconds": 10, ...},
+                                        hot-swapped weights, see model_registry.py (live)
+      "evidence": {"directory": "evidence", "frames_per_scan": 8, "max_megabytes": 500, ...},
+                                        violation snapshots, see evidence_recorder.py (live)
+      "debug": false                    per-frame printout      (live)
+    }
+
+DetectorConfig.reload_if_changed() re-reads the file when its mtime changes
+(checked at most every check_interval seconds), so "live" settings apply to
+the next frame without restarting the app or reloading the weights. A file
+that fails to parse is reported and the previous settings stay in effect.
+"""
+
+import json
+import os
+import threading
+import time
+
+from compliance import REQUIRED_CLASSES
+
+DEFAULT_CONFIG_PATH = 'detector_config.json'
+
+DEFAULTS = {
+    'model_path': 'best.pt',
+    'backend': 'pytorch',
+    'models': {},
+    'device': None,
+    'camera': {'camera_id': 0, 'width': 640, 'height': 480, 'fps': 30},
+    'imgsz': 640,
+    'confidence_threshold': 0.5,
+    'class_thresholds': {},
+    'required_classes': list(REQUIRED_CLASSES),
+    'no_detection_frames': 90,
+    'frame_budget_ms': 33,
+    'telemetry': {'window_seconds': 5.0, 'path': 'detection_telemetry.jsonl', 'ring_size': 256},
+    'runtime': {'intra_op_threads': None, 'inter_op_threads': None, 'inference_cpus': None, 'inference_mode': True},
+    'model_registry': {'models_dir': 'models', 'poll_seconds': 10.0, 'smoke_image': None,
+                       'max_smoke_ms': 5000, 'min_smoke_detections': 0},
+    'evidence': {'directory': 'evidence', 'frames_per_scan': 8, 'max_megabytes': 500, 'jpeg_quality': 85},
+    'debug': False,
+}
+
+# Settings that need the weights or the camera reopened
+RESTART_KEYS = ('model_path', 'backend', 'models', 'device', 'camera', 'runtime')
+
+
+class DetectorConfig:
+    def __init__(self, path=DEFAULT_CONFIG_PATH, check_interval=1.0):
+        """Load the detector configuration from a JSON file (defaults if missing)"""
+        self.path = path
+        self.check_interval = check_interval
+        self.values = dict(DEFAULTS)
+        self.version = 0
+        self._mtime = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+        self._started = False
+        self.load()
+        # Settings the process started with: restart keys are frozen from here on,
+        # whether or not the file existed, parsed or differed from the defaults
+        self._started = True
+
+    def load(self):
+        """(Re)read the file; returns True if the settings changed"""
+        mtime = None
+        try:
+            if not os.path.exists(self.path):
+                self._mtime = None
+                return False
+            mtime = os.path.getmtime(self.path)
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            values = self._validate(data)
+        except Exception as e:
+            print(f"Error loading detector config {self.path}: {e} - keeping previous settings")
+            if mtime is not None:
+                # Report a bad edit once; the next save gets a new mtime
+                with self._lock:
+                    self._mtime = mtime
+            return False
+
+        with self._lock:
+            self._mtime = mtime
+            if values == self.values:
+                return False
+            restart = [key for key in RESTART_KEYS if values[key] != self.values[key]]
+            if restart and self._started:
+                print(f"Detector config: {', '.join(restart)} changed - takes effect after restart")
+                for key in restart:
+                    values[key] = self.values[key]
+            self.values = values
+            self.version += 1
+        print(f"Detector config loaded from {self.path} (version {self.version})")
+        return True
+
+    def reload_if_changed(self):
+        """Cheap per-frame check: reload when the file's mtime changed"""
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return False
+        self._last_check = now
+        try:
+            mtime = os.path.getmtime(self.path) if os.path.exists(self.path) else None
+        except OSError:
+            return False
+        if mtime is None or mtime == self._mtime:
+            return False
+        return self.load()
+
+    def _validate(self, data):
+        """Merge a parsed file over the defaults and check the value types"""
+        if not isinstance(data, dict):
+            raise ValueError("top level must be an object")
+        unknown = set(data) - set(DEFAULTS)
+        if unknown:
+            print(f"Detector config: ignoring unknown keys {sorted(unknown)}")
+
+        values = dict(DEFAULTS)
+        values.update({key: value for key, value in data.items() if key in DEFAULTS})
+        values['camera'] = dict(DEFAULTS['camera'], **data.get('camera', {}))
+        values['telemetry'] = dict(DEFAULTS['telemetry'], **data.get('telemetry', {}))
+        values['telemetry']['window_seconds'] = max(0.1, float(values['telemetry']['window_seconds']))
+        values['runtime'] = dict(DEFAULTS['runtime'], **data.get('runtime', {}))
+        values['model_registry'] = dict(DEFAULTS['model_registry'], **data.get('model_registry', {}))
+        values['model_registry']['poll_seconds'] = max(1.0, float(values['model_registry']['poll_seconds']))
+        values['evidence'] = dict(DEFAULTS['evidence'], **data.get('evidence', {}))
+        values['evidence']['frames_per_scan'] = max(1, int(values['evidence']['frames_per_scan']))
+
+        if not 0.0 <= float(values['confidence_threshold']) <= 1.0:
+            raise ValueError("confidence_threshold must be between 0 and 1")
+        values['class_thresholds'] = {
+            str(name).lower(): float(threshold) for name, threshold in values['class_thresholds'].items()
+        }
+        for name, threshold in values['class_thresholds'].items():
+            if not 0.0 <= threshold <= 1.0:
+                raise ValueError(f"threshold for {name} must be between 0 and 1")
+        values['required_classes'] = [str(name).lower() for name in values['required_classes']]
+        if not values['required_classes']:
+            raise ValueError("required_classes must not be empty")
+        values['imgsz'] = int(values['imgsz'])
+        values['no_detection_frames'] = int(values['no_detection_frames'])
+        values['frame_budget_ms'] = max(1, int(values['frame_budget_ms']))
+        return values
+
+    def get(self, key):
+        """Return one setting"""
+        with self._lock:
+            return self.values[key]
+
+    @property
+    def model_path(self):
+        """Weights file for the configured backend"""
+        with self._lock:
+            return self.values['models'].get(self.values['backend'], self.values['model_path'])
+
+    @property
+    def required_classes(self):
+        return tuple(self.get('required_classes'))
+
+    def class_thresholds(self):
+        """Confidence threshold per class name (default for unlisted classes)"""
+        return dict(self.get('class_thresholds'))
+
+
+_config = None
+_config_lock = threading.Lock()
+
+
+def get_detector_config(path=DEFAULT_CONFIG_PATH):
+    """Return the shared DetectorConfig of the application"""
+    global _config
+    with _config_lock:
+        if _config is None or _config.path != path:
+            _config = DetectorConfig(path)
+        return _config
@@ -0,0 +1,351 @@
+"""
+Batch evaluation of the uniform model on a labeled dataset.
+
+Images are split into batches and spread over a process pool; every worker
+loads the YOLO model once and runs batched inference. Labels are standard
+YOLO txt files (one "class cx cy w h" line per box, normalized) with the same
+class ids as the model.
+
+Reports, for the four required uniform classes:
+- AP@0.5 (all-point interpolated) over all predictions
+- precision / recall at the operating confidence threshold
+and the end-to-end ENTRY ACCESS vs MANUAL VERIFICATION accuracy, using the
+same per-frame rule as the guard screen (compliance.compliance_result).
+
+Example:
+    python evaluate_model.py --images dataset/valid/images --model candidate.pt --workers 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+
+from compliance import REQUIRED_CLASSES, RESULT_ENTRY_ACCESS, RESULT_MANUAL_VERIFICATION, compliance_result
+from detector_config import DEFAULT_CONFIG_PATH, DetectorConfig
+from torch_runtime import configure_torch_runtime
+from yolo_detection import YOLOCameraDetection, box_iou
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+IOU_THRESHOLD = 0.5
+
+# Detector of the current worker process (loaded once by _init_worker)
+_worker_detector = None
+
+
+def _init_worker(model_path, device, confidence, threads, roi=None, config_path=DEFAULT_CONFIG_PATH):
+    """Load the model once per worker process"""
+    global _worker_detector
+    configure_torch_runtime(intra_op_threads=threads, inter_op_threads=1)
+    _worker_detector = YOLOCameraDetection(model_path=model_path, confidence_threshold=confidence,
+                                           device=device, debug=False, config=DetectorConfig(config_path))
+    if roi is not None:
+        # Two-stage person-crop detection (see roi_detection.py)
+        from roi_detection import PersonROIDetector
+        _worker_detector = PersonROIDetector(_worker_detector, **roi)
+    if not _worker_detector.load_model():
+        raise RuntimeError(f"Could not load model {model_path}")
+
+
+def _evaluate_batch(items):
+    """Worker task: detect on a batch of (image path, label path) pairs"""
+    frames = []
+    loaded = []
+    for image_path, label_path in items:
+        frame = cv2.imread(image_path)
+        if frame is None:
+            print(f"Warning: could not read image {image_path}", file=sys.stderr)
+            continue
+        frames.append(frame)
+        loaded.append((image_path, label_path, frame.shape[1], frame.shape[0]))
+
+    person_frames = getattr(_worker_detector, 'person_frames', 0)
+    start = time.perf_counter()
+    batch_detections = _worker_detector.detect_batch(frames)
+    detect_ms = (time.perf_counter() - start) * 1000.0
+    person_frames = getattr(_worker_detector, 'person_frames', 0) - person_frames
+
+    records = []
+    for (image_path, label_path, width, height), detections in zip(loaded, batch_detections):
+        records.append({
+            'image': image_path,
+            'predictions': detections,
+            'labels': read_labels(label_path, width, height),
+        })
+    return records, dict(_worker_detector.model.names), detect_ms, person_frames
+
+
+def read_labels(label_path, width, height):
+    """Read a YOLO txt label file into (class_id, (x1, y1, x2, y2)) boxes in pixels"""
+    labels = []
+    if not os.path.exists(label_path):
+        return labels
+    with open(label_path, 'r') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 5:
+                continue
+            class_id = int(float(parts[0]))
+            cx, cy, w, h = (float(value) for value in parts[1:5])
+            labels.append((class_id, (
+                (cx - w / 2) * width, (cy - h / 2) * height,
+                (cx + w / 2) * width, (cy + h / 2) * height,
+            )))
+    return labels
+
+
+def find_dataset(images_dir, labels_dir=None):
+    """Return (image path, label path) pairs; labels default to the sibling labels/ directory"""
+    if labels_dir is None:
+        parent, name = os.path.split(os.path.normpath(images_dir))
+        labels_dir = os.path.join(parent, 'labels') if name == 'images' else images_dir
+    pairs = []
+    for name in sorted(os.listdir(images_dir)):
+        if name.lower().endswith(IMAGE_EXTENSIONS):
+            stem = os.path.splitext(name)[0]
+            pairs.append((os.path.join(images_dir, name), os.path.join(labels_dir, stem + '.txt')))
+    return pairs
+
+
+def match_predictions(predictions, ground_truth):
+    """Greedy IoU>=0.5 matching by confidence; returns [(confidence, is_true_positive)]"""
+    matched = [False] * len(ground_truth)
+    scored = []
+    for prediction in sorted(predictions, key=lambda p: p['confidence'], reverse=True):
+        best_iou, best_index = 0.0, -1
+        for index, box in enumerate(ground_truth):
+            if matched[index]:
+                continue
+            overlap = box_iou(prediction['bbox'], box)
+            if overlap > best_iou:
+                best_iou, best_index = overlap, index
+        if best_iou >= IOU_THRESHOLD:
+            matched[best_index] = True
+            scored.append((prediction['confidence'], True))
+        else:
+            scored.append((prediction['confidence'], False))
+    return scored
+
+
+def average_precision(scored, total_ground_truth):
+    """All-point interpolated AP from [(confidence, is_true_positive)]"""
+    if total_ground_truth == 0:
+        return None
+    scored = sorted(scored, key=lambda item: item[0], reverse=True)
+    precisions, recalls = [], []
+    true_positives = 0
+    for rank, (_, is_true_positive) in enumerate(scored, start=1):
+        true_positives += is_true_positive
+        precisions.append(true_positives / rank)
+        recalls.append(true_positives / total_ground_truth)
+
+    # Make precision monotonically decreasing, then integrate over recall
+    for index in range(len(precisions) - 2, -1, -1):
+        precisions[index] = max(precisions[index], precisions[index + 1])
+    ap = 0.0
+    previous_recall = 0.0
+    for precision, recall in zip(precisions, recalls):
+        ap += (recall - previous_recall) * precision
+        previous_recall = recall
+    return ap
+
+
+class ModelEvaluation:
+    def __init__(self, confidence_threshold=0.5, required_classes=REQUIRED_CLASSES, class_thresholds=None):
+        """Accumulate per-class and end-to-end results image by image"""
+        self.confidence_threshold = confidence_threshold
+        self.required_classes = required_classes
+        self.class_thresholds = class_thresholds or {}
+        self.scored = {class_name: [] for class_name in required_classes}
+        self.ground_truth = {class_name: 0 for class_name in required_classes}
+        self.true_positives = {class_name: 0 for class_name in required_classes}
+        self.predicted = {class_name: 0 for class_name in required_classes}
+        self.confusion = {}
+        self.images = 0
+
+    def add(self, record, names):
+        """Add one image: predictions, labels and the model's class names"""
+        self.images += 1
+        predictions = record['predictions']
+        labels = [{'class_name': names.get(class_id, str(class_id)), 'bbox': box}
+                  for class_id, box in record['labels']]
+
+        for class_name in self.required_classes:
+            class_predictions = [p for p in predictions if p['class_name'].lower() == class_name]
+            class_labels = [label['bbox'] for label in labels if label['class_name'].lower() == class_name]
+            self.ground_truth[class_name] += len(class_labels)
+            self.scored[class_name].extend(match_predictions(class_predictions, class_labels))
+
+            # Precision/recall at the threshold the gate actually runs with
+            operating = [p for p in class_predictions if p['confidence'] >= self.threshold_for(class_name)]
+            self.predicted[class_name] += len(operating)
+            self.true_positives[class_name] += sum(
+                1 for _, is_true_positive in match_predictions(operating, class_labels) if is_true_positive
+            )
+
+        operating_predictions = [p for p in predictions if p['confidence'] >= self.threshold_for(p['class_name'])]
+        expected = compliance_result(labels, self.required_classes)
+        actual = compliance_result(operating_predictions, self.required_classes)
+        key = (expected, actual)
+        self.confusion[key] = self.confusion.get(key, 0) + 1
+
+    def threshold_for(self, class_name):
+        """Operating confidence threshold for one class"""
+        return self.class_thresholds.get(class_name.lower(), self.confidence_threshold)
+
+    def report(self):
+        """Return the evaluation results as a dict"""
+        classes = {}
+        for class_name in self.required_classes:
+            ap = average_precision(self.scored[class_name], self.ground_truth[class_name])
+            predicted = self.predicted[class_name]
+            ground_truth = self.ground_truth[class_name]
+            true_positives = self.true_positives[class_name]
+            classes[class_name] = {
+                'ap50': round(ap, 4) if ap is not None else None,
+                'precision': round(true_positives / predicted, 4) if predicted else None,
+                'recall': round(true_positives / ground_truth, 4) if ground_truth else None,
+                'labels': ground_truth,
+            }
+
+        ap_values = [result['ap50'] for result in classes.values() if result['ap50'] is not None]
+        correct = sum(count for (expected, actual), count in self.confusion.items() if expected == actual)
+        outcomes = (RESULT_ENTRY_ACCESS, RESULT_MANUAL_VERIFICATION)
+        return {
+            'images': self.images,
+            'confidence_threshold': self.confidence_threshold,
+            'class_thresholds': self.class_thresholds,
+            'classes': classes,
+            'map50': round(sum(ap_values) / len(ap_values), 4) if ap_values else None,
+            'decision_accuracy': round(correct / self.images, 4) if self.images else None,
+            # expected -> actual
+            'decision_confusion': {
+                expected: {actual: self.confusion.get((expected, actual), 0) for actual in outcomes}
+                for expected in outcomes
+            },
+        }
+
+
+def print_report(report):
+    """Print the evaluation results as a table"""
+    print("="*60)
+    print(f"MODEL EVALUATION - {report['images']} images (conf >= {report['confidence_threshold']})")
+    print("="*60)
+    print(f"{'class':<16}{'AP@0.5':>10}{'precision':>12}{'recall':>10}{'labels':>10}")
+    for class_name, result in report['classes'].items():
+        values = [result['ap50'], result['precision'], result['recall']]
+        ap, precision, recall = ("-" if value is None else f"{value:.3f}" for value in values)
+        print(f"{class_name:<16}{ap:>10}{precision:>12}{recall:>10}{result['labels']:>10}")
+    print(f"\nmAP@0.5 = {report['map50']}")
+    print(f"Decision accuracy (ENTRY ACCESS vs MANUAL VERIFICATION) = {report['decision_accuracy']}")
+    for expected, row in report['decision_confusion'].items():
+        print(f"  expected {expected}: {row}")
+    print(f"\nThroughput = {report['throughput_ips']} images/s "
+          f"({report['workers']} workers, batch {report['batch_size']})")
+    print(f"Detection time = {report['detect_ms_per_image']} ms/image per worker")
+    if report.get('roi'):
+        print(f"ROI: person found in {report['person_rate']:.1%} of images ({report['roi']})")
+    print("="*60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Evaluate the uniform model on a YOLO-labeled dataset')
+    parser.add_argument('--images', type=str, required=True,
+                       help='Directory of dataset images')
+    parser.add_argument('--labels', type=str, default=None,
+                       help='Directory of YOLO txt labels (default: sibling labels/ directory)')
+    parser.add_argument('--config', type=str, default=DEFAULT_CONFIG_PATH,
+                       help=f'Detector config with the operating thresholds (default: {DEFAULT_CONFIG_PATH})')
+    parser.add_argument('--model', type=str, default=None,
+                       help='Path to YOLO model file (default: from the config)')
+    parser.add_argument('--confidence', type=float, default=None,
+                       help='One operating threshold for all classes (default: per-class from the config)')
+    parser.add_argument('--min-confidence', type=float, default=0.001,
+                       help='Lowest confidence kept for AP (default: 0.001)')
+    parser.add_argument('--device', type=str, default='cpu',
+                       help='Inference device (default: cpu)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                       help='Worker processes (default: number of CPUs)')
+    parser.add_argument('--batch-size', type=int, default=16,
+                       help='Images per inference batch (default: 16)')
+    parser.add_argument('--output', type=str, default=None,
+                       help='Also write the report as JSON to this file')
+    parser.add_argument('--roi', action='store_true',
+                       help='Detect on upscaled person crops (two-stage)')
+    parser.add_argument('--person-model', type=str, default='yolov8n.pt',
+                       help='Person localization model for --roi (default: yolov8n.pt)')
+    parser.add_argument('--split-body', action='store_true',
+                       help='With --roi, detect on separate upper/lower body crops')
+
+    args = parser.parse_args()
+
+    pairs = find_dataset(args.images, args.labels)
+    if not pairs:
+        print(f"Error: no images found in {args.images}", file=sys.stderr)
+        sys.exit(1)
+
+    workers = max(1, args.workers)
+    # Split the cores between workers so they do not oversubscribe the CPU
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    batches = [pairs[i:i + args.batch_size] for i in range(0, len(pairs), args.batch_size)]
+    print(f"Evaluating {len(pairs)} images in {len(batches)} batches on {workers} workers...")
+
+    roi = None
+    if args.roi:
+        roi = {'person_model_path': args.person_model, 'split_body': args.split_body}
+
+    config = DetectorConfig(args.config)
+    model_path = args.model or config.model_path
+    if args.confidence is not None:
+        evaluation = ModelEvaluation(confidence_threshold=args.confidence,
+                                     required_classes=config.required_classes)
+    else:
+        evaluation = ModelEvaluation(confidence_threshold=config.get('confidence_threshold'),
+                                     required_classes=config.required_classes,
+                                     class_thresholds=config.class_thresholds())
+    detect_ms = 0.0
+    person_frames = 0
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(model_path, args.device, args.min_confidence, threads, roi,
+                                           args.config)) as executor:
+            for done, (records, names, batch_ms, batch_people) in enumerate(executor.map(_evaluate_batch, batches),
+                                                                            start=1):
+                for record in records:
+                    evaluation.add(record, names)
+                detect_ms += batch_ms
+                person_frames += batch_people
+                if done % 10 == 0 or done == len(batches):
+                    print(f"  {done}/{len(batches)} batches")
+    except Exception as e:
+        print(f"Error during evaluation: {e}", file=sys.stderr)
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    report = evaluation.report()
+    report.update({
+        'model': model_path,
+        'workers': workers,
+        'batch_size': args.batch_size,
+        'elapsed_s': round(elapsed, 2),
+        'throughput_ips': round(len(pairs) / elapsed, 2) if elapsed > 0 else 0.0,
+        'detect_ms_per_image': round(detect_ms / len(pairs), 2),
+        'roi': roi,
+    })
+    if roi is not None:
+        report['person_rate'] = round(person_frames / len(pairs), 4)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Image evidence for uniform violations.
+
+During a scan the splash loop hands every annotated frame to
+EvidenceRecorder.add_frame(), which keeps only the last frames_per_scan of
+them in a ring buffer (references to the per-frame copies, no encoding).
+When a scan ends in a violation or a manual decision, save() snapshots the
+ring and a background thread JPEG-encodes the frames into
+
+    <directory>/<scan id>/00.jpg, 01.jpg, ...
+
+and appends one line per decision to <directory>/manifest.jsonl (scan id,
+person id, decision, reason, files, detections). After every write the
+oldest scan folders are removed until the directory fits in max_megabytes,
+so disputes can be checked later without blocking the UI or filling the
+disk. Settings come from the "evidence" section of detector_config.json.
+"""
+
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+import cv2
+
+from detector_config import get_detector_config
+
+MANIFEST_NAME = 'manifest.jsonl'
+
+
+class EvidenceRecorder:
+    def __init__(self, directory='evidence', frames_per_scan=8, max_megabytes=500, jpeg_quality=85):
+        """Keep the last frames of the current scan and write them on request"""
+        self.directory = directory
+        self.frames_per_scan = frames_per_scan
+        self.max_megabytes = max_megabytes
+        self.jpeg_quality = jpeg_quality
+
+        self.frames = deque(maxlen=frames_per_scan)
+        self.scan_id = None
+        self.person_id = None
+        self.saved_files = None
+
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def begin_scan(self, person_id):
+        """Start a new scan; frames of the previous scan are dropped"""
+        with self._lock:
+            if self.frames.maxlen != self.frames_per_scan:
+                self.frames = deque(maxlen=self.frames_per_scan)
+            else:
+                self.frames.clear()
+            self.person_id = person_id
+            self.scan_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')[:-3]}_{person_id}"
+            self.saved_files = None
+
+    def add_frame(self, frame, detections):
+        """Keep an annotated frame (a private copy owned by the caller's loop)"""
+        if frame is None or self.scan_id is None:
+            return
+        with self._lock:
+            self.frames.append((time.time(), frame, detections))
+
+    def save(self, decision, reason=None, person_id=None):
+        """Queue the current scan's frames for writing; returns the scan id or None"""
+        with self._lock:
+            if self.scan_id is None:
+                return None
+            entry = {
+                'scan_id': self.scan_id,
+                'person_id': person_id if person_id is not None else self.person_id,
+                'decision': decision,
+                'reason': reason,
+                'time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            if self.saved_files is not None:
+                # Second decision for the same scan (e.g. manual deny): link the same images
+                frames = []
+                entry['files'] = self.saved_files
+            else:
+                frames = list(self.frames)
+                self.saved_files = [os.path.join(self.scan_id, f"{index:02d}.jpg") for index in range(len(frames))]
+                entry['files'] = self.saved_files
+            entry['detections'] = [
+                [{'class_name': d['class_name'], 'confidence': round(d['confidence'], 3)} for d in detections]
+                for _, _, detections in frames
+            ]
+        self._ensure_writer()
+        self._queue.put((entry, frames))
+        return entry['scan_id']
+
+    def _ensure_writer(self):
+        """Start the background writer on first use"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._write_loop, name="evidence-writer", daemon=True)
+            self._thread.start()
+
+    def _write_loop(self):
+        """Encode and write queued scans until stop() sends None"""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            entry, frames = job
+            try:
+                self._write(entry, frames)
+                self._enforce_quota(keep=entry['scan_id'])
+            except Exception as e:
+                print(f"Error writing violation evidence: {e}")
+
+    def _write(self, entry, frames):
+        """JPEG-encode the frames and append the manifest line"""
+        os.makedirs(self.directory, exist_ok=True)
+        if frames:
+            os.makedirs(os.path.join(self.directory, entry['scan_id']), exist_ok=True)
+        params = [int(cv2.IMWRITE_JPEG_QUALITY), int(self.jpeg_quality)]
+        for name, (_, frame, _) in zip(entry['files'], frames):
+            ok, encoded = cv2.imencode('.jpg', frame, params)
+            if ok:
+                with open(os.path.join(self.directory, name), 'wb') as f:
+                    f.write(encoded.tobytes())
+        if frames:
+            entry['frame_times'] = [datetime.fromtimestamp(t).strftime("%H:%M:%S.%f")[:-3] for t, _, _ in frames]
+        with open(os.path.join(self.directory, MANIFEST_NAME), 'a') as f:
+            f.write(json.dumps(entry) + "\n")
+        print(f"Violation evidence saved: {entry['scan_id']} ({len(frames)} frames, {entry['decision']})")
+
+    def _enforce_quota(self, keep=None):
+        """Delete the oldest scan folders until the directory fits the quota"""
+        limit = self.max_megabytes * 1024 * 1024
+        scans = []
+        total = 0
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if not os.path.isdir(path):
+                continue
+            size = sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+            scans.append((os.path.getmtime(path), name, size))
+            total += size
+        for _, name, size in sorted(scans):
+            if total <= limit:
+                break
+            if name == keep:
+                continue
+            shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+            total -= size
+            print(f"Evidence quota: removed {name}")
+
+    def stop(self):
+        """Finish queued writes and stop the writer"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5.0)
+        self._thread = None
+
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+
+def get_evidence_recorder():
+    """Return the shared recorder configured by detector_config.json"""
+    global _recorder
+    settings = get_detector_config().get('evidence')
+    with _recorder_lock:
+        if _recorder is None:
+            _recorder = EvidenceRecorder(directory=settings['directory'],
+                                         frames_per_scan=settings['frames_per_scan'],
+                                         max_megabytes=settings['max_megabytes'],
+                                         jpeg_quality=settings['jpeg_quality'])
+        else:
+            # Follow config reloads (the directory is fixed for the session)
+            _recorder.frames_per_scan = settings['frames_per_scan']
+            _recorder.max_megabytes = settings['max_megabytes']
+            _recorder.jpeg_quality = settings['jpeg_quality']
+        return _recorder
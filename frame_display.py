@@ -0,0 +1,80 @@
+"""
+Frame-to-display path for the Tk camera labels.
+
+The old path allocated a new RGB array, a new PIL image, a LANCZOS-resized
+copy and a new ImageTk.PhotoImage for every frame on the UI thread.
+TkFrameDisplay instead converts BGR->RGB into one preallocated buffer, wraps
+it with Image.frombuffer (no copy), only resizes when the frame size differs
+from the label size, and pastes into a single persistent PhotoImage.
+"""
+
+import time
+
+import cv2
+import numpy as np
+from PIL import Image, ImageTk
+
+
+class TkFrameDisplay:
+    def __init__(self, width=640, height=480):
+        """Create a display for frames shown at width x height"""
+        self.width = width
+        self.height = height
+        self.label = None
+        self.photo = None
+        self._rgb = None
+
+        # Per-frame UI-thread timing
+        self.frame_count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def attach(self, label):
+        """Show frames in a (new) Tk label; the PhotoImage is reused"""
+        self.label = label
+        if self.photo is not None:
+            self.label.configure(image=self.photo, text="")
+
+    def show(self, frame):
+        """Display a BGR frame in the attached label"""
+        if self.label is None or frame is None:
+            return
+        start = time.perf_counter()
+
+        height, width = frame.shape[:2]
+        if self._rgb is None or self._rgb.shape[:2] != (height, width):
+            self._rgb = np.empty((height, width, 3), dtype=np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        image = Image.frombuffer('RGB', (width, height), self._rgb, 'raw', 'RGB', 0, 1)
+
+        if (width, height) != (self.width, self.height):
+            image = image.resize((self.width, self.height), Image.Resampling.BILINEAR)
+
+        if self.photo is None:
+            self.photo = ImageTk.PhotoImage(image)
+            self.label.configure(image=self.photo, text="")
+        else:
+            self.photo.paste(image)
+            # The label may have been pointed at another image (scan-ok overlay)
+            if str(self.label.cget('image')) != str(self.photo):
+                self.label.configure(image=self.photo, text="")
+
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self.frame_count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def stats(self):
+        """Return per-frame display timing since the last reset"""
+        average_ms = self.total_ms / self.frame_count if self.frame_count else 0.0
+        return {
+            'frames': self.frame_count,
+            'avg_ms': round(average_ms, 3),
+            'max_ms': round(self.max_ms, 3),
+        }
+
+    def reset_stats(self):
+        """Start a new timing window (e.g. for the next scan)"""
+        self.frame_count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
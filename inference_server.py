@@ -0,0 +1,271 @@
+"""
+Local batched inference service for several gate lanes on one PC.
+
+Without it every lane runs its own YOLOCameraDetection loop and the model
+sees one frame at a time. InferenceServer owns one loaded detector and one
+batching thread: lanes submit frames, the thread collects up to max_batch
+frames (or whatever arrived within max_wait_ms of the oldest one), runs a
+single forward pass and resolves each lane's Future with its own detections.
+
+    server = InferenceServer(detector, max_batch=4, max_wait_ms=15)
+    server.start()
+    lane = server.lane("gate-1")
+    detections = lane.detect_objects(frame)
+
+Per-lane latency (submit -> result) and the batch-size histogram are kept for
+stats() / print_report(). Run this file directly to serve several cameras:
+
+    python inference_server.py --cameras 0 1 2 --seconds 60
+"""
+
+import argparse
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from compliance import compliance_result
+from torch_runtime import pin_inference_thread
+
+
+class InferenceLane:
+    """Per-lane handle with the detect_objects() call of YOLOCameraDetection"""
+
+    def __init__(self, server, name):
+        self.server = server
+        self.name = name
+
+    def submit(self, frame):
+        """Queue a frame and return a Future for its detections"""
+        return self.server.submit(self.name, frame)
+
+    def detect_objects(self, frame, timeout=5.0):
+        """Detect objects on one frame (blocks until its batch has run)"""
+        try:
+            return self.submit(frame).result(timeout=timeout)
+        except Exception as e:
+            print(f"Error during detection on lane {self.name}: {e}")
+            return []
+
+
+class InferenceServer:
+    def __init__(self, detector, max_batch=4, max_wait_ms=15.0, max_samples=1000):
+        """Serve a loaded YOLOCameraDetection to several lanes"""
+        self.detector = detector
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_samples = max_samples
+
+        self.is_running = False
+        self._queue = queue.Queue()
+        self._thread = None
+        self._stats_lock = threading.Lock()
+        self.lane_latency_ms = {}
+        self.lane_frames = {}
+        self.batch_histogram = {}
+        self.batches = 0
+
+    def start(self):
+        """Start the batching thread"""
+        if self.is_running:
+            return
+        self.is_running = True
+        self._thread = threading.Thread(target=self._serve, name="inference-server", daemon=True)
+        self._thread.start()
+        print(f"Inference server started (max batch {self.max_batch}, max wait {self.max_wait * 1000:.0f} ms)")
+
+    def stop(self):
+        """Stop the batching thread; pending requests are failed"""
+        if not self.is_running:
+            return
+        self.is_running = False
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        while True:
+            try:
+                _, _, future, _ = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            future.set_exception(RuntimeError("Inference server stopped"))
+        print("Inference server stopped")
+
+    def lane(self, name):
+        """Return a lane handle for one camera / turnstile"""
+        return InferenceLane(self, name)
+
+    def submit(self, lane, frame):
+        """Queue a frame for a lane and return a Future for its detections"""
+        future = Future()
+        if not self.is_running:
+            future.set_exception(RuntimeError("Inference server is not running"))
+            return future
+        self._queue.put((lane, frame, future, time.perf_counter()))
+        return future
+
+    def _next_batch(self):
+        """Wait for a request, then collect more until max_batch or the deadline"""
+        try:
+            first = self._queue.get(timeout=0.1)
+        except queue.Empty:
+            return []
+        batch = [first]
+        deadline = first[3] + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _serve(self):
+        """Batching loop: one forward pass per collected batch"""
+        config = getattr(self.detector, 'config', None)
+        if config is not None:
+            # Keep inference off the cores used by the lanes and the UI
+            pin_inference_thread(config)
+        while self.is_running:
+            batch = self._next_batch()
+            if not batch:
+                continue
+            try:
+                results = self.detector.detect_batch([frame for _, frame, _, _ in batch])
+            except Exception as e:
+                for _, _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            done = time.perf_counter()
+            for (lane, _, future, submitted), detections in zip(batch, results):
+                future.set_result(detections)
+                self._record(lane, (done - submitted) * 1000.0)
+            with self._stats_lock:
+                self.batches += 1
+                self.batch_histogram[len(batch)] = self.batch_histogram.get(len(batch), 0) + 1
+
+    def _record(self, lane, latency_ms):
+        """Keep the most recent latencies per lane"""
+        with self._stats_lock:
+            samples = self.lane_latency_ms.setdefault(lane, [])
+            samples.append(latency_ms)
+            if len(samples) > self.max_samples:
+                del samples[0]
+            self.lane_frames[lane] = self.lane_frames.get(lane, 0) + 1
+
+    def stats(self):
+        """Per-lane latency percentiles and the batch-size histogram"""
+        with self._stats_lock:
+            lanes = {}
+            for lane, samples in self.lane_latency_ms.items():
+                ordered = sorted(samples)
+                lanes[lane] = {
+                    'frames': self.lane_frames.get(lane, 0),
+                    'p50_ms': round(ordered[len(ordered) // 2], 2),
+                    'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+                    'max_ms': round(ordered[-1], 2),
+                }
+            histogram = dict(sorted(self.batch_histogram.items()))
+            frames = sum(size * count for size, count in histogram.items())
+            return {
+                'lanes': lanes,
+                'batch_histogram': histogram,
+                'batches': self.batches,
+                'mean_batch': round(frames / self.batches, 2) if self.batches else 0.0,
+            }
+
+    def print_report(self):
+        """Print per-lane latency and the batch-size histogram"""
+        stats = self.stats()
+        print("="*50)
+        print("INFERENCE SERVER")
+        print("="*50)
+        for lane, lane_stats in stats['lanes'].items():
+            print(f"{lane}: {lane_stats['frames']} frames, p50 {lane_stats['p50_ms']} ms, "
+                  f"p95 {lane_stats['p95_ms']} ms, max {lane_stats['max_ms']} ms")
+        print(f"\nBatches: {stats['batches']} (mean size {stats['mean_batch']})")
+        for size, count in stats['batch_histogram'].items():
+            print(f"  batch {size}: {count}")
+        print("="*50)
+
+
+def run_lane(lane, session, stop_event, results):
+    """Camera loop of one gate: read the newest frame, detect, decide"""
+    subscription = session.subscribe()
+    try:
+        while not stop_event.is_set():
+            ret, frame = subscription.wait_for_frame(timeout=1.0)
+            if not ret:
+                continue
+            detections = lane.detect_objects(frame)
+            result = compliance_result(detections, lane.server.detector.required_classes)
+            results[result] = results.get(result, 0) + 1
+    finally:
+        subscription.release()
+
+
+def main():
+    from camera_session import get_camera_session, shutdown_camera_sessions
+    from yolo_detection import YOLOCameraDetection
+
+    parser = argparse.ArgumentParser(description='Serve several gate cameras from one batched YOLO model')
+    parser.add_argument('--cameras', type=int, nargs='+', default=[0],
+                       help='Camera device IDs, one per lane (default: 0)')
+    parser.add_argument('--model', type=str, default=None,
+                       help='Path to YOLO model file (default: from detector_config.json)')
+    parser.add_argument('--confidence', type=float, default=None,
+                       help='One confidence threshold for all classes (default: per-class from the config)')
+    parser.add_argument('--device', type=str, default=None,
+                       help='Inference device, e.g. cpu or 0 (default: auto)')
+    parser.add_argument('--max-batch', type=int, default=None,
+                       help='Largest batch per forward pass (default: number of cameras)')
+    parser.add_argument('--max-wait-ms', type=float, default=15.0,
+                       help='Longest a frame waits for a batch to fill (default: 15)')
+    parser.add_argument('--seconds', type=float, default=30.0,
+                       help='How long to run before printing the report (default: 30)')
+
+    args = parser.parse_args()
+
+    detector = YOLOCameraDetection(model_path=args.model, confidence_threshold=args.confidence,
+                                   device=args.device, debug=False)
+    if not detector.load_model():
+        print(f"Error: could not load model {detector.model_path}")
+        return
+    detector.warm_up()
+
+    server = InferenceServer(detector, max_batch=args.max_batch or len(args.cameras),
+                             max_wait_ms=args.max_wait_ms)
+    server.start()
+
+    stop_event = threading.Event()
+    lane_results = {}
+    threads = []
+    for camera_id in args.cameras:
+        name = f"camera-{camera_id}"
+        lane_results[name] = {}
+        thread = threading.Thread(target=run_lane, name=name, daemon=True,
+                                  args=(server.lane(name), get_camera_session(camera_id), stop_event,
+                                        lane_results[name]))
+        thread.start()
+        threads.append(thread)
+
+    try:
+        time.sleep(args.seconds)
+    except KeyboardInterrupt:
+        print("\nStopping...")
+    finally:
+        stop_event.set()
+        for thread in threads:
+            thread.join(timeout=2.0)
+        server.stop()
+        shutdown_camera_sessions()
+
+    server.print_report()
+    for name, results in lane_results.items():
+        print(f"{name}: {results}")
+
+
+if __name__ == "__main__":
+    main()
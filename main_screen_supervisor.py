@@ -0,0 +1,205 @@
+"""
+Warm standby for the student-facing main screen (testmainscreen.py).
+
+Starting testmainscreen.py means a fresh interpreter, the PyQt5 import and
+building every widget, so after the main screen exits the display used to
+stay blank for seconds (MAIN_SCREEN_CLOSED polling plus a cold start).
+
+MainScreenSupervisor keeps two processes:
+
+    active    the visible main screen
+    standby   "testmainscreen.py --standby": fully built but hidden, waiting
+              for a "PROMOTE" line on its stdin
+
+The exit of either process is noticed from the Tk loop without polling: a
+pidfd (os.pidfd_open, Linux) or, elsewhere, a waiter thread that writes to
+a self-pipe, watched with createfilehandler. When the active screen exits,
+the standby is promoted at once and a new standby is started a moment
+later. Without Tk file handlers (Windows) the processes are checked with
+root.after().
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+import tkinter as tk
+
+MAIN_SCREEN_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "testmainscreen.py")
+
+
+class MainScreenSupervisor:
+    def __init__(self, root, script_path=MAIN_SCREEN_SCRIPT, on_failover=None, standby_delay_ms=1500):
+        """Supervise the main screen processes from the Tk loop of root"""
+        self.root = root
+        self.script_path = script_path
+        self.on_failover = on_failover
+        self.standby_delay_ms = standby_delay_ms
+        self.active = None
+        self.standby = None
+        self.running = False
+        self._watches = {}
+        self._standby_failures = 0
+        self._standby_started = 0.0
+
+    def ensure_active(self):
+        """Make sure a main screen is visible; returns the active process"""
+        self.running = True
+        if self.active is None or self.active.poll() is not None:
+            self._failover()
+        if self.standby is None:
+            self._schedule_standby()
+        return self.active
+
+    def _failover(self):
+        """Promote the standby (or cold-start a main screen if there is none)"""
+        old = self.active
+        self.active = None
+        if old is not None:
+            self._unwatch(old)
+
+        standby, self.standby = self.standby, None
+        if standby is not None:
+            # Watched again below as the active screen
+            self._unwatch(standby)
+        if standby is not None and standby.poll() is None:
+            try:
+                standby.stdin.write(b"PROMOTE\n")
+                standby.stdin.flush()
+                self.active = standby
+                print("Main screen failover: standby promoted")
+            except Exception as e:
+                print(f"Error promoting standby main screen: {e}")
+                self._stop_process(standby)
+        if self.active is None:
+            try:
+                self.active = subprocess.Popen([sys.executable, self.script_path])
+                print("Main screen launched as separate process")
+            except Exception as e:
+                print(f"Error launching main screen as process: {e}")
+                return
+        self._watch(self.active, self._on_active_exit)
+        if self.on_failover is not None:
+            self.on_failover(self.active)
+
+    def _schedule_standby(self, delay_ms=None):
+        """Start a standby after the active screen had time to come up"""
+        self.root.after(self.standby_delay_ms if delay_ms is None else delay_ms, self._start_standby)
+
+    def _start_standby(self):
+        if not self.running or (self.standby is not None and self.standby.poll() is None):
+            return
+        try:
+            self.standby = subprocess.Popen([sys.executable, self.script_path, "--standby"],
+                                            stdin=subprocess.PIPE)
+            self._standby_started = time.monotonic()
+            self._watch(self.standby, self._on_standby_exit)
+            print("Standby main screen starting")
+        except Exception as e:
+            print(f"Error starting standby main screen: {e}")
+            self.standby = None
+
+    def _on_active_exit(self, process):
+        if process is not self.active:
+            return
+        print(f"Main screen exited (code {process.returncode})")
+        if self.running:
+            self._failover()
+            self._schedule_standby()
+
+    def _on_standby_exit(self, process):
+        if process is not self.standby:
+            return
+        self.standby = None
+        if not self.running:
+            return
+        # A standby that keeps crashing on startup should not spin
+        if time.monotonic() - self._standby_started < 10.0:
+            self._standby_failures += 1
+        else:
+            self._standby_failures = 0
+        if self._standby_failures >= 3:
+            print("Standby main screen keeps exiting - giving up on standby")
+            return
+        print(f"Standby main screen exited (code {process.returncode}) - restarting")
+        self._schedule_standby(5000)
+
+    def _watch(self, process, on_exit):
+        """Call on_exit(process) from the Tk loop when the process exits"""
+        def _exited(*_):
+            self._unwatch(process)
+            process.wait()
+            on_exit(process)
+
+        fd = None
+        close_fds = []
+        if hasattr(os, 'pidfd_open'):
+            try:
+                fd = os.pidfd_open(process.pid)
+                close_fds = [fd]
+            except OSError:
+                fd = None
+        if fd is None:
+            # Self-pipe: a waiter thread blocks in wait() and writes one byte
+            read_fd, write_fd = os.pipe()
+
+            def _wait():
+                process.wait()
+                try:
+                    os.write(write_fd, b'x')
+                except OSError:
+                    pass
+                os.close(write_fd)
+
+            threading.Thread(target=_wait, name=f"main-screen-wait-{process.pid}", daemon=True).start()
+            fd = read_fd
+            close_fds = [read_fd]
+        try:
+            self.root.tk.createfilehandler(fd, tk.READABLE, _exited)
+            self._watches[process] = (fd, close_fds)
+        except Exception:
+            # No Tk file handlers on this platform
+            for close_fd in close_fds:
+                os.close(close_fd)
+            self._watches[process] = (None, [])
+            self._poll_exit(process, _exited)
+
+    def _poll_exit(self, process, exited):
+        if process not in self._watches:
+            return
+        if process.poll() is not None:
+            exited()
+        else:
+            self.root.after(250, lambda: self._poll_exit(process, exited))
+
+    def _unwatch(self, process):
+        fd, close_fds = self._watches.pop(process, (None, []))
+        if fd is not None:
+            try:
+                self.root.tk.deletefilehandler(fd)
+            except Exception:
+                pass
+        for close_fd in close_fds:
+            try:
+                os.close(close_fd)
+            except OSError:
+                pass
+
+    def _stop_process(self, process):
+        self._unwatch(process)
+        try:
+            if process.poll() is None:
+                process.terminate()
+                process.wait(timeout=5)
+        except Exception as e:
+            print(f"Error stopping main screen process: {e}")
+
+    def stop(self):
+        """Close the active and standby main screens (logout / quit)"""
+        self.running = False
+        for process in (self.standby, self.active):
+            if process is not None:
+                self._stop_process(process)
+        self.active = None
+        self.standby = None
@@ -0,0 +1,203 @@
+"""
+Embeddable PyQt5 main screen window.
+
+Kept out of ai_niform_login.py so the guard login does not import PyQt5 at
+startup; the guard application runs the main screen as a separate process
+(testmainscreen.py) and only needs this class when embedding it.
+"""
+
+import os
+from datetime import datetime
+
+from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
+from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtGui import QPixmap, QFont
+
+
+class STIMainScreenWindow(QMainWindow):
+    """PyQt5 Main Screen Window integrated into the tkinter application"""
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("AI-niform - Main Screen")
+        self.setGeometry(100, 100, 1920, 1080)
+        self.setFixedSize(1920, 1080)
+        
+        # Set up the main widget
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+        
+        # Create main layout
+        layout = QVBoxLayout(main_widget)
+        layout.setSpacing(0)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.setup_ui(layout)
+        self.setup_timer()
+        
+        # Set window style
+        self.setStyleSheet("""
+            QMainWindow {
+                background-color: white;
+            }
+        """)
+        
+        # Enable key events
+        self.setFocusPolicy(Qt.StrongFocus)
+    
+    def setup_ui(self, layout):
+        """Setup the main screen UI"""
+        # Top Banner
+        top_banner = QFrame()
+        top_banner.setFixedHeight(120)
+        top_banner.setStyleSheet("background-color: #DAA520;")
+        
+        welcome_label = QLabel("Welcome to STI College Balagtas!")
+        welcome_label.setAlignment(Qt.AlignCenter)
+        welcome_label.setStyleSheet("""
+            QLabel {
+                color: white;
+                font-size: 36px;
+                font-weight: bold;
+                background-color: transparent;
+            }
+        """)
+        
+        top_layout = QVBoxLayout(top_banner)
+        top_layout.addWidget(welcome_label)
+        layout.addWidget(top_banner)
+        
+        # Main Content Area
+        main_content = QFrame()
+        main_layout = QHBoxLayout(main_content)
+        main_layout.setSpacing(0)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Left Panel (Logo)
+        left_panel = QFrame()
+        left_panel.setStyleSheet("background-color: white;")
+        left_layout = QVBoxLayout(left_panel)
+        left_layout.setAlignment(Qt.AlignCenter)
+        
+        # Load and display STI Logo
+        logo_path = os.path.join("image-elements", "STI Balagtas Logo.png")
+        if os.path.exists(logo_path):
+            logo_label = QLabel()
+            pixmap = QPixmap(logo_path)
+            scaled_pixmap = pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            logo_label.setPixmap(scaled_pixmap)
+            logo_label.setAlignment(Qt.AlignCenter)
+            left_layout.addWidget(logo_label)
+        else:
+            fallback_label = QLabel("STI Balagtas Logo")
+            fallback_label.setAlignment(Qt.AlignCenter)
+            fallback_label.setStyleSheet("""
+                QLabel {
+                    font-size: 24px;
+                    font-weight: bold;
+                    color: #0066CC;
+                    background-color: #FFD700;
+                    padding: 20px;
+                    border-radius: 3px;
+                }
+            """)
+            left_layout.addWidget(fallback_label)
+        
+        main_layout.addWidget(left_panel, 40)
+        
+        # Right Panel (Card Reader)
+        right_panel = QFrame()
+        right_panel.setStyleSheet("background-color: #4A90E2;")
+        right_layout = QVBoxLayout(right_panel)
+        right_layout.setAlignment(Qt.AlignCenter)
+        
+        # Card Reader Interface
+        self.instruction_label = QLabel("Please tap your ID\nto the Card Reader")
+        self.instruction_label.setAlignment(Qt.AlignCenter)
+        self.instruction_label.setStyleSheet("""
+            QLabel {
+                color: white;
+                font-size: 24px;
+                font-weight: bold;
+                background-color: transparent;
+            }
+        """)
+        right_layout.addWidget(self.instruction_label)
+        
+        # Status label
+        self.status_label = QLabel("Ready for scanning...")
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setStyleSheet("""
+            QLabel {
+                color: white;
+                font-size: 18px;
+                background-color: transparent;
+            }
+        """)
+        right_layout.addWidget(self.status_label)
+        
+        main_layout.addWidget(right_panel, 60)
+        layout.addWidget(main_content)
+        
+        # Bottom bar
+        bottom_bar = QFrame()
+        bottom_bar.setFixedHeight(100)
+        bottom_layout = QHBoxLayout(bottom_bar)
+        
+        # Date and time
+        current_date = datetime.now().strftime("%B %d, %Y")
+        current_time = datetime.now().strftime("%I:%M:%S %p")
+        
+        date_label = QLabel(current_date)
+        date_label.setAlignment(Qt.AlignCenter)
+        date_label.setStyleSheet("""
+            QLabel {
+                color: white;
+                font-size: 18px;
+                font-weight: bold;
+                background-color: #87CEEB;
+            }
+        """)
+        
+        time_label = QLabel(current_time)
+        time_label.setAlignment(Qt.AlignCenter)
+        time_label.setStyleSheet("""
+            QLabel {
+                color: white;
+                font-size: 18px;
+                font-weight: bold;
+                background-color: #021C37;
+            }
+        """)
+        
+        bottom_layout.addWidget(date_label)
+        bottom_layout.addWidget(time_label)
+        layout.addWidget(bottom_bar)
+    
+    def setup_timer(self):
+        """Setup timer for updating time"""
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.update_time)
+        self.timer.start(1000)
+    
+    def update_time(self):
+        """Update the time display"""
+        current_time = datetime.now().strftime("%I:%M:%S %p")
+        # Update time label if it exists
+        for child in self.findChildren(QLabel):
+            if ":" in child.text() and len(child.text()) < 15:
+                child.setText(current_time)
+                break
+    
+    def keyPressEvent(self, event):
+        """Handle key press events"""
+        if event.key() == Qt.Key_Escape:
+            self.close()
+        else:
+            super().keyPressEvent(event)
+    
+    def closeEvent(self, event):
+        """Handle window close event"""
+        # Notify the parent application that this window is closing
+        if hasattr(self, 'parent_app'):
+            self.parent_app.on_main_screen_closed()
+        event.accept()
@@ -0,0 +1,247 @@
+"""
+Hot-swappable uniform model registry.
+
+Instead of replacing best.pt and restarting the guard application, new
+weights are copied into the models directory (detector_config.json
+"model_registry"). ModelRegistry polls that directory in the background;
+when a new file has stopped growing it is loaded, warmed up and smoke-tested
+on a background thread:
+
+- the model's class names must include every required class
+- one inference on the smoke image (or a blank frame) must succeed within
+  max_smoke_ms and return at least min_smoke_detections boxes
+
+A version that passes becomes current with a single reference swap, so
+detectors pick it up between two frames (YOLOCameraDetection.refresh_model).
+The previous version is kept for rollback(), which also happens
+automatically when the current version keeps failing at inference time.
+Rejected files are not retried until they change.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+
+import cv2
+import numpy as np
+from ultralytics import YOLO
+
+from detector_config import get_detector_config
+from torch_runtime import apply_runtime_config, inference_context
+
+MODEL_EXTENSIONS = ('.pt', '.onnx')
+
+
+class ModelVersion:
+    def __init__(self, version, path, model, mtime):
+        """A loaded and validated set of weights"""
+        self.version = version
+        self.path = path
+        self.model = model
+        self.mtime = mtime
+        self.loaded_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class ModelRegistry:
+    def __init__(self, config=None, failure_limit=3):
+        """Watch the configured models directory"""
+        self.config = config if config is not None else get_detector_config()
+        self.failure_limit = failure_limit
+        self.current = None
+        self.previous = None
+        self.generation = 0
+        self.is_running = False
+
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+        self._seen_sizes = {}
+        self._rejected = {}
+        self._failures = 0
+
+    @property
+    def settings(self):
+        return self.config.get('model_registry')
+
+    def start(self):
+        """Load the newest valid version, then keep watching in the background"""
+        if self.is_running:
+            return
+        self.is_running = True
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="model-registry", daemon=True)
+        self._thread.start()
+        print(f"Model registry watching {self.settings['models_dir']}")
+
+    def stop(self):
+        """Stop watching the models directory"""
+        self.is_running = False
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def current_version(self):
+        """Return (generation, ModelVersion or None) for detectors"""
+        with self._lock:
+            return self.generation, self.current
+
+    def _watch(self):
+        """Poll loop: stat the directory and load new stable files"""
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"Model registry: error while polling: {e}")
+            self._stop.wait(self.settings['poll_seconds'])
+
+    def poll(self):
+        """Check the models directory once; returns True if a new version went live"""
+        candidate = self._newest_stable_file()
+        if candidate is None:
+            return False
+        path, mtime = candidate
+        with self._lock:
+            if self.current is not None and self.current.path == path and self.current.mtime == mtime:
+                return False
+        if self._rejected.get(path) == mtime:
+            return False
+        version = self.load_version(path, mtime)
+        if version is None:
+            self._rejected[path] = mtime
+            return False
+        self.swap(version)
+        return True
+
+    def _newest_stable_file(self):
+        """Newest model file whose size did not change since the last poll"""
+        models_dir = self.settings['models_dir']
+        if not os.path.isdir(models_dir):
+            return None
+        files = []
+        for name in os.listdir(models_dir):
+            if name.lower().endswith(MODEL_EXTENSIONS):
+                path = os.path.join(models_dir, name)
+                stat = os.stat(path)
+                files.append((stat.st_mtime, path, stat.st_size))
+        if not files:
+            return None
+        mtime, path, size = max(files)
+        # A file that is still being copied grows between polls
+        stable = self._seen_sizes.get(path) == (mtime, size)
+        self._seen_sizes[path] = (mtime, size)
+        if not stable and self.current is not None:
+            return None
+        return path, mtime
+
+    def load_version(self, path, mtime):
+        """Load, warm up and smoke-test a model file; None if it fails"""
+        version = f"{os.path.basename(path)}@{datetime.fromtimestamp(mtime).strftime('%Y%m%d-%H%M%S')}"
+        print(f"Model registry: loading {version}...")
+        try:
+            apply_runtime_config(self.config)
+            model = YOLO(path)
+            names = {str(name).lower() for name in model.names.values()}
+            missing = [name for name in self.config.required_classes if name not in names]
+            if missing:
+                print(f"Model registry: rejected {version} - missing classes {missing}")
+                return None
+
+            frame = None
+            if self.settings['smoke_image']:
+                frame = cv2.imread(self.settings['smoke_image'])
+            if frame is None:
+                frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+            device = self.config.get('device')
+            kwargs = {'imgsz': self.config.get('imgsz'), 'verbose': False}
+            if device is not None:
+                kwargs['device'] = device
+            with inference_context(self.config.get('runtime')['inference_mode']):
+                model(frame, **kwargs)  # warm-up
+                start = time.perf_counter()
+                results = model(frame, **kwargs)
+                smoke_ms = (time.perf_counter() - start) * 1000.0
+
+            boxes = sum(len(result.boxes) for result in results if result.boxes is not None)
+            if smoke_ms > self.settings['max_smoke_ms']:
+                print(f"Model registry: rejected {version} - smoke inference took {smoke_ms:.0f} ms")
+                return None
+            if boxes < self.settings['min_smoke_detections']:
+                print(f"Model registry: rejected {version} - {boxes} boxes on the smoke image")
+                return None
+            print(f"Model registry: {version} passed smoke test ({smoke_ms:.0f} ms, {boxes} boxes)")
+            return ModelVersion(version, path, model, mtime)
+        except Exception as e:
+            print(f"Model registry: rejected {version} - {e}")
+            return None
+
+    def swap(self, version):
+        """Make a validated version current; the old one is kept for rollback"""
+        with self._lock:
+            self.previous = self.current
+            self.current = version
+            self.generation += 1
+            self._failures = 0
+        print(f"Model registry: now using {version.version}")
+
+    def rollback(self, reason="manual"):
+        """Go back to the previous version"""
+        with self._lock:
+            if self.previous is None:
+                print("Model registry: no previous version to roll back to")
+                return False
+            bad = self.current
+            self.current, self.previous = self.previous, None
+            self.generation += 1
+            self._failures = 0
+            if bad is not None:
+                self._rejected[bad.path] = bad.mtime
+        print(f"Model registry: rolled back to {self.current.version} ({reason})")
+        return True
+
+    def report_success(self):
+        """A detector finished a frame with the current version"""
+        self._failures = 0
+
+    def report_failure(self, version):
+        """A detector failed a frame; roll back after failure_limit in a row"""
+        with self._lock:
+            if self.current is None or self.current.version != version:
+                return
+            self._failures += 1
+            failures = self._failures
+        if failures >= self.failure_limit:
+            self.rollback(reason=f"{failures} failed inferences")
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def start_model_registry():
+    """Start the shared registry if the configured models directory exists"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            if not os.path.isdir(get_detector_config().get('model_registry')['models_dir']):
+                return None
+            _registry = ModelRegistry()
+            # The first poll (loading the newest version) runs in the background
+            _registry.start()
+        return _registry
+
+
+def active_model_registry():
+    """Return the running registry or None (detectors then load model_path)"""
+    return _registry
+
+
+def stop_model_registry():
+    """Stop the shared registry"""
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        registry.stop()
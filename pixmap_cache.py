@@ -0,0 +1,137 @@
+"""
+Scaled and masked pixmaps for the Qt main screen.
+
+Every show_* screen in testmainscreen.py used to load the STI logo and the
+avatar from disk, smooth-scale them and paint the rounded mask with a
+QPainter clip pass, on every transition. PixmapCache renders each
+(path, size, shape) once and hands out the finished QPixmap:
+
+    shape  'plain'    scaled with the aspect ratio kept
+           'rounded'  rounded-rectangle corners (radius 3, as the screens use)
+           'circle'   circular avatar
+
+Entries are keyed by (path, width, height, shape, mtime), so a replaced
+photo is picked up on its next use. Pinned paths (the logo, the generic
+avatar and the full-panel images) are never evicted; person photos live in a
+bounded LRU. Pixmaps need a QApplication, so rendering starts with
+preload() after the application object exists.
+"""
+
+import os
+from collections import OrderedDict
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QBrush, QPainter, QPainterPath, QPixmap
+
+IMAGE_DIR = "image-elements"
+LOGO_PATH = os.path.join(IMAGE_DIR, "STI Balagtas Logo.png")
+GENERIC_AVATAR_PATH = os.path.join(IMAGE_DIR, "Generic User Image.jpg")
+INSTRUCTIONS_PATH = os.path.join(IMAGE_DIR, "Instructions Scan.png")
+SCAN_OK_PATH = os.path.join(IMAGE_DIR, "scan-ok.png")
+
+# (path, width, height, shape) rendered at startup and kept for the whole run
+PINNED_PIXMAPS = [
+    (LOGO_PATH, 400, 400, 'plain'),
+    (LOGO_PATH, 120, 90, 'plain'),
+    (GENERIC_AVATAR_PATH, 180, 180, 'rounded'),
+    (GENERIC_AVATAR_PATH, 180, 180, 'plain'),
+    (GENERIC_AVATAR_PATH, 200, 200, 'circle'),
+    (INSTRUCTIONS_PATH, 1344, 900, 'plain'),
+    (SCAN_OK_PATH, 1344, 900, 'plain'),
+    (SCAN_OK_PATH, 1024, 1024, 'plain'),
+]
+
+
+def render_pixmap(path, width, height, shape='plain', radius=3):
+    """Load, scale and mask one image; None if it cannot be read"""
+    source = QPixmap(path)
+    if source.isNull():
+        return None
+    scaled = source.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    if shape == 'plain':
+        return scaled
+
+    result = QPixmap(scaled.size())
+    result.fill(Qt.transparent)
+    painter = QPainter(result)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setRenderHint(QPainter.SmoothPixmapTransform)
+    if shape == 'circle':
+        painter.setBrush(QBrush(scaled))
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(0, 0, scaled.width(), scaled.height())
+    else:
+        path_mask = QPainterPath()
+        path_mask.addRoundedRect(0, 0, scaled.width(), scaled.height(), radius, radius)
+        painter.setClipPath(path_mask)
+        painter.drawPixmap(0, 0, scaled)
+    painter.end()
+    return result
+
+
+class PixmapCache:
+    def __init__(self, max_entries=32):
+        """Rendered pixmaps: pinned paths forever, the rest in an LRU"""
+        self.max_entries = max_entries
+        self.pinned_paths = set()
+        self.pinned = {}
+        self.recent = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def pin(self, path):
+        """Never evict renders of this path"""
+        self.pinned_paths.add(os.path.abspath(path))
+
+    def preload(self, specs=PINNED_PIXMAPS):
+        """Pin and render (path, width, height, shape) entries ahead of the first screen"""
+        for path, width, height, shape in specs:
+            self.pin(path)
+            self.get(path, width, height, shape)
+
+    def get(self, path, width, height, shape='plain'):
+        """The rendered pixmap (isNull() if the file is missing or unreadable)"""
+        full_path = os.path.abspath(path)
+        try:
+            mtime = os.stat(full_path).st_mtime_ns
+        except OSError:
+            return QPixmap()
+        key = (full_path, width, height, shape)
+        store = self.pinned if full_path in self.pinned_paths else self.recent
+
+        entry = store.get(key)
+        if entry is not None and entry[0] == mtime:
+            self.hits += 1
+            if store is self.recent:
+                self.recent.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        try:
+            pixmap = render_pixmap(full_path, width, height, shape)
+        except Exception as e:
+            print(f"Error rendering {path}: {e}")
+            return QPixmap()
+        if pixmap is None:
+            return QPixmap()
+        store[key] = (mtime, pixmap)
+        if store is self.recent:
+            self.recent.move_to_end(key)
+            while len(self.recent) > self.max_entries:
+                self.recent.popitem(last=False)
+        return pixmap
+
+    def clear(self):
+        self.pinned.clear()
+        self.recent.clear()
+
+
+_cache = None
+
+
+def get_pixmap_cache():
+    """Process-wide pixmap cache (create it after the QApplication)"""
+    global _cache
+    if _cache is None:
+        _cache = PixmapCache()
+    return _cache
@@ -0,0 +1,250 @@
+"""
+Offline replay of the uniform compliance pipeline.
+
+Runs YOLOCameraDetection and the splash screen voting logic
+(SplashComplianceVoter) headless against a recorded video file or a
+directory of images instead of the live camera, and writes one JSON record
+per line:
+
+- {"type": "frame", ...}    detections, class counts, per-frame result,
+                            running scan decision and timings
+- {"type": "scan", ...}     final decision of each scan window
+- {"type": "summary", ...}  totals, decisions and throughput
+
+A scan window is --scan-seconds of footage at --fps, the same as one splash
+screen at the gate. Example:
+
+    python replay.py gate_footage.mp4 --device cpu --output replay.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import cv2
+
+from compliance import DECISION_MANUAL_VERIFICATION, SplashComplianceVoter, count_classes, compliance_result
+from detector_config import DEFAULT_CONFIG_PATH, DetectorConfig
+from yolo_detection import YOLOCameraDetection
+from roi_detection import PersonROIDetector
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+def iter_frames(source, fps):
+    """Yield (frame index, timestamp in seconds, BGR frame) from a video or image directory"""
+    if os.path.isdir(source):
+        names = sorted(name for name in os.listdir(source) if name.lower().endswith(IMAGE_EXTENSIONS))
+        for index, name in enumerate(names):
+            frame = cv2.imread(os.path.join(source, name))
+            if frame is None:
+                print(f"Warning: could not read image {name}", file=sys.stderr)
+                continue
+            yield index, index / fps, frame
+        return
+
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise IOError(f"Could not open video {source}")
+    try:
+        index = 0
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            timestamp = cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0 or index / fps
+            yield index, timestamp, frame
+            index += 1
+    finally:
+        cap.release()
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def latency_summary(values):
+    """p50/p95/p99/max of a list of millisecond timings"""
+    return {
+        'p50': round(percentile(values, 0.50), 3),
+        'p95': round(percentile(values, 0.95), 3),
+        'p99': round(percentile(values, 0.99), 3),
+        'max': round(max(values), 3) if values else 0.0,
+    }
+
+
+class ComplianceReplay:
+    def __init__(self, detector, fps=30, scan_seconds=8, no_detection_limit=90, write=print):
+        """Replay frames through the detector and the splash voting logic"""
+        self.detector = detector
+        self.fps = fps
+        self.scan_frames = max(1, int(round(scan_seconds * fps)))
+        self.voter = SplashComplianceVoter(no_detection_limit=no_detection_limit,
+                                           required_classes=detector.required_classes)
+        self.write = write
+
+        self.scan_index = 0
+        self.scan_start_frame = 0
+        self.frame_count = 0
+        self.decisions = {}
+        self.read_ms = []
+        self.detect_ms = []
+
+    def run(self, frames):
+        """Process every frame and return the summary record"""
+        start = time.perf_counter()
+        read_start = time.perf_counter()
+        for index, timestamp, frame in frames:
+            read_ms = (time.perf_counter() - read_start) * 1000.0
+            self.process_frame(index, timestamp, frame, read_ms)
+            read_start = time.perf_counter()
+        if self.frame_count > self.scan_start_frame:
+            self.finish_scan()
+        elapsed = time.perf_counter() - start
+
+        summary = {
+            'type': 'summary',
+            'frames': self.frame_count,
+            'scans': self.scan_index,
+            'decisions': self.decisions,
+            'elapsed_s': round(elapsed, 3),
+            'throughput_fps': round(self.frame_count / elapsed, 2) if elapsed > 0 else 0.0,
+            'read_ms': latency_summary(self.read_ms),
+            'detect_ms': latency_summary(self.detect_ms),
+            'device': self.detector.device,
+            'model': self.detector.model_path,
+        }
+        if hasattr(self.detector, 'stats'):
+            summary['roi'] = self.detector.stats()
+        self.write(summary)
+        return summary
+
+    def process_frame(self, index, timestamp, frame, read_ms):
+        """Detect, vote and emit the record for one frame"""
+        if self.frame_count - self.scan_start_frame >= self.scan_frames:
+            self.finish_scan()
+
+        detect_start = time.perf_counter()
+        detections = self.detector.detect_objects(frame)
+        detect_ms = (time.perf_counter() - detect_start) * 1000.0
+
+        vote_start = time.perf_counter()
+        was_finished = self.voter.finished
+        decision = self.voter.update(detections)
+        vote_ms = (time.perf_counter() - vote_start) * 1000.0
+
+        self.frame_count += 1
+        self.read_ms.append(read_ms)
+        self.detect_ms.append(detect_ms)
+
+        class_counts = count_classes(detections)
+        self.write({
+            'type': 'frame',
+            'frame': index,
+            'timestamp': round(timestamp, 3),
+            'scan': self.scan_index,
+            'detections': [
+                {
+                    'class_name': detection['class_name'],
+                    'confidence': round(detection['confidence'], 4),
+                    'bbox': list(detection['bbox']),
+                }
+                for detection in detections
+            ],
+            'counts': {class_name: class_counts.get(class_name, 0) for class_name in self.voter.required_classes},
+            'frame_result': compliance_result(detections, self.voter.required_classes),
+            'decision': decision,
+            # The live splash stops scanning on this frame
+            'scan_stopped': self.voter.finished and not was_finished,
+            'timings_ms': {
+                'read': round(read_ms, 3),
+                'detect': round(detect_ms, 3),
+                'vote': round(vote_ms, 3),
+            },
+        })
+
+    def finish_scan(self):
+        """Emit the decision of the current scan window and start the next one"""
+        # Like close_splash_and_restore: no decision yet means manual verification
+        decision = self.voter.result or DECISION_MANUAL_VERIFICATION
+        self.decisions[decision] = self.decisions.get(decision, 0) + 1
+        self.write({
+            'type': 'scan',
+            'scan': self.scan_index,
+            'first_frame': self.scan_start_frame,
+            'frames': self.frame_count - self.scan_start_frame,
+            'decision': decision,
+            'stopped_early': self.voter.finished,
+        })
+        self.scan_index += 1
+        self.scan_start_frame = self.frame_count
+        self.voter.reset()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay recorded footage through the uniform compliance pipeline')
+    parser.add_argument('source', type=str,
+                       help='Video file or directory of images')
+    parser.add_argument('--config', type=str, default=DEFAULT_CONFIG_PATH,
+                       help=f'Detector config file (default: {DEFAULT_CONFIG_PATH})')
+    parser.add_argument('--model', type=str, default=None,
+                       help='Path to YOLO model file (default: from the config)')
+    parser.add_argument('--confidence', type=float, default=None,
+                       help='One confidence threshold for all classes (default: per-class from the config)')
+    parser.add_argument('--device', type=str, default=None,
+                       help='Inference device, e.g. cpu or 0 (default: auto)')
+    parser.add_argument('--fps', type=float, default=30.0,
+                       help='Frame rate of the footage; also used for image directories (default: 30)')
+    parser.add_argument('--scan-seconds', type=float, default=8.0,
+                       help='Length of one scan window in seconds (default: 8, the splash duration)')
+    parser.add_argument('--no-detection-frames', type=int, default=None,
+                       help='Empty frames before manual verification (default: from the config)')
+    parser.add_argument('--output', type=str, default='-',
+                       help='JSONL output file, - for stdout (default: -)')
+    parser.add_argument('--roi', action='store_true',
+                       help='Detect on upscaled person crops (two-stage)')
+    parser.add_argument('--person-model', type=str, default='yolov8n.pt',
+                       help='Person localization model for --roi (default: yolov8n.pt)')
+    parser.add_argument('--split-body', action='store_true',
+                       help='With --roi, detect on separate upper/lower body crops')
+
+    args = parser.parse_args()
+
+    config = DetectorConfig(args.config)
+    detector = YOLOCameraDetection(model_path=args.model, confidence_threshold=args.confidence,
+                                   device=args.device, debug=False, config=config)
+    if args.roi:
+        detector = PersonROIDetector(detector, person_model_path=args.person_model, split_body=args.split_body)
+    if not detector.load_model():
+        print(f"Error: could not load model {detector.model_path}", file=sys.stderr)
+        sys.exit(1)
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'w')
+    try:
+        def write(record):
+            output.write(json.dumps(record) + "\n")
+
+        no_detection_limit = args.no_detection_frames or config.get('no_detection_frames')
+        replay = ComplianceReplay(detector, fps=args.fps, scan_seconds=args.scan_seconds,
+                                  no_detection_limit=no_detection_limit, write=write)
+        summary = replay.run(iter_frames(args.source, args.fps))
+    except Exception as e:
+        print(f"Error during replay: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"Replayed {summary['frames']} frames in {summary['scans']} scans at "
+          f"{summary['throughput_fps']} FPS: {summary['decisions']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Two-stage person-crop detection for small uniform parts.
+
+In a full 640x480 gate frame the `ict logo` and `black shoes` boxes are only a
+few pixels wide after YOLO's letterbox resize. PersonROIDetector first finds
+the student with a fast person model (COCO "person" class), crops the person
+box with a margin, upscales the crop to the uniform model's input size and
+runs the uniform classes on the crop. With split_body=True the crop is cut
+into an upper-body and a lower-body crop that go through the uniform model
+as one batch, so the logo and the shoes get even more pixels.
+
+Boxes are mapped back to frame coordinates, so callers see the same
+detection dicts as YOLOCameraDetection.detect_objects(). If no person is
+found the frame is detected as a whole.
+
+Locate/detect timings and the person hit rate are kept for stats(); compare
+evaluate_model.py recall with and without --roi to judge the trade-off.
+"""
+
+import time
+
+import cv2
+
+from yolo_detection import YOLOCameraDetection, box_iou
+
+PERSON_CLASS = 'person'
+
+
+class PersonROIDetector:
+    def __init__(self, detector, person_model_path='yolov8n.pt', person_confidence=0.4,
+                 crop_size=640, margin=0.1, split_body=False):
+        """Wrap a uniform YOLOCameraDetection with a person localization pass"""
+        self.detector = detector
+        self.person_detector = YOLOCameraDetection(model_path=person_model_path,
+                                                   confidence_threshold=person_confidence,
+                                                   device=detector.device, debug=False)
+        self.crop_size = crop_size
+        self.margin = margin
+        self.split_body = split_body
+
+        self.frames = 0
+        self.person_frames = 0
+        self.locate_ms = 0.0
+        self.detect_ms = 0.0
+
+    # Same attributes the offline tools read from a plain detector
+    @property
+    def model(self):
+        return self.detector.model
+
+    @property
+    def model_path(self):
+        return self.detector.model_path
+
+    @property
+    def device(self):
+        return self.detector.device
+
+    @property
+    def required_classes(self):
+        return self.detector.required_classes
+
+    def load_model(self):
+        """Load the uniform model and the person model"""
+        if not self.detector.load_model():
+            return False
+        if not self.person_detector.load_model():
+            print(f"Person model {self.person_detector.model_path} not available - using full frames")
+        return True
+
+    def locate_person(self, frame):
+        """Return the (x1, y1, x2, y2) box of the largest person, or None"""
+        if self.person_detector.model is None:
+            return None
+        people = [d for d in self.person_detector.detect_objects(frame) if d['class_name'] == PERSON_CLASS]
+        if not people:
+            return None
+        largest = max(people, key=lambda d: (d['bbox'][2] - d['bbox'][0]) * (d['bbox'][3] - d['bbox'][1]))
+        return largest['bbox']
+
+    def person_crops(self, frame, person_box):
+        """Return [(x offset, y offset, crop)] regions around a person box"""
+        height, width = frame.shape[:2]
+        x1, y1, x2, y2 = person_box
+        margin_x = int((x2 - x1) * self.margin)
+        margin_y = int((y2 - y1) * self.margin)
+        x1, y1 = max(0, x1 - margin_x), max(0, y1 - margin_y)
+        x2, y2 = min(width, x2 + margin_x), min(height, y2 + margin_y)
+
+        if not self.split_body:
+            return [(x1, y1, frame[y1:y2, x1:x2])]
+
+        # Overlapping halves so the belt line is seen by both crops
+        upper_bottom = y1 + int((y2 - y1) * 0.6)
+        lower_top = y1 + int((y2 - y1) * 0.45)
+        return [
+            (x1, y1, frame[y1:upper_bottom, x1:x2]),
+            (x1, lower_top, frame[lower_top:y2, x1:x2]),
+        ]
+
+    def detect_objects(self, frame):
+        """Detect uniform parts on the person crop(s), in frame coordinates"""
+        self.frames += 1
+        start = time.perf_counter()
+        person_box = self.locate_person(frame)
+        located = time.perf_counter()
+        self.locate_ms += (located - start) * 1000.0
+
+        if person_box is None:
+            detections = self.detector.detect_batch([frame])[0]
+        else:
+            self.person_frames += 1
+            regions = []
+            crops = []
+            for offset_x, offset_y, crop in self.person_crops(frame, person_box):
+                if crop.size == 0:
+                    continue
+                scale = self.crop_size / max(crop.shape[:2])
+                crops.append(cv2.resize(crop, None, fx=scale, fy=scale, interpolation=cv2.INTER_LINEAR))
+                regions.append((offset_x, offset_y, scale))
+
+            detections = []
+            for (offset_x, offset_y, scale), crop_detections in zip(regions, self.detector.detect_batch(crops)):
+                for detection in crop_detections:
+                    cx1, cy1, cx2, cy2 = detection['bbox']
+                    detection['bbox'] = (int(cx1 / scale) + offset_x, int(cy1 / scale) + offset_y,
+                                         int(cx2 / scale) + offset_x, int(cy2 / scale) + offset_y)
+                    detections.append(detection)
+            if len(regions) > 1:
+                detections = merge_duplicates(detections)
+
+        self.detect_ms += (time.perf_counter() - located) * 1000.0
+        if self.detector.debug:
+            self.detector.print_detection_debug(detections)
+        return detections
+
+    def detect_batch(self, frames):
+        """Per-frame ROI detection for the batch tools"""
+        return [self.detect_objects(frame) for frame in frames]
+
+    def stats(self):
+        """Average locate/detect time and how often a person was found"""
+        frames = self.frames or 1
+        return {
+            'frames': self.frames,
+            'person_rate': round(self.person_frames / frames, 4),
+            'locate_ms': round(self.locate_ms / frames, 3),
+            'detect_ms': round(self.detect_ms / frames, 3),
+        }
+
+
+def merge_duplicates(detections, iou_threshold=0.5):
+    """Drop lower-confidence boxes of the same class found in both body crops"""
+    kept = []
+    for detection in sorted(detections, key=lambda d: d['confidence'], reverse=True):
+        if not any(other['class_name'] == detection['class_name']
+                   and box_iou(other['bbox'], detection['bbox']) >= iou_threshold for other in kept):
+            kept.append(detection)
+    return kept
@@ -0,0 +1,222 @@
+"""
+Prebuilt overlay pages for the Qt main screen.
+
+The full-screen states of STIWelcomeScreen (getting ready, instructions,
+scanning, scan complete, verified, special pass, check-out, unable to
+verify, uniform issue) all share one layout: a coloured banner, a left image
+panel, the visitor panel on the right and the date/time bar. Each of them
+used to create a new overlay and several hundred lines of widgets and
+stylesheets per event. The pages here are built once into a QStackedWidget;
+a screen change is set_data() on the page plus a page switch.
+
+BoundPage is the data-binding layer: widgets register a setter per field
+name, and set_data() only touches the widgets whose value changed since the
+page was last shown.
+"""
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QFrame, QHBoxLayout, QLabel, QStackedWidget, QVBoxLayout, QWidget
+
+from pixmap_cache import GENERIC_AVATAR_PATH, INSTRUCTIONS_PATH, LOGO_PATH, SCAN_OK_PATH
+from theme import set_style_property
+
+# Left panel contents: (image path, width, height, background panel, fallback text)
+LEFT_LOGO = (LOGO_PATH, 400, 400, 'white', "STI Balagtas Logo")
+LEFT_INSTRUCTIONS = (INSTRUCTIONS_PATH, 1344, 900, 'white', "Instructions Scan image not found")
+LEFT_SCAN_OK = (SCAN_OK_PATH, 1024, 1024, 'black', "")
+
+
+class BoundPage(QWidget):
+    def __init__(self, parent=None):
+        """Page whose dynamic widgets are bound to field names"""
+        super().__init__(parent)
+        self._setters = {}
+        self._values = {}
+
+    def bind(self, name, setter):
+        self._setters[name] = setter
+
+    def bind_text(self, name, label):
+        self.bind(name, label.setText)
+
+    def set_data(self, **values):
+        """Apply field values, skipping the ones the page already shows"""
+        for name, value in values.items():
+            setter = self._setters.get(name)
+            if setter is None:
+                raise KeyError(f"{type(self).__name__} has no field '{name}'")
+            if name in self._values and self._values[name] == value:
+                continue
+            setter(value)
+            self._values[name] = value
+
+    def build_banner(self, layout):
+        """Top banner: fields banner_text, banner_state (theme.py pageBanner states), banner_height"""
+        banner = QFrame()
+        banner.setObjectName("pageBanner")
+        label = QLabel()
+        label.setAlignment(Qt.AlignCenter)
+        QVBoxLayout(banner).addWidget(label)
+        layout.addWidget(banner)
+        self.bind_text('banner_text', label)
+        self.bind('banner_state', lambda state: set_style_property(banner, 'state', state, children=True))
+        self.bind('banner_height', banner.setFixedHeight)
+
+    def build_bottom_bar(self, layout):
+        """Date and clock bar: fields date, clock"""
+        bottom_bar = QFrame()
+        bottom_bar.setFixedHeight(100)
+        bottom_layout = QHBoxLayout(bottom_bar)
+        bottom_layout.setSpacing(0)
+        bottom_layout.setContentsMargins(0, 0, 0, 0)
+        for name in ('date', 'clock'):
+            frame = QFrame()
+            frame.setProperty('panel', name)
+            label = QLabel()
+            label.setAlignment(Qt.AlignCenter)
+            label.setProperty('textStyle', 'strong')
+            QVBoxLayout(frame).addWidget(label)
+            bottom_layout.addWidget(frame)
+            self.bind_text(name, label)
+        layout.addWidget(bottom_bar)
+
+
+class SplitPage(BoundPage):
+    # Fields a caller does not set keep the look of the verified screen
+    DEFAULTS = {
+        'banner_state': 'verified',
+        'banner_height': 80,
+        'left': LEFT_LOGO,
+        'split': (70, 30),
+        'id_text': "Test ID Card",
+        'id_style': 'pageId',
+        'role_text': "(Test User Role)",
+        'time_caption': "Time Check-in:",
+    }
+
+    def __init__(self, pixmaps, parent=None):
+        """Banner, left image, visitor panel and date/time bar"""
+        super().__init__(parent)
+        self.pixmaps = pixmaps
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setSpacing(0)
+        self.build_banner(main_layout)
+
+        content_area = QFrame()
+        content_layout = QHBoxLayout(content_area)
+        content_layout.setContentsMargins(0, 0, 0, 0)
+        content_layout.setSpacing(0)
+
+        self.left_panel = QFrame()
+        left_layout = QVBoxLayout(self.left_panel)
+        left_layout.setAlignment(Qt.AlignCenter)
+        self.left_image = QLabel()
+        self.left_image.setAlignment(Qt.AlignCenter)
+        left_layout.addWidget(self.left_image)
+        content_layout.addWidget(self.left_panel)
+        self.bind('left', self._set_left)
+
+        right_panel = QFrame()
+        right_panel.setProperty('panel', 'navy')
+        right_layout = QVBoxLayout(right_panel)
+        right_layout.setAlignment(Qt.AlignCenter)
+
+        avatar = pixmaps.get(GENERIC_AVATAR_PATH, 180, 180, 'rounded')
+        if avatar.isNull():
+            user_icon = QLabel("👤")
+            user_icon.setFixedSize(180, 180)
+            user_icon.setProperty('textStyle', 'avatarFallback')
+        else:
+            user_icon = QLabel()
+            user_icon.setPixmap(avatar)
+            user_icon.setProperty('textStyle', 'image')
+        user_icon.setAlignment(Qt.AlignCenter)
+        right_layout.addWidget(user_icon)
+
+        id_label = QLabel()
+        role_label = QLabel()
+        role_label.setProperty('textStyle', 'body')
+        time_caption = QLabel()
+        time_caption.setProperty('textStyle', 'bodySpaced')
+        time_value = QLabel()
+        time_value.setProperty('textStyle', 'body')
+        for label in (id_label, role_label, time_caption, time_value):
+            right_layout.addWidget(label, alignment=Qt.AlignCenter)
+        self.bind_text('id_text', id_label)
+        self.bind('id_style', lambda style: set_style_property(id_label, 'textStyle', style))
+        self.bind_text('role_text', role_label)
+        self.bind_text('time_caption', time_caption)
+        self.bind_text('time_value', time_value)
+
+        content_layout.addWidget(right_panel)
+        self.bind('split', lambda split: (content_layout.setStretch(0, split[0]),
+                                          content_layout.setStretch(1, split[1])))
+        main_layout.addWidget(content_area)
+        self.build_bottom_bar(main_layout)
+
+    def _set_left(self, left):
+        path, width, height, background, fallback = left
+        set_style_property(self.left_panel, 'panel', background)
+        pixmap = self.pixmaps.get(path, width, height)
+        if pixmap.isNull():
+            self.left_image.setPixmap(QPixmap())
+            self.left_image.setText(fallback)
+            set_style_property(self.left_image, 'textStyle', 'logoFallback' if path == LOGO_PATH else 'missing')
+        else:
+            self.left_image.setText("")
+            self.left_image.setPixmap(pixmap)
+            set_style_property(self.left_image, 'textStyle', 'image')
+
+
+class ScanningPage(BoundPage):
+    def __init__(self, parent=None):
+        """Banner, camera mirror area and date/time bar"""
+        super().__init__(parent)
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setSpacing(0)
+        self.build_banner(main_layout)
+
+        content_area = QFrame()
+        content_area.setProperty('panel', 'black')
+        content_layout = QVBoxLayout(content_area)
+        content_layout.setAlignment(Qt.AlignCenter)
+        # Scanning text, replaced by the live camera mirror when available
+        self.mirror_label = QLabel()
+        self.mirror_label.setAlignment(Qt.AlignCenter)
+        self.mirror_label.setMinimumSize(1280, 720)
+        self.mirror_label.setProperty('textStyle', 'display')
+        content_layout.addWidget(self.mirror_label)
+        main_layout.addWidget(content_area)
+        self.build_bottom_bar(main_layout)
+
+    def reset_mirror(self):
+        """Back to the placeholder text after the mirror drew frames"""
+        self.mirror_label.setPixmap(QPixmap())
+        self.mirror_label.setText("Scanning...")
+
+
+class ScreenPages(QStackedWidget):
+    def __init__(self, window, pixmaps):
+        """Full-window stack of the prebuilt overlay pages (hidden until used)"""
+        super().__init__(window)
+        self.setGeometry(0, 0, 1920, 1080)
+        self.setProperty('panel', 'overlay')
+        self.pages = {'split': SplitPage(pixmaps), 'scanning': ScanningPage()}
+        for page in self.pages.values():
+            self.addWidget(page)
+        self.hide()
+
+    def show_page(self, name, **values):
+        """Bind the values and switch to the page; returns it"""
+        page = self.pages[name]
+        page.set_data(**values)
+        self.setCurrentWidget(page)
+        self.show()
+        self.raise_()
+        return page
+
+    def hide_pages(self):
+        self.hide()
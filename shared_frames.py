@@ -0,0 +1,144 @@
+"""
+Shared-memory camera frames for the main screen process.
+
+The login process owns the camera (camera_session.py). SharedFrameWriter
+publishes its frames into a multiprocessing.shared_memory ring so the
+student-facing main screen (testmainscreen.py, a separate process) can show
+a live mirror without opening the camera or copying frames through pipes.
+
+Layout of the block:
+
+    ring header   magic, layout version, slot count, slot capacity
+                  (height, width, channels), newest sequence number
+    slot header   begin seq, end seq, timestamp, height, width   (per slot)
+    slot data     height * width * channels bytes                (per slot)
+
+Frame n goes to slot n % slots. Each slot is a seqlock: the writer sets
+"begin" before copying the pixels and "end" after, and a reader only accepts
+a copy when both match the sequence it expected, so it never shows a
+half-written frame.
+"""
+
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+DEFAULT_NAME = 'ainiform_frames'
+MAGIC = b'AIFR'
+LAYOUT_VERSION = 1
+
+RING_HEADER = struct.Struct('<4sIIIIIQ')   # magic, version, slots, height, width, channels, latest seq
+SLOT_HEADER = struct.Struct('<QQdII')      # begin seq, end seq, timestamp, height, width
+SLOT_HEADER_SIZE = 32                      # SLOT_HEADER padded to 8-byte alignment
+
+
+class SharedFrameWriter:
+    def __init__(self, name=DEFAULT_NAME, slots=4, width=640, height=480, channels=3):
+        """Create (or replace) the shared frame ring"""
+        self.name = name
+        self.slots = slots
+        self.width = width
+        self.height = height
+        self.channels = channels
+        self.slot_bytes = width * height * channels
+        self.seq = 0
+
+        size = RING_HEADER.size + slots * (SLOT_HEADER_SIZE + self.slot_bytes)
+        try:
+            # A block left behind by a crashed run
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        RING_HEADER.pack_into(self.shm.buf, 0, MAGIC, LAYOUT_VERSION, slots, height, width, channels, 0)
+        print(f"Shared frame ring '{name}' created ({slots} x {width}x{height})")
+
+    def _slot_offset(self, slot):
+        return RING_HEADER.size + slot * (SLOT_HEADER_SIZE + self.slot_bytes)
+
+    def write(self, frame):
+        """Publish one BGR frame (called from the camera capture thread)"""
+        height, width = frame.shape[:2]
+        if height > self.height or width > self.width or frame.ndim != 3 or frame.shape[2] != self.channels:
+            return False
+
+        self.seq += 1
+        seq = self.seq
+        offset = self._slot_offset(seq % self.slots)
+        buf = self.shm.buf
+
+        # Seqlock: begin != end while the pixels are being replaced
+        struct.pack_into('<Q', buf, offset, seq)
+        data = np.ndarray((height, width, self.channels), dtype=np.uint8,
+                          buffer=buf, offset=offset + SLOT_HEADER_SIZE)
+        data[...] = frame
+        SLOT_HEADER.pack_into(buf, offset, seq, seq, time.time(), height, width)
+        struct.pack_into('<Q', buf, RING_HEADER.size - 8, seq)
+        return True
+
+    def close(self):
+        """Remove the ring (end of shift)"""
+        try:
+            self.shm.close()
+            self.shm.unlink()
+        except Exception as e:
+            print(f"Error closing shared frame ring: {e}")
+
+
+class SharedFrameReader:
+    def __init__(self, name=DEFAULT_NAME):
+        """Attach to a ring created by SharedFrameWriter; raises FileNotFoundError if absent"""
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=False, track=False)
+        except TypeError:
+            # Python < 3.13 always registers the block; keep the tracker from
+            # unlinking the writer's ring when this process exits
+            self.shm = shared_memory.SharedMemory(name=name, create=False)
+            try:
+                resource_tracker.unregister(self.shm._name, 'shared_memory')
+            except Exception:
+                pass
+
+        magic, version, self.slots, self.height, self.width, self.channels, _ = \
+            RING_HEADER.unpack_from(self.shm.buf, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION:
+            self.shm.close()
+            raise ValueError(f"Shared memory '{name}' is not a frame ring")
+        self.slot_bytes = self.width * self.height * self.channels
+        self.last_seq = 0
+
+    def latest_seq(self):
+        """Sequence number of the newest published frame"""
+        return struct.unpack_from('<Q', self.shm.buf, RING_HEADER.size - 8)[0]
+
+    def read_latest(self):
+        """Return (seq, timestamp, frame copy) of a frame newer than the last read, or None"""
+        seq = self.latest_seq()
+        if seq == 0 or seq == self.last_seq:
+            return None
+        offset = RING_HEADER.size + (seq % self.slots) * (SLOT_HEADER_SIZE + self.slot_bytes)
+        buf = self.shm.buf
+
+        _, end, timestamp, height, width = SLOT_HEADER.unpack_from(buf, offset)
+        if end != seq:
+            return None
+        data = np.ndarray((height, width, self.channels), dtype=np.uint8,
+                          buffer=buf, offset=offset + SLOT_HEADER_SIZE)
+        frame = data.copy()
+        begin = struct.unpack_from('<Q', buf, offset)[0]
+        if begin != seq:
+            # The writer lapped us while copying
+            return None
+        self.last_seq = seq
+        return seq, timestamp, frame
+
+    def close(self):
+        """Detach from the ring (the writer owns it)"""
+        try:
+            self.shm.close()
+        except Exception:
+            pass
@@ -0,0 +1,74 @@
+"""
+Speculative camera and detector warm-up for the guard interface.
+
+The first keystroke of an RFID burst starts a SpeculativeWarmup: the detector
+subscribes to the camera session and loads/warms the YOLO model on a
+background thread while the rest of the card ID is typed and looked up in
+the database. If the card turns out to be a student or teacher, the splash
+screen claims the already-warm detector; for guards, special passes and
+unknown cards the warm-up is cancelled.
+
+Only the subscription to a running camera session happens on the Tk thread.
+Without a session nothing is opened speculatively (cv2.VideoCapture blocks):
+the model is still warmed, and the splash opens the camera when it claims
+the detector. A cancelled warm-up is cleaned up by the worker thread once
+load_model() / warm_up() have returned, never underneath them.
+"""
+
+import threading
+
+
+class SpeculativeWarmup:
+    def __init__(self, detector):
+        """Wrap a YOLOCameraDetection that has not been started yet"""
+        self.detector = detector
+        self.cancelled = False
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        """Subscribe to the camera session and warm the model in the background"""
+        if self.detector.camera_session is not None:
+            try:
+                self.detector.initialize_camera()
+            except Exception as e:
+                print(f"Speculative warm-up: camera not available: {e}")
+        self._thread = threading.Thread(target=self._run, name="detector-warmup", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Load the model and run one throw-away inference on a live frame"""
+        try:
+            if not self.detector.load_model() or self.cancelled:
+                return
+            frame = None
+            # No camera session: warm up on a blank frame
+            wait_for_frame = getattr(self.detector.cap, 'wait_for_frame', None)
+            if wait_for_frame is not None:
+                ret, frame = wait_for_frame(timeout=1.0)
+                if not ret:
+                    frame = None
+            if not self.cancelled:
+                self.detector.warm_up(frame)
+        except Exception as e:
+            print(f"Speculative warm-up failed: {e}")
+        finally:
+            with self._lock:
+                self._ready.set()
+                cancelled = self.cancelled
+            if cancelled:
+                self.detector.cleanup()
+
+    def is_ready(self):
+        """True once the model is loaded and warmed (or loading failed)"""
+        return self._ready.is_set()
+
+    def cancel(self):
+        """Abandon the warm-up (guard card, special pass or unknown ID)"""
+        with self._lock:
+            self.cancelled = True
+            finished = self._ready.is_set()
+        if finished:
+            self.detector.cleanup()
+        # Otherwise _run cleans up once the model call in progress returns
@@ -0,0 +1,311 @@
+"""
+Status event bus between the guard application and the main screen.
+
+The two processes used to talk only by rewriting main_screen_status.txt and
+polling it every 2 seconds from both sides. The bus carries the same events
+over a Unix domain socket instead, so each side reacts as soon as an event
+arrives and nothing is written to disk per event:
+
+    message = 4-byte big-endian length + UTF-8 JSON
+              {"event": "TURNSTILE_OPEN", "fields": ["SP-001", "08:15:02 AM", "Guard"]}
+
+"fields" are the lines that follow the event name in the status file, so the
+handlers are the same for both transports. The main screen (testmainscreen.py)
+listens with StatusBusServer, the guard application connects with
+StatusBusClient. Both sides watch the socket file descriptors from their
+event loops (QSocketNotifier / Tk createfilehandler). When the socket is not
+available (main screen not started yet, Windows, ...) events fall back to the
+status file with write_status_file() / read_status_file().
+
+Every event is stamped by the sending process with its source id, a
+sequence number that only goes up, and the send time. Status files carry
+the stamp as a last line "@<source> <seq> <time>". EventFilter on the main
+screen applies each event exactly once (the file is read every tick and may
+also repeat a bus event) and skips events older than EVENT_MAX_AGE_SECONDS,
+such as a status left in the file by a previous session.
+"""
+
+import json
+import os
+import socket
+import struct
+import tempfile
+import threading
+import time
+
+STATUS_FILE = "main_screen_status.txt"
+HEADER = struct.Struct('>I')
+MAX_MESSAGE_BYTES = 64 * 1024
+BUS_AVAILABLE = hasattr(socket, 'AF_UNIX') and os.name != 'nt'
+EVENT_MAX_AGE_SECONDS = 10.0
+
+_source = f"{os.getpid()}-{int(time.time())}"
+_seq = 0
+_seq_lock = threading.Lock()
+
+
+def stamp_event():
+    """Return the next {source, seq, time} stamp of this process"""
+    global _seq
+    with _seq_lock:
+        _seq += 1
+        return {'source': _source, 'seq': _seq, 'time': time.time()}
+
+
+def default_socket_path():
+    """Socket path shared by both processes (AINIFORM_STATUS_SOCKET overrides it)"""
+    return os.environ.get('AINIFORM_STATUS_SOCKET') or os.path.join(tempfile.gettempdir(), 'ainiform_status.sock')
+
+
+def encode_event(event, fields=(), stamp=None):
+    """Frame one stamped event for the socket"""
+    message = {'event': event, 'fields': [str(field) for field in fields]}
+    message.update(stamp if stamp is not None else stamp_event())
+    payload = json.dumps(message).encode('utf-8')
+    return HEADER.pack(len(payload)) + payload
+
+
+def _event_stamp(message):
+    """The stamp of a decoded message, or None for an unstamped sender"""
+    if 'seq' not in message:
+        return None
+    return {'source': message.get('source'), 'seq': int(message['seq']), 'time': float(message.get('time', 0))}
+
+
+class EventDecoder:
+    def __init__(self):
+        """Reassemble length-prefixed messages from a byte stream"""
+        self.buffer = b''
+
+    def feed(self, data):
+        """Add received bytes; returns the list of complete (event, fields, stamp) messages"""
+        self.buffer += data
+        events = []
+        while len(self.buffer) >= HEADER.size:
+            (length,) = HEADER.unpack_from(self.buffer)
+            if length > MAX_MESSAGE_BYTES:
+                raise ValueError(f"status message too large ({length} bytes)")
+            if len(self.buffer) < HEADER.size + length:
+                break
+            payload = self.buffer[HEADER.size:HEADER.size + length]
+            self.buffer = self.buffer[HEADER.size + length:]
+            message = json.loads(payload.decode('utf-8'))
+            events.append((message['event'], list(message.get('fields', [])), _event_stamp(message)))
+        return events
+
+
+def write_status_file(event, fields=(), path=STATUS_FILE, stamp=None):
+    """File fallback: event name and fields, one per line (at least 4 lines), then the stamp"""
+    stamp = stamp if stamp is not None else stamp_event()
+    lines = [event] + [str(field) for field in fields]
+    lines += ["N/A"] * (4 - len(lines))
+    lines.append(f"@{stamp['source']} {stamp['seq']} {stamp['time']:.3f}")
+    with open(path, "w") as f:
+        for line in lines:
+            f.write(f"{line}\n")
+
+
+def read_status_file(path=STATUS_FILE):
+    """Return (event, fields, stamp) from the status file, or None"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        lines = [line.strip() for line in f.readlines()]
+    if not lines:
+        return None
+    stamp = None
+    if len(lines) > 1 and lines[-1].startswith('@'):
+        try:
+            source, seq, sent = lines.pop()[1:].split()
+            stamp = {'source': source, 'seq': int(seq), 'time': float(sent)}
+        except ValueError:
+            pass
+    return lines[0], lines[1:], stamp
+
+
+class EventFilter:
+    def __init__(self, max_age=EVENT_MAX_AGE_SECONDS):
+        """Pass each stamped event once and drop expired ones"""
+        self.max_age = max_age
+        self.source = None
+        self.last_seq = 0
+
+    def accept(self, stamp):
+        """True if the event should be applied"""
+        if stamp is None:
+            # Unstamped (older) sender: nothing to deduplicate on
+            return True
+        if stamp['source'] != self.source:
+            # Guard application restarted: its sequence starts over
+            self.source = stamp['source']
+            self.last_seq = 0
+        if stamp['seq'] <= self.last_seq:
+            return False
+        self.last_seq = stamp['seq']
+        age = time.time() - stamp['time']
+        if age > self.max_age:
+            print(f"Skipping expired status event #{stamp['seq']} ({age:.0f} s old)")
+            return False
+        return True
+
+
+class StatusBusServer:
+    def __init__(self, path=None):
+        """Listening side (main screen); the caller watches fileno() and client sockets"""
+        self.path = path or default_socket_path()
+        self.sock = None
+        self.clients = {}
+
+    def start(self):
+        """Bind the socket; False if the bus is not available here"""
+        if not BUS_AVAILABLE:
+            return False
+        try:
+            if os.path.exists(self.path):
+                # Left behind by a previous main screen
+                os.unlink(self.path)
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.bind(self.path)
+            self.sock.listen(4)
+            self.sock.setblocking(False)
+            print(f"Status bus listening on {self.path}")
+            return True
+        except Exception as e:
+            print(f"Status bus not available: {e}")
+            self.sock = None
+            return False
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def accept(self):
+        """Accept pending connections; returns the new client sockets"""
+        accepted = []
+        while self.sock is not None:
+            try:
+                client, _ = self.sock.accept()
+            except (BlockingIOError, InterruptedError):
+                break
+            client.setblocking(False)
+            self.clients[client] = EventDecoder()
+            accepted.append(client)
+        return accepted
+
+    def read(self, client):
+        """Read a readable client; returns its events, or None when it should be dropped"""
+        try:
+            data = client.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return []
+        except OSError:
+            data = b''
+        if not data:
+            return None
+        try:
+            return self.clients[client].feed(data)
+        except Exception as e:
+            print(f"Status bus: bad message from client: {e}")
+            return None
+
+    def drop(self, client):
+        """Forget a client connection"""
+        self.clients.pop(client, None)
+        try:
+            client.close()
+        except OSError:
+            pass
+
+    def has_clients(self):
+        return bool(self.clients)
+
+    def broadcast(self, event, fields=()):
+        """Send an event to every connected client; returns the number reached"""
+        message = encode_event(event, fields)
+        sent = 0
+        for client in list(self.clients):
+            try:
+                client.setblocking(True)
+                client.sendall(message)
+                client.setblocking(False)
+                sent += 1
+            except OSError:
+                self.drop(client)
+        return sent
+
+    def close(self):
+        """Close all connections and remove the socket file"""
+        for client in list(self.clients):
+            self.drop(client)
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+
+class StatusBusClient:
+    def __init__(self, path=None):
+        """Connecting side (guard application)"""
+        self.path = path or default_socket_path()
+        self.sock = None
+        self.decoder = EventDecoder()
+
+    @property
+    def connected(self):
+        return self.sock is not None
+
+    def connect(self):
+        """Connect if the main screen is listening; returns True when connected"""
+        if self.sock is not None:
+            return True
+        if not BUS_AVAILABLE or not os.path.exists(self.path):
+            return False
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            return False
+        self.sock = sock
+        self.decoder = EventDecoder()
+        print("Connected to main screen status bus")
+        return True
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def send(self, event, fields=(), stamp=None):
+        """Send one event; False if the bus is down (caller closes it and uses the file)"""
+        if not self.connect():
+            return False
+        try:
+            self.sock.sendall(encode_event(event, fields, stamp))
+            return True
+        except OSError:
+            return False
+
+    def receive(self):
+        """Read after the socket became readable; None when it should be closed"""
+        try:
+            data = self.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return []
+        except OSError:
+            data = b''
+        if not data:
+            return None
+        try:
+            return self.decoder.feed(data)
+        except Exception as e:
+            print(f"Status bus: bad message from main screen: {e}")
+            return None
+
+    def close(self):
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
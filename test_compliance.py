@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Behaviour checks for the uniform compliance rules (compliance.py)
+
+SplashComplianceVoter decides whether a student goes through or is sent to
+manual verification, so its frame-by-frame rules are pinned down here.
+"""
+
+from compliance import (DECISION_CLEAN, DECISION_MANUAL_VERIFICATION, REQUIRED_CLASSES,
+                        RESULT_ENTRY_ACCESS, RESULT_MANUAL_VERIFICATION, SplashComplianceVoter,
+                        compliance_result)
+
+
+def detections(*class_names):
+    return [{'class_name': class_name, 'confidence': 0.9} for class_name in class_names]
+
+
+FULL_UNIFORM = detections(*REQUIRED_CLASSES)
+
+
+def test_full_uniform_is_clean_and_keeps_scanning():
+    voter = SplashComplianceVoter()
+    assert voter.update(FULL_UNIFORM) == DECISION_CLEAN
+    assert not voter.finished
+
+
+def test_class_names_are_case_insensitive():
+    voter = SplashComplianceVoter()
+    assert voter.update(detections(*[name.upper() for name in REQUIRED_CLASSES])) == DECISION_CLEAN
+
+
+def test_partial_uniform_stops_for_manual_verification():
+    voter = SplashComplianceVoter()
+    voter.update(FULL_UNIFORM)
+    assert voter.update(detections('ict longsleeve', 'ict logo')) == DECISION_MANUAL_VERIFICATION
+    assert voter.finished
+    # The decision is final for this scan
+    assert voter.update(FULL_UNIFORM) == DECISION_MANUAL_VERIFICATION
+
+
+def test_no_detections_until_limit():
+    voter = SplashComplianceVoter(no_detection_limit=3)
+    assert voter.update([]) is None
+    assert voter.update([]) is None
+    assert not voter.finished
+    assert voter.update([]) == DECISION_MANUAL_VERIFICATION
+    assert voter.finished
+
+
+def test_detection_resets_no_detection_count():
+    voter = SplashComplianceVoter(no_detection_limit=3)
+    voter.update([])
+    voter.update([])
+    voter.update(FULL_UNIFORM)
+    voter.update([])
+    voter.update([])
+    assert not voter.finished
+    assert voter.result == DECISION_CLEAN
+
+
+def test_reset_starts_a_new_scan():
+    voter = SplashComplianceVoter()
+    voter.update(detections('black shoes'))
+    assert voter.finished
+    voter.reset()
+    assert not voter.finished
+    assert voter.result is None
+    assert voter.update(FULL_UNIFORM) == DECISION_CLEAN
+
+
+def test_custom_required_classes():
+    voter = SplashComplianceVoter(required_classes=('ict logo',))
+    assert voter.update(detections('ict logo')) == DECISION_CLEAN
+
+
+def test_compliance_result_per_frame():
+    assert compliance_result(FULL_UNIFORM) == RESULT_ENTRY_ACCESS
+    assert compliance_result(detections('ict pants')) == RESULT_MANUAL_VERIFICATION
+    assert compliance_result([]) == RESULT_MANUAL_VERIFICATION
+
+
+if __name__ == "__main__":
+    for name, test in sorted(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Behaviour checks for the status event bus (status_bus.py)
+
+Covers the exactly-once delivery the main screen relies on: EventFilter
+(stale, duplicate and out-of-order events, a restarted sender), the status
+file round trip including a legacy unstamped file, and EventDecoder with
+frames split across socket reads.
+"""
+
+import os
+import tempfile
+import time
+
+from status_bus import EventDecoder, EventFilter, encode_event, read_status_file, write_status_file
+
+
+def make_stamp(seq, source="guard-1", age=0.0):
+    return {'source': source, 'seq': seq, 'time': time.time() - age}
+
+
+def test_filter_passes_each_event_once():
+    event_filter = EventFilter()
+    stamp = make_stamp(1)
+    assert event_filter.accept(stamp)
+    # The same event read again from the file (or repeated over the bus)
+    assert not event_filter.accept(dict(stamp))
+
+
+def test_filter_drops_out_of_order_events():
+    event_filter = EventFilter()
+    assert event_filter.accept(make_stamp(5))
+    assert not event_filter.accept(make_stamp(4))
+    assert event_filter.accept(make_stamp(6))
+
+
+def test_filter_drops_stale_events():
+    event_filter = EventFilter(max_age=10.0)
+    # e.g. a status left in the file by a previous session
+    assert not event_filter.accept(make_stamp(1, age=30.0))
+    assert event_filter.accept(make_stamp(2, age=1.0))
+
+
+def test_filter_restarts_sequence_for_new_source():
+    event_filter = EventFilter()
+    assert event_filter.accept(make_stamp(7, source="guard-1"))
+    # Guard application restarted: its sequence starts over at 1
+    assert event_filter.accept(make_stamp(1, source="guard-2"))
+    assert not event_filter.accept(make_stamp(1, source="guard-2"))
+
+
+def test_filter_passes_unstamped_events():
+    event_filter = EventFilter()
+    assert event_filter.accept(None)
+    assert event_filter.accept(None)
+
+
+def test_status_file_round_trip():
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    os.close(fd)
+    try:
+        stamp = make_stamp(3)
+        write_status_file("TURNSTILE_OPEN", ["SP-001", "08:15:02 AM", "Guard"], path=path, stamp=stamp)
+        event, fields, read_stamp = read_status_file(path)
+        assert event == "TURNSTILE_OPEN"
+        assert fields == ["SP-001", "08:15:02 AM", "Guard"]
+        assert read_stamp['source'] == "guard-1"
+        assert read_stamp['seq'] == 3
+        assert abs(read_stamp['time'] - stamp['time']) < 0.01
+    finally:
+        os.unlink(path)
+
+
+def test_status_file_pads_short_events():
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    os.close(fd)
+    try:
+        write_status_file("RESET_TO_DEFAULT", path=path, stamp=make_stamp(1))
+        event, fields, stamp = read_status_file(path)
+        assert event == "RESET_TO_DEFAULT"
+        assert fields == ["N/A", "N/A", "N/A"]
+        assert stamp['seq'] == 1
+    finally:
+        os.unlink(path)
+
+
+def test_legacy_unstamped_status_file():
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    os.close(fd)
+    try:
+        with open(path, 'w') as f:
+            f.write("STUDENT_TEACHER_INFO\nBob Wilson\nSTUDENT\n08:15:02 AM\nGuard\n")
+        event, fields, stamp = read_status_file(path)
+        assert event == "STUDENT_TEACHER_INFO"
+        assert fields == ["Bob Wilson", "STUDENT", "08:15:02 AM", "Guard"]
+        assert stamp is None
+    finally:
+        os.unlink(path)
+
+
+def test_missing_or_empty_status_file():
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    os.close(fd)
+    try:
+        assert read_status_file(path) is None
+    finally:
+        os.unlink(path)
+    assert read_status_file(path) is None
+
+
+def test_decoder_reassembles_split_frames():
+    data = (encode_event("TURNSTILE_OPEN", ["SP-001"], stamp=make_stamp(1))
+            + encode_event("TURNSTILE_CLOSED", stamp=make_stamp(2)))
+    decoder = EventDecoder()
+    events = []
+    # One byte per read: every header and payload arrives in pieces
+    for i in range(len(data)):
+        events += decoder.feed(data[i:i + 1])
+    assert [(event, fields) for event, fields, _stamp in events] == [("TURNSTILE_OPEN", ["SP-001"]),
+                                                                       ("TURNSTILE_CLOSED", [])]
+    assert [stamp['seq'] for _event, _fields, stamp in events] == [1, 2]
+    assert decoder.buffer == b''
+
+
+def test_decoder_keeps_partial_frame():
+    frame = encode_event("INVALID_ID", stamp=make_stamp(4))
+    decoder = EventDecoder()
+    assert decoder.feed(frame[:-3]) == []
+    events = decoder.feed(frame[-3:])
+    assert len(events) == 1
+    assert events[0][0] == "INVALID_ID"
+
+
+if __name__ == "__main__":
+    for name, test in sorted(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: ok")
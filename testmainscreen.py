@@ -5,20 +5,30 @@ import signal
 from datetime import datetime
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QFrame, QGridLayout, QPushButton, QDialog)
-from PyQt5.QtCore import QTimer, Qt, QSize
-from PyQt5.QtGui import QPixmap, QFont, QPainter, QColor, QPen, QBrush, QPainterPath
+from PyQt5.QtCore import QTimer, Qt, QSize, QSocketNotifier
+from PyQt5.QtGui import QPixmap, QFont, QColor, QPen, QImage
 from PyQt5.QtSvg import QSvgWidget
 
+from status_bus import EventFilter, StatusBusServer, read_status_file, write_status_file
+from ui_marks import mark
+from pixmap_cache import get_pixmap_cache
+from screen_pages import LEFT_INSTRUCTIONS, LEFT_SCAN_OK, ScreenPages, SplitPage
+from timer_scheduler import TimerScheduler
+from theme import apply_theme, set_style_property
+
+# Live camera mirror published by the guard application (needs numpy)
+try:
+    from shared_frames import SharedFrameReader
+    SHARED_FRAMES_AVAILABLE = True
+except ImportError:
+    SHARED_FRAMES_AVAILABLE = False
+
 class DeveloperModeDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Developer Mode")
         self.setFixedSize(800, 600)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1E3A8A;
-            }
-        """)
+        self.setObjectName("developerDialog")
         
         # Make dialog modal
         self.setModal(True)
@@ -33,221 +43,74 @@ class DeveloperModeDialog(QDialog):
         # Header
         header = QLabel("Developer Mode")
         header.setAlignment(Qt.AlignCenter)
-        header.setStyleSheet("""
-            QLabel {
-                background-color: #DAA520;
-                color: white;
-                font-family: Arial, sans-serif;
-                font-size: 28px;
-                font-weight: bold;
-                padding: 15px;
-                border-radius: 8px;
-                min-height: 30px;
-            }
-        """)
+        header.setProperty('textStyle', 'devHeader')
         layout.addWidget(header)
         
+        # Pending deadlines of the main screen's timer scheduler
+        timers = getattr(self.parent(), 'timers', None)
+        if timers is not None:
+            pending = ", ".join(f"{name} ({ms} ms)" for name, ms in timers.pending())
+            timers_label = QLabel(f"Pending timers: {timers.pending_count()}" + (f" - {pending}" if pending else ""))
+            timers_label.setWordWrap(True)
+            timers_label.setProperty('textStyle', 'devInfo')
+            layout.addWidget(timers_label)
+        
         # Status Simulation Section
         status_label = QLabel("Status Simulation:")
-        status_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-family: Arial, sans-serif;
-                font-size: 18px;
-                font-weight: bold;
-                margin-top: 15px;
-                margin-bottom: 5px;
-            }
-        """)
+        status_label.setProperty('textStyle', 'devSection')
         layout.addWidget(status_label)
         
         # Invalid ID Button
         invalid_btn = QPushButton("Invalid ID")
         invalid_btn.setMinimumHeight(50)
-        invalid_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #DC3545;
-                color: white;
-                font-family: Arial, sans-serif;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 12px 20px;
-                border-radius: 8px;
-                border: none;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: #C82333;
-            }
-            QPushButton:pressed {
-                background-color: #A71E2A;
-            }
-        """)
+        invalid_btn.setProperty('button', 'devDanger')
         invalid_btn.clicked.connect(lambda: self.simulate_status("Invalid ID"))
         layout.addWidget(invalid_btn)
         
         # Deactivated Pass Button
         deactivated_btn = QPushButton("Deactivated Pass")
         deactivated_btn.setMinimumHeight(50)
-        deactivated_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #DC3545;
-                color: white;
-                font-family: Arial, sans-serif;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 12px 20px;
-                border-radius: 8px;
-                border: none;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: #C82333;
-            }
-            QPushButton:pressed {
-                background-color: #A71E2A;
-            }
-        """)
+        deactivated_btn.setProperty('button', 'devDanger')
         deactivated_btn.clicked.connect(lambda: self.simulate_status("Deactivated Pass"))
         layout.addWidget(deactivated_btn)
         
         # Valid Special Pass Button
         valid_special_btn = QPushButton("Valid Special Pass")
         valid_special_btn.setMinimumHeight(50)
-        valid_special_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28A745;
-                color: white;
-                font-family: Arial, sans-serif;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 12px 20px;
-                border-radius: 8px;
-                border: none;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:pressed {
-                background-color: #1E7E34;
-            }
-        """)
+        valid_special_btn.setProperty('button', 'devSuccess')
         valid_special_btn.clicked.connect(lambda: self.simulate_status("Valid Special Pass"))
         layout.addWidget(valid_special_btn)
         
         # Valid ID Button
         valid_btn = QPushButton("Valid ID")
         valid_btn.setMinimumHeight(50)
-        valid_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28A745;
-                color: white;
-                font-family: Arial, sans-serif;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 12px 20px;
-                border-radius: 8px;
-                border: none;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:pressed {
-                background-color: #1E7E34;
-            }
-        """)
+        valid_btn.setProperty('button', 'devSuccess')
         valid_btn.clicked.connect(lambda: self.simulate_status("Valid Pass"))
         layout.addWidget(valid_btn)
         
         # Time Check-out Section
         checkout_label = QLabel("For Time Check-out:")
-        checkout_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-family: Arial, sans-serif;
-                font-size: 18px;
-                font-weight: bold;
-                margin-top: 15px;
-                margin-bottom: 5px;
-            }
-        """)
+        checkout_label.setProperty('textStyle', 'devSection')
         layout.addWidget(checkout_label)
         
         # Special Pass Button
         special_pass_btn = QPushButton("Special Pass")
         special_pass_btn.setMinimumHeight(50)
-        special_pass_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28A745;
-                color: white;
-                font-family: Arial, sans-serif;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 12px 20px;
-                border-radius: 8px;
-                border: none;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:pressed {
-                background-color: #1E7E34;
-            }
-        """)
+        special_pass_btn.setProperty('button', 'devSuccess')
         special_pass_btn.clicked.connect(lambda: self.simulate_status("Special Pass"))
         layout.addWidget(special_pass_btn)
         
         # Student / Teacher / Staff Button
         student_teacher_staff_btn = QPushButton("Student / Teacher / Staff")
         student_teacher_staff_btn.setMinimumHeight(50)
-        student_teacher_staff_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28A745;
-                color: white;
-                font-family: Arial, sans-serif;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 12px 20px;
-                border-radius: 8px;
-                border: none;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:pressed {
-                background-color: #1E7E34;
-            }
-        """)
+        student_teacher_staff_btn.setProperty('button', 'devSuccess')
         student_teacher_staff_btn.clicked.connect(lambda: self.simulate_status("Student / Teacher / Staff"))
         layout.addWidget(student_teacher_staff_btn)
         
         # Exit Button
         exit_btn = QPushButton("Exit Developer Mode")
         exit_btn.setMinimumHeight(50)
-        exit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FD7E14;
-                color: white;
-                font-family: Arial, sans-serif;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 12px 20px;
-                border-radius: 8px;
-                border: none;
-                text-align: center;
-                margin-top: 10px;
-            }
-            QPushButton:hover {
-                background-color: #E55A00;
-            }
-            QPushButton:pressed {
-                background-color: #CC5200;
-            }
-        """)
+        exit_btn.setProperty('button', 'devExit')
         exit_btn.clicked.connect(self.close)
         layout.addWidget(exit_btn)
     
@@ -266,16 +129,29 @@ class DeveloperModeDialog(QDialog):
         self.close()  # Close developer dialog
 
 class STIWelcomeScreen(QMainWindow):
-    def __init__(self):
+    def __init__(self, standby=False):
         super().__init__()
+        # Every widget is styled by the application stylesheet and its theme properties
+        apply_theme(QApplication.instance())
         self.setWindowTitle("AI-niform - Main Screen")
         self.setFixedSize(1920, 1080)  # Lock to 1920x1080 resolution
         
+        # A standby instance is fully built but hidden until promote()
+        self.standby = standby
+        
         # Position window on secondary monitor if available
         self.position_on_secondary_monitor()
         
         # Set window to fullscreen
-        self.showFullScreen()
+        if not self.standby:
+            self.showFullScreen()
+        
+        # Logo and avatars are scaled and masked once, not on every screen
+        self.pixmaps = get_pixmap_cache()
+        self.pixmaps.preload()
+        
+        # Full-screen states are prebuilt pages; showing one only rebinds its fields
+        self.screen_pages = ScreenPages(self, self.pixmaps)
         
         # Set up the main widget
         main_widget = QWidget()
@@ -289,20 +165,10 @@ class STIWelcomeScreen(QMainWindow):
         self.setup_ui(layout)
         self.setup_timer()
         
-        # Set window style
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: white;
-            }
-        """)
-        
         # Developer mode input tracking
         self.developer_input = ""
-        self.developer_timeout = None
         
         # Status message tracking
-        self.status_timer = None
-        self.reset_timer = None
         self.original_instruction_text = "Please tap your ID\nto the Card Reader"
         
         # Scanning sequence tracking
@@ -314,22 +180,39 @@ class STIWelcomeScreen(QMainWindow):
         self.setFocusPolicy(Qt.StrongFocus)
         self.setFocus()  # Set focus to receive keyboard events
         
-        # Status file for communication with guard screen
+        # Status file for communication with guard screen (fallback for the status bus)
         self.status_file = "main_screen_status.txt"
+        self.status_bus = None
+        self.status_filter = EventFilter()
+        if self.standby:
+            # Only the visible instance listens for guard screen events
+            self.timers.cancel('status_check')
+        else:
+            self.setup_status_bus()
+        
+        # Live mirror of the guard application's camera (shared memory)
+        self.frame_reader = None
+        self.live_mirror_label = None
     
     def closeEvent(self, event):
         """Handle window close event"""
         print("closeEvent called - main screen is closing")
+        self.stop_live_mirror()
+        self.timers.cancel_all()
+        if self.frame_reader is not None:
+            self.frame_reader.close()
+            self.frame_reader = None
         # Write a status to indicate main screen is closing
         try:
-            with open(self.status_file, "w") as f:
-                f.write("MAIN_SCREEN_CLOSED\n")
-                f.write("N/A\n")
-                f.write("N/A\n")
-                f.write("N/A\n")
+            write_status_file("MAIN_SCREEN_CLOSED", path=self.status_file)
             print("Main screen closing - status written to file")
         except Exception as e:
             print(f"Error writing close status: {e}")
+        # Tell a connected guard screen right away (after the file, which it resets)
+        if self.status_bus is not None:
+            self.status_bus.broadcast("MAIN_SCREEN_CLOSED")
+            self.status_bus.close()
+            self.status_bus = None
         
         event.accept()
     
@@ -492,18 +375,7 @@ class STIWelcomeScreen(QMainWindow):
             
             # Update top banner to show check-in status
             if hasattr(self, 'top_banner') and self.is_widget_valid(self.top_banner):
-                self.top_banner.setStyleSheet("background-color: #90EE90;")  # Light green
-                for child in self.top_banner.findChildren(QLabel):
-                    if self.is_widget_valid(child):
-                        child.setText("Turnstile is Open")
-                        child.setStyleSheet("""
-                            QLabel {
-                                color: black;
-                                font-size: 24px;
-                                font-weight: bold;
-                                background-color: transparent;
-                            }
-                        """)
+                self.set_banner("Turnstile is Open", 'openCompact')
             
             # Clear right panel and show check-in information
             if hasattr(self, 'right_panel') and self.is_widget_valid(self.right_panel):
@@ -513,26 +385,13 @@ class STIWelcomeScreen(QMainWindow):
                 # Add person information
                 name_label = QLabel(person['name'])
                 name_label.setAlignment(Qt.AlignCenter)
-                name_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 24px;
-                        font-weight: bold;
-                        background-color: transparent;
-                    }
-                """)
+                name_label.setProperty('textStyle', 'strong')
                 self.right_panel.layout().addWidget(name_label)
                 
                 # Add role
                 role_label = QLabel(f"({person['role']})")
                 role_label.setAlignment(Qt.AlignCenter)
-                role_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                role_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(role_label)
                 
                 # Add check-in time
@@ -540,53 +399,29 @@ class STIWelcomeScreen(QMainWindow):
                 checkin_time = datetime.now().strftime("%I:%M:%S %p")
                 time_label = QLabel(f"Time Check-in: {checkin_time}")
                 time_label.setAlignment(Qt.AlignLeft)
-                time_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                time_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(time_label)
                 
                 # Add date
                 checkin_date = datetime.now().strftime("%B %d, %Y")
                 date_label = QLabel(f"Date: {checkin_date}")
                 date_label.setAlignment(Qt.AlignLeft)
-                date_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                date_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(date_label)
                 
                 # Add guard information
                 guard_label = QLabel("Guard in-charge:")
                 guard_label.setAlignment(Qt.AlignLeft)
-                guard_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                guard_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(guard_label)
                 
                 guard_name_label = QLabel("Arvin Jay De Guzman")
                 guard_name_label.setAlignment(Qt.AlignLeft)
-                guard_name_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                guard_name_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(guard_name_label)
             
             # Reset after 5 seconds
-            self.timer.singleShot(5000, self.reset_to_main_screen)
+            self.timers.schedule('screen_reset', 5000, self.reset_to_main_screen)
             
             # Force UI update
             self.update()
@@ -602,23 +437,11 @@ class STIWelcomeScreen(QMainWindow):
             print(f"Showing special pass check-out screen for: {person['name']}")
             
             # Stop the status check timer to prevent flashing
-            if hasattr(self, 'status_check_timer') and self.status_check_timer:
-                self.status_check_timer.stop()
+            self.timers.cancel('status_check')
             
             # Update top banner to show check-out status
             if hasattr(self, 'top_banner') and self.is_widget_valid(self.top_banner):
-                self.top_banner.setStyleSheet("background-color: #FFB6C1;")  # Light pink
-                for child in self.top_banner.findChildren(QLabel):
-                    if self.is_widget_valid(child):
-                        child.setText("Check-out Complete")
-                        child.setStyleSheet("""
-                            QLabel {
-                                color: black;
-                                font-size: 24px;
-                                font-weight: bold;
-                                background-color: transparent;
-                            }
-                        """)
+                self.set_banner("Check-out Complete", 'checkout')
             
             # Clear right panel and show check-out information
             if hasattr(self, 'right_panel') and self.is_widget_valid(self.right_panel):
@@ -628,26 +451,13 @@ class STIWelcomeScreen(QMainWindow):
                 # Add person information
                 name_label = QLabel(person['name'])
                 name_label.setAlignment(Qt.AlignCenter)
-                name_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 24px;
-                        font-weight: bold;
-                        background-color: transparent;
-                    }
-                """)
+                name_label.setProperty('textStyle', 'strong')
                 self.right_panel.layout().addWidget(name_label)
                 
                 # Add role
                 role_label = QLabel(f"({person['role']})")
                 role_label.setAlignment(Qt.AlignCenter)
-                role_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                role_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(role_label)
                 
                 # Add check-out time
@@ -655,53 +465,29 @@ class STIWelcomeScreen(QMainWindow):
                 checkout_time = datetime.now().strftime("%I:%M:%S %p")
                 time_label = QLabel(f"Time Check-out: {checkout_time}")
                 time_label.setAlignment(Qt.AlignLeft)
-                time_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                time_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(time_label)
                 
                 # Add date
                 checkout_date = datetime.now().strftime("%B %d, %Y")
                 date_label = QLabel(f"Date: {checkout_date}")
                 date_label.setAlignment(Qt.AlignLeft)
-                date_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                date_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(date_label)
                 
                 # Add guard information
                 guard_label = QLabel("Guard in-charge:")
                 guard_label.setAlignment(Qt.AlignLeft)
-                guard_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                guard_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(guard_label)
                 
                 guard_name_label = QLabel("Arvin Jay De Guzman")
                 guard_name_label.setAlignment(Qt.AlignLeft)
-                guard_name_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                guard_name_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(guard_name_label)
             
             # Reset after 5 seconds
-            self.timer.singleShot(5000, self.reset_to_main_screen)
+            self.timers.schedule('screen_reset', 5000, self.reset_to_main_screen)
             
             # Force UI update
             self.update()
@@ -712,100 +498,121 @@ class STIWelcomeScreen(QMainWindow):
             self.reset_to_main_screen()
     
     def check_status_file(self):
-        """Check status file for updates from guard screen"""
+        """Check status file for updates from guard screen (fallback when the bus is not connected)"""
+        if self.status_bus is not None and self.status_bus.has_clients():
+            return
         try:
-            if os.path.exists(self.status_file):
-                with open(self.status_file, 'r') as f:
-                    lines = f.readlines()
-                    if len(lines) >= 4:
-                        status = lines[0].strip()
-                        print(f"Status file read - Status: {status}, Lines: {len(lines)}")
-                        
-                        if status == "TURNSTILE_OPEN":
-                            special_pass = lines[1].strip()
-                            time_checkin = lines[2].strip()
-                            guard_name = lines[3].strip()
-                            print(f"Processing TURNSTILE_OPEN: {special_pass}, {time_checkin}, {guard_name}")
-                            self.show_turnstile_open_status(special_pass, time_checkin, guard_name)
-                        elif status == "SPECIAL_PASS_CHECKOUT":
-                            special_pass = lines[1].strip()
-                            time_checkout = lines[2].strip()
-                            guard_name = lines[3].strip()
-                            print(f"Processing SPECIAL_PASS_CHECKOUT: {special_pass}, {time_checkout}, {guard_name}")
-                            self.show_special_pass_checkout_status(special_pass, time_checkout, guard_name)
-                        elif status in ("STUDENT_TEACHER_APPROVED", "STUDENT_TEACHER_INFO") and len(lines) >= 5:
-                            person_name = lines[1].strip()
-                            person_role = lines[2].strip()
-                            time_value = lines[3].strip()
-                            guard_name = lines[4].strip()
-                            print(f"Processing STUDENT_TEACHER_INFO: {person_name}, {person_role}, {time_value}, {guard_name}")
-                            # First show instructions overlay, then the person info
-                            self.show_instructions_then_person(person_name, person_role, time_value, guard_name)
-                        elif status == "TURNSTILE_CLOSED":
-                            print("Processing TURNSTILE_CLOSED - calling reset_to_main_screen")
-                            self.reset_to_main_screen()
-                            # Clear the status file after processing to prevent re-processing
-                            try:
-                                with open(self.status_file, "w") as f:
-                                    f.write("PROCESSED\n")
-                                    f.write("N/A\n")
-                                    f.write("N/A\n")
-                                    f.write("N/A\n")
-                                print("Status file cleared after processing TURNSTILE_CLOSED")
-                            except Exception as e:
-                                print(f"Error clearing status file: {e}")
-                        elif status == "INVALID_ID":
-                            print("Processing INVALID_ID")
-                            self.show_invalid_id_message()
-                        elif status == "DEACTIVATED_PASS":
-                            print("Processing DEACTIVATED_PASS")
-                            self.show_deactivated_pass_message()
-                        elif status == "RESET_TO_DEFAULT":
-                            print("Processing RESET_TO_DEFAULT - calling reset_to_main_screen")
-                            self.reset_to_main_screen()
-                    else:
-                        print(f"Status file has insufficient lines: {len(lines)}")
-            else:
+            status_entry = read_status_file(self.status_file)
+            if status_entry is None:
                 print("Status file does not exist")
-                            
+                return
+            status, fields, stamp = status_entry
+            if len(fields) < 3:
+                print(f"Status file has insufficient lines: {len(fields) + 1}")
+                return
+            # The file keeps the last event; apply it only once
+            if not self.status_filter.accept(stamp):
+                return
+            print(f"Status file read - Status: {status}, Lines: {len(fields) + 1}")
+            self.handle_status_event(status, fields)
         except Exception as e:
             print(f"Error reading status file: {e}")
     
+    def handle_status_event(self, status, fields):
+        """Apply one status event from the guard screen (status bus or status file)"""
+        if status in ("TURNSTILE_OPEN", "SPECIAL_PASS_CHECKOUT") and len(fields) >= 3:
+            special_pass = fields[0]
+            time_value = fields[1]
+            guard_name = fields[2]
+            print(f"Processing {status}: {special_pass}, {time_value}, {guard_name}")
+            if status == "TURNSTILE_OPEN":
+                self.show_turnstile_open_status(special_pass, time_value, guard_name)
+            else:
+                self.show_special_pass_checkout_status(special_pass, time_value, guard_name)
+        elif status in ("STUDENT_TEACHER_APPROVED", "STUDENT_TEACHER_INFO") and len(fields) >= 4:
+            person_name = fields[0]
+            person_role = fields[1]
+            time_value = fields[2]
+            guard_name = fields[3]
+            print(f"Processing STUDENT_TEACHER_INFO: {person_name}, {person_role}, {time_value}, {guard_name}")
+            # First show instructions overlay, then the person info
+            self.show_instructions_then_person(person_name, person_role, time_value, guard_name)
+        elif status == "TURNSTILE_CLOSED":
+            print("Processing TURNSTILE_CLOSED - calling reset_to_main_screen")
+            self.reset_to_main_screen()
+        elif status == "INVALID_ID":
+            print("Processing INVALID_ID")
+            self.show_invalid_id_message()
+        elif status == "DEACTIVATED_PASS":
+            print("Processing DEACTIVATED_PASS")
+            self.show_deactivated_pass_message()
+        elif status == "RESET_TO_DEFAULT":
+            print("Processing RESET_TO_DEFAULT - calling reset_to_main_screen")
+            self.reset_to_main_screen()
+    
+    def promote(self):
+        """Take over from the main screen that just exited (standby instance)"""
+        if not self.standby:
+            return
+        self.standby = False
+        print("Standby main screen promoted")
+        self.setup_status_bus()
+        self.start_status_check()
+        self.position_on_secondary_monitor()
+        self.showFullScreen()
+        self.raise_()
+        self.check_status_file()
+    
+    def setup_status_bus(self):
+        """Listen for status events from the guard screen on the status bus"""
+        self.status_bus = StatusBusServer()
+        self.status_bus_notifiers = {}
+        if not self.status_bus.start():
+            self.status_bus = None
+            return
+        self.status_bus_notifier = QSocketNotifier(self.status_bus.fileno(), QSocketNotifier.Read, self)
+        self.status_bus_notifier.activated.connect(self.on_status_bus_connection)
+    
+    def on_status_bus_connection(self, _fd):
+        """Accept the guard screen's connection and watch it for events"""
+        for client in self.status_bus.accept():
+            print("Guard screen connected to status bus")
+            notifier = QSocketNotifier(client.fileno(), QSocketNotifier.Read, self)
+            notifier.activated.connect(lambda _fd, client=client: self.on_status_bus_readable(client))
+            self.status_bus_notifiers[client] = notifier
+    
+    def on_status_bus_readable(self, client):
+        """Handle status events as soon as they arrive"""
+        events = self.status_bus.read(client)
+        if events is None:
+            notifier = self.status_bus_notifiers.pop(client, None)
+            if notifier is not None:
+                notifier.setEnabled(False)
+                notifier.deleteLater()
+            self.status_bus.drop(client)
+            print("Guard screen disconnected from status bus - using status file")
+            return
+        for status, fields, stamp in events:
+            if not self.status_filter.accept(stamp):
+                continue
+            try:
+                self.handle_status_event(status, fields)
+            except Exception as e:
+                print(f"Error handling status event {status}: {e}")
+    
     def show_turnstile_open_status(self, special_pass, time_checkin, guard_name):
         """Show turnstile open status with special pass information"""
         # Stop the status check timer to prevent flashing
-        if hasattr(self, 'status_check_timer') and self.status_check_timer:
-            self.status_check_timer.stop()
-            # Restart the timer immediately to continue monitoring for status changes
-            self.status_check_timer.start(2000)
+        self.start_status_check()
         
         # Update top banner to show turnstile open status
         if hasattr(self, 'top_banner'):
-            self.top_banner.setStyleSheet("background-color: #90EE90;")  # Light green
-            for child in self.top_banner.findChildren(QLabel):
-                child.setText("Turnstile is Open")
-                child.setWordWrap(True)
-                child.setStyleSheet("""
-                    QLabel {
-                        color: black;
-                        font-size: 36px;
-                        font-weight: bold;
-                        background-color: transparent;
-                    }
-                """)
+            self.set_banner("Turnstile is Open", 'open')
         
         # Update instruction label
         if hasattr(self, 'instruction_label'):
             self.instruction_label.setText("Special Pass")
-            self.instruction_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 32px;
-                    font-weight: bold;
-                    background-color: transparent;
-                    margin-top: 40px;
-                }
-            """)
+            set_style_property(self.instruction_label, 'textStyle', 'instruction')
         
         # Clear existing labels and add new information
         if hasattr(self, 'right_panel'):
@@ -817,104 +624,49 @@ class STIWelcomeScreen(QMainWindow):
             # Add reference number
             ref_label = QLabel(f"Ref. {special_pass}")
             ref_label.setAlignment(Qt.AlignCenter)
-            ref_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 24px;
-                    background-color: transparent;
-                    margin-top: 10px;
-                }
-            """)
+            ref_label.setProperty('textStyle', 'reference')
             ref_label.is_special_label = True
             self.right_panel.layout().addWidget(ref_label)
             
             # Add time check-in
             time_label = QLabel("Time Check-in:")
             time_label.setAlignment(Qt.AlignLeft)
-            time_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 18px;
-                    background-color: transparent;
-                    margin-top: 20px;
-                }
-            """)
+            time_label.setProperty('textStyle', 'detailSpaced')
             time_label.is_special_label = True
             self.right_panel.layout().addWidget(time_label)
             
             time_value_label = QLabel(time_checkin)
             time_value_label.setAlignment(Qt.AlignLeft)
-            time_value_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 18px;
-                    background-color: transparent;
-                }
-            """)
+            time_value_label.setProperty('textStyle', 'detail')
             time_value_label.is_special_label = True
             self.right_panel.layout().addWidget(time_value_label)
             
             # Add guard name
             guard_label = QLabel("Guard in-charge:")
             guard_label.setAlignment(Qt.AlignLeft)
-            guard_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 18px;
-                    background-color: transparent;
-                    margin-top: 20px;
-                }
-            """)
+            guard_label.setProperty('textStyle', 'detailSpaced')
             guard_label.is_special_label = True
             self.right_panel.layout().addWidget(guard_label)
             
             guard_name_label = QLabel(guard_name)
             guard_name_label.setAlignment(Qt.AlignLeft)
-            guard_name_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 18px;
-                    background-color: transparent;
-                }
-            """)
+            guard_name_label.setProperty('textStyle', 'detail')
             guard_name_label.is_special_label = True
             self.right_panel.layout().addWidget(guard_name_label)
     
     def show_special_pass_checkout_status(self, special_pass, time_checkout, guard_name):
         """Show special pass checkout status with checkout information"""
         # Stop the status check timer to prevent flashing
-        if hasattr(self, 'status_check_timer') and self.status_check_timer:
-            self.status_check_timer.stop()
-            # Restart the timer immediately to continue monitoring for status changes
-            self.status_check_timer.start(2000)
+        self.start_status_check()
         
         # Update top banner to show turnstile open status (same as check-in)
         if hasattr(self, 'top_banner'):
-            self.top_banner.setStyleSheet("background-color: #90EE90;")  # Light green
-            for child in self.top_banner.findChildren(QLabel):
-                child.setText("Turnstile is Open")
-                child.setWordWrap(True)
-                child.setStyleSheet("""
-                    QLabel {
-                        color: black;
-                        font-size: 36px;
-                        font-weight: bold;
-                        background-color: transparent;
-                    }
-                """)
+            self.set_banner("Turnstile is Open", 'open')
         
         # Update instruction label
         if hasattr(self, 'instruction_label'):
             self.instruction_label.setText("Special Pass")
-            self.instruction_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 32px;
-                    font-weight: bold;
-                    background-color: transparent;
-                    margin-top: 40px;
-                }
-            """)
+            set_style_property(self.instruction_label, 'textStyle', 'instruction')
         
         # Clear existing labels and add new information (same layout as check-in)
         if hasattr(self, 'right_panel'):
@@ -926,71 +678,38 @@ class STIWelcomeScreen(QMainWindow):
             # Add reference number
             ref_label = QLabel(f"Ref. {special_pass}")
             ref_label.setAlignment(Qt.AlignCenter)
-            ref_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 24px;
-                    background-color: transparent;
-                    margin-top: 10px;
-                }
-            """)
+            ref_label.setProperty('textStyle', 'reference')
             ref_label.is_special_label = True
             self.right_panel.layout().addWidget(ref_label)
             
             # Add time check-out (same format as check-in)
             time_label = QLabel("Time Check-out:")
             time_label.setAlignment(Qt.AlignLeft)
-            time_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 18px;
-                    background-color: transparent;
-                    margin-top: 20px;
-                }
-            """)
+            time_label.setProperty('textStyle', 'detailSpaced')
             time_label.is_special_label = True
             self.right_panel.layout().addWidget(time_label)
             
             time_value_label = QLabel(time_checkout)
             time_value_label.setAlignment(Qt.AlignLeft)
-            time_value_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 18px;
-                    background-color: transparent;
-                }
-            """)
+            time_value_label.setProperty('textStyle', 'detail')
             time_value_label.is_special_label = True
             self.right_panel.layout().addWidget(time_value_label)
             
             # Add guard name
             guard_label = QLabel("Guard in-charge:")
             guard_label.setAlignment(Qt.AlignLeft)
-            guard_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 18px;
-                    background-color: transparent;
-                    margin-top: 20px;
-                }
-            """)
+            guard_label.setProperty('textStyle', 'detailSpaced')
             guard_label.is_special_label = True
             self.right_panel.layout().addWidget(guard_label)
             
             guard_name_label = QLabel(guard_name)
             guard_name_label.setAlignment(Qt.AlignLeft)
-            guard_name_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 18px;
-                    background-color: transparent;
-                }
-            """)
+            guard_name_label.setProperty('textStyle', 'detail')
             guard_name_label.is_special_label = True
             self.right_panel.layout().addWidget(guard_name_label)
         
         # Reset after 5 seconds
-        self.timer.singleShot(5000, self.reset_to_main_screen)
+        self.timers.schedule('screen_reset', 5000, self.reset_to_main_screen)
         
         # Force UI update
         self.update()
@@ -999,25 +718,11 @@ class STIWelcomeScreen(QMainWindow):
     def show_student_teacher_info(self, person_name, person_role, time_value, guard_name):
         """Show student/teacher info on the right panel, then reset after 5s."""
         # Stop the status check timer to prevent flashing
-        if hasattr(self, 'status_check_timer') and self.status_check_timer:
-            self.status_check_timer.stop()
-            # Restart the timer immediately to continue monitoring for status changes
-            self.status_check_timer.start(2000)
+        self.start_status_check()
         
         # Update top banner
         if hasattr(self, 'top_banner'):
-            self.top_banner.setStyleSheet("background-color: #90EE90;")
-            for child in self.top_banner.findChildren(QLabel):
-                child.setText("Turnstile is Open")
-                child.setWordWrap(True)
-                child.setStyleSheet("""
-                    QLabel {
-                        color: black;
-                        font-size: 36px;
-                        font-weight: bold;
-                        background-color: transparent;
-                    }
-                """)
+            self.set_banner("Turnstile is Open", 'open')
         
         # Populate right panel with profile picture and info
         if hasattr(self, 'right_panel'):
@@ -1030,12 +735,11 @@ class STIWelcomeScreen(QMainWindow):
                 logo_path = os.path.join("image-elements", "STI Balagtas Logo.png")
                 if os.path.exists(logo_path):
                     logo_icon = QLabel()
-                    pixmap = QPixmap(logo_path)
                     # Scale the logo to a reasonable size
-                    scaled_pixmap = pixmap.scaled(120, 90, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    scaled_pixmap = self.pixmaps.get(logo_path, 120, 90)
                     logo_icon.setPixmap(scaled_pixmap)
                     logo_icon.setAlignment(Qt.AlignCenter)
-                    logo_icon.setStyleSheet("background-color: transparent;")
+                    logo_icon.setProperty('textStyle', 'image')
                     self.right_panel.layout().addWidget(logo_icon)
                     
                     # Add spacing after logo
@@ -1067,27 +771,12 @@ class STIWelcomeScreen(QMainWindow):
             # Load and display profile picture
             if os.path.exists(profile_image_path):
                 profile_icon = QLabel()
-                pixmap = QPixmap(profile_image_path)
                 # Scale the profile image to a reasonable size
-                scaled_pixmap = pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                
-                # Create rounded corners on the image
-                rounded_pixmap = QPixmap(scaled_pixmap.size())
-                rounded_pixmap.fill(Qt.transparent)
-                
-                painter = QPainter(rounded_pixmap)
-                painter.setRenderHint(QPainter.Antialiasing)
-                painter.setRenderHint(QPainter.SmoothPixmapTransform)
-                
-                # Create circular mask
-                painter.setBrush(QBrush(scaled_pixmap))
-                painter.setPen(Qt.NoPen)
-                painter.drawEllipse(0, 0, scaled_pixmap.width(), scaled_pixmap.height())
-                painter.end()
+                rounded_pixmap = self.pixmaps.get(profile_image_path, 200, 200, 'circle')
                 
                 profile_icon.setPixmap(rounded_pixmap)
                 profile_icon.setAlignment(Qt.AlignCenter)
-                profile_icon.setStyleSheet("background-color: transparent;")
+                profile_icon.setProperty('textStyle', 'image')
                 self.right_panel.layout().addWidget(profile_icon)
             
             # Add spacing
@@ -1098,28 +787,13 @@ class STIWelcomeScreen(QMainWindow):
             # Add name
             name_label = QLabel(person_name)
             name_label.setAlignment(Qt.AlignCenter)
-            name_label.setStyleSheet("""
-                QLabel { 
-                    color: white; 
-                    font-size: 28px; 
-                    font-weight: bold; 
-                    background-color: transparent; 
-                    margin: 10px;
-                }
-            """)
+            name_label.setProperty('textStyle', 'profileName')
             self.right_panel.layout().addWidget(name_label)
             
             # Add role
             role_label = QLabel(f"({person_role})")
             role_label.setAlignment(Qt.AlignCenter)
-            role_label.setStyleSheet("""
-                QLabel { 
-                    color: white; 
-                    font-size: 20px; 
-                    background-color: transparent; 
-                    margin: 5px;
-                }
-            """)
+            role_label.setProperty('textStyle', 'subtitlePadded')
             self.right_panel.layout().addWidget(role_label)
             
             # Add spacing
@@ -1130,27 +804,13 @@ class STIWelcomeScreen(QMainWindow):
             # Add time check-in
             time_label = QLabel(f"Time Check-in: {time_value}")
             time_label.setAlignment(Qt.AlignLeft)
-            time_label.setStyleSheet("""
-                QLabel { 
-                    color: white; 
-                    font-size: 18px; 
-                    background-color: transparent; 
-                    margin: 5px;
-                }
-            """)
+            time_label.setProperty('textStyle', 'detailPadded')
             self.right_panel.layout().addWidget(time_label)
             
             # Add date
             date_label = QLabel(f"Date: {datetime.now().strftime('%B %d, %Y')}")
             date_label.setAlignment(Qt.AlignLeft)
-            date_label.setStyleSheet("""
-                QLabel { 
-                    color: white; 
-                    font-size: 18px; 
-                    background-color: transparent; 
-                    margin: 5px;
-                }
-            """)
+            date_label.setProperty('textStyle', 'detailPadded')
             self.right_panel.layout().addWidget(date_label)
             
             # Add spacing
@@ -1161,37 +821,15 @@ class STIWelcomeScreen(QMainWindow):
             # Add guard information
             guard_label = QLabel("Guard in-charge:")
             guard_label.setAlignment(Qt.AlignLeft)
-            guard_label.setStyleSheet("""
-                QLabel { 
-                    color: white; 
-                    font-size: 18px; 
-                    font-weight: bold;
-                    background-color: transparent; 
-                    margin: 5px;
-                }
-            """)
+            guard_label.setProperty('textStyle', 'detailPaddedBold')
             self.right_panel.layout().addWidget(guard_label)
             
             guard_name_label = QLabel(guard_name)
             guard_name_label.setAlignment(Qt.AlignLeft)
-            guard_name_label.setStyleSheet("""
-                QLabel { 
-                    color: white; 
-                    font-size: 18px; 
-                    background-color: transparent; 
-                    margin: 5px;
-                }
-            """)
+            guard_name_label.setProperty('textStyle', 'detailPadded')
             self.right_panel.layout().addWidget(guard_name_label)
-        # Stop any existing singleShot timer before starting a new one
-        if hasattr(self, 'reset_timer') and self.reset_timer:
-            self.reset_timer.stop()
-        
-        # Reset after 5 seconds
-        self.reset_timer = QTimer()
-        self.reset_timer.setSingleShot(True)
-        self.reset_timer.timeout.connect(self.reset_to_main_screen)
-        self.reset_timer.start(5000)
+        # Reset after 5 seconds (replaces a reset still pending for the previous person)
+        self.timers.schedule('screen_reset', 5000, self.reset_to_main_screen)
         print(f"Reset timer started for {person_name} - will reset in 5 seconds")
         
         self.update()
@@ -1201,60 +839,23 @@ class STIWelcomeScreen(QMainWindow):
         """Show invalid ID message on main screen"""
         # Update top banner to show error status
         if hasattr(self, 'top_banner'):
-            self.top_banner.setStyleSheet("background-color: #FF6B6B;")  # Light red
-            for child in self.top_banner.findChildren(QLabel):
-                child.setText("Invalid ID Scanned")
-                child.setWordWrap(True)
-                child.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 36px;
-                        font-weight: bold;
-                        background-color: transparent;
-                    }
-                """)
+            self.set_banner("Invalid ID Scanned", 'denied')
         
         # Update instruction label
         if hasattr(self, 'instruction_label'):
             self.instruction_label.setText("Invalid Card")
-            self.instruction_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 32px;
-                    font-weight: bold;
-                    background-color: transparent;
-                    margin-top: 40px;
-                }
-            """)
+            set_style_property(self.instruction_label, 'textStyle', 'instruction')
     
     def show_deactivated_pass_message(self):
         """Show deactivated pass message on main screen"""
         # Update top banner to show error status
         if hasattr(self, 'top_banner'):
-            self.top_banner.setStyleSheet("background-color: #FF6B6B;")  # Light red
-            for child in self.top_banner.findChildren(QLabel):
-                child.setText("Deactivated Pass Scanned")
-                child.setWordWrap(True)
-                child.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 36px;
-                        font-weight: bold;
-                        background-color: transparent;
-                    }
-                """)
+            self.set_banner("Deactivated Pass Scanned", 'denied')
         
         # Update instruction label
         if hasattr(self, 'instruction_label'):
             self.instruction_label.setText("Deactivated Pass")
-            self.instruction_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 32px;
-                    font-weight: bold;
-                    background-color: transparent;
-                }
-            """)
+            set_style_property(self.instruction_label, 'textStyle', 'instructionCompact')
     
     def test_special_pass(self):
         """Test method to simulate special pass verification"""
@@ -1303,17 +904,7 @@ class STIWelcomeScreen(QMainWindow):
             
             # Update top banner to show check-in status
             if hasattr(self, 'top_banner'):
-                self.top_banner.setStyleSheet("background-color: #90EE90;")  # Light green
-                for child in self.top_banner.findChildren(QLabel):
-                    child.setText("Turnstile is Open")
-                    child.setStyleSheet("""
-                        QLabel {
-                            color: black;
-                            font-size: 24px;
-                            font-weight: bold;
-                            background-color: transparent;
-                        }
-                    """)
+                self.set_banner("Turnstile is Open", 'openCompact')
             
             # Clear right panel and show check-in information
             if hasattr(self, 'right_panel'):
@@ -1323,26 +914,13 @@ class STIWelcomeScreen(QMainWindow):
                 # Add person information
                 name_label = QLabel(person['name'])
                 name_label.setAlignment(Qt.AlignCenter)
-                name_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 24px;
-                        font-weight: bold;
-                        background-color: transparent;
-                    }
-                """)
+                name_label.setProperty('textStyle', 'strong')
                 self.right_panel.layout().addWidget(name_label)
                 
                 # Add role
                 role_label = QLabel(f"({person['role']})")
                 role_label.setAlignment(Qt.AlignCenter)
-                role_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                role_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(role_label)
                 
                 # Add check-in time
@@ -1350,53 +928,29 @@ class STIWelcomeScreen(QMainWindow):
                 checkin_time = datetime.now().strftime("%I:%M:%S %p")
                 time_label = QLabel(f"Time Check-in: {checkin_time}")
                 time_label.setAlignment(Qt.AlignLeft)
-                time_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                time_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(time_label)
                 
                 # Add date
                 checkin_date = datetime.now().strftime("%B %d, %Y")
                 date_label = QLabel(f"Date: {checkin_date}")
                 date_label.setAlignment(Qt.AlignLeft)
-                date_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                date_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(date_label)
                 
                 # Add guard information
                 guard_label = QLabel("Guard in-charge:")
                 guard_label.setAlignment(Qt.AlignLeft)
-                guard_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                guard_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(guard_label)
                 
                 guard_name_label = QLabel("Arvin Jay De Guzman")
                 guard_name_label.setAlignment(Qt.AlignLeft)
-                guard_name_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                guard_name_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(guard_name_label)
             
             # Reset after 5 seconds
-            self.timer.singleShot(5000, self.reset_to_main_screen)
+            self.timers.schedule('screen_reset', 5000, self.reset_to_main_screen)
             
             # Force UI update
             self.update()
@@ -1412,22 +966,11 @@ class STIWelcomeScreen(QMainWindow):
             print(f"Showing check-out screen for: {person['name']}")
             
             # Stop the status check timer to prevent flashing
-            if hasattr(self, 'status_check_timer') and self.status_check_timer:
-                self.status_check_timer.stop()
+            self.timers.cancel('status_check')
             
             # Update top banner to show check-out status
             if hasattr(self, 'top_banner'):
-                self.top_banner.setStyleSheet("background-color: #FFB6C1;")  # Light pink
-                for child in self.top_banner.findChildren(QLabel):
-                    child.setText("Check-out Complete")
-                    child.setStyleSheet("""
-                        QLabel {
-                            color: black;
-                            font-size: 24px;
-                            font-weight: bold;
-                            background-color: transparent;
-                        }
-                    """)
+                self.set_banner("Check-out Complete", 'checkout')
             
             # Clear right panel and show check-out information
             if hasattr(self, 'right_panel'):
@@ -1437,26 +980,13 @@ class STIWelcomeScreen(QMainWindow):
                 # Add person information
                 name_label = QLabel(person['name'])
                 name_label.setAlignment(Qt.AlignCenter)
-                name_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 24px;
-                        font-weight: bold;
-                        background-color: transparent;
-                    }
-                """)
+                name_label.setProperty('textStyle', 'strong')
                 self.right_panel.layout().addWidget(name_label)
                 
                 # Add role
                 role_label = QLabel(f"({person['role']})")
                 role_label.setAlignment(Qt.AlignCenter)
-                role_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                role_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(role_label)
                 
                 # Add check-out time
@@ -1464,53 +994,29 @@ class STIWelcomeScreen(QMainWindow):
                 checkout_time = datetime.now().strftime("%I:%M:%S %p")
                 time_label = QLabel(f"Time Check-out: {checkout_time}")
                 time_label.setAlignment(Qt.AlignLeft)
-                time_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                time_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(time_label)
                 
                 # Add date
                 checkout_date = datetime.now().strftime("%B %d, %Y")
                 date_label = QLabel(f"Date: {checkout_date}")
                 date_label.setAlignment(Qt.AlignLeft)
-                date_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                date_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(date_label)
                 
                 # Add guard information
                 guard_label = QLabel("Guard in-charge:")
                 guard_label.setAlignment(Qt.AlignLeft)
-                guard_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                guard_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(guard_label)
                 
                 guard_name_label = QLabel("Arvin Jay De Guzman")
                 guard_name_label.setAlignment(Qt.AlignLeft)
-                guard_name_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 18px;
-                        background-color: transparent;
-                    }
-                """)
+                guard_name_label.setProperty('textStyle', 'detail')
                 self.right_panel.layout().addWidget(guard_name_label)
             
             # Reset after 5 seconds
-            self.timer.singleShot(5000, self.reset_to_main_screen)
+            self.timers.schedule('screen_reset', 5000, self.reset_to_main_screen)
             
             # Force UI update
             self.update()
@@ -1528,17 +1034,7 @@ class STIWelcomeScreen(QMainWindow):
             # Update top banner to show error status
             if hasattr(self, 'top_banner'):
                 print("Updating top banner for invalid card...")
-                self.top_banner.setStyleSheet("background-color: #FF6B6B;")  # Light red
-                for child in self.top_banner.findChildren(QLabel):
-                    child.setText("Invalid ID Scanned")
-                    child.setStyleSheet("""
-                        QLabel {
-                            color: white;
-                            font-size: 36px;
-                            font-weight: bold;
-                            background-color: transparent;
-                        }
-                    """)
+                self.set_banner("Invalid ID Scanned", 'denied')
             else:
                 print("Top banner not found!")
             
@@ -1546,20 +1042,12 @@ class STIWelcomeScreen(QMainWindow):
             if hasattr(self, 'instruction_label'):
                 print("Updating instruction label for invalid card...")
                 self.instruction_label.setText("Invalid Card")
-                self.instruction_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 32px;
-                        font-weight: bold;
-                        background-color: transparent;
-                        margin-top: 40px;
-                    }
-                """)
+                set_style_property(self.instruction_label, 'textStyle', 'instruction')
             else:
                 print("Instruction label not found!")
             
             # Reset to main screen after 3 seconds
-            self.timer.singleShot(3000, self.reset_to_main_screen)
+            self.timers.schedule('screen_reset', 3000, self.reset_to_main_screen)
             
             # Force UI update
             self.update()
@@ -1575,22 +1063,12 @@ class STIWelcomeScreen(QMainWindow):
             print("reset_to_main_screen called - resetting to awaiting ID scan")
             # Stop all timers first
             self.stop_all_timers()
+            self.screen_pages.hide_pages()
             
             # Reset top banner
             if hasattr(self, 'top_banner') and self.is_widget_valid(self.top_banner):
                 try:
-                    self.top_banner.setStyleSheet("background-color: #DAA520;")  # Mustard yellow
-                    for child in self.top_banner.findChildren(QLabel):
-                        if self.is_widget_valid(child):
-                            child.setText("Awaiting ID card scan.")
-                            child.setStyleSheet("""
-                                QLabel {
-                                    color: white;
-                                    font-size: 36px;
-                                    font-weight: bold;
-                                    background-color: transparent;
-                                }
-                            """)
+                    self.set_banner("Awaiting ID card scan.", 'awaiting')
                 except RuntimeError:
                     print("Top banner has been deleted, skipping reset")
             
@@ -1598,15 +1076,7 @@ class STIWelcomeScreen(QMainWindow):
             if hasattr(self, 'instruction_label') and self.is_widget_valid(self.instruction_label):
                 try:
                     self.instruction_label.setText("Please tap your ID\nto the Card Reader")
-                    self.instruction_label.setStyleSheet("""
-                        QLabel {
-                            color: white;
-                            font-size: 32px;
-                            font-weight: bold;
-                            background-color: transparent;
-                            margin-top: 40px;
-                        }
-                    """)
+                    set_style_property(self.instruction_label, 'textStyle', 'instruction')
                 except RuntimeError:
                     print("Instruction label has been deleted, skipping reset")
             
@@ -1618,10 +1088,6 @@ class STIWelcomeScreen(QMainWindow):
                         if self.is_widget_valid(child):
                             child.deleteLater()
                     
-                    # Force immediate cleanup
-                    self.right_panel.update()
-                    self.right_panel.repaint()
-                    
                     # Restore the default right panel content
                     self.restore_default_right_panel()
                 except RuntimeError:
@@ -1636,8 +1102,7 @@ class STIWelcomeScreen(QMainWindow):
             self.repaint()
             
             # Restart the status check timer
-            if hasattr(self, 'status_check_timer'):
-                self.status_check_timer.start(2000)  # Check every 2 seconds
+            self.start_status_check()
             
         except Exception as e:
             print(f"Error resetting to main screen: {e}")
@@ -1675,20 +1140,13 @@ class STIWelcomeScreen(QMainWindow):
         # Top Banner
         top_banner = QFrame()
         top_banner.setFixedHeight(120)
-        top_banner.setStyleSheet("background-color: #DAA520;")  # Mustard yellow
+        top_banner.setObjectName("topBanner")
+        top_banner.setProperty('state', 'awaiting')  # Mustard yellow
         
         # Main welcome label
         welcome_label = QLabel("Awaiting ID card scan.")
         welcome_label.setAlignment(Qt.AlignCenter)
         welcome_label.setWordWrap(True)
-        welcome_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 36px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
         
         top_layout = QVBoxLayout(top_banner)
         top_layout.addWidget(welcome_label)
@@ -1696,6 +1154,7 @@ class STIWelcomeScreen(QMainWindow):
         
         # Store reference to top banner for later use
         self.top_banner = top_banner
+        self.banner_label = welcome_label
         
         # Main Content Area
         main_content = QFrame()
@@ -1705,7 +1164,7 @@ class STIWelcomeScreen(QMainWindow):
         
         # Left Panel (White Background with Logo)
         left_panel = QFrame()
-        left_panel.setStyleSheet("background-color: white;")
+        left_panel.setProperty('panel', 'white')
         left_layout = QVBoxLayout(left_panel)
         left_layout.setAlignment(Qt.AlignCenter)
         
@@ -1713,9 +1172,8 @@ class STIWelcomeScreen(QMainWindow):
         logo_path = os.path.join("image-elements", "STI Balagtas Logo.png")
         if os.path.exists(logo_path):
             logo_label = QLabel()
-            pixmap = QPixmap(logo_path)
             # Scale the logo to a reasonable size for 1920x1080
-            scaled_pixmap = pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            scaled_pixmap = self.pixmaps.get(logo_path, 400, 400)
             logo_label.setPixmap(scaled_pixmap)
             logo_label.setAlignment(Qt.AlignCenter)
             left_layout.addWidget(logo_label)
@@ -1723,23 +1181,14 @@ class STIWelcomeScreen(QMainWindow):
             # Fallback if logo not found
             fallback_label = QLabel("STI Balagtas Logo")
             fallback_label.setAlignment(Qt.AlignCenter)
-            fallback_label.setStyleSheet("""
-                QLabel {
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #0066CC;
-                    background-color: #FFD700;
-                    padding: 20px;
-                    border-radius: 3px;
-                }
-            """)
+            fallback_label.setProperty('textStyle', 'logoFallback')
             left_layout.addWidget(fallback_label)
         
         main_layout.addWidget(left_panel)
         
         # Right Panel (Dark Blue Background)
         right_panel = QFrame()
-        right_panel.setStyleSheet("background-color: #1E3A8A;")
+        right_panel.setProperty('panel', 'navy')
         right_layout = QVBoxLayout(right_panel)
         right_layout.setAlignment(Qt.AlignCenter)
         
@@ -1747,47 +1196,17 @@ class STIWelcomeScreen(QMainWindow):
         user_image_path = os.path.join("image-elements", "Generic User Image.jpg")
         if os.path.exists(user_image_path):
             user_icon = QLabel()
-            pixmap = QPixmap(user_image_path)
             # Scale the user image to a reasonable size for 1920x1080
-            scaled_pixmap = pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            
-            # Create rounded corners on the image itself
-            rounded_pixmap = QPixmap(scaled_pixmap.size())
-            rounded_pixmap.fill(Qt.transparent)
-            
-            painter = QPainter(rounded_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            
-            # Create rounded rectangle path
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, scaled_pixmap.width(), scaled_pixmap.height(), 3, 3)
-            painter.setClipPath(path)
-            
-            # Draw the image
-            painter.drawPixmap(0, 0, scaled_pixmap)
-            painter.end()
+            rounded_pixmap = self.pixmaps.get(user_image_path, 180, 180, 'rounded')
             
             user_icon.setPixmap(rounded_pixmap)
             user_icon.setAlignment(Qt.AlignCenter)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: transparent;
-                }
-            """)
+            user_icon.setProperty('textStyle', 'image')
         else:
             # Fallback if image not found
             user_icon = QLabel("👤")
             user_icon.setFixedSize(180, 180)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: #D3D3D3;
-                    border-radius: 3px;
-                    border: 2px solid white;
-                    font-size: 80px;
-                    color: #1E3A8A;
-                }
-            """)
+            user_icon.setProperty('textStyle', 'avatarFallback')
             user_icon.setAlignment(Qt.AlignCenter)
         
         right_layout.addWidget(user_icon)
@@ -1795,15 +1214,7 @@ class STIWelcomeScreen(QMainWindow):
         # Instruction text
         self.instruction_label = QLabel("Please tap your ID\nto the Card Reader")
         self.instruction_label.setAlignment(Qt.AlignCenter)
-        self.instruction_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 32px;
-                font-weight: bold;
-                background-color: transparent;
-                margin-top: 40px;
-            }
-        """)
+        self.instruction_label.setProperty('textStyle', 'instruction')
         right_layout.addWidget(self.instruction_label)
         
 
@@ -1823,53 +1234,41 @@ class STIWelcomeScreen(QMainWindow):
         
         # Date section (Light Blue)
         date_frame = QFrame()
-        date_frame.setStyleSheet("background-color: #87CEEB;")
+        date_frame.setProperty('panel', 'date')
         date_layout = QVBoxLayout(date_frame)
         
         self.date_label = QLabel()
         self.date_label.setAlignment(Qt.AlignCenter)
-        self.date_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
+        self.date_label.setProperty('textStyle', 'strong')
         date_layout.addWidget(self.date_label)
         bottom_layout.addWidget(date_frame)
         
         # Time section (Darker Navy Blue)
         time_frame = QFrame()
-        time_frame.setStyleSheet("background-color: #021C37;")
+        time_frame.setProperty('panel', 'clock')
         time_layout = QVBoxLayout(time_frame)
         
         self.time_label = QLabel()
         self.time_label.setAlignment(Qt.AlignCenter)
-        self.time_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
+        self.time_label.setProperty('textStyle', 'strong')
         time_layout.addWidget(self.time_label)
         bottom_layout.addWidget(time_frame)
         
         layout.addWidget(bottom_bar)
     
     def setup_timer(self):
-        """Set up timer to update date and time"""
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_time)
-        self.timer.start(1000)  # Update every second
+        """Set up the scheduler with the clock and the status file check"""
+        # Every delayed step of the screen runs from this one scheduler
+        self.timers = TimerScheduler(self)
+        self.timers.every('clock', 1000, self.update_time)  # Update every second
         self.update_time()  # Initial update
         
-        # Set up timer to check status file for updates from guard screen
-        self.status_check_timer = QTimer()
-        self.status_check_timer.timeout.connect(self.check_status_file)
-        self.status_check_timer.start(2000)  # Check every 2 seconds
+        # Check status file for updates from guard screen
+        self.start_status_check()
+    
+    def start_status_check(self):
+        """(Re)start checking the status file every 2 seconds"""
+        self.timers.every('status_check', 2000, self.check_status_file)
     
     def update_time(self):
         """Update the date and time display"""
@@ -1900,11 +1299,8 @@ class STIWelcomeScreen(QMainWindow):
                     self.developer_input = ""
                 
                 # Reset input after 3 seconds of inactivity
-                if self.developer_timeout:
-                    self.developer_timeout.stop()
-                self.developer_timeout = QTimer()
-                self.developer_timeout.timeout.connect(lambda: setattr(self, 'developer_input', ''))
-                self.developer_timeout.start(3000)  # 3 seconds
+                self.timers.schedule('developer_input', 3000, lambda: setattr(self, 'developer_input', ''),
+                                     screen=False)
             
             super().keyPressEvent(event)
     
@@ -1915,23 +1311,18 @@ class STIWelcomeScreen(QMainWindow):
     
     def show_status_message(self, status):
         """Show status message on the main screen for 3 seconds"""
-        # Stop any existing timer
-        if self.status_timer:
-            self.status_timer.stop()
+        # Stop any pending revert
+        self.timers.cancel('status_message')
         
         # Update the instruction text based on status
         if status == "Invalid ID":
             self.instruction_label.setText("Invalid ID\nScanned")
-            # Set up timer to revert back to original text after 3 seconds
-            self.status_timer = QTimer()
-            self.status_timer.timeout.connect(self.reset_instruction_text)
-            self.status_timer.start(3000)  # 3 seconds
+            # Revert back to original text after 3 seconds
+            self.timers.schedule('status_message', 3000, self.reset_instruction_text)
         elif status == "Deactivated Pass":
             self.instruction_label.setText("Deactivated Pass\nhas been scanned.")
-            # Set up timer to revert back to original text after 3 seconds
-            self.status_timer = QTimer()
-            self.status_timer.timeout.connect(self.reset_instruction_text)
-            self.status_timer.start(3000)  # 3 seconds
+            # Revert back to original text after 3 seconds
+            self.timers.schedule('status_message', 3000, self.reset_instruction_text)
         elif status == "Valid Pass":
             # Start the scanning sequence
             self.start_scanning_sequence()
@@ -1946,16 +1337,12 @@ class STIWelcomeScreen(QMainWindow):
             self.show_student_staff_checkout_screen()
         elif status == "Accept Entry":
             self.instruction_label.setText("Entry Accepted\nby Manual Verification.")
-            # Set up timer to revert back to original text after 3 seconds
-            self.status_timer = QTimer()
-            self.status_timer.timeout.connect(self.reset_instruction_text)
-            self.status_timer.start(3000)  # 3 seconds
+            # Revert back to original text after 3 seconds
+            self.timers.schedule('status_message', 3000, self.reset_instruction_text)
         elif status == "Deny Entry":
             self.instruction_label.setText("Entry Denied\nby Manual Verification.")
-            # Set up timer to revert back to original text after 3 seconds
-            self.status_timer = QTimer()
-            self.status_timer.timeout.connect(self.reset_instruction_text)
-            self.status_timer.start(3000)  # 3 seconds
+            # Revert back to original text after 3 seconds
+            self.timers.schedule('status_message', 3000, self.reset_instruction_text)
     
     def reset_instruction_text(self):
         """Reset instruction text back to original"""
@@ -1969,30 +1356,23 @@ class STIWelcomeScreen(QMainWindow):
                     print("Instruction label has been deleted, skipping reset")
                     return
             
-            if hasattr(self, 'status_timer') and self.status_timer:
-                self.status_timer.stop()
+            self.timers.cancel('status_message')
             
             # Also reset the top banner to "Awaiting ID card scan"
             if hasattr(self, 'top_banner') and self.is_widget_valid(self.top_banner):
                 try:
-                    self.top_banner.setStyleSheet("background-color: #DAA520;")  # Mustard yellow
-                    for child in self.top_banner.findChildren(QLabel):
-                        if self.is_widget_valid(child):
-                            child.setText("Awaiting ID card scan.")
-                            child.setStyleSheet("""
-                                QLabel {
-                                    color: white;
-                                    font-size: 36px;
-                                    font-weight: bold;
-                                    background-color: transparent;
-                                }
-                            """)
+                    self.set_banner("Awaiting ID card scan.", 'awaiting')
                 except RuntimeError:
                     # Top banner has been deleted, skip this operation
                     print("Top banner has been deleted, skipping reset")
         except Exception as e:
             print(f"Error in reset_instruction_text: {e}")
     
+    def set_banner(self, text, state):
+        """Top banner text and theme state (awaiting, open, openCompact, checkout, denied)"""
+        self.banner_label.setText(text)
+        set_style_property(self.top_banner, 'state', state, children=True)
+    
     def is_widget_valid(self, widget):
         """Check if a QWidget still exists and is valid"""
         try:
@@ -2015,14 +1395,6 @@ class STIWelcomeScreen(QMainWindow):
                         child.hide()  # Hide first
                         child.deleteLater()  # Then delete
                 
-                # Force immediate cleanup and processing
-                self.right_panel.update()
-                self.right_panel.repaint()
-                
-                # Process any pending events to ensure cleanup happens immediately
-                from PyQt5.QtWidgets import QApplication
-                QApplication.processEvents()
-                
                 print("Right panel cleared successfully")
         except Exception as e:
             print(f"Error clearing right panel: {e}")
@@ -2035,47 +1407,17 @@ class STIWelcomeScreen(QMainWindow):
                 user_image_path = os.path.join("image-elements", "Generic User Image.jpg")
                 if os.path.exists(user_image_path):
                     user_icon = QLabel()
-                    pixmap = QPixmap(user_image_path)
                     # Scale the user image to a reasonable size for 1920x1080
-                    scaled_pixmap = pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    
-                    # Create rounded corners on the image itself
-                    rounded_pixmap = QPixmap(scaled_pixmap.size())
-                    rounded_pixmap.fill(Qt.transparent)
-                    
-                    painter = QPainter(rounded_pixmap)
-                    painter.setRenderHint(QPainter.Antialiasing)
-                    painter.setRenderHint(QPainter.SmoothPixmapTransform)
-                    
-                    # Create rounded rectangle path
-                    path = QPainterPath()
-                    path.addRoundedRect(0, 0, scaled_pixmap.width(), scaled_pixmap.height(), 3, 3)
-                    painter.setClipPath(path)
-                    
-                    # Draw the image
-                    painter.drawPixmap(0, 0, scaled_pixmap)
-                    painter.end()
+                    rounded_pixmap = self.pixmaps.get(user_image_path, 180, 180, 'rounded')
                     
                     user_icon.setPixmap(rounded_pixmap)
                     user_icon.setAlignment(Qt.AlignCenter)
-                    user_icon.setStyleSheet("""
-                        QLabel {
-                            background-color: transparent;
-                        }
-                    """)
+                    user_icon.setProperty('textStyle', 'image')
                 else:
                     # Fallback if image not found
                     user_icon = QLabel("👤")
                     user_icon.setFixedSize(180, 180)
-                    user_icon.setStyleSheet("""
-                        QLabel {
-                            background-color: #D3D3D3;
-                            border-radius: 3px;
-                            border: 2px solid white;
-                            font-size: 80px;
-                            color: #1E3A8A;
-                        }
-                    """)
+                    user_icon.setProperty('textStyle', 'avatarFallback')
                     user_icon.setAlignment(Qt.AlignCenter)
                 
                 self.right_panel.layout().addWidget(user_icon)
@@ -2083,15 +1425,7 @@ class STIWelcomeScreen(QMainWindow):
                 # 2) Large instruction text (same as initial setup)
                 self.instruction_label = QLabel("Please tap your ID\nto the Card Reader")
                 self.instruction_label.setAlignment(Qt.AlignCenter)
-                self.instruction_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 32px;
-                        font-weight: bold;
-                        background-color: transparent;
-                        margin-top: 40px;
-                    }
-                """)
+                self.instruction_label.setProperty('textStyle', 'instruction')
                 self.right_panel.layout().addWidget(self.instruction_label)
                 
                 print("Default right panel content restored")
@@ -2099,21 +1433,61 @@ class STIWelcomeScreen(QMainWindow):
             print(f"Error restoring default right panel: {e}")
     
     def stop_all_timers(self):
-        """Stop all active timers to prevent conflicts"""
+        """Screen change: cancel the pending steps of the screen being left"""
         try:
-            if hasattr(self, 'status_timer') and self.status_timer:
-                self.status_timer.stop()
-                self.status_timer = None
-            if hasattr(self, 'developer_timeout') and self.developer_timeout:
-                self.developer_timeout.stop()
-                self.developer_timeout = None
-            if hasattr(self, 'reset_timer') and self.reset_timer:
-                self.reset_timer.stop()
-                self.reset_timer = None
-            # Note: We don't stop status_check_timer here as it should continue running
+            # The clock, status check and developer input timeout keep running
+            cancelled = self.timers.screen_changed()
+            if cancelled:
+                print(f"Cancelled {cancelled} screen timer(s), {self.timers.pending_count()} pending")
+            # A sequence whose next step was cancelled will not finish by itself
+            self.sequence_in_progress = False
+            self.stop_live_mirror()
         except Exception as e:
             print(f"Error stopping timers: {e}")
     
+    def start_live_mirror(self, label):
+        """Show the guard application's camera frames in a label; False if unavailable"""
+        if not SHARED_FRAMES_AVAILABLE:
+            return False
+        if self.frame_reader is None:
+            try:
+                self.frame_reader = SharedFrameReader()
+            except FileNotFoundError:
+                return False
+            except Exception as e:
+                print(f"Live mirror not available: {e}")
+                return False
+        
+        self.stop_live_mirror()
+        self.live_mirror_label = label
+        self.timers.every('live_mirror', 66, self.update_live_mirror, screen=True)  # ~15 FPS is enough
+        return True
+    
+    def update_live_mirror(self):
+        """Draw the newest shared frame, if there is one"""
+        if self.frame_reader is None or not self.is_widget_valid(self.live_mirror_label):
+            self.stop_live_mirror()
+            return
+        try:
+            latest = self.frame_reader.read_latest()
+            if latest is None:
+                return
+            _, _, frame = latest
+            height, width = frame.shape[:2]
+            # BGR -> RGB while wrapping the buffer; rgbSwapped() returns a copy
+            image = QImage(frame.data, width, height, width * 3, QImage.Format_RGB888).rgbSwapped()
+            pixmap = QPixmap.fromImage(image).scaled(self.live_mirror_label.size(), Qt.KeepAspectRatio,
+                                                     Qt.FastTransformation)
+            self.live_mirror_label.setPixmap(pixmap)
+        except Exception as e:
+            print(f"Error updating live mirror: {e}")
+            self.stop_live_mirror()
+    
+    def stop_live_mirror(self):
+        """Stop updating the live mirror label"""
+        self.timers.cancel('live_mirror')
+        self.live_mirror_label = None
+    
     def start_scanning_sequence(self):
         """Start the scanning sequence for Valid Pass"""
         self.scanning_sequence_step = 1
@@ -2121,577 +1495,38 @@ class STIWelcomeScreen(QMainWindow):
     
     def show_instructions_screen(self):
         """Show the instructions screen with countdown"""
-        # Create overlay widget
-        self.create_scanning_overlay()
-        
-        # Create main layout for overlay
-        main_layout = QVBoxLayout(self.scanning_overlay)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        # Top banner - Gold/Mustard Yellow like main screen
-        top_banner = QFrame()
-        top_banner.setFixedHeight(120)
-        top_banner.setStyleSheet("background-color: #DAA520;")
-        
-        countdown_label = QLabel("Getting ready in 3 second(s)...")
-        countdown_label.setAlignment(Qt.AlignCenter)
-        countdown_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 36px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        
-        top_banner_layout = QVBoxLayout(top_banner)
-        top_banner_layout.addWidget(countdown_label)
-        main_layout.addWidget(top_banner)
-        
-        # Main content area - Split like main screen
-        content_area = QFrame()
-        content_layout = QHBoxLayout(content_area)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(0)
-        
-        # Left panel - White background with STI logo (like main screen)
-        left_panel = QFrame()
-        left_panel.setStyleSheet("background-color: white;")
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setAlignment(Qt.AlignCenter)
-        
-        # Load and display STI Logo (same as main screen)
-        logo_path = os.path.join("image-elements", "STI Balagtas Logo.png")
-        if os.path.exists(logo_path):
-            logo_label = QLabel()
-            pixmap = QPixmap(logo_path)
-            # Scale the logo to a reasonable size for 1920x1080
-            scaled_pixmap = pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
-            logo_label.setAlignment(Qt.AlignCenter)
-            left_layout.addWidget(logo_label)
-        else:
-            # Fallback if logo not found
-            fallback_label = QLabel("STI Balagtas Logo")
-            fallback_label.setAlignment(Qt.AlignCenter)
-            fallback_label.setStyleSheet("""
-                QLabel {
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #0066CC;
-                    background-color: #FFD700;
-                    padding: 20px;
-                    border-radius: 3px;
-                }
-            """)
-            left_layout.addWidget(fallback_label)
-        
-        content_layout.addWidget(left_panel)
-        
-        # Right panel - Dark blue background (like main screen)
-        right_panel = QFrame()
-        right_panel.setStyleSheet("background-color: #1E3A8A;")
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.setAlignment(Qt.AlignCenter)
-        
-        # User icon - Load Generic User Image
-        user_image_path = os.path.join("image-elements", "Generic User Image.jpg")
-        if os.path.exists(user_image_path):
-            user_icon = QLabel()
-            pixmap = QPixmap(user_image_path)
-            # Scale the user image to a reasonable size
-            scaled_pixmap = pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            
-            # Create rounded corners on the image itself
-            rounded_pixmap = QPixmap(scaled_pixmap.size())
-            rounded_pixmap.fill(Qt.transparent)
-            
-            painter = QPainter(rounded_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            
-            # Create rounded rectangle path
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, scaled_pixmap.width(), scaled_pixmap.height(), 3, 3)
-            painter.setClipPath(path)
-            
-            # Draw the image
-            painter.drawPixmap(0, 0, scaled_pixmap)
-            painter.end()
-            
-            user_icon.setPixmap(rounded_pixmap)
-            user_icon.setAlignment(Qt.AlignCenter)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: transparent;
-                }
-            """)
-        else:
-            # Fallback if image not found
-            user_icon = QLabel("👤")
-            user_icon.setFixedSize(180, 180)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: #D3D3D3;
-                    border-radius: 3px;
-                    border: 2px solid white;
-                    font-size: 80px;
-                    color: #1E3A8A;
-                }
-            """)
-            user_icon.setAlignment(Qt.AlignCenter)
-        
-        right_layout.addWidget(user_icon)
-        
-        # ID Card info
-        id_label = QLabel("Test ID Card")
-        id_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-                margin-top: 20px;
-            }
-        """)
-        right_layout.addWidget(id_label, alignment=Qt.AlignCenter)
-        
-        role_label = QLabel("(Test User Role)")
-        role_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(role_label, alignment=Qt.AlignCenter)
-        
-        # Time check-in
-        time_check_label = QLabel("Time Check-in:")
-        time_check_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-                margin-top: 40px;
-            }
-        """)
-        right_layout.addWidget(time_check_label, alignment=Qt.AlignCenter)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_value = QLabel(current_time)
-        time_value.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(time_value, alignment=Qt.AlignCenter)
-        
-        content_layout.addWidget(right_panel)
-        main_layout.addWidget(content_area)
-        
-        # Bottom bar - Light blue and dark blue (like main screen)
-        bottom_bar = QFrame()
-        bottom_bar.setFixedHeight(100)
-        bottom_layout = QHBoxLayout(bottom_bar)
-        bottom_layout.setSpacing(0)
-        bottom_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Date section - Light blue
-        date_frame = QFrame()
-        date_frame.setStyleSheet("background-color: #87CEEB;")
-        date_layout = QVBoxLayout(date_frame)
-        
-        current_date = datetime.now().strftime("%B %d, %Y")
-        date_label = QLabel(current_date)
-        date_label.setAlignment(Qt.AlignCenter)
-        date_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        date_layout.addWidget(date_label)
-        bottom_layout.addWidget(date_frame)
-        
-        # Time section - Dark blue
-        time_frame = QFrame()
-        time_frame.setStyleSheet("background-color: #021C37;")
-        time_layout = QVBoxLayout(time_frame)
-        
-        time_display = QLabel(current_time)
-        time_display.setAlignment(Qt.AlignCenter)
-        time_display.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        time_layout.addWidget(time_display)
-        bottom_layout.addWidget(time_frame)
-        
-        main_layout.addWidget(bottom_bar)
-        
-        # Show overlay
-        self.scanning_overlay.show()
+        # Getting-ready page (prebuilt; only the bound fields change)
+        self.show_split_page(banner_text="Getting ready in 3 second(s)...", banner_state='ready',
+                             banner_height=120, split=(0, 0), id_style='pageIdSmall')
         
         # Timer for next step
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.show_instructions_image)
-        self.status_timer.start(3000)  # 3 seconds
+        self.timers.schedule('screen_step', 3000, self.show_instructions_image)
     
     def show_instructions_image(self):
         """Show the instructions image screen for 3 seconds"""
         self.scanning_sequence_step = 2
         print(f"Entering show_instructions_image - step {self.scanning_sequence_step}")
         
-        # Stop any existing timer
-        if hasattr(self, 'status_timer') and self.status_timer:
-            self.status_timer.stop()
-        
-        # Clear previous content
-        self.clear_overlay_content()
-        
-        # Create main layout for overlay
-        main_layout = QVBoxLayout(self.scanning_overlay)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        # Top banner - Light blue like in the image
-        top_banner = QFrame()
-        top_banner.setFixedHeight(80)
-        top_banner.setStyleSheet("background-color: #87CEEB;")
-        
-        progress_label = QLabel("Scanning is in progress… Please do not move.")
-        progress_label.setAlignment(Qt.AlignCenter)
-        progress_label.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 28px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        
-        top_banner_layout = QVBoxLayout(top_banner)
-        top_banner_layout.addWidget(progress_label)
-        main_layout.addWidget(top_banner)
-        
-        # Main content area - Split layout like reference
-        content_area = QFrame()
-        content_layout = QHBoxLayout(content_area)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(0)
-        
-        # Left side - Instructions image (70% width)
-        left_panel = QFrame()
-        left_panel.setStyleSheet("background-color: white;")
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setAlignment(Qt.AlignCenter)
-        
-        instructions_path = os.path.join("image-elements", "Instructions Scan.png")
-        if os.path.exists(instructions_path):
-            instructions_label = QLabel()
-            pixmap = QPixmap(instructions_path)
-            # Scale to fit the left panel
-            scaled_pixmap = pixmap.scaled(1344, 900, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            instructions_label.setPixmap(scaled_pixmap)
-            instructions_label.setAlignment(Qt.AlignCenter)
-            instructions_label.setStyleSheet("background-color: transparent;")
-            left_layout.addWidget(instructions_label)
-        else:
-            # Fallback if image not found
-            fallback_label = QLabel("Instructions Scan image not found")
-            fallback_label.setAlignment(Qt.AlignCenter)
-            fallback_label.setStyleSheet("""
-                QLabel {
-                    color: red;
-                    font-size: 24px;
-                    font-weight: bold;
-                    background-color: white;
-                }
-            """)
-            left_layout.addWidget(fallback_label)
-        
-        content_layout.addWidget(left_panel, 70)  # 70% width
-        
-        # Right panel - User info (30% width) - Dark blue background
-        right_panel = QFrame()
-        right_panel.setStyleSheet("background-color: #1E3A8A;")
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.setAlignment(Qt.AlignCenter)
-        
-        # User icon - Load Generic User Image with rounded corners
-        user_image_path = os.path.join("image-elements", "Generic User Image.jpg")
-        if os.path.exists(user_image_path):
-            user_icon = QLabel()
-            pixmap = QPixmap(user_image_path)
-            # Scale the user image
-            scaled_pixmap = pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            
-            # Create rounded corners on the image itself
-            rounded_pixmap = QPixmap(scaled_pixmap.size())
-            rounded_pixmap.fill(Qt.transparent)
-            
-            painter = QPainter(rounded_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            
-            # Create rounded rectangle path
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, scaled_pixmap.width(), scaled_pixmap.height(), 3, 3)
-            painter.setClipPath(path)
-            
-            # Draw the image
-            painter.drawPixmap(0, 0, scaled_pixmap)
-            painter.end()
-            
-            user_icon.setPixmap(rounded_pixmap)
-            user_icon.setAlignment(Qt.AlignCenter)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: transparent;
-                }
-            """)
-        else:
-            # Fallback if image not found
-            user_icon = QLabel("👤")
-            user_icon.setFixedSize(180, 180)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: #D3D3D3;
-                    border-radius: 3px;
-                    border: 2px solid white;
-                    font-size: 80px;
-                    color: #1E3A8A;
-                }
-            """)
-            user_icon.setAlignment(Qt.AlignCenter)
-        
-        right_layout.addWidget(user_icon)
-        
-        # ID Card info
-        id_label = QLabel("Test ID Card")
-        id_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 32px;
-                font-weight: bold;
-                background-color: transparent;
-                margin-top: 20px;
-            }
-        """)
-        right_layout.addWidget(id_label, alignment=Qt.AlignCenter)
-        
-        role_label = QLabel("(Test User Role)")
-        role_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(role_label, alignment=Qt.AlignCenter)
-        
-        # Time check-in
-        time_check_label = QLabel("Time Check-in:")
-        time_check_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-                margin-top: 40px;
-            }
-        """)
-        right_layout.addWidget(time_check_label, alignment=Qt.AlignCenter)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_value = QLabel(current_time)
-        time_value.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(time_value, alignment=Qt.AlignCenter)
-        
-        content_layout.addWidget(right_panel, 30)  # 30% width
-        main_layout.addWidget(content_area)
-        
-        # Bottom bar - Light blue and dark blue
-        bottom_bar = QFrame()
-        bottom_bar.setFixedHeight(100)
-        bottom_layout = QHBoxLayout(bottom_bar)
-        bottom_layout.setSpacing(0)
-        bottom_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Date section - Light blue
-        date_frame = QFrame()
-        date_frame.setStyleSheet("background-color: #87CEEB;")
-        date_layout = QVBoxLayout(date_frame)
-        
-        current_date = datetime.now().strftime("%B %d, %Y")
-        date_label = QLabel(current_date)
-        date_label.setAlignment(Qt.AlignCenter)
-        date_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        date_layout.addWidget(date_label)
-        bottom_layout.addWidget(date_frame)
-        
-        # Time section - Dark blue
-        time_frame = QFrame()
-        time_frame.setStyleSheet("background-color: #021C37;")
-        time_layout = QVBoxLayout(time_frame)
-        
-        time_display = QLabel(current_time)
-        time_display.setAlignment(Qt.AlignCenter)
-        time_display.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        time_layout.addWidget(time_display)
-        bottom_layout.addWidget(time_frame)
-        
-        main_layout.addWidget(bottom_bar)
-        
-        # Show overlay
-        self.scanning_overlay.show()
+        # Instructions page
+        self.show_split_page(banner_text="Scanning is in progress… Please do not move.",
+                             banner_state='scanning', left=LEFT_INSTRUCTIONS)
         
         # Timer for next step
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.show_scanning_progress)
-        self.status_timer.start(3000)  # 3 seconds
+        self.timers.schedule('screen_step', 3000, self.show_scanning_progress)
         print(f"Timer started for step {self.scanning_sequence_step} - will call show_scanning_progress in 3 seconds")
     
     def show_scanning_progress(self):
         """Show scanning in progress screen"""
         self.scanning_sequence_step = 3
         
-        # Stop any existing timer
-        if hasattr(self, 'status_timer') and self.status_timer:
-            self.status_timer.stop()
-        
-        # Clear previous content
-        self.clear_overlay_content()
-        
-        # Create main layout for overlay
-        main_layout = QVBoxLayout(self.scanning_overlay)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        # Top banner
-        top_banner = QFrame()
-        top_banner.setFixedHeight(80)
-        top_banner.setStyleSheet("background-color: #87CEEB;")
-        
-        progress_label = QLabel("Scanning is in progress… Please do not move.")
-        progress_label.setAlignment(Qt.AlignCenter)
-        progress_label.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 28px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        
-        top_banner_layout = QVBoxLayout(top_banner)
-        top_banner_layout.addWidget(progress_label)
-        main_layout.addWidget(top_banner)
-        
-        # Main content area - black background
-        content_area = QFrame()
-        content_area.setStyleSheet("background-color: black;")
-        content_layout = QVBoxLayout(content_area)
-        content_layout.setAlignment(Qt.AlignCenter)
-        
-        # Scanning text
-        scanning_text = QLabel("Scanning...")
-        scanning_text.setAlignment(Qt.AlignCenter)
-        scanning_text.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 48px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        content_layout.addWidget(scanning_text)
-        
-        main_layout.addWidget(content_area)
-        
-        # Bottom bar
-        bottom_bar = QFrame()
-        bottom_bar.setFixedHeight(100)
-        bottom_layout = QHBoxLayout(bottom_bar)
-        bottom_layout.setSpacing(0)
-        bottom_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Date section
-        date_frame = QFrame()
-        date_frame.setStyleSheet("background-color: #87CEEB;")
-        date_layout = QVBoxLayout(date_frame)
-        
-        current_date = datetime.now().strftime("%B %d, %Y")
-        date_label = QLabel(current_date)
-        date_label.setAlignment(Qt.AlignCenter)
-        date_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        date_layout.addWidget(date_label)
-        bottom_layout.addWidget(date_frame)
-        
-        # Time section
-        time_frame = QFrame()
-        time_frame.setStyleSheet("background-color: #021C37;")
-        time_layout = QVBoxLayout(time_frame)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_display = QLabel(current_time)
-        time_display.setAlignment(Qt.AlignCenter)
-        time_display.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        time_layout.addWidget(time_display)
-        bottom_layout.addWidget(time_frame)
-        
-        main_layout.addWidget(bottom_bar)
-        
-        # Show overlay
-        self.scanning_overlay.show()
+        # Scanning page; the live camera mirror replaces the placeholder text
+        page = self.show_overlay_page('scanning', banner_text="Scanning is in progress… Please do not move.",
+                                      banner_state='scanning', banner_height=80)
+        page.reset_mirror()
+        self.start_live_mirror(page.mirror_label)
         
         # Timer for next step
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.show_scanning_complete)
-        self.status_timer.start(3000)  # 3 seconds
+        self.timers.schedule('screen_step', 3000, self.show_scanning_complete)
         print(f"Timer started for step {self.scanning_sequence_step} - will call show_scanning_complete in 3 seconds")
     
     def show_scanning_complete(self):
@@ -2699,225 +1534,17 @@ class STIWelcomeScreen(QMainWindow):
         self.scanning_sequence_step = 4
         print(f"Entering show_scanning_complete - step {self.scanning_sequence_step}")
         
-        # Stop any existing timer
-        if hasattr(self, 'status_timer') and self.status_timer:
-            self.status_timer.stop()
-        
-        # Clear previous content
-        self.clear_overlay_content()
-        
-        # Create main layout for overlay
-        main_layout = QVBoxLayout(self.scanning_overlay)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        # Top banner
-        top_banner = QFrame()
-        top_banner.setFixedHeight(80)
-        top_banner.setStyleSheet("background-color: #87CEEB;")
-        
-        result_label = QLabel("Please wait for the result.")
-        result_label.setAlignment(Qt.AlignCenter)
-        result_label.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 28px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        
-        top_banner_layout = QVBoxLayout(top_banner)
-        top_banner_layout.addWidget(result_label)
-        main_layout.addWidget(top_banner)
-        
-        # Main content area - Split layout like reference
-        content_area = QFrame()
-        content_layout = QHBoxLayout(content_area)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(0)
-        
-        # Left side - Scanning complete content (70% width)
-        left_panel = QFrame()
-        left_panel.setStyleSheet("background-color: black;")
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setAlignment(Qt.AlignCenter)
-        
-        # Load scan-ok image
-        scan_ok_path = os.path.join("image-elements", "scan-ok.png")
-        if os.path.exists(scan_ok_path):
-            scan_ok_label = QLabel()
-            pixmap = QPixmap(scan_ok_path)
-            # Scale the scan-ok image (70% bigger than before: 300 * 1.7 = 510)
-            scaled_pixmap = pixmap.scaled(1024, 1024, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            scan_ok_label.setPixmap(scaled_pixmap)
-            scan_ok_label.setAlignment(Qt.AlignCenter)
-            left_layout.addWidget(scan_ok_label)
-        
-        content_layout.addWidget(left_panel, 70)  # 70% width
-        
-        # Right panel - User info (30% width) - Dark blue background
-        right_panel = QFrame()
-        right_panel.setStyleSheet("background-color: #1E3A8A;")
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.setAlignment(Qt.AlignCenter)
-        
-        # User icon - Load Generic User Image with rounded corners
-        user_image_path = os.path.join("image-elements", "Generic User Image.jpg")
-        if os.path.exists(user_image_path):
-            user_icon = QLabel()
-            pixmap = QPixmap(user_image_path)
-            # Scale the user image
-            scaled_pixmap = pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            
-            # Create rounded corners on the image itself
-            rounded_pixmap = QPixmap(scaled_pixmap.size())
-            rounded_pixmap.fill(Qt.transparent)
-            
-            painter = QPainter(rounded_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            
-            # Create rounded rectangle path
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, scaled_pixmap.width(), scaled_pixmap.height(), 3, 3)
-            painter.setClipPath(path)
-            
-            # Draw the image
-            painter.drawPixmap(0, 0, scaled_pixmap)
-            painter.end()
-            
-            user_icon.setPixmap(rounded_pixmap)
-            user_icon.setAlignment(Qt.AlignCenter)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: transparent;
-                }
-            """)
-        else:
-            # Fallback if image not found
-            user_icon = QLabel("👤")
-            user_icon.setFixedSize(180, 180)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: #D3D3D3;
-                    border-radius: 3px;
-                    border: 2px solid white;
-                    font-size: 80px;
-                    color: #1E3A8A;
-                }
-            """)
-            user_icon.setAlignment(Qt.AlignCenter)
-        
-        right_layout.addWidget(user_icon)
-        
-        # ID Card info
-        id_label = QLabel("Test ID Card")
-        id_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 32px;
-                font-weight: bold;
-                background-color: transparent;
-                margin-top: 20px;
-            }
-        """)
-        right_layout.addWidget(id_label, alignment=Qt.AlignCenter)
-        
-        role_label = QLabel("(Test User Role)")
-        role_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(role_label, alignment=Qt.AlignCenter)
-        
-        # Time check-in
-        time_check_label = QLabel("Time Check-in:")
-        time_check_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-                margin-top: 40px;
-            }
-        """)
-        right_layout.addWidget(time_check_label, alignment=Qt.AlignCenter)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_value = QLabel(current_time)
-        time_value.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(time_value, alignment=Qt.AlignCenter)
-        
-        content_layout.addWidget(right_panel, 30)  # 30% width
-        main_layout.addWidget(content_area)
-        
-        # Bottom bar
-        bottom_bar = QFrame()
-        bottom_bar.setFixedHeight(100)
-        bottom_layout = QHBoxLayout(bottom_bar)
-        bottom_layout.setSpacing(0)
-        bottom_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Date section
-        date_frame = QFrame()
-        date_frame.setStyleSheet("background-color: #87CEEB;")
-        date_layout = QVBoxLayout(date_frame)
-        
-        current_date = datetime.now().strftime("%B %d, %Y")
-        date_label = QLabel(current_date)
-        date_label.setAlignment(Qt.AlignCenter)
-        date_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        date_layout.addWidget(date_label)
-        bottom_layout.addWidget(date_frame)
-        
-        # Time section
-        time_frame = QFrame()
-        time_frame.setStyleSheet("background-color: #021C37;")
-        time_layout = QVBoxLayout(time_frame)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_display = QLabel(current_time)
-        time_display.setAlignment(Qt.AlignCenter)
-        time_display.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        time_layout.addWidget(time_display)
-        bottom_layout.addWidget(time_frame)
-        
-        main_layout.addWidget(bottom_bar)
-        
-        # Show overlay
-        self.scanning_overlay.show()
+        # Scan complete page
+        self.show_split_page(banner_text="Please wait for the result.", banner_state='scanning',
+                             left=LEFT_SCAN_OK)
         
         # Timer to close overlay and return to normal
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.end_scanning_sequence)
-        self.status_timer.start(3000)  # 3 seconds
+        self.timers.schedule('screen_step', 3000, self.end_scanning_sequence)
         print(f"Timer started for step {self.scanning_sequence_step} - will call end_scanning_sequence in 3 seconds")
     
     def create_scanning_overlay(self):
         """Create the scanning overlay widget"""
+        self.screen_pages.hide_pages()
         try:
             # Properly clean up existing overlay
             if hasattr(self, 'scanning_overlay') and self.scanning_overlay:
@@ -2928,42 +1555,48 @@ class STIWelcomeScreen(QMainWindow):
             # Create new overlay
             self.scanning_overlay = QWidget(self)
             self.scanning_overlay.setGeometry(0, 0, 1920, 1080)
-            self.scanning_overlay.setStyleSheet("background-color: rgba(0, 0, 0, 180);")
+            self.scanning_overlay.setProperty('panel', 'overlay')
         except Exception as e:
             print(f"Error creating scanning overlay: {e}")
             # Fallback: try to create a simple overlay
             try:
                 self.scanning_overlay = QWidget(self)
                 self.scanning_overlay.setGeometry(0, 0, 1920, 1080)
-                self.scanning_overlay.setStyleSheet("background-color: rgba(0, 0, 0, 180);")
+                self.scanning_overlay.setProperty('panel', 'overlay')
             except Exception as e2:
                 print(f"Failed to create fallback overlay: {e2}")
                 self.scanning_overlay = None
     
-    def clear_overlay_content(self):
-        """Clear the overlay content by recreating the overlay"""
+    def show_overlay_page(self, name, **values):
+        """Switch to a prebuilt overlay page, refreshing the date and time bar"""
+        # New screen: the previous screen's pending steps must not run against it
+        self.stop_all_timers()
+        # A hand-built overlay (instructions then person) may still be up
         if self.scanning_overlay:
             self.scanning_overlay.hide()
             self.scanning_overlay.deleteLater()
             self.scanning_overlay = None
-        
-        # Recreate the overlay
-        self.scanning_overlay = QWidget(self)
-        self.scanning_overlay.setGeometry(0, 0, 1920, 1080)
-        self.scanning_overlay.setStyleSheet("background-color: rgba(0, 0, 0, 180);")
+        now = datetime.now()
+        values.setdefault('date', now.strftime("%B %d, %Y"))
+        values.setdefault('clock', now.strftime("%I:%M:%S %p"))
+        return self.screen_pages.show_page(name, **values)
+    
+    def show_split_page(self, **values):
+        """Show the banner / image / visitor page; fields not given use the verified-screen look"""
+        data = dict(SplitPage.DEFAULTS)
+        data['time_value'] = datetime.now().strftime("%I:%M:%S %p")
+        data.update(values)
+        return self.show_overlay_page('split', **data)
     
     def end_scanning_sequence(self):
         """End the scanning sequence and show verification dialog"""
         print("Entering end_scanning_sequence - showing verification dialog")
         
-        # Stop any existing timer
-        if hasattr(self, 'status_timer') and self.status_timer:
-            self.status_timer.stop()
-        
         if self.scanning_overlay:
             self.scanning_overlay.hide()
             self.scanning_overlay.deleteLater()
             self.scanning_overlay = None
+        self.screen_pages.hide_pages()
         
         self.scanning_sequence_step = 0
         
@@ -2986,18 +1619,11 @@ class STIWelcomeScreen(QMainWindow):
         # Header - Mustard yellow
         header = QFrame()
         header.setFixedHeight(80)
-        header.setStyleSheet("background-color: #DAA520;")
+        header.setProperty('panel', 'mustard')
         
         header_label = QLabel("Developer Mode")
         header_label.setAlignment(Qt.AlignCenter)
-        header_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 36px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
+        header_label.setProperty('textStyle', 'title')
         
         header_layout = QVBoxLayout(header)
         header_layout.addWidget(header_label)
@@ -3005,54 +1631,21 @@ class STIWelcomeScreen(QMainWindow):
         
         # Content area - Dark blue
         content = QFrame()
-        content.setStyleSheet("background-color: #1E3A8A;")
+        content.setProperty('panel', 'navy')
         content_layout = QVBoxLayout(content)
         content_layout.setAlignment(Qt.AlignCenter)
         
         # Accept Automatically button - Green
         accept_button = QPushButton("Accept Automatically")
         accept_button.setFixedSize(400, 80)
-        accept_button.setStyleSheet("""
-            QPushButton {
-                background-color: #28A745;
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                border: none;
-                border-radius: 20px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:pressed {
-                background-color: #1E7E34;
-            }
-        """)
+        accept_button.setProperty('button', 'accept')
         accept_button.clicked.connect(self.accept_automatically)
         content_layout.addWidget(accept_button, alignment=Qt.AlignCenter)
         
         # Manual Verification button - Red
         manual_button = QPushButton("Manual Verification")
         manual_button.setFixedSize(400, 80)
-        manual_button.setStyleSheet("""
-            QPushButton {
-                background-color: #DC3545;
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                border: none;
-                border-radius: 20px;
-                padding: 10px;
-                margin-top: 20px;
-            }
-            QPushButton:hover {
-                background-color: #C82333;
-            }
-            QPushButton:pressed {
-                background-color: #BD2130;
-            }
-        """)
+        manual_button.setProperty('button', 'reject')
         manual_button.clicked.connect(self.manual_verification)
         content_layout.addWidget(manual_button, alignment=Qt.AlignCenter)
         
@@ -3074,232 +1667,11 @@ class STIWelcomeScreen(QMainWindow):
     
     def show_success_screen(self):
         """Show the success screen after accepting automatically"""
-        # Create overlay for success screen
-        self.create_scanning_overlay()
-        
-        # Create main layout for overlay
-        main_layout = QVBoxLayout(self.scanning_overlay)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        # Top banner - Light green
-        top_banner = QFrame()
-        top_banner.setFixedHeight(80)
-        top_banner.setStyleSheet("background-color: #90EE90;")
-        
-        success_label = QLabel("User Identity Verified. Thank You!")
-        success_label.setAlignment(Qt.AlignCenter)
-        success_label.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 28px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        
-        top_banner_layout = QVBoxLayout(top_banner)
-        top_banner_layout.addWidget(success_label)
-        main_layout.addWidget(top_banner)
-        
-        # Main content area - Split layout
-        content_area = QFrame()
-        content_layout = QHBoxLayout(content_area)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(0)
-        
-        # Left panel - White background with STI logo (70% width)
-        left_panel = QFrame()
-        left_panel.setStyleSheet("background-color: white;")
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setAlignment(Qt.AlignCenter)
-        
-        # Load and display STI Logo
-        logo_path = os.path.join("image-elements", "STI Balagtas Logo.png")
-        if os.path.exists(logo_path):
-            logo_label = QLabel()
-            pixmap = QPixmap(logo_path)
-            # Scale the logo
-            scaled_pixmap = pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
-            logo_label.setAlignment(Qt.AlignCenter)
-            left_layout.addWidget(logo_label)
-        else:
-            # Fallback if logo not found
-            fallback_label = QLabel("STI Balagtas Logo")
-            fallback_label.setAlignment(Qt.AlignCenter)
-            fallback_label.setStyleSheet("""
-                QLabel {
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #0066CC;
-                    background-color: #FFD700;
-                    padding: 20px;
-                    border-radius: 3px;
-                }
-            """)
-            left_layout.addWidget(fallback_label)
-        
-        content_layout.addWidget(left_panel, 70)  # 70% width
-        
-        # Right panel - User info (30% width) - Dark blue background
-        right_panel = QFrame()
-        right_panel.setStyleSheet("background-color: #1E3A8A;")
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.setAlignment(Qt.AlignCenter)
-        
-        # User icon - Load Generic User Image with rounded corners
-        user_image_path = os.path.join("image-elements", "Generic User Image.jpg")
-        if os.path.exists(user_image_path):
-            user_icon = QLabel()
-            pixmap = QPixmap(user_image_path)
-            # Scale the user image
-            scaled_pixmap = pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            
-            # Create rounded corners on the image itself
-            rounded_pixmap = QPixmap(scaled_pixmap.size())
-            rounded_pixmap.fill(Qt.transparent)
-            
-            painter = QPainter(rounded_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            
-            # Create rounded rectangle path
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, scaled_pixmap.width(), scaled_pixmap.height(), 3, 3)
-            painter.setClipPath(path)
-            
-            # Draw the image
-            painter.drawPixmap(0, 0, scaled_pixmap)
-            painter.end()
-            
-            user_icon.setPixmap(rounded_pixmap)
-            user_icon.setAlignment(Qt.AlignCenter)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: transparent;
-                }
-            """)
-        else:
-            # Fallback if image not found
-            user_icon = QLabel("👤")
-            user_icon.setFixedSize(180, 180)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: #D3D3D3;
-                    border-radius: 3px;
-                    border: 2px solid white;
-                    font-size: 80px;
-                    color: #1E3A8A;
-                }
-            """)
-            user_icon.setAlignment(Qt.AlignCenter)
-        
-        right_layout.addWidget(user_icon)
-        
-        # ID Card info
-        id_label = QLabel("Test ID Card")
-        id_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 32px;
-                font-weight: bold;
-                background-color: transparent;
-                margin-top: 20px;
-            }
-        """)
-        right_layout.addWidget(id_label, alignment=Qt.AlignCenter)
-        
-        role_label = QLabel("(Test User Role)")
-        role_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(role_label, alignment=Qt.AlignCenter)
-        
-        # Time check-in
-        time_check_label = QLabel("Time Check-in:")
-        time_check_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-                margin-top: 40px;
-            }
-        """)
-        right_layout.addWidget(time_check_label, alignment=Qt.AlignCenter)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_value = QLabel(current_time)
-        time_value.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(time_value, alignment=Qt.AlignCenter)
-        
-        content_layout.addWidget(right_panel, 30)  # 30% width
-        main_layout.addWidget(content_area)
-        
-        # Bottom bar - Light blue and dark blue
-        bottom_bar = QFrame()
-        bottom_bar.setFixedHeight(100)
-        bottom_layout = QHBoxLayout(bottom_bar)
-        bottom_layout.setSpacing(0)
-        bottom_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Date section - Light blue
-        date_frame = QFrame()
-        date_frame.setStyleSheet("background-color: #87CEEB;")
-        date_layout = QVBoxLayout(date_frame)
-        
-        current_date = datetime.now().strftime("%B %d, %Y")
-        date_label = QLabel(current_date)
-        date_label.setAlignment(Qt.AlignCenter)
-        date_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        date_layout.addWidget(date_label)
-        bottom_layout.addWidget(date_frame)
-        
-        # Time section - Dark blue
-        time_frame = QFrame()
-        time_frame.setStyleSheet("background-color: #021C37;")
-        time_layout = QVBoxLayout(time_frame)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_display = QLabel(current_time)
-        time_display.setAlignment(Qt.AlignCenter)
-        time_display.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        time_layout.addWidget(time_display)
-        bottom_layout.addWidget(time_frame)
-        
-        main_layout.addWidget(bottom_bar)
-        
-        # Show overlay
-        self.scanning_overlay.show()
+        # Verified page
+        self.show_split_page(banner_text="User Identity Verified. Thank You!")
         
         # Timer to return to main screen after 5 seconds
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.return_to_main_screen)
-        self.status_timer.start(5000)  # 5 seconds
+        self.timers.schedule('screen_step', 5000, self.return_to_main_screen)
         print("Success screen shown - will return to main screen in 5 seconds")
     
     def return_to_main_screen(self):
@@ -3315,6 +1687,7 @@ class STIWelcomeScreen(QMainWindow):
                 self.scanning_overlay.hide()
                 self.scanning_overlay.deleteLater()
                 self.scanning_overlay = None
+            self.screen_pages.hide_pages()
             
             # Reset to main screen
             self.reset_to_main_screen()
@@ -3328,934 +1701,48 @@ class STIWelcomeScreen(QMainWindow):
     
     def show_special_pass_success_screen(self):
         """Show the special pass success screen"""
-        # Create overlay for special pass success screen
-        self.create_scanning_overlay()
-        
-        # Create main layout for overlay
-        main_layout = QVBoxLayout(self.scanning_overlay)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        # Top banner - Light green
-        top_banner = QFrame()
-        top_banner.setFixedHeight(80)
-        top_banner.setStyleSheet("background-color: #90EE90;")
-        
-        success_label = QLabel("User Identity Verified. Thank You!")
-        success_label.setAlignment(Qt.AlignCenter)
-        success_label.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 28px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        
-        top_banner_layout = QVBoxLayout(top_banner)
-        top_banner_layout.addWidget(success_label)
-        main_layout.addWidget(top_banner)
-        
-        # Main content area - Split layout
-        content_area = QFrame()
-        content_layout = QHBoxLayout(content_area)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(0)
-        
-        # Left panel - White background with STI logo (70% width)
-        left_panel = QFrame()
-        left_panel.setStyleSheet("background-color: white;")
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setAlignment(Qt.AlignCenter)
-        
-        # Load and display STI Logo
-        logo_path = os.path.join("image-elements", "STI Balagtas Logo.png")
-        if os.path.exists(logo_path):
-            logo_label = QLabel()
-            pixmap = QPixmap(logo_path)
-            # Scale the logo
-            scaled_pixmap = pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
-            logo_label.setAlignment(Qt.AlignCenter)
-            left_layout.addWidget(logo_label)
-        else:
-            # Fallback if logo not found
-            fallback_label = QLabel("STI Balagtas Logo")
-            fallback_label.setAlignment(Qt.AlignCenter)
-            fallback_label.setStyleSheet("""
-                QLabel {
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #0066CC;
-                    background-color: #FFD700;
-                    padding: 20px;
-                    border-radius: 3px;
-                }
-            """)
-            left_layout.addWidget(fallback_label)
-        
-        content_layout.addWidget(left_panel, 70)  # 70% width
-        
-        # Right panel - User info (30% width) - Dark blue background
-        right_panel = QFrame()
-        right_panel.setStyleSheet("background-color: #1E3A8A;")
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.setAlignment(Qt.AlignCenter)
-        
-        # User icon - Load Generic User Image with rounded corners
-        user_image_path = os.path.join("image-elements", "Generic User Image.jpg")
-        if os.path.exists(user_image_path):
-            user_icon = QLabel()
-            pixmap = QPixmap(user_image_path)
-            # Scale the user image
-            scaled_pixmap = pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            
-            # Create rounded corners on the image itself
-            rounded_pixmap = QPixmap(scaled_pixmap.size())
-            rounded_pixmap.fill(Qt.transparent)
-            
-            painter = QPainter(rounded_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            
-            # Create rounded rectangle path
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, scaled_pixmap.width(), scaled_pixmap.height(), 3, 3)
-            painter.setClipPath(path)
-            
-            # Draw the image
-            painter.drawPixmap(0, 0, scaled_pixmap)
-            painter.end()
-            
-            user_icon.setPixmap(rounded_pixmap)
-            user_icon.setAlignment(Qt.AlignCenter)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: transparent;
-                }
-            """)
-        else:
-            # Fallback if image not found
-            user_icon = QLabel("👤")
-            user_icon.setFixedSize(180, 180)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: #D3D3D3;
-                    border-radius: 3px;
-                    border: 2px solid white;
-                    font-size: 80px;
-                    color: #1E3A8A;
-                }
-            """)
-            user_icon.setAlignment(Qt.AlignCenter)
-        
-        right_layout.addWidget(user_icon)
-        
-        # Special Pass info instead of Test ID Card
-        id_label = QLabel("Special Pass")
-        id_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 32px;
-                font-weight: bold;
-                background-color: transparent;
-                margin-top: 20px;
-            }
-        """)
-        right_layout.addWidget(id_label, alignment=Qt.AlignCenter)
-        
-        ref_label = QLabel("Ref. 001")
-        ref_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(ref_label, alignment=Qt.AlignCenter)
-        
-        # Time check-in
-        time_check_label = QLabel("Time Check-in:")
-        time_check_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-                margin-top: 40px;
-            }
-        """)
-        right_layout.addWidget(time_check_label, alignment=Qt.AlignCenter)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_value = QLabel(current_time)
-        time_value.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(time_value, alignment=Qt.AlignCenter)
-        
-        content_layout.addWidget(right_panel, 30)  # 30% width
-        main_layout.addWidget(content_area)
-        
-        # Bottom bar - Light blue and dark blue
-        bottom_bar = QFrame()
-        bottom_bar.setFixedHeight(100)
-        bottom_layout = QHBoxLayout(bottom_bar)
-        bottom_layout.setSpacing(0)
-        bottom_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Date section - Light blue
-        date_frame = QFrame()
-        date_frame.setStyleSheet("background-color: #87CEEB;")
-        date_layout = QVBoxLayout(date_frame)
-        
-        current_date = datetime.now().strftime("%B %d, %Y")
-        date_label = QLabel(current_date)
-        date_label.setAlignment(Qt.AlignCenter)
-        date_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        date_layout.addWidget(date_label)
-        bottom_layout.addWidget(date_frame)
-        
-        # Time section - Dark blue
-        time_frame = QFrame()
-        time_frame.setStyleSheet("background-color: #021C37;")
-        time_layout = QVBoxLayout(time_frame)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_display = QLabel(current_time)
-        time_display.setAlignment(Qt.AlignCenter)
-        time_display.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        time_layout.addWidget(time_display)
-        bottom_layout.addWidget(time_frame)
-        
-        main_layout.addWidget(bottom_bar)
-        
-        # Show overlay
-        self.scanning_overlay.show()
+        # Special pass info instead of the ID card
+        self.show_split_page(banner_text="User Identity Verified. Thank You!",
+                             id_text="Special Pass", role_text="Ref. 001")
         
         # Timer to return to main screen after 5 seconds
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.return_to_main_screen)
-        self.status_timer.start(5000)  # 5 seconds
+        self.timers.schedule('screen_step', 5000, self.return_to_main_screen)
         print("Special pass success screen shown - will return to main screen in 5 seconds")
     
     def show_special_pass_checkout_screen(self):
         """Show the special pass check-out screen"""
-        # Create overlay for special pass check-out screen
-        self.create_scanning_overlay()
-        
-        # Create main layout for overlay
-        main_layout = QVBoxLayout(self.scanning_overlay)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        # Top banner - Light green
-        top_banner = QFrame()
-        top_banner.setFixedHeight(80)
-        top_banner.setStyleSheet("background-color: #90EE90;")
-        
-        success_label = QLabel("User Identity Verified. Thank You!")
-        success_label.setAlignment(Qt.AlignCenter)
-        success_label.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 28px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        
-        top_banner_layout = QVBoxLayout(top_banner)
-        top_banner_layout.addWidget(success_label)
-        main_layout.addWidget(top_banner)
-        
-        # Main content area - Split layout
-        content_area = QFrame()
-        content_layout = QHBoxLayout(content_area)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(0)
-        
-        # Left panel - White background with STI logo (70% width)
-        left_panel = QFrame()
-        left_panel.setStyleSheet("background-color: white;")
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setAlignment(Qt.AlignCenter)
-        
-        # Load and display STI Logo
-        logo_path = os.path.join("image-elements", "STI Balagtas Logo.png")
-        if os.path.exists(logo_path):
-            logo_label = QLabel()
-            pixmap = QPixmap(logo_path)
-            # Scale the logo
-            scaled_pixmap = pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
-            logo_label.setAlignment(Qt.AlignCenter)
-            left_layout.addWidget(logo_label)
-        else:
-            # Fallback if logo not found
-            fallback_label = QLabel("STI Balagtas Logo")
-            fallback_label.setAlignment(Qt.AlignCenter)
-            fallback_label.setStyleSheet("""
-                QLabel {
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #0066CC;
-                    background-color: #FFD700;
-                    padding: 20px;
-                    border-radius: 3px;
-                }
-            """)
-            left_layout.addWidget(fallback_label)
-        
-        content_layout.addWidget(left_panel, 70)  # 70% width
-        
-        # Right panel - User info (30% width) - Dark blue background
-        right_panel = QFrame()
-        right_panel.setStyleSheet("background-color: #1E3A8A;")
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.setAlignment(Qt.AlignCenter)
-        
-        # User icon - Load Generic User Image with rounded corners
-        user_image_path = os.path.join("image-elements", "Generic User Image.jpg")
-        if os.path.exists(user_image_path):
-            user_icon = QLabel()
-            pixmap = QPixmap(user_image_path)
-            # Scale the user image
-            scaled_pixmap = pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            
-            # Create rounded corners on the image itself
-            rounded_pixmap = QPixmap(scaled_pixmap.size())
-            rounded_pixmap.fill(Qt.transparent)
-            
-            painter = QPainter(rounded_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            
-            # Create rounded rectangle path
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, scaled_pixmap.width(), scaled_pixmap.height(), 3, 3)
-            painter.setClipPath(path)
-            
-            # Draw the image
-            painter.drawPixmap(0, 0, scaled_pixmap)
-            painter.end()
-            
-            user_icon.setPixmap(rounded_pixmap)
-            user_icon.setAlignment(Qt.AlignCenter)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: transparent;
-                }
-            """)
-        else:
-            # Fallback if image not found
-            user_icon = QLabel("👤")
-            user_icon.setFixedSize(180, 180)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: #D3D3D3;
-                    border-radius: 3px;
-                    border: 2px solid white;
-                    font-size: 80px;
-                    color: #1E3A8A;
-                }
-            """)
-            user_icon.setAlignment(Qt.AlignCenter)
-        
-        right_layout.addWidget(user_icon)
-        
-        # Special Pass info instead of Test ID Card
-        id_label = QLabel("Special Pass")
-        id_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 32px;
-                font-weight: bold;
-                background-color: transparent;
-                margin-top: 20px;
-            }
-        """)
-        right_layout.addWidget(id_label, alignment=Qt.AlignCenter)
-        
-        ref_label = QLabel("Ref. 001")
-        ref_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(ref_label, alignment=Qt.AlignCenter)
-        
-        # Time check-out (instead of check-in)
-        time_check_label = QLabel("Time Check-out:")
-        time_check_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-                margin-top: 40px;
-            }
-        """)
-        right_layout.addWidget(time_check_label, alignment=Qt.AlignCenter)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_value = QLabel(current_time)
-        time_value.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(time_value, alignment=Qt.AlignCenter)
-        
-        content_layout.addWidget(right_panel, 30)  # 30% width
-        main_layout.addWidget(content_area)
-        
-        # Bottom bar - Light blue and dark blue
-        bottom_bar = QFrame()
-        bottom_bar.setFixedHeight(100)
-        bottom_layout = QHBoxLayout(bottom_bar)
-        bottom_layout.setSpacing(0)
-        bottom_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Date section - Light blue
-        date_frame = QFrame()
-        date_frame.setStyleSheet("background-color: #87CEEB;")
-        date_layout = QVBoxLayout(date_frame)
-        
-        current_date = datetime.now().strftime("%B %d, %Y")
-        date_label = QLabel(current_date)
-        date_label.setAlignment(Qt.AlignCenter)
-        date_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        date_layout.addWidget(date_label)
-        bottom_layout.addWidget(date_frame)
-        
-        # Time section - Dark blue
-        time_frame = QFrame()
-        time_frame.setStyleSheet("background-color: #021C37;")
-        time_layout = QVBoxLayout(time_frame)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_display = QLabel(current_time)
-        time_display.setAlignment(Qt.AlignCenter)
-        time_display.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        time_layout.addWidget(time_display)
-        bottom_layout.addWidget(time_frame)
-        
-        main_layout.addWidget(bottom_bar)
-        
-        # Show overlay
-        self.scanning_overlay.show()
+        # Special pass info and the check-out time
+        self.show_split_page(banner_text="User Identity Verified. Thank You!",
+                             id_text="Special Pass", role_text="Ref. 001", time_caption="Time Check-out:")
         
         # Timer to return to main screen after 5 seconds
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.return_to_main_screen)
-        self.status_timer.start(5000)  # 5 seconds
+        self.timers.schedule('screen_step', 5000, self.return_to_main_screen)
         print("Special pass check-out screen shown - will return to main screen in 5 seconds")
     
     def show_student_staff_checkout_screen(self):
         """Show the student/teacher/staff check-out screen"""
-        # Create overlay for student/staff check-out screen
-        self.create_scanning_overlay()
-        
-        # Create main layout for overlay
-        main_layout = QVBoxLayout(self.scanning_overlay)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        # Top banner - Light green
-        top_banner = QFrame()
-        top_banner.setFixedHeight(80)
-        top_banner.setStyleSheet("background-color: #90EE90;")
-        
-        success_label = QLabel("User Identity Verified. Thank You!")
-        success_label.setAlignment(Qt.AlignCenter)
-        success_label.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 28px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        
-        top_banner_layout = QVBoxLayout(top_banner)
-        top_banner_layout.addWidget(success_label)
-        main_layout.addWidget(top_banner)
-        
-        # Main content area - Split layout
-        content_area = QFrame()
-        content_layout = QHBoxLayout(content_area)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(0)
-        
-        # Left panel - White background with STI logo (70% width)
-        left_panel = QFrame()
-        left_panel.setStyleSheet("background-color: white;")
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setAlignment(Qt.AlignCenter)
-        
-        # Load and display STI Logo
-        logo_path = os.path.join("image-elements", "STI Balagtas Logo.png")
-        if os.path.exists(logo_path):
-            logo_label = QLabel()
-            pixmap = QPixmap(logo_path)
-            # Scale the logo
-            scaled_pixmap = pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
-            logo_label.setAlignment(Qt.AlignCenter)
-            left_layout.addWidget(logo_label)
-        else:
-            # Fallback if logo not found
-            fallback_label = QLabel("STI Balagtas Logo")
-            fallback_label.setAlignment(Qt.AlignCenter)
-            fallback_label.setStyleSheet("""
-                QLabel {
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #0066CC;
-                    background-color: #FFD700;
-                    padding: 20px;
-                    border-radius: 3px;
-                }
-            """)
-            left_layout.addWidget(fallback_label)
-        
-        content_layout.addWidget(left_panel, 70)  # 70% width
-        
-        # Right panel - User info (30% width) - Dark blue background
-        right_panel = QFrame()
-        right_panel.setStyleSheet("background-color: #1E3A8A;")
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.setAlignment(Qt.AlignCenter)
-        
-        # User icon - Load Generic User Image with rounded corners
-        user_image_path = os.path.join("image-elements", "Generic User Image.jpg")
-        if os.path.exists(user_image_path):
-            user_icon = QLabel()
-            pixmap = QPixmap(user_image_path)
-            # Scale the user image
-            scaled_pixmap = pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            
-            # Create rounded corners on the image itself
-            rounded_pixmap = QPixmap(scaled_pixmap.size())
-            rounded_pixmap.fill(Qt.transparent)
-            
-            painter = QPainter(rounded_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            
-            # Create rounded rectangle path
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, scaled_pixmap.width(), scaled_pixmap.height(), 3, 3)
-            painter.setClipPath(path)
-            
-            # Draw the image
-            painter.drawPixmap(0, 0, scaled_pixmap)
-            painter.end()
-            
-            user_icon.setPixmap(rounded_pixmap)
-            user_icon.setAlignment(Qt.AlignCenter)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: transparent;
-                }
-            """)
-        else:
-            # Fallback if image not found
-            user_icon = QLabel("👤")
-            user_icon.setFixedSize(180, 180)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: #D3D3D3;
-                    border-radius: 3px;
-                    border: 2px solid white;
-                    font-size: 80px;
-                    color: #1E3A8A;
-                }
-            """)
-            user_icon.setAlignment(Qt.AlignCenter)
-        
-        right_layout.addWidget(user_icon)
-        
-        # Test ID Card info (standard user info)
-        id_label = QLabel("Test ID Card")
-        id_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 32px;
-                font-weight: bold;
-                background-color: transparent;
-                margin-top: 20px;
-            }
-        """)
-        right_layout.addWidget(id_label, alignment=Qt.AlignCenter)
-        
-        role_label = QLabel("(Test User Role)")
-        role_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(role_label, alignment=Qt.AlignCenter)
-        
-        # Time check-out
-        time_check_label = QLabel("Time Check-out:")
-        time_check_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-                margin-top: 40px;
-            }
-        """)
-        right_layout.addWidget(time_check_label, alignment=Qt.AlignCenter)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_value = QLabel(current_time)
-        time_value.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(time_value, alignment=Qt.AlignCenter)
-        
-        content_layout.addWidget(right_panel, 30)  # 30% width
-        main_layout.addWidget(content_area)
-        
-        # Bottom bar - Light blue and dark blue
-        bottom_bar = QFrame()
-        bottom_bar.setFixedHeight(100)
-        bottom_layout = QHBoxLayout(bottom_bar)
-        bottom_layout.setSpacing(0)
-        bottom_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Date section - Light blue
-        date_frame = QFrame()
-        date_frame.setStyleSheet("background-color: #87CEEB;")
-        date_layout = QVBoxLayout(date_frame)
-        
-        current_date = datetime.now().strftime("%B %d, %Y")
-        date_label = QLabel(current_date)
-        date_label.setAlignment(Qt.AlignCenter)
-        date_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        date_layout.addWidget(date_label)
-        bottom_layout.addWidget(date_frame)
-        
-        # Time section - Dark blue
-        time_frame = QFrame()
-        time_frame.setStyleSheet("background-color: #021C37;")
-        time_layout = QVBoxLayout(time_frame)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_display = QLabel(current_time)
-        time_display.setAlignment(Qt.AlignCenter)
-        time_display.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        time_layout.addWidget(time_display)
-        bottom_layout.addWidget(time_frame)
-        
-        main_layout.addWidget(bottom_bar)
-        
-        # Show overlay
-        self.scanning_overlay.show()
+        # Standard user info with the check-out time
+        self.show_split_page(banner_text="User Identity Verified. Thank You!", time_caption="Time Check-out:")
         
         # Timer to return to main screen after 5 seconds
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.return_to_main_screen)
-        self.status_timer.start(5000)  # 5 seconds
+        self.timers.schedule('screen_step', 5000, self.return_to_main_screen)
         print("Student/staff check-out screen shown - will return to main screen in 5 seconds")
     
     def show_unable_to_verify_screen(self):
         """Show the unable to verify identity screen"""
-        # Create overlay for unable to verify screen
-        self.create_scanning_overlay()
-        
-        # Create main layout for overlay
-        main_layout = QVBoxLayout(self.scanning_overlay)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        # Top banner - Orange/yellow background
-        top_banner = QFrame()
-        top_banner.setFixedHeight(80)
-        top_banner.setStyleSheet("background-color: #FFA500;")
-        
-        unable_label = QLabel("Unable to Verify your Identity")
-        unable_label.setAlignment(Qt.AlignCenter)
-        unable_label.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 28px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        
-        top_banner_layout = QVBoxLayout(top_banner)
-        top_banner_layout.addWidget(unable_label)
-        main_layout.addWidget(top_banner)
-        
-        # Main content area - Split layout
-        content_area = QFrame()
-        content_layout = QHBoxLayout(content_area)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(0)
-        
-        # Left panel - White background with STI logo (70% width)
-        left_panel = QFrame()
-        left_panel.setStyleSheet("background-color: white;")
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setAlignment(Qt.AlignCenter)
-        
-        # Load and display STI Logo
-        logo_path = os.path.join("image-elements", "STI Balagtas Logo.png")
-        if os.path.exists(logo_path):
-            logo_label = QLabel()
-            pixmap = QPixmap(logo_path)
-            # Scale the logo
-            scaled_pixmap = pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
-            logo_label.setAlignment(Qt.AlignCenter)
-            left_layout.addWidget(logo_label)
-        else:
-            # Fallback if logo not found
-            fallback_label = QLabel("STI Balagtas Logo")
-            fallback_label.setAlignment(Qt.AlignCenter)
-            fallback_label.setStyleSheet("""
-                QLabel {
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #0066CC;
-                    background-color: #FFD700;
-                    padding: 20px;
-                    border-radius: 3px;
-                }
-            """)
-            left_layout.addWidget(fallback_label)
-        
-        content_layout.addWidget(left_panel, 70)  # 70% width
-        
-        # Right panel - User info (30% width) - Dark blue background
-        right_panel = QFrame()
-        right_panel.setStyleSheet("background-color: #1E3A8A;")
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.setAlignment(Qt.AlignCenter)
-        
-        # User icon - Load Generic User Image with rounded corners
-        user_image_path = os.path.join("image-elements", "Generic User Image.jpg")
-        if os.path.exists(user_image_path):
-            user_icon = QLabel()
-            pixmap = QPixmap(user_image_path)
-            # Scale the user image
-            scaled_pixmap = pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            
-            # Create rounded corners on the image itself
-            rounded_pixmap = QPixmap(scaled_pixmap.size())
-            rounded_pixmap.fill(Qt.transparent)
-            
-            painter = QPainter(rounded_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            
-            # Create rounded rectangle path
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, scaled_pixmap.width(), scaled_pixmap.height(), 3, 3)
-            painter.setClipPath(path)
-            
-            # Draw the image
-            painter.drawPixmap(0, 0, scaled_pixmap)
-            painter.end()
-            
-            user_icon.setPixmap(rounded_pixmap)
-            user_icon.setAlignment(Qt.AlignCenter)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: transparent;
-                }
-            """)
-        else:
-            # Fallback if image not found
-            user_icon = QLabel("👤")
-            user_icon.setFixedSize(180, 180)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: #D3D3D3;
-                    border-radius: 3px;
-                    border: 2px solid white;
-                    font-size: 80px;
-                    color: #1E3A8A;
-                }
-            """)
-            user_icon.setAlignment(Qt.AlignCenter)
-        
-        right_layout.addWidget(user_icon)
-        
-        # ID Card info
-        id_label = QLabel("Test ID Card")
-        id_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 32px;
-                font-weight: bold;
-                background-color: transparent;
-                margin-top: 20px;
-            }
-        """)
-        right_layout.addWidget(id_label, alignment=Qt.AlignCenter)
-        
-        role_label = QLabel("(Test User Role)")
-        role_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(role_label, alignment=Qt.AlignCenter)
-        
-        # Time check-in
-        time_check_label = QLabel("Time Check-in:")
-        time_check_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-                margin-top: 40px;
-            }
-        """)
-        right_layout.addWidget(time_check_label, alignment=Qt.AlignCenter)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_value = QLabel(current_time)
-        time_value.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(time_value, alignment=Qt.AlignCenter)
-        
-        content_layout.addWidget(right_panel, 30)  # 30% width
-        main_layout.addWidget(content_area)
-        
-        # Bottom bar - Light blue and dark blue
-        bottom_bar = QFrame()
-        bottom_bar.setFixedHeight(100)
-        bottom_layout = QHBoxLayout(bottom_bar)
-        bottom_layout.setSpacing(0)
-        bottom_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Date section - Light blue
-        date_frame = QFrame()
-        date_frame.setStyleSheet("background-color: #87CEEB;")
-        date_layout = QVBoxLayout(date_frame)
-        
-        current_date = datetime.now().strftime("%B %d, %Y")
-        date_label = QLabel(current_date)
-        date_label.setAlignment(Qt.AlignCenter)
-        date_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        date_layout.addWidget(date_label)
-        bottom_layout.addWidget(date_frame)
-        
-        # Time section - Dark blue
-        time_frame = QFrame()
-        time_frame.setStyleSheet("background-color: #021C37;")
-        time_layout = QVBoxLayout(time_frame)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_display = QLabel(current_time)
-        time_display.setAlignment(Qt.AlignCenter)
-        time_display.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        time_layout.addWidget(time_display)
-        bottom_layout.addWidget(time_frame)
-        
-        main_layout.addWidget(bottom_bar)
-        
-        # Show overlay
-        self.scanning_overlay.show()
+        # Orange banner
+        self.show_split_page(banner_text="Unable to Verify your Identity", banner_state='unverified')
         
         # Timer to show manual verification dialog after 3 seconds
-        self.status_timer = QTimer()
-        self.status_timer.setSingleShot(True)  # Ensure timer only fires once
-        self.status_timer.timeout.connect(self.show_manual_verification_dialog)
-        self.status_timer.start(3000)  # 3 seconds
+        self.timers.schedule('screen_step', 3000, self.show_manual_verification_dialog)
         print("Unable to verify screen shown - will show manual verification dialog in 3 seconds")
     
     def show_manual_verification_dialog(self):
         """Show the manual verification dialog after unable to verify screen"""
-        # Stop any existing timer first
-        if hasattr(self, 'status_timer') and self.status_timer:
-            self.status_timer.stop()
-        
         # Hide the overlay first
         if self.scanning_overlay:
             self.scanning_overlay.hide()
+        self.screen_pages.hide_pages()
         
         # Check if dialog already exists and close it
         if hasattr(self, 'manual_verification_dialog') and self.manual_verification_dialog:
@@ -4274,18 +1761,11 @@ class STIWelcomeScreen(QMainWindow):
         # Header - Mustard yellow
         header = QFrame()
         header.setFixedHeight(80)
-        header.setStyleSheet("background-color: #DAA520;")
+        header.setProperty('panel', 'mustard')
         
         header_label = QLabel("Developer Mode")
         header_label.setAlignment(Qt.AlignCenter)
-        header_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 36px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
+        header_label.setProperty('textStyle', 'title')
         
         header_layout = QVBoxLayout(header)
         header_layout.addWidget(header_label)
@@ -4293,68 +1773,27 @@ class STIWelcomeScreen(QMainWindow):
         
         # Content area - Dark blue
         content = QFrame()
-        content.setStyleSheet("background-color: #1E3A8A;")
+        content.setProperty('panel', 'navy')
         content_layout = QVBoxLayout(content)
         content_layout.setAlignment(Qt.AlignCenter)
         
         # Manual verification text
         manual_text = QLabel("For Manual Verification:")
         manual_text.setAlignment(Qt.AlignCenter)
-        manual_text.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 28px;
-                font-weight: bold;
-                background-color: transparent;
-                margin-bottom: 30px;
-            }
-        """)
+        manual_text.setProperty('textStyle', 'prompt')
         content_layout.addWidget(manual_text, alignment=Qt.AlignCenter)
         
         # Accept Entry button - Green
         accept_entry_button = QPushButton("Accept Entry")
         accept_entry_button.setFixedSize(400, 80)
-        accept_entry_button.setStyleSheet("""
-            QPushButton {
-                background-color: #28A745;
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                border: none;
-                border-radius: 20px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:pressed {
-                background-color: #1E7E34;
-            }
-        """)
+        accept_entry_button.setProperty('button', 'accept')
         accept_entry_button.clicked.connect(self.accept_entry)
         content_layout.addWidget(accept_entry_button, alignment=Qt.AlignCenter)
         
         # Deny Entry button - Red
         deny_entry_button = QPushButton("Deny Entry")
         deny_entry_button.setFixedSize(400, 80)
-        deny_entry_button.setStyleSheet("""
-            QPushButton {
-                background-color: #DC3545;
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                border: none;
-                border-radius: 20px;
-                padding: 10px;
-                margin-top: 20px;
-            }
-            QPushButton:hover {
-                background-color: #C82333;
-            }
-            QPushButton:pressed {
-                background-color: #BD2130;
-            }
-        """)
+        deny_entry_button.setProperty('button', 'reject')
         deny_entry_button.clicked.connect(self.deny_entry)
         content_layout.addWidget(deny_entry_button, alignment=Qt.AlignCenter)
         
@@ -4366,10 +1805,6 @@ class STIWelcomeScreen(QMainWindow):
         """Handle Accept Entry button click"""
         print("Accept Entry clicked - showing success screen")
         
-        # Stop any existing timer
-        if hasattr(self, 'status_timer') and self.status_timer:
-            self.status_timer.stop()
-        
         self.manual_verification_dialog.close()
         self.show_success_screen()
     
@@ -4377,241 +1812,16 @@ class STIWelcomeScreen(QMainWindow):
         """Handle Deny Entry button click"""
         print("Deny Entry clicked - showing uniform issue screen")
         
-        # Stop any existing timer
-        if hasattr(self, 'status_timer') and self.status_timer:
-            self.status_timer.stop()
-        
         self.manual_verification_dialog.close()
         self.show_uniform_issue_screen()
     
     def show_uniform_issue_screen(self):
         """Show the uniform issue screen after denying entry"""
-        # Create overlay for uniform issue screen
-        self.create_scanning_overlay()
-        
-        # Create main layout for overlay
-        main_layout = QVBoxLayout(self.scanning_overlay)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        # Top banner - Light orange/tan background
-        top_banner = QFrame()
-        top_banner.setFixedHeight(80)
-        top_banner.setStyleSheet("background-color: #D2B48C;")
-        
-        uniform_label = QLabel("Different / Incomplete Uniform Found.")
-        uniform_label.setAlignment(Qt.AlignCenter)
-        uniform_label.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 28px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        
-        top_banner_layout = QVBoxLayout(top_banner)
-        top_banner_layout.addWidget(uniform_label)
-        main_layout.addWidget(top_banner)
-        
-        # Main content area - Split layout
-        content_area = QFrame()
-        content_layout = QHBoxLayout(content_area)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(0)
-        
-        # Left panel - White background with STI logo (70% width)
-        left_panel = QFrame()
-        left_panel.setStyleSheet("background-color: white;")
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setAlignment(Qt.AlignCenter)
-        
-        # Load and display STI Logo
-        logo_path = os.path.join("image-elements", "STI Balagtas Logo.png")
-        if os.path.exists(logo_path):
-            logo_label = QLabel()
-            pixmap = QPixmap(logo_path)
-            # Scale the logo
-            scaled_pixmap = pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
-            logo_label.setAlignment(Qt.AlignCenter)
-            left_layout.addWidget(logo_label)
-        else:
-            # Fallback if logo not found
-            fallback_label = QLabel("STI Balagtas Logo")
-            fallback_label.setAlignment(Qt.AlignCenter)
-            fallback_label.setStyleSheet("""
-                QLabel {
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #0066CC;
-                    background-color: #FFD700;
-                    padding: 20px;
-                    border-radius: 3px;
-                }
-            """)
-            left_layout.addWidget(fallback_label)
-        
-        content_layout.addWidget(left_panel, 70)  # 70% width
-        
-        # Right panel - User info (30% width) - Dark blue background
-        right_panel = QFrame()
-        right_panel.setStyleSheet("background-color: #1E3A8A;")
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.setAlignment(Qt.AlignCenter)
-        
-        # User icon - Load Generic User Image with rounded corners
-        user_image_path = os.path.join("image-elements", "Generic User Image.jpg")
-        if os.path.exists(user_image_path):
-            user_icon = QLabel()
-            pixmap = QPixmap(user_image_path)
-            # Scale the user image
-            scaled_pixmap = pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            
-            # Create rounded corners on the image itself
-            rounded_pixmap = QPixmap(scaled_pixmap.size())
-            rounded_pixmap.fill(Qt.transparent)
-            
-            painter = QPainter(rounded_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            
-            # Create rounded rectangle path
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, scaled_pixmap.width(), scaled_pixmap.height(), 3, 3)
-            painter.setClipPath(path)
-            
-            # Draw the image
-            painter.drawPixmap(0, 0, scaled_pixmap)
-            painter.end()
-            
-            user_icon.setPixmap(rounded_pixmap)
-            user_icon.setAlignment(Qt.AlignCenter)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: transparent;
-                }
-            """)
-        else:
-            # Fallback if image not found
-            user_icon = QLabel("👤")
-            user_icon.setFixedSize(180, 180)
-            user_icon.setStyleSheet("""
-                QLabel {
-                    background-color: #D3D3D3;
-                    border-radius: 3px;
-                    border: 2px solid white;
-                    font-size: 80px;
-                    color: #1E3A8A;
-                }
-            """)
-            user_icon.setAlignment(Qt.AlignCenter)
-        
-        right_layout.addWidget(user_icon)
-        
-        # ID Card info
-        id_label = QLabel("Test ID Card")
-        id_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 32px;
-                font-weight: bold;
-                background-color: transparent;
-                margin-top: 20px;
-            }
-        """)
-        right_layout.addWidget(id_label, alignment=Qt.AlignCenter)
-        
-        role_label = QLabel("(Test User Role)")
-        role_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(role_label, alignment=Qt.AlignCenter)
-        
-        # Time check-in
-        time_check_label = QLabel("Time Check-in:")
-        time_check_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-                margin-top: 40px;
-            }
-        """)
-        right_layout.addWidget(time_check_label, alignment=Qt.AlignCenter)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_value = QLabel(current_time)
-        time_value.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                background-color: transparent;
-            }
-        """)
-        right_layout.addWidget(time_value, alignment=Qt.AlignCenter)
-        
-        content_layout.addWidget(right_panel, 30)  # 30% width
-        main_layout.addWidget(content_area)
-        
-        # Bottom bar - Light blue and dark blue
-        bottom_bar = QFrame()
-        bottom_bar.setFixedHeight(100)
-        bottom_layout = QHBoxLayout(bottom_bar)
-        bottom_layout.setSpacing(0)
-        bottom_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Date section - Light blue
-        date_frame = QFrame()
-        date_frame.setStyleSheet("background-color: #87CEEB;")
-        date_layout = QVBoxLayout(date_frame)
-        
-        current_date = datetime.now().strftime("%B %d, %Y")
-        date_label = QLabel(current_date)
-        date_label.setAlignment(Qt.AlignCenter)
-        date_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        date_layout.addWidget(date_label)
-        bottom_layout.addWidget(date_frame)
-        
-        # Time section - Dark blue
-        time_frame = QFrame()
-        time_frame.setStyleSheet("background-color: #021C37;")
-        time_layout = QVBoxLayout(time_frame)
-        
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        time_display = QLabel(current_time)
-        time_display.setAlignment(Qt.AlignCenter)
-        time_display.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
-        time_layout.addWidget(time_display)
-        bottom_layout.addWidget(time_frame)
-        
-        main_layout.addWidget(bottom_bar)
-        
-        # Show overlay
-        self.scanning_overlay.show()
+        # Tan banner
+        self.show_split_page(banner_text="Different / Incomplete Uniform Found.", banner_state='uniform')
         
         # Timer to return to main screen after 5 seconds
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.return_to_main_screen)
-        self.status_timer.start(5000)  # 5 seconds
+        self.timers.schedule('screen_step', 5000, self.return_to_main_screen)
         print("Uniform issue screen shown - will return to main screen in 5 seconds")
 
     def show_instructions_then_person(self, person_name, person_role, time_value, guard_name):
@@ -4624,8 +1834,7 @@ class STIWelcomeScreen(QMainWindow):
             self.sequence_in_progress = True
 
             # Stop any existing short timers
-            if hasattr(self, 'status_timer') and self.status_timer:
-                self.status_timer.stop()
+            self.timers.cancel('screen_step')
 
             # Create overlay
             self.create_scanning_overlay()
@@ -4638,13 +1847,11 @@ class STIWelcomeScreen(QMainWindow):
             # Top banner
             top_banner = QFrame()
             top_banner.setFixedHeight(120)
-            top_banner.setStyleSheet("background-color: #ADD8E6;")  # Light blue like screenshot
+            top_banner.setProperty('panel', 'lightBlue')  # Light blue like screenshot
             top_layout = QVBoxLayout(top_banner)
             banner_label = QLabel("Getting ready in 3 second(s)...")
             banner_label.setAlignment(Qt.AlignCenter)
-            banner_label.setStyleSheet("""
-                QLabel { color: black; font-size: 36px; font-weight: bold; background-color: transparent; }
-            """)
+            banner_label.setProperty('textStyle', 'titleDark')
             top_layout.addWidget(banner_label)
             overlay_layout.addWidget(top_banner)
 
@@ -4656,27 +1863,26 @@ class STIWelcomeScreen(QMainWindow):
 
             # Left: instructions image
             left_panel = QFrame()
-            left_panel.setStyleSheet("background-color: white;")
+            left_panel.setProperty('panel', 'white')
             left_layout = QVBoxLayout(left_panel)
             left_layout.setAlignment(Qt.AlignCenter)
             instructions_path = os.path.join("image-elements", "Instructions Scan.png")
             if os.path.exists(instructions_path):
                 img_label = QLabel()
-                pix = QPixmap(instructions_path)
-                scaled = pix.scaled(1344, 900, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                scaled = self.pixmaps.get(instructions_path, 1344, 900)
                 img_label.setPixmap(scaled)
                 img_label.setAlignment(Qt.AlignCenter)
                 left_layout.addWidget(img_label)
             else:
                 fallback = QLabel("Instructions Scan image not found")
                 fallback.setAlignment(Qt.AlignCenter)
-                fallback.setStyleSheet("QLabel { color: red; font-size: 24px; font-weight: bold; }")
+                fallback.setProperty('textStyle', 'missing')
                 left_layout.addWidget(fallback)
             content_layout.addWidget(left_panel, 70)
 
             # Right: simple person summary (optional)
             right_panel = QFrame()
-            right_panel.setStyleSheet("background-color: #1E3A8A;")
+            right_panel.setProperty('panel', 'navy')
             right_layout = QVBoxLayout(right_panel)
             right_layout.setAlignment(Qt.AlignCenter)
 
@@ -4684,32 +1890,32 @@ class STIWelcomeScreen(QMainWindow):
             user_image_path = os.path.join("image-elements", "Generic User Image.jpg")
             icon_label = QLabel()
             if os.path.exists(user_image_path):
-                upix = QPixmap(user_image_path).scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                upix = self.pixmaps.get(user_image_path, 180, 180)
                 icon_label.setPixmap(upix)
             icon_label.setAlignment(Qt.AlignCenter)
-            icon_label.setStyleSheet("background-color: transparent;")
+            icon_label.setProperty('textStyle', 'image')
             right_layout.addWidget(icon_label)
 
             # Name and role (smaller preview)
             preview_name = QLabel(person_name)
             preview_name.setAlignment(Qt.AlignCenter)
-            preview_name.setStyleSheet("QLabel { color: white; font-size: 28px; font-weight: bold; background: transparent; margin-top: 10px; }")
+            preview_name.setProperty('textStyle', 'previewName')
             right_layout.addWidget(preview_name)
 
             preview_role = QLabel(f"({person_role})")
             preview_role.setAlignment(Qt.AlignCenter)
-            preview_role.setStyleSheet("QLabel { color: white; font-size: 20px; background: transparent; }")
+            preview_role.setProperty('textStyle', 'subtitle')
             right_layout.addWidget(preview_role)
 
             # Time
             preview_time_label = QLabel("Time Check-in:")
             preview_time_label.setAlignment(Qt.AlignCenter)
-            preview_time_label.setStyleSheet("QLabel { color: white; font-size: 18px; background: transparent; margin-top: 20px; }")
+            preview_time_label.setProperty('textStyle', 'detailSpaced')
             right_layout.addWidget(preview_time_label)
 
             preview_time_val = QLabel(time_value)
             preview_time_val.setAlignment(Qt.AlignCenter)
-            preview_time_val.setStyleSheet("QLabel { color: white; font-size: 18px; background: transparent; }")
+            preview_time_val.setProperty('textStyle', 'detail')
             right_layout.addWidget(preview_time_val)
 
             content_layout.addWidget(right_panel, 30)
@@ -4722,19 +1928,19 @@ class STIWelcomeScreen(QMainWindow):
             bottom_layout.setSpacing(0)
             bottom_layout.setContentsMargins(0, 0, 0, 0)
 
-            date_frame = QFrame(); date_frame.setStyleSheet("background-color: #87CEEB;")
+            date_frame = QFrame(); date_frame.setProperty('panel', 'date')
             date_layout = QVBoxLayout(date_frame)
             date_label = QLabel(datetime.now().strftime("%B %d, %Y"))
             date_label.setAlignment(Qt.AlignCenter)
-            date_label.setStyleSheet("QLabel { color: white; font-size: 24px; font-weight: bold; background: transparent; }")
+            date_label.setProperty('textStyle', 'strong')
             date_layout.addWidget(date_label)
             bottom_layout.addWidget(date_frame)
 
-            time_frame = QFrame(); time_frame.setStyleSheet("background-color: #021C37;")
+            time_frame = QFrame(); time_frame.setProperty('panel', 'clock')
             time_layout = QVBoxLayout(time_frame)
             time_label = QLabel(datetime.now().strftime("%I:%M:%S %p"))
             time_label.setAlignment(Qt.AlignCenter)
-            time_label.setStyleSheet("QLabel { color: white; font-size: 24px; font-weight: bold; background: transparent; }")
+            time_label.setProperty('textStyle', 'strong')
             time_layout.addWidget(time_label)
             bottom_layout.addWidget(time_frame)
 
@@ -4746,38 +1952,43 @@ class STIWelcomeScreen(QMainWindow):
                 self.scanning_overlay.show()
 
             # Phase 1 timer (3s)
-            self.status_timer = QTimer(self)
             def _start_scanning_phase():
-                try:
-                    if self.status_timer:
-                        self.status_timer.stop()
-                except Exception:
-                    pass
-
                 # Update banner to scanning message
                 try:
                     banner_label.setText("Scanning is in progress... Please do not move.")
                 except Exception:
                     pass
 
+                # Show the live camera mirror instead of the instructions image
+                try:
+                    mirror_label = QLabel()
+                    mirror_label.setAlignment(Qt.AlignCenter)
+                    mirror_label.setMinimumSize(1280, 720)
+                    mirror_label.setProperty('panel', 'black')
+                    if self.start_live_mirror(mirror_label):
+                        set_style_property(left_panel, 'panel', 'black')
+                        while left_layout.count():
+                            item = left_layout.takeAt(0)
+                            if item.widget():
+                                item.widget().deleteLater()
+                        left_layout.addWidget(mirror_label)
+                    else:
+                        mirror_label.deleteLater()
+                except Exception as e:
+                    print(f"Error showing live mirror: {e}")
+
                 # Phase 2 timer (5s) then show "Scanning Complete" for 2s, then finish
-                self.status_timer = QTimer(self)
                 def _show_scanning_complete():
-                    try:
-                        if self.status_timer:
-                            self.status_timer.stop()
-                    except Exception:
-                        pass
-
                     # Update banner to result message
                     try:
                         banner_label.setText("Please wait for the result.")
                     except Exception:
                         pass
+                    self.stop_live_mirror()
 
                     # Replace left panel content with scan-ok image on black background
                     try:
-                        left_panel.setStyleSheet("background-color: black;")
+                        set_style_property(left_panel, 'panel', 'black')
                         # Clear existing items in left_layout
                         try:
                             while left_layout.count():
@@ -4791,17 +2002,15 @@ class STIWelcomeScreen(QMainWindow):
                         ok_path = os.path.join("image-elements", "scan-ok.png")
                         ok_label = QLabel()
                         if os.path.exists(ok_path):
-                            ok_pix = QPixmap(ok_path)
-                            ok_scaled = ok_pix.scaled(1344, 900, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                            ok_scaled = self.pixmaps.get(ok_path, 1344, 900)
                             ok_label.setPixmap(ok_scaled)
                         ok_label.setAlignment(Qt.AlignCenter)
-                        ok_label.setStyleSheet("background-color: transparent;")
+                        ok_label.setProperty('textStyle', 'image')
                         left_layout.addWidget(ok_label)
                     except Exception as e:
                         print(f"Error showing scan-ok image: {e}")
 
                     # Hold for 2 seconds then finish
-                    self.status_timer = QTimer(self)
                     def _finish():
                         # Hide overlay and show the person info screen
                         if self.scanning_overlay:
@@ -4810,17 +2019,11 @@ class STIWelcomeScreen(QMainWindow):
                             self.scanning_overlay = None
                         self.show_student_teacher_info(person_name, person_role, time_value, guard_name)
                         self.sequence_in_progress = False
-                    self.status_timer.timeout.connect(_finish)
-                    self.status_timer.setSingleShot(True)
-                    self.status_timer.start(2000)  # 2 seconds for scanning complete
+                    self.timers.schedule('screen_step', 2000, _finish)  # 2 seconds for scanning complete
 
-                self.status_timer.timeout.connect(_show_scanning_complete)
-                self.status_timer.setSingleShot(True)
-                self.status_timer.start(5000)  # 5 seconds scanning screen
+                self.timers.schedule('screen_step', 5000, _show_scanning_complete)  # 5 seconds scanning screen
 
-            self.status_timer.timeout.connect(_start_scanning_phase)
-            self.status_timer.setSingleShot(True)
-            self.status_timer.start(3000)  # 3 seconds getting-ready screen
+            self.timers.schedule('screen_step', 3000, _start_scanning_phase)  # 3 seconds getting-ready screen
         except Exception as e:
             print(f"Error showing instructions then person: {e}")
             # Fallback directly to person info
@@ -4829,30 +2032,58 @@ class STIWelcomeScreen(QMainWindow):
 
 def signal_handler(signum, frame):
     """Handle termination signals"""
+    if _window is not None and _window.standby:
+        # A hidden standby was never the main screen - nothing to report
+        sys.exit(0)
     print(f"Received signal {signum} - writing close status")
     try:
-        with open("main_screen_status.txt", "w") as f:
-            f.write("MAIN_SCREEN_CLOSED\n")
-            f.write("N/A\n")
-            f.write("N/A\n")
-            f.write("N/A\n")
+        write_status_file("MAIN_SCREEN_CLOSED")
         print("Close status written to file")
     except Exception as e:
         print(f"Error writing close status: {e}")
     sys.exit(0)
 
+def watch_promote_requests(app, window):
+    """Standby mode: wait for PROMOTE on stdin from the guard screen's supervisor"""
+    notifier = QSocketNotifier(sys.stdin.fileno(), QSocketNotifier.Read, window)
+    
+    def _read_command(_fd):
+        line = sys.stdin.readline()
+        if not line:
+            # Supervisor is gone; a standby has nothing left to do
+            notifier.setEnabled(False)
+            if window.standby:
+                app.quit()
+            return
+        if line.strip() == "PROMOTE":
+            notifier.setEnabled(False)
+            window.promote()
+    
+    notifier.activated.connect(_read_command)
+    return notifier
+
+_window = None
+
 def main():
+    global _window
     # Set up signal handlers
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
     
-    app = QApplication(sys.argv)
+    standby = '--standby' in sys.argv
+    app = QApplication([arg for arg in sys.argv if arg != '--standby'])
     
     # Set application style for better macOS appearance
     app.setStyle('Fusion')
     
-    window = STIWelcomeScreen()
-    window.show()
+    window = STIWelcomeScreen(standby=standby)
+    _window = window
+    if standby:
+        print("Main screen ready in standby")
+        _promote_notifier = watch_promote_requests(app, window)
+    else:
+        window.show()
+        QTimer.singleShot(0, lambda: mark('main_screen_shown'))
     
     sys.exit(app.exec_())
 
@@ -0,0 +1,210 @@
+"""
+Application stylesheet for the Qt main screen.
+
+The screens used to call setStyleSheet() with a literal CSS block on nearly
+every QLabel and QFrame, and again on every transition (each reset re-styled
+the banner and all of its labels). Every call makes Qt parse the sheet and
+re-polish the widget and its children.
+
+All rules now live in APP_STYLESHEET, installed once on the QApplication by
+apply_theme(). Widgets pick their rule with a dynamic property that is set
+once when they are created:
+
+    textStyle   QLabel text styles ("detail", "strong", "title", ...)
+    panel       QFrame / QWidget backgrounds ("navy", "white", "overlay", ...)
+    button      QPushButton styles ("accept", "reject", "devDanger", ...)
+    state       banner state; the banner's label is styled by the banner rule
+
+A state change is set_style_property(): the property is toggled and only that
+widget (and, for banners, its children) is re-polished - and nothing at all
+happens when the value did not change.
+"""
+
+from PyQt5.QtWidgets import QWidget
+
+APP_STYLESHEET = """
+QMainWindow {
+    background-color: white;
+}
+QDialog#developerDialog {
+    background-color: #1E3A8A;
+}
+
+/* Main screen top banner: the state picks the colour and its label's font */
+QFrame#topBanner[state="awaiting"] { background-color: #DAA520; }
+QFrame#topBanner[state="open"] { background-color: #90EE90; }
+QFrame#topBanner[state="openCompact"] { background-color: #90EE90; }
+QFrame#topBanner[state="checkout"] { background-color: #FFB6C1; }
+QFrame#topBanner[state="denied"] { background-color: #FF6B6B; }
+QFrame#topBanner QLabel {
+    color: white;
+    font-size: 36px;
+    font-weight: bold;
+    background-color: transparent;
+}
+QFrame#topBanner[state="open"] QLabel { color: black; }
+QFrame#topBanner[state="openCompact"] QLabel,
+QFrame#topBanner[state="checkout"] QLabel {
+    color: black;
+    font-size: 24px;
+}
+
+/* Overlay page banner (screen_pages.py) */
+QFrame#pageBanner[state="ready"] { background-color: #DAA520; }
+QFrame#pageBanner[state="scanning"] { background-color: #87CEEB; }
+QFrame#pageBanner[state="verified"] { background-color: #90EE90; }
+QFrame#pageBanner[state="unverified"] { background-color: #FFA500; }
+QFrame#pageBanner[state="uniform"] { background-color: #D2B48C; }
+QFrame#pageBanner QLabel {
+    color: black;
+    font-size: 28px;
+    font-weight: bold;
+    background-color: transparent;
+}
+QFrame#pageBanner[state="ready"] QLabel {
+    color: white;
+    font-size: 36px;
+}
+
+/* Backgrounds */
+QWidget[panel="white"] { background-color: white; }
+QWidget[panel="black"] { background-color: black; }
+QWidget[panel="navy"] { background-color: #1E3A8A; }
+QWidget[panel="mustard"] { background-color: #DAA520; }
+QWidget[panel="lightBlue"] { background-color: #ADD8E6; }
+QWidget[panel="date"] { background-color: #87CEEB; }
+QWidget[panel="clock"] { background-color: #021C37; }
+QWidget[panel="overlay"] { background-color: rgba(0, 0, 0, 180); }
+
+/* Text */
+QLabel[textStyle] {
+    color: white;
+    background-color: transparent;
+}
+QLabel[textStyle="detail"] { font-size: 18px; }
+QLabel[textStyle="detailSpaced"] { font-size: 18px; margin-top: 20px; }
+QLabel[textStyle="detailPadded"] { font-size: 18px; margin: 5px; }
+QLabel[textStyle="detailPaddedBold"] { font-size: 18px; font-weight: bold; margin: 5px; }
+QLabel[textStyle="body"] { font-size: 24px; }
+QLabel[textStyle="bodySpaced"] { font-size: 24px; margin-top: 40px; }
+QLabel[textStyle="reference"] { font-size: 24px; margin-top: 10px; }
+QLabel[textStyle="strong"] { font-size: 24px; font-weight: bold; }
+QLabel[textStyle="subtitle"] { font-size: 20px; }
+QLabel[textStyle="subtitlePadded"] { font-size: 20px; margin: 5px; }
+QLabel[textStyle="profileName"] { font-size: 28px; font-weight: bold; margin: 10px; }
+QLabel[textStyle="previewName"] { font-size: 28px; font-weight: bold; margin-top: 10px; }
+QLabel[textStyle="prompt"] { font-size: 28px; font-weight: bold; margin-bottom: 30px; }
+QLabel[textStyle="instruction"] { font-size: 32px; font-weight: bold; margin-top: 40px; }
+QLabel[textStyle="instructionCompact"] { font-size: 32px; font-weight: bold; }
+QLabel[textStyle="pageId"] { font-size: 32px; font-weight: bold; margin-top: 20px; }
+QLabel[textStyle="pageIdSmall"] { font-size: 24px; font-weight: bold; margin-top: 20px; }
+QLabel[textStyle="title"] { font-size: 36px; font-weight: bold; }
+QLabel[textStyle="titleDark"] { color: black; font-size: 36px; font-weight: bold; }
+QLabel[textStyle="display"] { font-size: 48px; font-weight: bold; }
+QLabel[textStyle="missing"] {
+    color: red;
+    font-size: 24px;
+    font-weight: bold;
+    background-color: white;
+}
+QLabel[textStyle="logoFallback"] {
+    font-size: 24px;
+    font-weight: bold;
+    color: #0066CC;
+    background-color: #FFD700;
+    padding: 20px;
+    border-radius: 3px;
+}
+QLabel[textStyle="avatarFallback"] {
+    background-color: #D3D3D3;
+    border-radius: 3px;
+    border: 2px solid white;
+    font-size: 80px;
+    color: #1E3A8A;
+}
+
+/* Developer mode dialog */
+QLabel[textStyle="devHeader"] {
+    background-color: #DAA520;
+    font-family: Arial, sans-serif;
+    font-size: 28px;
+    font-weight: bold;
+    padding: 15px;
+    border-radius: 8px;
+    min-height: 30px;
+}
+QLabel[textStyle="devSection"] {
+    font-family: Arial, sans-serif;
+    font-size: 18px;
+    font-weight: bold;
+    margin-top: 15px;
+    margin-bottom: 5px;
+}
+QLabel[textStyle="devInfo"] {
+    font-family: Arial, sans-serif;
+    font-size: 14px;
+}
+QPushButton[button="devDanger"],
+QPushButton[button="devSuccess"],
+QPushButton[button="devExit"] {
+    color: white;
+    font-family: Arial, sans-serif;
+    font-size: 18px;
+    font-weight: bold;
+    padding: 12px 20px;
+    border-radius: 8px;
+    border: none;
+    text-align: center;
+}
+QPushButton[button="devDanger"] { background-color: #DC3545; }
+QPushButton[button="devDanger"]:hover { background-color: #C82333; }
+QPushButton[button="devDanger"]:pressed { background-color: #A71E2A; }
+QPushButton[button="devSuccess"] { background-color: #28A745; }
+QPushButton[button="devSuccess"]:hover { background-color: #218838; }
+QPushButton[button="devSuccess"]:pressed { background-color: #1E7E34; }
+QPushButton[button="devExit"] { background-color: #FD7E14; margin-top: 10px; }
+QPushButton[button="devExit"]:hover { background-color: #E55A00; }
+QPushButton[button="devExit"]:pressed { background-color: #CC5200; }
+
+/* Verification dialogs */
+QPushButton[button="accept"],
+QPushButton[button="reject"] {
+    color: white;
+    font-size: 24px;
+    font-weight: bold;
+    border: none;
+    border-radius: 20px;
+    padding: 10px;
+}
+QPushButton[button="accept"] { background-color: #28A745; }
+QPushButton[button="accept"]:hover { background-color: #218838; }
+QPushButton[button="accept"]:pressed { background-color: #1E7E34; }
+QPushButton[button="reject"] { background-color: #DC3545; margin-top: 20px; }
+QPushButton[button="reject"]:hover { background-color: #C82333; }
+QPushButton[button="reject"]:pressed { background-color: #BD2130; }
+"""
+
+
+def apply_theme(app):
+    """Install the application stylesheet (once per QApplication)"""
+    if app is None or app.property('ainiformTheme'):
+        return
+    app.setStyleSheet(APP_STYLESHEET)
+    app.setProperty('ainiformTheme', True)
+
+
+def set_style_property(widget, name, value, children=False):
+    """Toggle a theme property; re-polish only when the value changed"""
+    if widget.property(name) == value:
+        return False
+    widget.setProperty(name, value)
+    style = widget.style()
+    widgets = [widget]
+    if children:
+        # Descendant rules (banner labels) depend on the parent's property
+        widgets += widget.findChildren(QWidget)
+    for target in widgets:
+        style.unpolish(target)
+        style.polish(target)
+    widget.update()
+    return True
@@ -0,0 +1,127 @@
+"""
+Single timer for the Qt main screen.
+
+STIWelcomeScreen used to create a new QTimer for every delayed step: the
+status message revert, each step of the scanning sequence, the return to the
+main screen, the developer input timeout, plus QTimer.singleShot resets that
+could not be cancelled at all. stop_all_timers only knew about some of them,
+so a timer left over from the previous screen could reset or advance the
+screen the guard is looking at now.
+
+TimerScheduler keeps named deadlines and serves them from one single-shot
+QTimer armed for the earliest one:
+
+    schedule(name, ms, callback)    run once; the same name replaces the old deadline
+    every(name, ms, callback)       run repeatedly until cancelled
+    cancel(name) / screen_changed() drop one deadline / all screen deadlines
+
+Deadlines falling within `coalesce_ms` of each other run on the same wakeup
+(the clock, the status poll and the live mirror line up most seconds).
+Deadlines are screen deadlines unless created with screen=False; those are
+dropped by screen_changed(), so a step of the previous screen never runs
+against the next one. pending_count() and pending() show what is waiting.
+"""
+
+import math
+import time
+
+from PyQt5.QtCore import QObject, QTimer
+
+COALESCE_MS = 15
+
+
+class Deadline:
+    def __init__(self, due, callback, interval=0, screen=True):
+        """One named deadline (due in monotonic milliseconds)"""
+        self.due = due
+        self.callback = callback
+        self.interval = interval
+        self.screen = screen
+
+
+class TimerScheduler(QObject):
+    def __init__(self, parent=None, coalesce_ms=COALESCE_MS):
+        """Named deadlines served by one QTimer"""
+        super().__init__(parent)
+        self.coalesce_ms = coalesce_ms
+        self.deadlines = {}
+        self.wakeups = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire)
+
+    def schedule(self, name, delay_ms, callback, screen=True):
+        """Run callback once after delay_ms, replacing a pending deadline of the same name"""
+        self.deadlines[name] = Deadline(self._now() + delay_ms, callback, 0, screen)
+        self._arm()
+
+    def every(self, name, interval_ms, callback, screen=False):
+        """Run callback every interval_ms until cancelled (restarts the period if already running)"""
+        self.deadlines[name] = Deadline(self._now() + interval_ms, callback, interval_ms, screen)
+        self._arm()
+
+    def cancel(self, name):
+        """Drop a deadline; False if it was not pending"""
+        if self.deadlines.pop(name, None) is None:
+            return False
+        self._arm()
+        return True
+
+    def is_pending(self, name):
+        return name in self.deadlines
+
+    def screen_changed(self):
+        """Drop every screen deadline; returns how many were pending"""
+        names = [name for name, deadline in self.deadlines.items() if deadline.screen]
+        for name in names:
+            del self.deadlines[name]
+        self._arm()
+        return len(names)
+
+    def cancel_all(self):
+        self.deadlines.clear()
+        self._timer.stop()
+
+    def pending_count(self):
+        return len(self.deadlines)
+
+    def pending(self):
+        """(name, ms left) of the pending deadlines, soonest first"""
+        now = self._now()
+        items = sorted(self.deadlines.items(), key=lambda item: item[1].due)
+        return [(name, max(0, int(deadline.due - now))) for name, deadline in items]
+
+    def _now(self):
+        return time.monotonic() * 1000
+
+    def _arm(self):
+        """Point the QTimer at the earliest deadline"""
+        if not self.deadlines:
+            self._timer.stop()
+            return
+        due = min(deadline.due for deadline in self.deadlines.values())
+        self._timer.start(max(0, math.ceil(due - self._now())))
+
+    def _fire(self):
+        self.wakeups += 1
+        horizon = self._now() + self.coalesce_ms
+        due = sorted((deadline.due, name) for name, deadline in self.deadlines.items()
+                     if deadline.due <= horizon)
+        for _, name in due:
+            # An earlier callback may have cancelled or moved this deadline
+            deadline = self.deadlines.get(name)
+            if deadline is None or deadline.due > horizon:
+                continue
+            if deadline.interval:
+                deadline.due += deadline.interval
+                if deadline.due <= horizon:
+                    # Fell behind (busy event loop) - skip the missed periods
+                    deadline.due = self._now() + deadline.interval
+            else:
+                del self.deadlines[name]
+            try:
+                deadline.callback()
+            except Exception as e:
+                # An exception escaping a Qt slot would abort the application
+                print(f"Error in scheduled callback '{name}': {e}")
+        self._arm()
@@ -0,0 +1,88 @@
+"""
+Torch CPU runtime settings for the detector.
+
+By default torch starts one intra-op thread per core in the same process as
+the Tk UI and the turnstile serial listener, so inference competes with both
+for every core. The "runtime" section of detector_config.json sets:
+
+    "runtime": {
+      "intra_op_threads": 2,        torch.set_num_threads
+      "inter_op_threads": 1,        torch.set_num_interop_threads
+      "inference_cpus": [2, 3],     CPU affinity of dedicated inference threads
+      "inference_mode": true        torch.inference_mode() around predictions
+    }
+
+null keeps the torch default. Thread counts can only be applied once per
+process (before the first inference), so changes need a restart.
+bench_torch_threads.py sweeps these settings on the current host.
+"""
+
+import contextlib
+import os
+import threading
+
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+_applied = False
+_applied_lock = threading.Lock()
+
+
+def configure_torch_runtime(intra_op_threads=None, inter_op_threads=None):
+    """Apply torch thread counts once per process"""
+    global _applied
+    with _applied_lock:
+        if _applied or not TORCH_AVAILABLE:
+            return False
+        _applied = True
+    try:
+        if intra_op_threads:
+            torch.set_num_threads(int(intra_op_threads))
+        if inter_op_threads:
+            # Must happen before torch runs any parallel work
+            torch.set_num_interop_threads(int(inter_op_threads))
+        print(f"Torch runtime: {torch.get_num_threads()} intra-op / "
+              f"{torch.get_num_interop_threads()} inter-op threads")
+        return True
+    except RuntimeError as e:
+        print(f"Torch runtime: could not set thread counts: {e}")
+        return False
+
+
+def apply_runtime_config(config):
+    """Apply the "runtime" section of a DetectorConfig"""
+    runtime = config.get('runtime')
+    return configure_torch_runtime(runtime['intra_op_threads'], runtime['inter_op_threads'])
+
+
+def pin_current_thread(cpus):
+    """Restrict the calling thread (and threads it starts) to a set of CPUs"""
+    if not cpus:
+        return False
+    if not hasattr(os, 'sched_setaffinity'):
+        print("CPU affinity is not supported on this platform")
+        return False
+    try:
+        # On Linux a thread id pins only that thread, not the whole process
+        os.sched_setaffinity(threading.get_native_id(), set(cpus))
+        return True
+    except Exception as e:
+        print(f"Error setting CPU affinity {cpus}: {e}")
+        return False
+
+
+def pin_inference_thread(config):
+    """Pin a dedicated inference thread to the configured CPUs"""
+    return pin_current_thread(config.get('runtime')['inference_cpus'])
+
+
+def inference_context(enabled=True):
+    """Context manager that disables autograd bookkeeping for inference"""
+    if not enabled or not TORCH_AVAILABLE:
+        return contextlib.nullcontext()
+    if hasattr(torch, 'inference_mode'):
+        return torch.inference_mode()
+    return torch.no_grad()
@@ -0,0 +1,27 @@
+"""
+Optional UI timing marks.
+
+When AINIFORM_UI_MARKS names a file, mark() appends one JSON line
+{"mark": name, "time": epoch seconds, ...} to it; otherwise it does nothing.
+bench_ui_latency.py sets the variable to time cold starts of the real
+scripts from the outside.
+"""
+
+import json
+import os
+import time
+
+MARKS_PATH = os.environ.get('AINIFORM_UI_MARKS')
+
+
+def mark(name, **fields):
+    """Record that a UI milestone was reached (no-op unless enabled)"""
+    if not MARKS_PATH:
+        return
+    record = {'mark': name, 'time': time.time(), 'pid': os.getpid()}
+    record.update(fields)
+    try:
+        with open(MARKS_PATH, 'a') as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError:
+        pass
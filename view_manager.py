@@ -0,0 +1,69 @@
+"""
+Cached Tk views for the guard application.
+
+Every screen switch in AINiformLogin (guard, visitor form, student, special
+pass, splash, compliance) used to destroy every child of main_frame and build
+the next screen from scratch: a few hundred widgets, the logo re-read and
+resized with PIL, all on the Tk thread while the guard is waiting for the
+next card tap.
+
+ViewManager builds each registered view once into its own frame and keeps it
+off-screen with pack_forget() while another view is up. Showing a view packs
+its frame again and calls the view's refresh function, which only updates
+the fields that change between shows (entries, messages, the person on the
+splash). Widgets that are not part of a registered view (login, compliance
+and result screens) are still destroyed when the screen changes, so those
+screens keep working unchanged next to the cached ones.
+"""
+
+import tkinter as tk
+
+
+class ViewManager:
+    def __init__(self, parent, keep=()):
+        """Views packed into `parent`; widgets in `keep` (the status bar) are never touched"""
+        self.parent = parent
+        self.keep = list(keep)
+        self.views = {}
+        self.frames = {}
+        self.current = None
+
+    def register(self, name, build, refresh=None, bg='white'):
+        """build(frame) creates the widgets once; refresh(*args) runs on every show"""
+        self.views[name] = (build, refresh, bg)
+        self.frames.pop(name, None)
+
+    def show(self, name, *args):
+        """Switch to a view, building it on first use; returns its frame"""
+        build, refresh, bg = self.views[name]
+        self.clear()
+        frame = self.frames.get(name)
+        if frame is None or not frame.winfo_exists():
+            frame = tk.Frame(self.parent, bg=bg)
+            build(frame)
+            self.frames[name] = frame
+        frame.pack(side='top', expand=True, fill='both')
+        self.current = name
+        if refresh is not None:
+            refresh(*args)
+        return frame
+
+    def clear(self):
+        """Hide the cached views and destroy every other widget in the parent"""
+        cached = set(self.frames.values())
+        for widget in self.parent.winfo_children():
+            if widget in self.keep:
+                continue
+            if widget in cached:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+        self.current = None
+
+    def reset(self):
+        """Drop all cached views (on logout the next guard gets fresh ones)"""
+        for frame in self.frames.values():
+            if frame.winfo_exists():
+                frame.destroy()
+        self.frames.clear()
+        self.clear()
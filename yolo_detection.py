@@ -0,0 +1,329 @@
+"""
+YOLO uniform detector.
+
+YOLOCameraDetection has no UI dependencies: the guard screens feed it frames
+from the camera session, and the offline tools (replay.py) feed it frames
+from video files or image directories.
+
+Settings not passed to the constructor come from detector_config.json
+(see detector_config.py); live settings such as per-class thresholds are
+picked up on the next frame when the file changes.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+
+import cv2
+import numpy as np
+from ultralytics import YOLO
+
+from compliance import count_classes, compliance_result
+from detector_config import get_detector_config
+from torch_runtime import apply_runtime_config, inference_context
+from model_registry import active_model_registry
+
+
+def box_iou(box_a, box_b):
+    """Intersection over union of two (x1, y1, x2, y2) boxes"""
+    ix1, iy1 = max(box_a[0], box_b[0]), max(box_a[1], box_b[1])
+    ix2, iy2 = min(box_a[2], box_b[2]), min(box_a[3], box_b[3])
+    intersection = max(0.0, ix2 - ix1) * max(0.0, iy2 - iy1)
+    area_a = (box_a[2] - box_a[0]) * (box_a[3] - box_a[1])
+    area_b = (box_b[2] - box_b[0]) * (box_b[3] - box_b[1])
+    union = area_a + area_b - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+class YOLOCameraDetection:
+    # Loaded models shared by every detector instance (keyed by model path)
+    _model_cache = {}
+    _model_cache_lock = threading.Lock()
+    
+    def __init__(self, model_path=None, camera_id=None, confidence_threshold=None, camera_session=None,
+                 device=None, debug=None, config=None, registry=None):
+        """Initialize YOLO Camera Detection (unset arguments come from the detector config)"""
+        self.config = config if config is not None else get_detector_config()
+        # Without an explicit model path, follow the hot-swap registry if it is running
+        self.registry = registry if registry is not None or model_path else active_model_registry()
+        self.model_path = model_path or self.config.model_path
+        self.camera_id = camera_id if camera_id is not None else self.config.get('camera')['camera_id']
+        self.camera_session = camera_session
+        # None lets ultralytics pick; "cpu" for build machines
+        self.device = device if device is not None else self.config.get('device')
+        self._confidence_override = confidence_threshold
+        self._debug_override = debug
+        self.cap = None
+        self.model = None
+        self.model_version = None
+        self._model_generation = None
+        self.is_running = False
+        self.last_inference_ms = None
+        self.apply_config()
+    
+    def apply_config(self):
+        """Take the live settings from the detector config (weights are kept)"""
+        if self._confidence_override is not None:
+            # An explicit threshold applies to every class
+            self.confidence_threshold = self._confidence_override
+            self.class_thresholds = {}
+        else:
+            self.confidence_threshold = self.config.get('confidence_threshold')
+            self.class_thresholds = self.config.class_thresholds()
+        self.required_classes = self.config.required_classes
+        self.imgsz = self.config.get('imgsz')
+        # Per-frame result printout
+        self.debug = self._debug_override if self._debug_override is not None else self.config.get('debug')
+        self._config_version = self.config.version
+    
+    def refresh_config(self):
+        """Apply the config file if it changed since the last frame"""
+        self.config.reload_if_changed()
+        if self._config_version != self.config.version:
+            self.apply_config()
+            print(f"Detector settings updated (config version {self._config_version})")
+    
+    def threshold_for(self, class_name):
+        """Confidence threshold for one class"""
+        return self.class_thresholds.get(class_name.lower(), self.confidence_threshold)
+    
+    def refresh_model(self):
+        """Pick up a version swapped in by the model registry (between frames)"""
+        if self.registry is None:
+            return False
+        generation, current = self.registry.current_version()
+        if current is None or generation == self._model_generation:
+            return False
+        self.model = current.model
+        self.model_version = current.version
+        self._model_generation = generation
+        return True
+    
+    def load_model(self):
+        """Load YOLO model"""
+        if self.refresh_model():
+            return True
+        try:
+            with YOLOCameraDetection._model_cache_lock:
+                cached_model = YOLOCameraDetection._model_cache.get(self.model_path)
+            if cached_model is not None:
+                self.model = cached_model
+                self.model_version = os.path.basename(self.model_path)
+                return True
+            
+            # Thread counts must be set before the first inference
+            apply_runtime_config(self.config)
+            print(f"Loading YOLO model from {self.model_path}...")
+            if os.path.exists(self.model_path):
+                self.model = YOLO(self.model_path)
+                with YOLOCameraDetection._model_cache_lock:
+                    YOLOCameraDetection._model_cache[self.model_path] = self.model
+                self.model_version = os.path.basename(self.model_path)
+                print("Model loaded successfully!")
+                return True
+            else:
+                print(f"Model file {self.model_path} not found. Using placeholder detection.")
+                self.model = None
+                return False
+        except Exception as e:
+            print(f"Error loading model: {e}")
+            self.model = None
+            return False
+    
+    def warm_up(self, frame=None):
+        """Run one throw-away inference so the first real frame is not slow"""
+        if self.model is None:
+            return False
+        try:
+            if frame is None:
+                frame = np.zeros((480, 640, 3), dtype=np.uint8)
+            self._predict(frame)
+            return True
+        except Exception as e:
+            print(f"Error warming up model: {e}")
+            return False
+    
+    def _predict(self, frame):
+        """Run the model on one frame with the detector settings"""
+        # The model keeps everything above the lowest class threshold;
+        # _parse_result applies the per-class thresholds
+        conf = min([self.confidence_threshold] + list(self.class_thresholds.values()))
+        with inference_context(self.config.get('runtime')['inference_mode']):
+            if self.device is not None:
+                return self.model(frame, conf=conf, imgsz=self.imgsz, device=self.device, verbose=False)
+            return self.model(frame, conf=conf, imgsz=self.imgsz, verbose=False)
+    
+    def initialize_camera(self):
+        """Initialize camera capture"""
+        if self.camera_session is not None:
+            # Persistent session: the device is already open and streaming,
+            # so just subscribe to its frames
+            self.cap = self.camera_session.subscribe()
+            if not self.camera_session.is_live():
+                print(f"Warning: camera session {self.camera_session.camera_id} has no live frame yet")
+            return True
+        
+        try:
+            self.cap = cv2.VideoCapture(self.camera_id)
+            if not self.cap.isOpened():
+                print(f"Error: Could not open camera {self.camera_id}")
+                return False
+            
+            # Set camera properties
+            camera = self.config.get('camera')
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera['width'])
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera['height'])
+            self.cap.set(cv2.CAP_PROP_FPS, camera['fps'])
+            
+            print(f"Camera {self.camera_id} initialized successfully!")
+            return True
+        except Exception as e:
+            print(f"Error initializing camera: {e}")
+            return False
+    
+    def detect_objects(self, frame):
+        """Perform object detection on frame"""
+        try:
+            self.refresh_model()
+            if self.model is None:
+                return []
+            self.refresh_config()
+            
+            # Run YOLO detection
+            start = time.perf_counter()
+            results = self._predict(frame)
+            self.last_inference_ms = (time.perf_counter() - start) * 1000.0
+            
+            # Process results
+            detections = []
+            for result in results:
+                detections.extend(self._parse_result(result))
+            
+            # Print debugging information
+            if self.debug:
+                self.print_detection_debug(detections)
+            
+            if self.registry is not None:
+                self.registry.report_success()
+            return detections
+        except Exception as e:
+            print(f"Error during detection: {e}")
+            if self.registry is not None:
+                self.registry.report_failure(self.model_version)
+            return []
+    
+    def detect_batch(self, frames):
+        """Detect objects on a list of frames in one forward pass.
+        
+        Returns one detection list per frame. Used by the offline tools;
+        the per-frame debug printout is skipped.
+        """
+        try:
+            self.refresh_model()
+            if self.model is None or not frames:
+                return [[] for _ in frames]
+            self.refresh_config()
+            results = self._predict(list(frames))
+            return [self._parse_result(result) for result in results]
+        except Exception as e:
+            print(f"Error during batch detection: {e}")
+            return [[] for _ in frames]
+    
+    def _parse_result(self, result):
+        """Convert one ultralytics result into detection dicts"""
+        detections = []
+        boxes = result.boxes
+        if boxes is None:
+            return detections
+        
+        for box in boxes:
+            # Get box coordinates
+            x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
+            x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+            
+            # Get confidence and class
+            confidence = float(box.conf[0])
+            class_id = int(box.cls[0])
+            class_name = self.model.names[class_id]
+            if confidence < self.threshold_for(class_name):
+                continue
+            
+            detections.append({
+                'bbox': (x1, y1, x2, y2),
+                'confidence': confidence,
+                'class_id': class_id,
+                'class_name': class_name
+            })
+        return detections
+    
+    def print_detection_debug(self, detections):
+        """Print debugging information for YOLO detections"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"\n[{timestamp}] " + "="*50)
+        print("YOLO DETECTION RESULTS")
+        print("="*50)
+        
+        # Print counts for each expected class
+        class_counts = count_classes(detections)
+        for class_name in self.required_classes:
+            print(f"{class_name} = {class_counts.get(class_name, 0)}")
+        
+        print(f"\nRESULT = {compliance_result(detections, self.required_classes)}")
+        print("="*50)
+    
+    def draw_detections(self, frame, detections):
+        """Draw detection boxes and labels on frame"""
+        for detection in detections:
+            x1, y1, x2, y2 = detection['bbox']
+            confidence = detection['confidence']
+            class_name = detection['class_name']
+            
+            # Draw bounding box
+            cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
+            
+            # Create label
+            label = f"{class_name}: {confidence:.2f}"
+            
+            # Get label size
+            (label_width, label_height), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
+            
+            # Draw label background
+            cv2.rectangle(frame, (x1, y1 - label_height - 10), (x1 + label_width, y1), (0, 255, 0), -1)
+            
+            # Draw label text
+            cv2.putText(frame, label, (x1, y1 - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 2)
+        
+        return frame
+    
+    def get_frame_and_detections(self):
+        """Read one frame, detect once and return (annotated frame, detections)"""
+        if self.cap is None:
+            return None, []
+        
+        ret, frame = self.cap.read()
+        if not ret:
+            return None, []
+        
+        # Perform object detection
+        detections = self.detect_objects(frame)
+        
+        # Draw detections
+        frame = self.draw_detections(frame, detections)
+        
+        return frame, detections
+    
+    def get_frame_with_detection(self):
+        """Get a frame with object detection"""
+        frame, _ = self.get_frame_and_detections()
+        return frame
+    
+    def cleanup(self):
+        """Clean up resources"""
+        self.is_running = False
+        if self.cap is not None:
+            # With a camera session this only drops the subscription;
+            # the device stays open for the next scan
+            self.cap.release()
+            self.cap = None
+        print("Camera cleanup completed")